@@ -0,0 +1,27 @@
+"""Add composite index for event keyset pagination
+
+Revision ID: 002_event_keyset_index
+Revises: 001_initial_schema
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002_event_keyset_index"
+down_revision: Union[str, Sequence[str], None] = "001_initial_schema"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_event_start_date_id", "event", ["start_date", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_event_start_date_id", table_name="event")
@@ -0,0 +1,53 @@
+"""Add pg_trgm GIN indexes for keyword search
+
+Revision ID: 003_search_trgm_indexes
+Revises: 002_event_keyset_index
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003_search_trgm_indexes"
+down_revision: Union[str, Sequence[str], None] = "002_event_keyset_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (インデックス名, テーブル名, カラム名)
+TRGM_INDEXES = [
+    ("ix_person_search_name_trgm", "person", "search_name"),
+    ("ix_event_title_trgm", "event", "title"),
+    ("ix_event_description_trgm", "event", "description"),
+    ("ix_tag_name_trgm", "tag", "name"),
+    ("ix_tag_description_trgm", "tag", "description"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        # SQLiteはcreate_all時にFTS5テーブルを作成する（app/models/search.py）
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, table_name, column_name in TRGM_INDEXES:
+        op.create_index(
+            index_name,
+            table_name,
+            [column_name],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column_name: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for index_name, table_name, _ in reversed(TRGM_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,30 @@
+"""Add reverse composite indexes on event association tables
+
+Revision ID: 004_association_reverse_indexes
+Revises: 003_search_trgm_indexes
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004_association_reverse_indexes"
+down_revision: Union[str, Sequence[str], None] = "003_search_trgm_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 主キーは (event_id, ...) の順のため、人物・タグからイベントを引く逆方向のインデックスを追加
+    op.create_index("ix_event_person_person_id_event_id", "event_person", ["person_id", "event_id"], unique=False)
+    op.create_index("ix_event_tag_tag_id_event_id", "event_tag", ["tag_id", "event_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_event_tag_tag_id_event_id", table_name="event_tag")
+    op.drop_index("ix_event_person_person_id_event_id", table_name="event_person")
@@ -0,0 +1,38 @@
+"""Add GiST daterange index for event period overlap queries
+
+Revision ID: 005_event_period_index
+Revises: 004_association_reverse_indexes
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005_event_period_index"
+down_revision: Union[str, Sequence[str], None] = "004_association_reverse_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        # SQLiteは開始日・終了日の比較で重なりを判定する（app/crud/timeline.py）
+        return
+
+    # app/models/event.py の EVENT_PERIOD_SQL と同じ式（式が一致しないとインデックスが使われない）
+    op.execute(
+        "CREATE INDEX ix_event_period_gist ON event "
+        "USING gist (daterange(start_date, greatest(end_date, start_date), '[]'))"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_event_period_gist", table_name="event")
@@ -0,0 +1,32 @@
+"""Add person indexes for birth year and country filters
+
+Revision ID: 006_person_filter_indexes
+Revises: 005_event_period_index
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006_person_filter_indexes"
+down_revision: Union[str, Sequence[str], None] = "005_event_period_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 生年はbirth_dateの範囲条件で絞り込むため、式ではなく列のインデックスで足りる
+    op.create_index("ix_person_birth_date_id", "person", ["birth_date", "id"], unique=False)
+    op.create_index("ix_person_born_country_lower_id", "person", [sa.text("lower(born_country)"), "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_person_born_country_lower_id", table_name="person")
+    op.drop_index("ix_person_birth_date_id", table_name="person")
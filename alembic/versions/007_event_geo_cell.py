@@ -0,0 +1,49 @@
+"""Add event geo_cell column for bounding-box and radius search
+
+Revision ID: 007_event_geo_cell
+Revises: 006_person_filter_indexes
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.core.geo import grid_cell
+
+# revision identifiers, used by Alembic.
+revision: str = "007_event_geo_cell"
+down_revision: Union[str, Sequence[str], None] = "006_person_filter_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# バックフィルで1回に更新する行数
+BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("event", sa.Column("geo_cell", sa.Integer(), nullable=True))
+
+    # 既存行のセル番号はアプリケーションと同じ関数で計算する
+    bind = op.get_bind()
+    event = sa.table("event", sa.column("id"), sa.column("latitude"), sa.column("longitude"), sa.column("geo_cell"))
+    rows = bind.execute(
+        sa.select(event.c.id, event.c.latitude, event.c.longitude).where(
+            event.c.latitude.isnot(None), event.c.longitude.isnot(None)
+        )
+    ).all()
+    update = event.update().where(event.c.id == sa.bindparam("event_id")).values(geo_cell=sa.bindparam("cell"))
+    for start in range(0, len(rows), BATCH_SIZE):
+        batch = rows[start : start + BATCH_SIZE]
+        bind.execute(update, [{"event_id": row.id, "cell": grid_cell(row.latitude, row.longitude)} for row in batch])
+
+    op.create_index("ix_event_geo_cell", "event", ["geo_cell"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_event_geo_cell", table_name="event")
+    op.drop_column("event", "geo_cell")
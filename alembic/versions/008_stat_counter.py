@@ -0,0 +1,66 @@
+"""Add stat_counter summary table for aggregate statistics
+
+Revision ID: 008_stat_counter
+Revises: 007_event_geo_cell
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008_stat_counter"
+down_revision: Union[str, Sequence[str], None] = "007_event_geo_cell"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (スコープ, テーブル名, キーのSQL式) ※キーがNoneのものは総数
+COUNTERS = [
+    ("person", "person", None),
+    ("person_country", "person", "born_country"),
+    ("event", "event", None),
+    ("event_year", "event", "CAST(CAST(EXTRACT(YEAR FROM start_date) AS INTEGER) AS VARCHAR(100))"),
+    ("tag", "tag", None),
+    ("user", "users", None),
+    ("user_role", "users", "role"),
+    ("user_active", "users", "CASE WHEN is_active THEN 'true' ELSE 'false' END"),
+]
+
+# SQLiteはEXTRACTがないため開始年を文字列から取り出す
+SQLITE_EXPRESSIONS = {"event_year": "CAST(CAST(strftime('%Y', start_date) AS INTEGER) AS TEXT)"}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "stat_counter",
+        sa.Column("scope", sa.String(length=32), nullable=False),
+        sa.Column("key", sa.String(length=100), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("scope", "key"),
+    )
+
+    # 既存データから初期値を集計（以降はアプリケーションが書き込みごとに差分更新する）
+    is_sqlite = op.get_bind().dialect.name == "sqlite"
+    for scope, table, expression in COUNTERS:
+        if expression is None:
+            op.execute(
+                f"INSERT INTO stat_counter (scope, key, count) SELECT '{scope}', 'total', count(*) FROM {table} "
+                "HAVING count(*) > 0"
+            )
+            continue
+        if is_sqlite:
+            expression = SQLITE_EXPRESSIONS.get(scope, expression)
+        op.execute(
+            f"INSERT INTO stat_counter (scope, key, count) SELECT '{scope}', {expression}, count(*) FROM {table} "
+            f"GROUP BY {expression}"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("stat_counter")
@@ -0,0 +1,139 @@
+"""
+パスワードハッシュ用エグゼキューター
+
+bcryptによるハッシュ化・検証を、リクエスト処理用のスレッドプールとは別の上限付きワーカーで実行します。
+ログインが集中しても他のエンドポイントのスレッドを奪わず、待ち行列が上限に達した場合は即座に拒否します。
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from .utils import get_password_hash, verify_password
+
+# 同時にハッシュ処理を行うワーカー数
+DEFAULT_MAX_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# ワーカーの空きを待てる件数（これを超えると拒否）
+DEFAULT_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "32"))
+
+
+class PasswordExecutorBusyError(Exception):
+    """待ち行列が上限に達しているためパスワード処理を受け付けられない"""
+
+
+class PasswordExecutor:
+    """
+    パスワードハッシュ用エグゼキューター
+
+    bcrypt（pyca/bcrypt）は計算中にGILを解放するため、専用スレッドでもCPUコア数まで並列に処理できます。
+    処理中と待機中の合計が max_workers + max_queue に達すると PasswordExecutorBusyError を送出します。
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, max_queue: int = DEFAULT_MAX_QUEUE):
+        """
+        初期化
+
+        Args:
+            max_workers: 同時に処理するワーカー数
+            max_queue: ワーカーの空きを待てる件数
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hash")
+            return self._executor
+
+    def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """ワーカースレッドで実行し、実行中の件数を更新"""
+        with self._lock:
+            self._running += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def _done(self, future: Future) -> None:
+        """
+        処理が終わった（失敗・キャンセルを含む）ときに待ち行列の枠を解放
+
+        待機中にリクエストがキャンセルされた場合は _call が実行されないため、枠の解放はここで行う。
+        """
+        with self._lock:
+            self._pending -= 1
+            if not future.cancelled():
+                self._completed += 1
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        関数をワーカーで実行して結果を待つ
+
+        Args:
+            func: 実行する関数
+            *args: 関数の引数
+
+        Returns:
+            関数の戻り値
+
+        Raises:
+            PasswordExecutorBusyError: 待ち行列が上限に達している場合
+        """
+        executor = self._get_executor()
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise PasswordExecutorBusyError("Password hashing queue is full")
+            self._pending += 1
+
+        try:
+            future = executor.submit(self._call, func, *args)
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            raise
+        future.add_done_callback(self._done)
+
+        # 待っているリクエストがキャンセルされると、待機中のジョブもキャンセルされる
+        return await asyncio.wrap_future(future)
+
+    async def verify(self, client_password: str, hashed_password: str) -> bool:
+        """パスワードを検証"""
+        return await self.run(verify_password, client_password, hashed_password)
+
+    async def hash(self, client_password: str) -> str:
+        """パスワードをハッシュ化"""
+        return await self.run(get_password_hash, client_password)
+
+    def stats(self) -> Dict[str, int]:
+        """ワーカー数・待ち行列の深さ・処理件数を取得"""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """ワーカーを停止"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+password_executor = PasswordExecutor()
@@ -0,0 +1,71 @@
+"""
+ユーザープリンシパルキャッシュ
+
+JWT認証のたびにusersテーブルを引かないよう、認可に必要なユーザー情報を短いTTLでキャッシュします。
+バックエンドは共有キャッシュ（Redisが設定されていればRedis、なければプロセス内メモリ）を使用します。
+プロセス内メモリの場合、有効期限はバックエンドの上限（CACHE_IN_MEMORY_MAX_TTL_SECONDS）に切り詰められます。
+"""
+
+import json
+import os
+from typing import Optional
+
+from ..core.cache import KEY_PREFIX, CacheBackend, cache_stats, get_cache_backend
+from ..models.user import User
+
+# ヒット/ミスを記録する名前空間
+STATS_NAMESPACE = "user_principal"
+
+# エントリの有効期限（秒）
+DEFAULT_TTL_SECONDS = int(os.getenv("USER_PRINCIPAL_CACHE_TTL_SECONDS", "30"))
+
+# キャッシュする属性（パスワードハッシュ等の秘匿情報は含めない）
+PRINCIPAL_FIELDS = ("id", "username", "email", "full_name", "role", "is_active", "is_superuser")
+
+
+class UserPrincipalCache:
+    """
+    ユーザープリンシパルキャッシュ
+
+    ヒット時はセッションに属さないUserを返します。認可判定（id・role・is_active）専用で、
+    hashed_password などキャッシュしない属性は空です。
+    UserCRUDの更新・有効化・無効化・削除で無効化されます。
+    """
+
+    def __init__(self, *, backend: Optional[CacheBackend] = None, ttl: int = DEFAULT_TTL_SECONDS):
+        """
+        初期化
+
+        Args:
+            backend: キャッシュバックエンド（デフォルトで共有バックエンドを使用）
+            ttl: エントリの有効期限（秒）
+        """
+        self.backend = backend
+        self.ttl = ttl
+
+    def _backend(self) -> CacheBackend:
+        return self.backend if self.backend is not None else get_cache_backend()
+
+    @staticmethod
+    def _key(user_id: str) -> str:
+        return f"{KEY_PREFIX}{STATS_NAMESPACE}:id:{user_id}"
+
+    def get(self, user_id: str) -> Optional[User]:
+        """ユーザーIDでプリンシパルを取得"""
+        raw = self._backend().get(self._key(user_id))
+        cache_stats.record(STATS_NAMESPACE, hit=raw is not None)
+        if raw is None:
+            return None
+        return User(hashed_password="", **json.loads(raw))
+
+    def set(self, user: User) -> None:
+        """プリンシパルを保存"""
+        principal = {field: getattr(user, field) for field in PRINCIPAL_FIELDS}
+        self._backend().set(self._key(user.id), json.dumps(principal), self.ttl)
+
+    def invalidate(self, user_id: str) -> None:
+        """ユーザーIDのエントリを無効化"""
+        self._backend().delete(self._key(user_id))
+
+
+user_principal_cache = UserPrincipalCache()
@@ -0,0 +1,93 @@
+"""
+JWT検証キャッシュ
+
+同じベアラートークンの署名・発行者・対象者の検証結果を、トークンの有効期限（exp）まで再利用します。
+"""
+
+import copy
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from ..core.cache import cache_stats
+
+# ヒット/ミスを記録する名前空間
+STATS_NAMESPACE = "jwt"
+
+# 保持するトークン数の上限
+DEFAULT_MAXSIZE = int(os.getenv("JWT_CACHE_MAXSIZE", "1024"))
+
+
+class TokenVerificationCache:
+    """
+    検証済みJWTペイロードのLRUキャッシュ
+
+    キーはトークン全体（署名を含む）のSHA-256のため、署名だけを差し替えたトークンは必ずミスして
+    通常の検証に回ります。検証に成功しexpを持つペイロードだけを保存し、exp到達で破棄します。
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[dict]:
+        """
+        検証済みペイロードを取得
+
+        Args:
+            token: JWTトークン
+
+        Returns:
+            有効期限内のペイロードのコピー（未登録・期限切れならNone）
+        """
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.time():
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        cache_stats.record(STATS_NAMESPACE, entry is not None)
+        # 呼び出し側での変更がキャッシュに波及しないようにコピーを返す
+        return copy.deepcopy(entry[1]) if entry is not None else None
+
+    def set(self, token: str, payload: dict) -> None:
+        """
+        検証済みペイロードを保存
+
+        Args:
+            token: JWTトークン
+            payload: 検証済みのペイロード（expがなければ保存しない）
+        """
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, (int, float)) or expires_at <= time.time():
+            return
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (float(expires_at), copy.deepcopy(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """全エントリを削除"""
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> Dict[str, int]:
+        """現在の件数と上限を取得"""
+        with self._lock:
+            return {"size": len(self._entries), "maxsize": self.maxsize}
+
+
+token_verification_cache = TokenVerificationCache()
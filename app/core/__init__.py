@@ -4,6 +4,7 @@
 アプリケーションのコア機能を管理します。
 """
 
+from .cache import cache_stats, get_cache_backend
 from .logging import (
     RequestLogFilter,
     get_logger,
@@ -14,6 +15,8 @@ from .logging import (
 )
 
 __all__ = [
+    "cache_stats",
+    "get_cache_backend",
     "setup_logging",
     "setup_development_logging",
     "setup_production_logging",
@@ -0,0 +1,217 @@
+"""
+キャッシュバックエンド
+
+サービス層のリードスルーキャッシュで使用するキー・バリューストアを提供します。
+REDIS_URL（未設定なら REDIS_HOST / REDIS_PORT / REDIS_DB）が設定されていればRedisを、
+どちらも未設定ならプロセス内メモリを使用します。
+プロセス内メモリはワーカー間で共有されず、他のワーカーでの更新による無効化が届かないため、
+エントリの有効期限を短く制限します。
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional, Protocol, Tuple
+
+from .logging import get_logger
+
+logger = get_logger("core.cache")
+
+# 全キー共通のプレフィックス
+KEY_PREFIX = "chrono_wiki:cache:"
+
+# デフォルトTTL（秒）
+DEFAULT_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+
+# インメモリバックエンドでの有効期限の上限（秒）
+IN_MEMORY_MAX_TTL_SECONDS = int(os.getenv("CACHE_IN_MEMORY_MAX_TTL_SECONDS", "5"))
+
+
+class CacheBackend(Protocol):
+    """キャッシュバックエンドのインターフェース"""
+
+    def get(self, key: str) -> Optional[str]: ...
+
+    def set(self, key: str, value: str, ttl: int) -> None: ...
+
+    def delete(self, *keys: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class InMemoryCacheBackend:
+    """
+    プロセス内メモリのキャッシュバックエンド
+
+    Redisが使えない環境（ローカル開発・テスト）用のスタンドインです。
+    """
+
+    def __init__(self, max_ttl: Optional[int] = None):
+        """
+        初期化
+
+        Args:
+            max_ttl: 有効期限の上限（秒）。Noneの場合は制限しない
+        """
+        self.max_ttl = max_ttl
+        self._store: Dict[str, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._store[key]
+                return None
+            return value
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        if self.max_ttl is not None:
+            ttl = min(ttl, self.max_ttl)
+        with self._lock:
+            self._store[key] = (time.monotonic() + ttl, value)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._store.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+
+
+class RedisCacheBackend:
+    """
+    Redisのキャッシュバックエンド
+
+    Redisの障害はキャッシュミスとして扱い、リクエストを失敗させません。
+    """
+
+    def __init__(self, url: str):
+        import redis
+
+        self._client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            value = self._client.get(key)
+        except Exception as e:
+            logger.warning(f"キャッシュ取得に失敗しました: {key} - {e}")
+            return None
+        if value is None:
+            return None
+        return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        try:
+            self._client.set(key, value, ex=ttl)
+        except Exception as e:
+            logger.warning(f"キャッシュ保存に失敗しました: {key} - {e}")
+
+    def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            self._client.delete(*keys)
+        except Exception as e:
+            logger.warning(f"キャッシュ削除に失敗しました: {keys} - {e}")
+
+    def clear(self) -> None:
+        try:
+            keys = list(self._client.scan_iter(match=f"{KEY_PREFIX}*"))
+            if keys:
+                self._client.delete(*keys)
+        except Exception as e:
+            logger.warning(f"キャッシュのクリアに失敗しました: {e}")
+
+
+class CacheStats:
+    """名前空間ごとのヒット/ミス回数"""
+
+    def __init__(self):
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, namespace: str, hit: bool) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(namespace, {"hits": 0, "misses": 0})
+            counts["hits" if hit else "misses"] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """現在のカウンタとヒット率を取得"""
+        with self._lock:
+            result: Dict[str, Dict[str, float]] = {}
+            for namespace, counts in self._counts.items():
+                total = counts["hits"] + counts["misses"]
+                result[namespace] = {
+                    "hits": counts["hits"],
+                    "misses": counts["misses"],
+                    "hit_rate": round(counts["hits"] / total, 4) if total else 0.0,
+                }
+            return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+_backend: Optional[CacheBackend] = None
+cache_stats = CacheStats()
+
+
+def get_redis_url() -> Optional[str]:
+    """
+    RedisのURLを取得
+
+    REDIS_URL が未設定の場合は REDIS_HOST / REDIS_PORT / REDIS_DB（.env.example）から組み立てます。
+
+    Returns:
+        RedisのURL、Redisが設定されていない場合はNone
+    """
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        return redis_url
+    redis_host = os.getenv("REDIS_HOST")
+    if redis_host:
+        return f"redis://{redis_host}:{os.getenv('REDIS_PORT', '6379')}/{os.getenv('REDIS_DB', '0')}"
+    return None
+
+
+def _worker_count() -> int:
+    """ワーカープロセス数（gunicorn / uvicorn と同じく WEB_CONCURRENCY を参照）"""
+    try:
+        return int(os.getenv("WEB_CONCURRENCY", "1"))
+    except ValueError:
+        return 1
+
+
+def get_cache_backend() -> CacheBackend:
+    """設定に応じたキャッシュバックエンドを取得（プロセス内で共有）"""
+    global _backend
+    if _backend is None:
+        redis_url = get_redis_url()
+        if redis_url:
+            _backend = RedisCacheBackend(redis_url)
+            logger.info("Redisキャッシュバックエンドを使用します")
+        else:
+            _backend = InMemoryCacheBackend(max_ttl=IN_MEMORY_MAX_TTL_SECONDS)
+            workers = _worker_count()
+            if workers > 1:
+                logger.error(
+                    f"Redis未設定のまま{workers}ワーカーで起動しています。"
+                    f"ワーカー間でキャッシュの無効化が共有されないため、REDIS_URL または REDIS_HOST を設定してください"
+                    f"（キャッシュの有効期限は{IN_MEMORY_MAX_TTL_SECONDS}秒に制限されます）"
+                )
+            else:
+                logger.info("Redis未設定のため、インメモリキャッシュバックエンドを使用します")
+    return _backend
+
+
+def set_cache_backend(backend: Optional[CacheBackend]) -> None:
+    """キャッシュバックエンドを差し替え（テスト用）"""
+    global _backend
+    _backend = backend
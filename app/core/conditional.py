@@ -0,0 +1,136 @@
+"""
+条件付きGET
+
+詳細・一覧レスポンスのETag / Last-Modifiedを生成し、If-None-Match / If-Modified-Since に一致する場合は
+本文をシリアライズせずに 304 Not Modified を返します。
+ETagはレスポンスに含まれるエンティティ（include した関連エンティティを含む）のIDとupdated_atから計算するため、
+JSONを組み立てる前に判定できます。
+"""
+
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+# 認証が必要なレスポンスのため共有キャッシュには保存させず、利用のたびに再検証させる
+CACHE_CONTROL = "private, no-cache"
+
+
+def _collect_versions(item: BaseModel, parts: List[str], prefix: str = "") -> bool:
+    """
+    エンティティと関連エンティティの「ID@updated_at」を集める
+
+    Returns:
+        関連エンティティのリストを含む場合はTrue
+    """
+    parts.append(f"{prefix}{getattr(item, 'id', '')}@{_isoformat(getattr(item, 'updated_at', None))}")
+    has_relations = False
+    for name, value in item:
+        if isinstance(value, list) and all(isinstance(child, BaseModel) for child in value):
+            # 関連の追加・削除は親のupdated_atを変えないため、関連ごとの件数と各バージョンを含める
+            has_relations = True
+            parts.append(f"{prefix}{name}[{len(value)}]")
+            for child in value:
+                _collect_versions(child, parts, f"{prefix}{name}.")
+    return has_relations
+
+
+def _isoformat(value: Optional[datetime]) -> str:
+    return value.isoformat() if value is not None else ""
+
+
+def entity_validators(payload: Union[BaseModel, Sequence[BaseModel]], *extra: Any) -> Tuple[str, Optional[datetime]]:
+    """
+    レスポンスのETagとLast-Modifiedを計算
+
+    Last-Modifiedは関連エンティティを含まない単一エンティティの場合のみ返します。
+    一覧や関連エンティティは削除されても最新の更新日時が進まないため、ETagだけで判定します。
+
+    Args:
+        payload: レスポンスにするスキーマ（またはそのリスト）
+        *extra: ETagに含める追加の値（次ページのカーソルなど）
+
+    Returns:
+        (弱いETag, Last-Modified またはNone)
+    """
+    is_single = isinstance(payload, BaseModel)
+    items = [payload] if isinstance(payload, BaseModel) else list(payload)
+    parts = [] if is_single else [f"{len(items)}"]
+    has_relations = False
+    for item in items:
+        has_relations = _collect_versions(item, parts) or has_relations
+    parts.extend(f"+{value}" for value in extra)
+
+    digest = hashlib.blake2b("\n".join(parts).encode(), digest_size=16).hexdigest()
+    last_modified = None
+    if is_single and not has_relations:
+        last_modified = getattr(payload, "updated_at", None)
+    return f'W/"{digest}"', last_modified
+
+
+def _opaque_tag(etag: str) -> str:
+    """弱い比較用にW/を取り除いたETag"""
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """
+    条件付きリクエストのヘッダーがレスポンスの検証子と一致するか判定
+
+    RFC 9110 に従い、If-None-Match がある場合は If-Modified-Since を無視します。
+
+    Args:
+        request: リクエスト
+        etag: レスポンスのETag
+        last_modified: レスポンスの最終更新日時（UTC、タイムゾーンなし）
+
+    Returns:
+        304 Not Modified を返してよい場合はTrue
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {_opaque_tag(tag) for tag in if_none_match.split(",")}
+        return "*" in candidates or _opaque_tag(etag) in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        # 解釈できない日付は無視する
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    # HTTP日付は秒単位のため、更新日時の秒未満を切り捨てて比較する
+    return last_modified.replace(tzinfo=UTC, microsecond=0) <= since
+
+
+def not_modified_response(
+    request: Request, response: Response, payload: Union[BaseModel, Sequence[BaseModel]], *extra: Any
+) -> Optional[Response]:
+    """
+    レスポンスに検証子を設定し、条件付きリクエストに一致すれば 304 のレスポンスを返す
+
+    Args:
+        request: リクエスト
+        response: エンドポイントのレスポンス（ETag等のヘッダーを設定）
+        payload: レスポンスにするスキーマ（またはそのリスト）
+        *extra: ETagに含める追加の値（次ページのカーソルなど）
+
+    Returns:
+        本文なしの 304 レスポンス（一致しない場合はNone）
+    """
+    etag, last_modified = entity_validators(payload, *extra)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.replace(tzinfo=UTC), usegmt=True)
+
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,133 @@
+"""
+地理計算ユーティリティ
+
+緯度経度を固定サイズのグリッドセル番号に変換し、範囲検索をインデックス付き整数列の
+区間検索に置き換えます。PostGISなどの拡張を必要とせず、SQLiteでも同じ方法で動作します。
+"""
+
+import math
+from typing import List, NamedTuple, Optional, Tuple
+
+# 地球の平均半径（km）
+EARTH_RADIUS_KM = 6371.0088
+
+# 緯度1度あたりの距離（km）
+KM_PER_DEGREE = 111.32
+
+# グリッドセルの一辺（度）。0.1度は赤道付近で約11km
+GRID_CELL_DEGREES = 0.1
+GRID_ROWS = round(180 / GRID_CELL_DEGREES)
+GRID_COLUMNS = round(360 / GRID_CELL_DEGREES)
+
+# 範囲検索で展開する区間の上限（超える場合は緯度帯全体を1区間で検索する）
+MAX_CELL_RANGES = 64
+
+
+class BoundingBox(NamedTuple):
+    """緯度経度の矩形（両端を含む。経度は min_lon <= max_lon であること）"""
+
+    min_lat: float
+    min_lon: float
+    max_lat: float
+    max_lon: float
+
+
+def _row(lat: float) -> int:
+    return min(max(int((lat + 90) // GRID_CELL_DEGREES), 0), GRID_ROWS - 1)
+
+
+def _column(lon: float) -> int:
+    return min(max(int((lon + 180) // GRID_CELL_DEGREES), 0), GRID_COLUMNS - 1)
+
+
+def grid_cell(lat: Optional[float], lon: Optional[float]) -> Optional[int]:
+    """
+    緯度経度をグリッドセル番号に変換
+
+    セル番号は行（緯度）優先で振るため、同じ緯度帯の連続した経度は連続した番号になります。
+
+    Args:
+        lat: 緯度
+        lon: 経度
+
+    Returns:
+        セル番号（緯度・経度のどちらかがない場合はNone）
+    """
+    if lat is None or lon is None:
+        return None
+    return _row(float(lat)) * GRID_COLUMNS + _column(float(lon))
+
+
+def cell_ranges(box: BoundingBox, max_ranges: int = MAX_CELL_RANGES) -> List[Tuple[int, int]]:
+    """
+    矩形を覆うセル番号の区間を取得
+
+    緯度帯ごとに1区間になります。緯度帯が max_ranges を超える場合は、
+    最初と最後のセルを結ぶ1区間（矩形を含む上位集合）を返します。
+
+    Args:
+        box: 矩形
+        max_ranges: 展開する区間の上限
+
+    Returns:
+        (開始セル, 終了セル) のリスト（両端を含む）
+    """
+    first_row, last_row = _row(box.min_lat), _row(box.max_lat)
+    first_column, last_column = _column(box.min_lon), _column(box.max_lon)
+    if last_row - first_row + 1 > max_ranges:
+        return [(first_row * GRID_COLUMNS + first_column, last_row * GRID_COLUMNS + last_column)]
+    return [
+        (row * GRID_COLUMNS + first_column, row * GRID_COLUMNS + last_column) for row in range(first_row, last_row + 1)
+    ]
+
+
+def split_antimeridian(box: BoundingBox) -> List[BoundingBox]:
+    """
+    日付変更線をまたぐ矩形（min_lon > max_lon）を2つに分割
+
+    Args:
+        box: 矩形
+
+    Returns:
+        経度が min_lon <= max_lon の矩形のリスト
+    """
+    if box.min_lon <= box.max_lon:
+        return [box]
+    return [
+        BoundingBox(box.min_lat, box.min_lon, box.max_lat, 180.0),
+        BoundingBox(box.min_lat, -180.0, box.max_lat, box.max_lon),
+    ]
+
+
+def bounding_boxes_around(lat: float, lon: float, radius_km: float) -> List[BoundingBox]:
+    """
+    中心から半径 radius_km の円を含む矩形を取得
+
+    Args:
+        lat: 中心の緯度
+        lon: 中心の経度
+        radius_km: 半径（km）
+
+    Returns:
+        円を含む矩形のリスト（日付変更線をまたぐ場合は2つ）
+    """
+    lat_delta = radius_km / KM_PER_DEGREE
+    min_lat, max_lat = lat - lat_delta, lat + lat_delta
+    cos_lat = math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    if min_lat <= -90 or max_lat >= 90 or radius_km >= KM_PER_DEGREE * 180 * cos_lat:
+        # 極を含む、または経度方向に一周する場合は緯度帯全体
+        return [BoundingBox(max(min_lat, -90.0), -180.0, min(max_lat, 90.0), 180.0)]
+
+    lon_delta = radius_km / (KM_PER_DEGREE * cos_lat)
+    min_lon = (lon - lon_delta + 180) % 360 - 180
+    max_lon = (lon + lon_delta + 180) % 360 - 180
+    return split_antimeridian(BoundingBox(min_lat, min_lon, max_lat, max_lon))
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """2点間の大円距離（km）"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
@@ -0,0 +1,136 @@
+"""
+画像処理用エグゼキューター
+
+Pillowによるデコード・縮小・エンコードを、イベントループとは別のワーカープロセスで実行します。
+大きな画像の処理中も同じワーカーの他のリクエストを止めず、待ち行列が上限に達した場合は即座に拒否します。
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+from .images import ProcessedAvatar, process_avatar_images
+
+# 同時に画像を処理するワーカープロセス数
+DEFAULT_MAX_WORKERS = int(os.getenv("IMAGE_PROCESS_WORKERS", str(min(2, os.cpu_count() or 1))))
+
+# ワーカーの空きを待てる件数（これを超えると拒否）
+DEFAULT_MAX_QUEUE = int(os.getenv("IMAGE_PROCESS_QUEUE_SIZE", "16"))
+
+
+class ImageExecutorBusyError(Exception):
+    """待ち行列が上限に達しているため画像処理を受け付けられない"""
+
+
+class ImageExecutor:
+    """
+    画像処理用エグゼキューター
+
+    PillowのLANCZOS縮小や最適化エンコードはGILを保持する区間が長いため、スレッドではなくプロセスで実行します。
+    ワーカーはアプリのスレッドを引き継がないよう spawn で起動し、最初の利用時に作成します。
+    処理中と待機中の合計が max_workers + max_queue に達すると ImageExecutorBusyError を送出します。
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, max_queue: int = DEFAULT_MAX_QUEUE):
+        """
+        初期化
+
+        Args:
+            max_workers: 同時に処理するワーカープロセス数
+            max_queue: ワーカーの空きを待てる件数
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def _done(self, future: Future) -> None:
+        """処理が終わった（失敗を含む）ときに件数を更新"""
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        関数をワーカープロセスで実行して結果を待つ
+
+        Args:
+            func: 実行する関数（モジュールレベルで定義され、pickleできること）
+            *args: 関数の引数（pickleできること）
+
+        Returns:
+            関数の戻り値
+
+        Raises:
+            ImageExecutorBusyError: 待ち行列が上限に達している場合
+        """
+        executor = self._get_executor()
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise ImageExecutorBusyError("Image processing queue is full")
+            self._pending += 1
+
+        try:
+            future = executor.submit(func, *args)
+        except BrokenProcessPool:
+            with self._lock:
+                self._pending -= 1
+            self._discard(executor)
+            raise
+        future.add_done_callback(self._done)
+
+        try:
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            # ワーカーが異常終了した（メモリ不足など）場合は次の呼び出しで作り直す
+            self._discard(executor)
+            raise
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+
+    async def process_avatar(self, file_content: bytes, file_extension: str) -> ProcessedAvatar:
+        """アバター画像を検証・縮小・再エンコードし、サイズ・形式ごとのバリアントを生成"""
+        return await self.run(process_avatar_images, file_content, file_extension)
+
+    def stats(self) -> Dict[str, int]:
+        """ワーカー数・待ち行列の深さ・処理件数を取得"""
+        with self._lock:
+            running = min(self._pending, self.max_workers)
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running": running,
+                "queued": self._pending - running,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """ワーカーを停止"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+image_executor = ImageExecutor()
@@ -0,0 +1,178 @@
+"""
+画像処理
+
+アバター画像の検証・縮小・再エンコードを行います。
+ワーカープロセスで実行できるよう、バイト列を受け取り、バイト列（またはそれを持つデータクラス）を返す
+モジュールレベルの関数にしています。
+"""
+
+import io
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from PIL import Image, features
+
+# アバターの最大サイズ（幅, 高さ）
+AVATAR_SIZE: Tuple[int, int] = (300, 300)
+
+# JPEGのdraftで縮小デコードするときの倍率（thumbnail の reducing_gap と同じ考え方で画質を保つ）
+DRAFT_SCALE = 2
+
+# 拡張子ごとの保存形式と保存オプション
+SAVE_OPTIONS: Dict[str, Tuple[str, dict]] = {
+    ".jpg": ("JPEG", {"optimize": True, "quality": 85}),
+    ".jpeg": ("JPEG", {"optimize": True, "quality": 85}),
+    ".png": ("PNG", {"optimize": True}),
+    ".gif": ("GIF", {"optimize": True}),
+    ".webp": ("WEBP", {"quality": 85}),
+}
+
+
+# レスポンシブ表示用バリアントの最大辺（一覧表示の32/64/128pxと詳細表示の300px）
+AVATAR_VARIANT_SIZES: Tuple[int, ...] = (32, 64, 128, 300)
+
+# バリアントの形式ごとの (拡張子, MIMEタイプ, 保存形式, 保存オプション)
+# AVIFのspeedはデフォルト(6)だと300pxでも1枚150ms以上かかるため、サイズ増を1割程度に抑えられる8にする
+VARIANT_FORMATS: Dict[str, Tuple[str, str, str, dict]] = {
+    "avif": (".avif", "image/avif", "AVIF", {"quality": 60, "speed": 8}),
+    "webp": (".webp", "image/webp", "WEBP", {"quality": 80}),
+    "jpeg": (".jpg", "image/jpeg", "JPEG", {"optimize": True, "quality": 85}),
+}
+
+# このPillowで生成できるバリアント形式（AVIFはlibavif付きのビルドのみ。JPEGは常にフォールバックとして生成）
+AVAILABLE_VARIANT_FORMATS: Tuple[str, ...] = tuple(
+    name for name in VARIANT_FORMATS if name != "avif" or features.check("avif")
+)
+
+
+class InvalidImageError(ValueError):
+    """画像として読み込めない、または処理できない"""
+
+
+@dataclass(frozen=True)
+class ImageVariant:
+    """サイズ・形式ごとのアバター画像"""
+
+    size: int
+    width: int
+    height: int
+    format: str
+    content: bytes
+
+    @property
+    def extension(self) -> str:
+        return VARIANT_FORMATS[self.format][0]
+
+    @property
+    def content_type(self) -> str:
+        return VARIANT_FORMATS[self.format][1]
+
+
+@dataclass
+class ProcessedAvatar:
+    """1回のデコードから生成したアバター画像とバリアント"""
+
+    content: bytes
+    variants: List[ImageVariant] = field(default_factory=list)
+
+
+def _decode_avatar(file_content: bytes) -> Image.Image:
+    """
+    画像を検証してデコードし、AVATAR_SIZE 以内に縮小したRGB画像を返す
+
+    JPEGは draft() でDCTの段階で縮小してデコードするため、元の解像度での展開を行いません。
+    """
+    # 画像形式の検証（verify後の画像は使えないため、処理用に開き直す）
+    with Image.open(io.BytesIO(file_content)) as img:
+        img.verify()
+
+    with Image.open(io.BytesIO(file_content)) as img:
+        if img.format == "JPEG":
+            img.draft("RGB", (AVATAR_SIZE[0] * DRAFT_SCALE, AVATAR_SIZE[1] * DRAFT_SCALE))
+
+        # RGBAの場合はRGBに変換
+        if img.mode in ("RGBA", "LA", "P"):
+            img = img.convert("RGB")
+
+        # アバター用にリサイズ
+        img.thumbnail(AVATAR_SIZE, Image.Resampling.LANCZOS)
+        img.load()
+        return img
+
+
+def _encode(img: Image.Image, image_format: str, options: dict) -> bytes:
+    output_buffer = io.BytesIO()
+    img.save(output_buffer, format=image_format, **options)
+    return output_buffer.getvalue()
+
+
+def process_avatar_image(file_content: bytes, file_extension: str) -> bytes:
+    """
+    アバター画像を検証し、AVATAR_SIZE 以内に縮小して再エンコード
+
+    Args:
+        file_content: 画像ファイルの内容
+        file_extension: 保存形式を決める拡張子（未対応の場合はJPEG）
+
+    Returns:
+        処理された画像データ
+
+    Raises:
+        InvalidImageError: 画像として読み込めない場合
+    """
+    try:
+        img = _decode_avatar(file_content)
+        # 拡張子に応じて保存形式を決定（デフォルトはJPEG）
+        return _encode(img, *SAVE_OPTIONS.get(file_extension.lower(), SAVE_OPTIONS[".jpg"]))
+    except Exception as e:
+        raise InvalidImageError(str(e)) from e
+
+
+def process_avatar_images(
+    file_content: bytes,
+    file_extension: str,
+    sizes: Sequence[int] = AVATAR_VARIANT_SIZES,
+    formats: Optional[Sequence[str]] = None,
+) -> ProcessedAvatar:
+    """
+    アバター画像を1回だけデコードし、アップロード形式の画像とサイズ・形式ごとのバリアントを生成
+
+    バリアントはAVATAR_SIZEに縮小済みの画像からさらに縮小します。元画像より大きいサイズには拡大せず、
+    同じ寸法になるサイズは最初の1つだけを生成します。
+
+    Args:
+        file_content: 画像ファイルの内容
+        file_extension: アップロード形式の画像の保存形式を決める拡張子（未対応の場合はJPEG）
+        sizes: バリアントの最大辺
+        formats: バリアントの形式（省略時は AVAILABLE_VARIANT_FORMATS）
+
+    Returns:
+        処理された画像とバリアント
+
+    Raises:
+        InvalidImageError: 画像として読み込めない場合
+    """
+    try:
+        base = _decode_avatar(file_content)
+        processed = ProcessedAvatar(
+            content=_encode(base, *SAVE_OPTIONS.get(file_extension.lower(), SAVE_OPTIONS[".jpg"]))
+        )
+
+        seen = set()
+        for size in sorted(sizes):
+            img = base
+            if size < max(base.size):
+                img = base.copy()
+                img.thumbnail((size, size), Image.Resampling.LANCZOS)
+            if img.size in seen:
+                continue
+            seen.add(img.size)
+
+            for name in formats or AVAILABLE_VARIANT_FORMATS:
+                _, _, image_format, options = VARIANT_FORMATS[name]
+                processed.variants.append(
+                    ImageVariant(size, img.width, img.height, name, _encode(img, image_format, options))
+                )
+        return processed
+    except Exception as e:
+        raise InvalidImageError(str(e)) from e
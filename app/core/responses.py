@@ -0,0 +1,78 @@
+"""
+高速なJSONレスポンス
+
+アプリ全体のデフォルトレスポンスとして、orjsonで直列化する FastJSONResponse を提供します。
+一覧エンドポイント向けの ModelListResponse は、サービス層で検証済みのスキーマを
+response_model で再検証せず、pydantic-core のシリアライザーで直接JSONのバイト列にします。
+"""
+
+import json
+from types import ModuleType
+from typing import Any, Mapping, Optional, Sequence
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjsonがない環境では標準のjsonを使う
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """
+    JSONのバイト列に変換（orjsonがなければ標準のjsonで同じ形式に変換）
+
+    Args:
+        content: jsonable_encoder 済みの値
+
+    Returns:
+        UTF-8のJSON
+    """
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """orjsonで直列化するJSONレスポンス（FastAPIのdefault_response_class用）"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class ModelListResponse(JSONResponse):
+    """
+    検証済みスキーマのリストをそのまま返すJSONレスポンス
+
+    エンドポイントがResponseを返すとFastAPIは response_model による再検証と jsonable_encoder を省略します。
+    各要素はFastAPIと同じ pydantic-core のシリアライザーで変換するため、出力は response_model を通した場合と同じです。
+    """
+
+    def __init__(
+        self,
+        items: Sequence[BaseModel],
+        *,
+        exclude_unset: bool = False,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        background: Optional[BackgroundTask] = None,
+    ):
+        """
+        初期化
+
+        Args:
+            items: サービス層で検証済みのスキーマのリスト
+            exclude_unset: 設定されていないフィールドを除外するか（response_model_exclude_unset と同じ）
+            status_code: ステータスコード
+            headers: 追加のヘッダー（X-Next-Cursor・ETagなど）
+            background: レスポンス送信後に実行するタスク
+        """
+        self.exclude_unset = exclude_unset
+        super().__init__(items, status_code=status_code, headers=headers, background=background)
+
+    def render(self, content: Sequence[BaseModel]) -> bytes:
+        rows = [item.__pydantic_serializer__.to_json(item, exclude_unset=self.exclude_unset) for item in content]
+        return b"[" + b",".join(rows) + b"]"
@@ -5,13 +5,25 @@ This module provides data access layer operations separated by entity type.
 Each module contains CRUD operations for a specific database table.
 """
 
-from .event import EventCRUD
-from .person import PersonCRUD
-from .tag import TagCRUD
+from .event import AsyncEventCRUD, EventCRUD
+from .person import AsyncPersonCRUD, PersonCRUD
+from .search import SearchCRUD
+from .statistics import StatisticsCRUD
+from .storage import AvatarObjectCRUD
+from .tag import AsyncTagCRUD, TagCRUD
+from .timeline import TimelineCRUD
 
 __all__ = [
     # CRUD classes
+    "AvatarObjectCRUD",
     "EventCRUD",
     "PersonCRUD",
+    "SearchCRUD",
+    "StatisticsCRUD",
     "TagCRUD",
+    "TimelineCRUD",
+    # Async CRUD classes
+    "AsyncEventCRUD",
+    "AsyncPersonCRUD",
+    "AsyncTagCRUD",
 ]
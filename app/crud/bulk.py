@@ -0,0 +1,76 @@
+"""
+Bulk write helpers.
+
+This module provides set-based operations shared by the CRUD classes for batch ingest.
+"""
+
+from typing import Any, Iterable, List, Protocol, Sequence, Set, Type, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..models.base import BaseModel as ModelBase
+
+ModelType = TypeVar("ModelType", bound=ModelBase)
+
+
+class SsidModel(Protocol):
+    """ssidカラムを持つモデル"""
+
+    ssid: Any
+
+
+def get_existing_ssids(db: Session, model: Type[SsidModel], ssids: Iterable[str]) -> Set[str]:
+    """
+    登録済みのSSIDを1クエリで取得
+
+    Args:
+        db: データベースセッション
+        model: 対象モデル（ssidカラムを持つこと）
+        ssids: 確認するSSID
+
+    Returns:
+        ssidsのうち既に登録されているもの
+    """
+    ssids = set(ssids)
+    if not ssids:
+        return set()
+    return {ssid for (ssid,) in db.query(model.ssid).filter(model.ssid.in_(ssids)).all()}
+
+
+def bulk_create(db: Session, model: Type[ModelType], objs_in: Sequence[BaseModel]) -> List[ModelType]:
+    """
+    複数のエンティティを1トランザクションで作成
+
+    同じカラム構成の行はflush時に INSERT ... RETURNING 1文にまとめられ、
+    コミット後の再読み込みも IN 句の1クエリで行います。
+    途中で失敗した場合はロールバックし、1件も作成しません。
+
+    Args:
+        db: データベースセッション
+        model: 対象モデル
+        objs_in: 作成データのリスト
+
+    Returns:
+        作成されたエンティティのリスト（入力順）
+
+    Raises:
+        ValueError: 一意制約違反などで作成できなかった場合
+    """
+    if not objs_in:
+        return []
+
+    db_objs = [model(**obj_in.model_dump()) for obj_in in objs_in]
+    db.add_all(db_objs)
+    try:
+        db.flush()
+        ids = [db_obj.id for db_obj in db_objs]
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        raise ValueError(f"Bulk insert failed: {e.orig}") from e
+
+    # コミットで失効した属性をまとめて再読み込み（1件ずつのrefreshを避ける）
+    db.query(model).filter(model.id.in_(ids)).all()
+    return db_objs
@@ -4,13 +4,23 @@ CRUD operations for Event entity.
 This module provides data access layer operations for the event table.
 """
 
+import heapq
 from datetime import date
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
+from ..core.geo import BoundingBox, bounding_boxes_around, haversine_km, split_antimeridian
+from .bulk import bulk_create, get_existing_ssids
+from .geo import within_bounding_boxes
+from .pagination import paginate_by_keyset
+from .relations import with_columns, with_relations
+from .statistics import StatisticsCRUD
+from .streaming import DEFAULT_CHUNK_SIZE, iter_chunks
+from .timeline import overlaps_period
 
 
 class EventCRUD:
@@ -20,17 +30,65 @@ class EventCRUD:
     イベントエンティティの全てのデータアクセス操作を提供します。
     """
 
-    def get(self, db: Session, id: int) -> Optional[models.Event]:
+    def get(self, db: Session, id: int, *, include: Sequence[str] = ()) -> Optional[models.Event]:
         """IDでイベントを取得"""
-        return db.query(models.Event).filter(models.Event.id == id).first()
+        return with_relations(db.query(models.Event), models.Event, include).filter(models.Event.id == id).first()
 
-    def get_by_ssid(self, db: Session, ssid: str) -> Optional[models.Event]:
+    def get_by_ssid(self, db: Session, ssid: str, *, include: Sequence[str] = ()) -> Optional[models.Event]:
         """SSIDでイベントを取得"""
-        return db.query(models.Event).filter(models.Event.ssid == ssid).first()
+        return with_relations(db.query(models.Event), models.Event, include).filter(models.Event.ssid == ssid).first()
 
-    def get_multi(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[models.Event]:
-        """イベント一覧を取得"""
-        return db.query(models.Event).offset(skip).limit(limit).all()
+    def get_multi(
+        self, db: Session, *, skip: int = 0, limit: int = 100, include: Sequence[str] = (), fields: Sequence[str] = ()
+    ) -> List[models.Event]:
+        """イベント一覧を取得（fieldsを指定した場合はその列だけを読み込む）"""
+        query = with_columns(with_relations(db.query(models.Event), models.Event, include), models.Event, fields)
+        return query.order_by(models.Event.start_date, models.Event.id).offset(skip).limit(limit).all()
+
+    def get_multi_by_cursor(
+        self,
+        db: Session,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        include: Sequence[str] = (),
+        fields: Sequence[str] = (),
+    ) -> Tuple[List[models.Event], Optional[str]]:
+        """
+        イベント一覧をキーセットページネーションで取得
+
+        (start_date, id) の順で並べ、ix_event_start_date_id インデックスでシークします。
+
+        Args:
+            db: データベースセッション
+            cursor: 前ページのnext_cursor（最初のページはNone）
+            limit: 取得上限数
+            include: 一括読み込みするリレーション名
+            fields: 読み込む列名（空の場合は全列。並び順の列は常に読み込む）
+
+        Returns:
+            (イベントのリスト, 次ページのカーソル)
+
+        Raises:
+            ValueError: カーソルが不正な場合
+        """
+        key_columns = [models.Event.start_date, models.Event.id]
+        return paginate_by_keyset(
+            with_columns(
+                with_relations(db.query(models.Event), models.Event, include),
+                models.Event,
+                fields,
+                required=key_columns,
+            ),
+            key_columns,
+            cursor=cursor,
+            limit=limit,
+            parsers=[date.fromisoformat, int],
+        )
+
+    def iter_chunks(self, db: Session, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Sequence[models.Event]]:
+        """イベント全件をチャンク単位で取得（サーバーサイドカーソル）"""
+        return iter_chunks(db, models.Event, chunk_size=chunk_size)
 
     def create(self, db: Session, *, obj_in: schemas.EventCreate) -> models.Event:
         """イベントを作成"""
@@ -40,6 +98,14 @@ class EventCRUD:
         db.refresh(db_event)
         return db_event
 
+    def create_multi(self, db: Session, *, objs_in: List[schemas.EventCreate]) -> List[models.Event]:
+        """イベントを一括作成（1トランザクション）"""
+        return bulk_create(db, models.Event, objs_in)
+
+    def get_existing_ssids(self, db: Session, ssids: Iterable[str]) -> Set[str]:
+        """登録済みのSSIDを取得"""
+        return get_existing_ssids(db, models.Event, ssids)
+
     def update(self, db: Session, *, id: int, obj_in: schemas.EventUpdate) -> Optional[models.Event]:
         """イベントを更新"""
         db_event = self.get(db, id)
@@ -78,6 +144,8 @@ class EventCRUD:
         """
         日付範囲でイベントを取得
 
+        複数日にわたるイベントも、期間と重なれば対象になります（PostgreSQLではGiSTインデックスを使用）。
+
         Args:
             db: データベースセッション
             start_date: 開始日
@@ -86,14 +154,12 @@ class EventCRUD:
             limit: 取得上限数
 
         Returns:
-            イベントのリスト
+            期間と重なるイベントのリスト（開始日順）
         """
         return (
             db.query(models.Event)
-            .filter(
-                models.Event.start_date >= start_date,
-                models.Event.start_date <= end_date,
-            )
+            .filter(overlaps_period(db, start_date, end_date))
+            .order_by(models.Event.start_date, models.Event.id)
             .offset(skip)
             .limit(limit)
             .all()
@@ -141,30 +207,87 @@ class EventCRUD:
             .all()
         )
 
-    def count_events_by_year(self, db: Session, year: int) -> int:
+    def get_events_in_bbox(self, db: Session, box: BoundingBox, limit: int = 100) -> List[models.Event]:
         """
-        指定年のイベント数を取得
+        矩形内のイベントを取得
 
         Args:
             db: データベースセッション
-            year: 年
+            box: 矩形（min_lon > max_lon の場合は日付変更線をまたぐ矩形として扱う）
+            limit: 取得上限数
 
         Returns:
-            イベント数
+            イベントのリスト（開始日順）
         """
         return (
             db.query(models.Event)
-            .filter(
-                models.Event.start_date >= date(year, 1, 1),
-                models.Event.start_date <= date(year, 12, 31),
+            .filter(within_bounding_boxes(split_antimeridian(box)))
+            .order_by(models.Event.start_date, models.Event.id)
+            .limit(limit)
+            .all()
+        )
+
+    def get_events_nearby(
+        self, db: Session, latitude: float, longitude: float, radius_km: float, limit: int = 100
+    ) -> List[Tuple[models.Event, float]]:
+        """
+        中心から半径 radius_km 以内のイベントを近い順に取得
+
+        円を含む矩形でインデックスを使って候補を絞り込み、正確な距離の判定と並べ替えは候補に対してのみ行います。
+        候補はID・緯度・経度だけを取得し、イベントの行は上位 limit 件分だけ読み込みます。
+
+        Args:
+            db: データベースセッション
+            latitude: 中心の緯度
+            longitude: 中心の経度
+            radius_km: 半径（km）
+            limit: 取得上限数
+
+        Returns:
+            (イベント, 距離km) のリスト（距離順）
+        """
+        if limit < 1:
+            return []
+
+        candidates = db.execute(
+            select(models.Event.id, models.Event.latitude, models.Event.longitude).where(
+                within_bounding_boxes(bounding_boxes_around(latitude, longitude, radius_km))
             )
-            .count()
         )
+        distances = []
+        for event_id, event_latitude, event_longitude in candidates:
+            distance = haversine_km(latitude, longitude, float(event_latitude), float(event_longitude))
+            if distance <= radius_km:
+                distances.append((distance, event_id))
+        nearest = heapq.nsmallest(limit, distances)
+        if not nearest:
+            return []
+
+        events = {
+            event.id: event
+            for event in db.query(models.Event).filter(models.Event.id.in_([event_id for _, event_id in nearest]))
+        }
+        return [(events[event_id], distance) for distance, event_id in nearest if event_id in events]
+
+    def count_events_by_year(self, db: Session, year: int) -> int:
+        """
+        指定年のイベント数を取得
+
+        Args:
+            db: データベースセッション
+            year: 年
+
+        Returns:
+            イベント数（集計カウンターから取得）
+        """
+        return StatisticsCRUD().get_count(db, "event_year", str(year))
 
     def get_events_by_person(self, db: Session, person_id: int, skip: int = 0, limit: int = 100) -> List[models.Event]:
         """
         人物に関連するイベントを取得
 
+        event_personを ix_event_person_person_id_event_id でシークし、開始日順に返します。
+
         Args:
             db: データベースセッション
             person_id: 人物ID
@@ -174,11 +297,11 @@ class EventCRUD:
         Returns:
             イベントのリスト
         """
-        # 将来的に人物-イベントの関連テーブルが追加された場合の実装
-        # 現在は基本的な実装
         return (
             db.query(models.Event)
-            .filter(models.Event.description.ilike(f"%{person_id}%"))
+            .join(models.EventPerson, models.EventPerson.event_id == models.Event.id)
+            .filter(models.EventPerson.person_id == person_id)
+            .order_by(models.Event.start_date, models.Event.id)
             .offset(skip)
             .limit(limit)
             .all()
@@ -188,6 +311,8 @@ class EventCRUD:
         """
         タグに関連するイベントを取得
 
+        event_tagを ix_event_tag_tag_id_event_id でシークし、開始日順に返します。
+
         Args:
             db: データベースセッション
             tag_id: タグID
@@ -197,10 +322,14 @@ class EventCRUD:
         Returns:
             イベントのリスト
         """
-        # 将来的にイベント-タグの関連テーブルが追加された場合の実装
-        # 現在は基本的な実装
         return (
-            db.query(models.Event).filter(models.Event.description.ilike(f"%{tag_id}%")).offset(skip).limit(limit).all()
+            db.query(models.Event)
+            .join(models.EventTag, models.EventTag.event_id == models.Event.id)
+            .filter(models.EventTag.tag_id == tag_id)
+            .order_by(models.Event.start_date, models.Event.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
         )
 
     def get_events_statistics(self, db: Session) -> dict:
@@ -211,21 +340,68 @@ class EventCRUD:
             db: データベースセッション
 
         Returns:
-            統計情報の辞書
+            統計情報の辞書（集計カウンターから取得、年別統計は年順）
         """
-        total_events = db.query(models.Event).count()
-
-        # 年別統計
-        yearly_stats = (
-            db.query(
-                func.extract("year", models.Event.start_date).label("year"),
-                func.count(models.Event.id).label("count"),
-            )
-            .group_by("year")
-            .all()
-        )
+        statistics = StatisticsCRUD()
+        yearly_counts = statistics.get_counts(db, "event_year")
 
         return {
-            "total_events": total_events,
-            "yearly_statistics": [{"year": int(stat.year), "count": stat.count} for stat in yearly_stats],
+            "total_events": statistics.get_count(db, "event"),
+            "yearly_statistics": [
+                {"year": year, "count": yearly_counts[str(year)]} for year in sorted(map(int, yearly_counts))
+            ],
         }
+
+
+class AsyncEventCRUD:
+    """
+    イベントCRUDクラス（非同期版）
+
+    EventCRUDと同じ操作をAsyncSession上で提供します。
+    async defのルーターからイベントループをブロックせずに利用できます。
+    """
+
+    async def get(self, db: AsyncSession, id: int) -> Optional[models.Event]:
+        """IDでイベントを取得"""
+        return await db.get(models.Event, id)
+
+    async def get_by_ssid(self, db: AsyncSession, ssid: str) -> Optional[models.Event]:
+        """SSIDでイベントを取得"""
+        result = await db.execute(select(models.Event).where(models.Event.ssid == ssid))
+        return result.scalars().first()
+
+    async def get_multi(self, db: AsyncSession, *, skip: int = 0, limit: int = 100) -> List[models.Event]:
+        """イベント一覧を取得"""
+        result = await db.execute(select(models.Event).offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def create(self, db: AsyncSession, *, obj_in: schemas.EventCreate) -> models.Event:
+        """イベントを作成"""
+        db_event = models.Event(**obj_in.model_dump())
+        db.add(db_event)
+        await db.commit()
+        await db.refresh(db_event)
+        return db_event
+
+    async def update(self, db: AsyncSession, *, id: int, obj_in: schemas.EventUpdate) -> Optional[models.Event]:
+        """イベントを更新"""
+        db_event = await self.get(db, id)
+        if db_event:
+            # None値を除外して更新対象フィールドのみを抽出
+            filtered_data = {field: value for field, value in obj_in.model_dump().items() if value is not None}
+
+            for field, value in filtered_data.items():
+                setattr(db_event, field, value)
+
+            await db.commit()
+            await db.refresh(db_event)
+        return db_event
+
+    async def remove(self, db: AsyncSession, *, id: int) -> bool:
+        """イベントを削除"""
+        db_event = await self.get(db, id)
+        if db_event:
+            await db.delete(db_event)
+            await db.commit()
+            return True
+        return False
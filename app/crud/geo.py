@@ -0,0 +1,38 @@
+"""
+Geospatial query helpers.
+
+This module turns bounding boxes into conditions on the indexed event
+geo_cell column (see app/core/geo.py). The cell ranges narrow the scan
+through the index and the latitude/longitude comparison removes the
+remainder of the edge cells, so the same SQL runs on PostgreSQL and SQLite.
+"""
+
+from typing import Sequence
+
+from sqlalchemy import and_, or_
+
+from .. import models
+from ..core.geo import BoundingBox, cell_ranges
+
+
+def within_bounding_boxes(boxes: Sequence[BoundingBox]):
+    """
+    いずれかの矩形に含まれる出来事の条件式を生成
+
+    Args:
+        boxes: 矩形のリスト（経度は min_lon <= max_lon であること）
+
+    Returns:
+        filterに渡す条件式
+    """
+    conditions = []
+    for box in boxes:
+        cells = [models.Event.geo_cell.between(first, last) for first, last in cell_ranges(box)]
+        conditions.append(
+            and_(
+                or_(*cells),
+                models.Event.latitude.between(box.min_lat, box.max_lat),
+                models.Event.longitude.between(box.min_lon, box.max_lon),
+            )
+        )
+    return or_(*conditions)
@@ -0,0 +1,89 @@
+"""
+Keyset (cursor) pagination helpers.
+
+This module provides opaque cursor encoding and keyset filtering used by
+the CRUD classes. Unlike OFFSET, a keyset query seeks directly to the
+last seen key through the index, so deep pages cost the same as the first.
+"""
+
+import base64
+import json
+from datetime import date
+from typing import Any, List, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+ModelType = TypeVar("ModelType")
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """キー値のタプルを不透明なカーソル文字列にエンコード"""
+    payload = [value.isoformat() if isinstance(value, date) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    カーソル文字列をキー値のリストにデコード
+
+    Raises:
+        ValueError: カーソルが不正な場合
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def paginate_by_keyset(
+    query: Query,
+    key_columns: Sequence[Any],
+    *,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    parsers: Optional[Sequence[Any]] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    クエリにキーセットページネーションを適用
+
+    Args:
+        query: ベースクエリ（ORDER BY / LIMITは未指定のもの）
+        key_columns: 並び順を決めるユニークなキー列（最後の列は主キー）
+        cursor: 前ページのnext_cursor（最初のページはNone）
+        limit: 取得上限数
+        parsers: カーソルの各値を列の型に戻す関数（Noneの場合はそのまま使用）
+
+    Returns:
+        (取得結果のリスト, 次ページのカーソル。最終ページの場合はNone)
+
+    Raises:
+        ValueError: カーソルが不正な場合
+    """
+    if cursor:
+        values = decode_cursor(cursor, len(key_columns))
+        if parsers:
+            try:
+                values = [parse(value) for parse, value in zip(parsers, values)]
+            except (TypeError, ValueError):
+                raise ValueError("Invalid cursor")
+        query = query.filter(tuple_(*key_columns) > tuple_(*values))
+
+    if limit < 1:
+        return [], None
+
+    # 次ページの有無を判定するため1件多く取得する
+    rows = query.order_by(*key_columns).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([getattr(last, column.key) for column in key_columns])
+    return rows, next_cursor
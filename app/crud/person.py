@@ -4,11 +4,24 @@ CRUD operations for Person entity.
 This module provides data access layer operations for the person table.
 """
 
-from typing import List, Optional
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
 
 from .. import models, schemas
+from .bulk import bulk_create, get_existing_ssids
+from .pagination import paginate_by_keyset
+from .relations import with_columns, with_relations
+from .streaming import DEFAULT_CHUNK_SIZE, iter_chunks
+
+# 並べ替えキーごとの (キーセットの列, カーソルの各値のパーサー)。最後の列は主キー
+PERSON_SORT_KEYS: Dict[str, Tuple[Sequence[Any], Sequence[Callable[[Any], Any]]]] = {
+    "id": ((models.Person.id,), (int,)),
+    "birth_date": ((models.Person.birth_date, models.Person.id), (date.fromisoformat, int)),
+}
 
 
 class PersonCRUD:
@@ -18,17 +31,122 @@ class PersonCRUD:
     人物エンティティの全てのデータアクセス操作を提供します。
     """
 
-    def get(self, db: Session, id: int) -> Optional[models.Person]:
+    def build_query(
+        self, db: Session, filters: Optional[schemas.PersonFilter] = None, *, include: Sequence[str] = ()
+    ) -> "Query[models.Person]":
+        """
+        絞り込み条件をWHERE句にしたクエリを生成（ORDER BY / LIMITは未指定）
+
+        生年はbirth_dateの範囲条件にするため、ix_person_birth_date_id を使えます。
+        出生国は lower(born_country) で比較するため、ix_person_born_country_lower_id を使えます。
+
+        Args:
+            db: データベースセッション
+            filters: 絞り込み条件（Noneの場合は全件）
+            include: 一括読み込みするリレーション名
+
+        Returns:
+            人物のクエリ
+        """
+        query = with_relations(db.query(models.Person), models.Person, include)
+        if filters is None:
+            return query
+
+        if filters.birth_year is not None:
+            query = query.filter(
+                models.Person.birth_date >= date(filters.birth_year, 1, 1),
+                models.Person.birth_date <= date(filters.birth_year, 12, 31),
+            )
+        if filters.birth_year_from is not None:
+            query = query.filter(models.Person.birth_date >= date(filters.birth_year_from, 1, 1))
+        if filters.birth_year_to is not None:
+            query = query.filter(models.Person.birth_date <= date(filters.birth_year_to, 12, 31))
+        if filters.born_country:
+            query = query.filter(func.lower(models.Person.born_country) == filters.born_country.lower())
+        return query
+
+    @staticmethod
+    def sort_key(filters: Optional[schemas.PersonFilter] = None) -> Tuple[Sequence[Any], Sequence[Callable]]:
+        """
+        並べ替えキーの列とカーソルのパーサーを取得
+
+        Raises:
+            ValueError: 並べ替えキーが不正な場合
+        """
+        sort = filters.sort if filters is not None else "id"
+        if sort not in PERSON_SORT_KEYS:
+            raise ValueError(f"Invalid sort '{sort}'. Allowed values: {', '.join(PERSON_SORT_KEYS)}")
+        return PERSON_SORT_KEYS[sort]
+
+    def get(self, db: Session, id: int, *, include: Sequence[str] = ()) -> Optional[models.Person]:
         """IDで人物を取得"""
-        return db.query(models.Person).filter(models.Person.id == id).first()
+        return with_relations(db.query(models.Person), models.Person, include).filter(models.Person.id == id).first()
 
-    def get_by_ssid(self, db: Session, ssid: str) -> Optional[models.Person]:
+    def get_by_ssid(self, db: Session, ssid: str, *, include: Sequence[str] = ()) -> Optional[models.Person]:
         """SSIDで人物を取得"""
-        return db.query(models.Person).filter(models.Person.ssid == ssid).first()
+        return (
+            with_relations(db.query(models.Person), models.Person, include).filter(models.Person.ssid == ssid).first()
+        )
 
-    def get_multi(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[models.Person]:
-        """人物一覧を取得"""
-        return db.query(models.Person).offset(skip).limit(limit).all()
+    def get_multi(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        include: Sequence[str] = (),
+        filters: Optional[schemas.PersonFilter] = None,
+        fields: Sequence[str] = (),
+    ) -> List[models.Person]:
+        """
+        人物一覧を取得（fieldsを指定した場合はその列だけを読み込む）
+
+        Raises:
+            ValueError: 並べ替えキーが不正な場合
+        """
+        key_columns, _ = self.sort_key(filters)
+        query = with_columns(self.build_query(db, filters, include=include), models.Person, fields)
+        return query.order_by(*key_columns).offset(skip).limit(limit).all()
+
+    def get_multi_by_cursor(
+        self,
+        db: Session,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        include: Sequence[str] = (),
+        filters: Optional[schemas.PersonFilter] = None,
+        fields: Sequence[str] = (),
+    ) -> Tuple[List[models.Person], Optional[str]]:
+        """
+        人物一覧をキーセットページネーションで取得
+
+        Args:
+            db: データベースセッション
+            cursor: 前ページのnext_cursor（最初のページはNone）
+            limit: 取得上限数
+            include: 一括読み込みするリレーション名
+            filters: 絞り込み・並べ替え条件（カーソルは同じ条件で使うこと）
+            fields: 読み込む列名（空の場合は全列。並び順の列は常に読み込む）
+
+        Returns:
+            (人物のリスト, 次ページのカーソル)
+
+        Raises:
+            ValueError: カーソルまたは並べ替えキーが不正な場合
+        """
+        key_columns, parsers = self.sort_key(filters)
+        return paginate_by_keyset(
+            with_columns(self.build_query(db, filters, include=include), models.Person, fields, required=key_columns),
+            key_columns,
+            cursor=cursor,
+            limit=limit,
+            parsers=parsers,
+        )
+
+    def iter_chunks(self, db: Session, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Sequence[models.Person]]:
+        """人物全件をチャンク単位で取得（サーバーサイドカーソル）"""
+        return iter_chunks(db, models.Person, chunk_size=chunk_size)
 
     def create(self, db: Session, *, obj_in: schemas.PersonCreate) -> models.Person:
         """人物を作成"""
@@ -38,6 +156,14 @@ class PersonCRUD:
         db.refresh(db_person)
         return db_person
 
+    def create_multi(self, db: Session, *, objs_in: List[schemas.PersonCreate]) -> List[models.Person]:
+        """人物を一括作成（1トランザクション）"""
+        return bulk_create(db, models.Person, objs_in)
+
+    def get_existing_ssids(self, db: Session, ssids: Iterable[str]) -> Set[str]:
+        """登録済みのSSIDを取得"""
+        return get_existing_ssids(db, models.Person, ssids)
+
     def update(self, db: Session, *, id: int, obj_in: schemas.PersonUpdate) -> Optional[models.Person]:
         """人物を更新"""
         db_person = self.get(db, id)
@@ -63,3 +189,57 @@ class PersonCRUD:
             db.commit()
             return True
         return False
+
+
+class AsyncPersonCRUD:
+    """
+    人物CRUDクラス（非同期版）
+
+    PersonCRUDと同じ操作をAsyncSession上で提供します。
+    async defのルーターからイベントループをブロックせずに利用できます。
+    """
+
+    async def get(self, db: AsyncSession, id: int) -> Optional[models.Person]:
+        """IDで人物を取得"""
+        return await db.get(models.Person, id)
+
+    async def get_by_ssid(self, db: AsyncSession, ssid: str) -> Optional[models.Person]:
+        """SSIDで人物を取得"""
+        result = await db.execute(select(models.Person).where(models.Person.ssid == ssid))
+        return result.scalars().first()
+
+    async def get_multi(self, db: AsyncSession, *, skip: int = 0, limit: int = 100) -> List[models.Person]:
+        """人物一覧を取得"""
+        result = await db.execute(select(models.Person).offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def create(self, db: AsyncSession, *, obj_in: schemas.PersonCreate) -> models.Person:
+        """人物を作成"""
+        db_person = models.Person(**obj_in.model_dump())
+        db.add(db_person)
+        await db.commit()
+        await db.refresh(db_person)
+        return db_person
+
+    async def update(self, db: AsyncSession, *, id: int, obj_in: schemas.PersonUpdate) -> Optional[models.Person]:
+        """人物を更新"""
+        db_person = await self.get(db, id)
+        if db_person:
+            # None値を除外して更新対象フィールドのみを抽出
+            filtered_data = {field: value for field, value in obj_in.model_dump().items() if value is not None}
+
+            for field, value in filtered_data.items():
+                setattr(db_person, field, value)
+
+            await db.commit()
+            await db.refresh(db_person)
+        return db_person
+
+    async def remove(self, db: AsyncSession, *, id: int) -> bool:
+        """人物を削除"""
+        db_person = await self.get(db, id)
+        if db_person:
+            await db.delete(db_person)
+            await db.commit()
+            return True
+        return False
@@ -0,0 +1,55 @@
+"""
+Relationship eager-loading helpers.
+
+This module resolves the relationships requested with ``include`` into
+``selectinload`` options. Each requested relationship is loaded for the
+whole result set with one additional ``SELECT ... WHERE id IN (...)``, so a
+page costs a constant number of queries instead of one per row. Sparse
+fieldsets requested with ``fields`` become ``load_only`` options so that
+unrequested columns are never read from the database.
+"""
+
+from typing import Any, Sequence, TypeVar
+
+from sqlalchemy.orm import Query, load_only, selectinload
+
+ModelType = TypeVar("ModelType")
+
+
+def with_relations(query: "Query[ModelType]", model: type, include: Sequence[str] = ()) -> "Query[ModelType]":
+    """
+    指定したリレーションをselectinloadで一括読み込みするクエリを返す
+
+    Args:
+        query: 対象モデルのクエリ
+        model: 対象モデル
+        include: 読み込むリレーション名（検証済みであること）
+
+    Returns:
+        読み込みオプションを付けたクエリ（includeが空ならそのまま）
+    """
+    if not include:
+        return query
+    return query.options(*(selectinload(getattr(model, name)) for name in include))
+
+
+def with_columns(
+    query: "Query[ModelType]", model: type, fields: Sequence[str] = (), *, required: Sequence[Any] = ()
+) -> "Query[ModelType]":
+    """
+    指定した列だけをload_onlyで読み込むクエリを返す
+
+    Args:
+        query: 対象モデルのクエリ
+        model: 対象モデル
+        fields: 読み込む列名（検証済みであること）
+        required: 必ず読み込む列（キーセットページネーションの並び順の列など）
+
+    Returns:
+        読み込みオプションを付けたクエリ（fieldsが空なら全列を読み込むのでそのまま）
+    """
+    if not fields:
+        return query
+    columns = {name: getattr(model, name) for name in fields}
+    columns.update((column.key, column) for column in required)
+    return query.options(load_only(*columns.values()))
@@ -0,0 +1,172 @@
+"""
+CRUD operations for keyword search.
+
+This module provides ranked keyword search across the person, event and tag tables.
+"""
+
+from typing import List, Tuple, Type, TypeVar
+
+from sqlalchemy import case, func, or_, text
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..models.search import SEARCH_FTS_TABLE
+
+ModelType = TypeVar("ModelType", models.Person, models.Event, models.Tag)
+
+# FTS5のtrigramトークナイザは3文字未満の語をMATCHできない
+FTS_MIN_TERM_LENGTH = 3
+
+
+def _escape_like(term: str) -> str:
+    """LIKEのワイルドカードをエスケープ"""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _match_rank(column, term: str, weight: int):
+    """
+    カラムの一致度をスコア化するCASE式を生成
+
+    完全一致 > 前方一致 > 部分一致 の順にスコアが高くなります。
+    """
+    escaped = _escape_like(term)
+    lowered = func.lower(column)
+    return case(
+        (lowered == term, weight + 2),
+        (lowered.like(f"{escaped}%", escape="\\"), weight + 1),
+        (lowered.like(f"%{escaped}%", escape="\\"), weight),
+        else_=0,
+    )
+
+
+class SearchCRUD:
+    """
+    キーワード検索CRUDクラス
+
+    PostgreSQLでは pg_trgm のGINインデックスが効く ILIKE '%語%' で絞り込み、
+    一致箇所に応じたスコアで並べ替えます。
+    SQLiteでは3文字以上の語をFTS5（search_fts）で検索し、bm25でランク付けします。
+    """
+
+    def search_persons(self, db: Session, term: str, *, limit: int = 20) -> List[Tuple[models.Person, float]]:
+        """
+        人物をキーワード検索
+
+        Args:
+            db: データベースセッション
+            term: 検索語
+            limit: 取得上限数
+
+        Returns:
+            (人物, スコア) のリスト（スコアの降順）
+        """
+        term = term.strip().lower()
+        if self._use_fts(db, term):
+            return self._search_fts(db, models.Person, "person", term, limit)
+
+        return self._search_like(
+            db,
+            models.Person,
+            models.Person.search_name.ilike(f"%{_escape_like(term)}%", escape="\\"),
+            [
+                _match_rank(models.Person.display_name, term, 2),
+                _match_rank(models.Person.full_name, term, 2),
+            ],
+            limit,
+        )
+
+    def search_events(self, db: Session, term: str, *, limit: int = 20) -> List[Tuple[models.Event, float]]:
+        """
+        イベントをタイトル・説明でキーワード検索
+
+        Args:
+            db: データベースセッション
+            term: 検索語
+            limit: 取得上限数
+
+        Returns:
+            (イベント, スコア) のリスト（スコアの降順）
+        """
+        term = term.strip().lower()
+        if self._use_fts(db, term):
+            return self._search_fts(db, models.Event, "event", term, limit)
+
+        pattern = f"%{_escape_like(term)}%"
+        return self._search_like(
+            db,
+            models.Event,
+            or_(
+                models.Event.title.ilike(pattern, escape="\\"),
+                models.Event.description.ilike(pattern, escape="\\"),
+            ),
+            [_match_rank(models.Event.title, term, 2)],
+            limit,
+        )
+
+    def search_tags(self, db: Session, term: str, *, limit: int = 20) -> List[Tuple[models.Tag, float]]:
+        """
+        タグを名前・説明でキーワード検索
+
+        Args:
+            db: データベースセッション
+            term: 検索語
+            limit: 取得上限数
+
+        Returns:
+            (タグ, スコア) のリスト（スコアの降順）
+        """
+        term = term.strip().lower()
+        if self._use_fts(db, term):
+            return self._search_fts(db, models.Tag, "tag", term, limit)
+
+        pattern = f"%{_escape_like(term)}%"
+        return self._search_like(
+            db,
+            models.Tag,
+            or_(
+                models.Tag.name.ilike(pattern, escape="\\"),
+                models.Tag.description.ilike(pattern, escape="\\"),
+            ),
+            [_match_rank(models.Tag.name, term, 2)],
+            limit,
+        )
+
+    def _use_fts(self, db: Session, term: str) -> bool:
+        """FTS5で検索するかどうか"""
+        return db.get_bind().dialect.name == "sqlite" and len(term) >= FTS_MIN_TERM_LENGTH
+
+    def _search_like(
+        self, db: Session, model: Type[ModelType], condition, ranks: list, limit: int
+    ) -> List[Tuple[ModelType, float]]:
+        """ILIKEで絞り込み、スコア順に取得（部分一致のみの行はスコア1）"""
+        # SQLiteには greatest がないが、複数引数のmaxが同じ意味になる
+        greatest = func.max if db.get_bind().dialect.name == "sqlite" else func.greatest
+        rank = greatest(*ranks, 1)
+
+        rows = db.query(model, rank.label("rank")).filter(condition).order_by(rank.desc(), model.id).limit(limit).all()
+        return [(row[0], float(row[1])) for row in rows]
+
+    def _search_fts(
+        self, db: Session, model: Type[ModelType], entity_type: str, term: str, limit: int
+    ) -> List[Tuple[ModelType, float]]:
+        """FTS5テーブルをbm25順に検索し、エンティティを取得"""
+        # 語をフレーズとして扱い、FTS5のクエリ構文として解釈させない
+        phrase = '"' + term.replace('"', '""') + '"'
+        rows = db.execute(
+            text(
+                f"SELECT entity_id, bm25({SEARCH_FTS_TABLE}) AS score FROM {SEARCH_FTS_TABLE} "
+                f"WHERE {SEARCH_FTS_TABLE} MATCH :phrase AND entity_type = :entity_type "
+                "ORDER BY score LIMIT :limit"
+            ),
+            {"phrase": phrase, "entity_type": entity_type, "limit": limit},
+        ).all()
+        if not rows:
+            return []
+
+        # bm25は小さいほど関連度が高いため、符号を反転してスコアとする
+        scores = {int(entity_id): -float(score) for entity_id, score in rows}
+        entities = db.query(model).filter(model.id.in_(scores)).all()
+        return sorted(((entity, scores[int(entity.id)]) for entity in entities), key=lambda pair: pair[1], reverse=True)
+
+
+search_crud = SearchCRUD()
@@ -0,0 +1,67 @@
+"""
+CRUD operations for aggregate statistics.
+
+This module reads the stat_counter summary table. The counters are kept
+up to date by the session hooks in app/models/statistics.py, so every read
+here is a primary-key lookup (or a scan of one small scope) instead of a
+count over the entity tables.
+"""
+
+from typing import Dict
+
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..models.statistics import TOTAL_KEY, rebuild_counters
+
+
+class StatisticsCRUD:
+    """
+    集計カウンターCRUDクラス
+
+    スコープ（person / person_country / event / event_year / tag / user / user_role / user_active）
+    ごとのカウンターを提供します。
+    """
+
+    def get_count(self, db: Session, scope: str, key: str = TOTAL_KEY) -> int:
+        """
+        カウンターの値を取得
+
+        Args:
+            db: データベースセッション
+            scope: スコープ
+            key: キー（省略時は総数）
+
+        Returns:
+            件数（カウンターがない場合は0）
+        """
+        counter = db.get(models.StatCounter, (scope, key))
+        return int(counter.count) if counter is not None else 0
+
+    def get_counts(self, db: Session, scope: str) -> Dict[str, int]:
+        """
+        スコープ内の全キーのカウンターを取得
+
+        Args:
+            db: データベースセッション
+            scope: スコープ
+
+        Returns:
+            キーごとの件数（0件のキーは含まない、キー順）
+        """
+        counters = (
+            db.query(models.StatCounter)
+            .filter(models.StatCounter.scope == scope, models.StatCounter.count > 0)
+            .order_by(models.StatCounter.key)
+            .all()
+        )
+        return {str(counter.key): int(counter.count) for counter in counters}
+
+    def rebuild(self, db: Session) -> None:
+        """全カウンターを元テーブルから再集計してコミット"""
+        rebuild_counters(db)
+        db.commit()
+
+
+# シングルトンインスタンス
+statistics_crud = StatisticsCRUD()
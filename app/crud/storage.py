@@ -0,0 +1,123 @@
+"""
+CRUD operations for avatar object references.
+
+Content-addressed avatars share one S3 object between every upload of the
+same image. Each upload gets its own row in avatar_upload, and the object is
+only removed from S3 when the last of those rows is released. Releasing is
+by upload id, so a retried or repeated delete can only ever drop the
+caller's own reference.
+"""
+
+import uuid
+from typing import Optional, Tuple, cast
+
+from sqlalchemy import CursorResult, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..models.base import utc_now
+
+
+class AvatarObjectCRUD:
+    """
+    アバター画像の参照CRUDクラス
+
+    同じキーへの acquire と release は avatar_object の行ロックで直列化されます。
+    acquire は参照を追加してコミットします。release は行ロックを取ったまま参照を削除し、
+    呼び出し側がS3の削除を終えてからコミットします（その間、同じキーへの acquire は待たされます）。
+    """
+
+    def get_upload(self, db: Session, upload_id: str) -> Optional[models.AvatarUpload]:
+        """アップロードの参照を取得"""
+        return db.get(models.AvatarUpload, upload_id)
+
+    def get_ref_count(self, db: Session, key: str) -> int:
+        """
+        参照数を取得
+
+        Args:
+            db: データベースセッション
+            key: S3オブジェクトキー
+
+        Returns:
+            参照しているアップロードの数
+        """
+        count = db.scalar(select(func.count()).select_from(models.AvatarUpload).where(models.AvatarUpload.key == key))
+        return count or 0
+
+    def is_tracked(self, db: Session, key: str) -> bool:
+        """キーの参照が記録されているか（ハッシュ化以前のキーなどはFalse）"""
+        return db.get(models.AvatarObject, key) is not None
+
+    def acquire(self, db: Session, key: str) -> Tuple[str, int]:
+        """
+        アップロードの参照を追加してコミット
+
+        Args:
+            db: データベースセッション
+            key: S3オブジェクトキー
+
+        Returns:
+            (アップロードID, 追加後の参照数)。参照数が1ならこのアップロードが最初の参照
+        """
+        self._lock_object(db, key)
+        upload_id = str(uuid.uuid4())
+        db.add(models.AvatarUpload(id=upload_id, key=key))
+        db.flush()
+        ref_count = self.get_ref_count(db, key)
+        db.commit()
+        return upload_id, ref_count
+
+    def release(self, db: Session, upload_id: str) -> Optional[Tuple[str, int]]:
+        """
+        アップロードの参照を削除（最後の参照であればキーの記録も削除）
+
+        すでに解放された参照に対してはNoneを返すため、同じアップロードIDで何度呼び出しても
+        他のアップロードの参照は減りません。行ロックはコミットまで保持されます。
+        残りの参照数が0の場合はS3のオブジェクトを削除してからコミットし、削除に失敗した場合はロールバックしてください。
+
+        Args:
+            db: データベースセッション
+            upload_id: アップロードID
+
+        Returns:
+            (S3オブジェクトキー, 残りの参照数)、参照が存在しない場合はNone
+        """
+        key = db.scalar(select(models.AvatarUpload.key).where(models.AvatarUpload.id == upload_id))
+        if key is None:
+            return None
+
+        db.execute(select(models.AvatarObject.key).where(models.AvatarObject.key == key).with_for_update())
+        # ロックを待つ間に同じ参照が解放されていれば何もしない
+        result = cast(CursorResult, db.execute(delete(models.AvatarUpload).where(models.AvatarUpload.id == upload_id)))
+        if result.rowcount == 0:
+            return None
+
+        ref_count = self.get_ref_count(db, key)
+        if ref_count == 0:
+            db.execute(delete(models.AvatarObject).where(models.AvatarObject.key == key))
+        return key, ref_count
+
+    def _lock_object(self, db: Session, key: str) -> None:
+        """キーの記録を作成（または更新）して行ロックを取得"""
+        now = utc_now()
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+            stmt = insert(models.AvatarObject).values(key=key, created_at=now, updated_at=now)
+            stmt = stmt.on_conflict_do_update(index_elements=[models.AvatarObject.key], set_={"updated_at": now})
+            db.execute(stmt)
+            return
+
+        obj = db.get(models.AvatarObject, key, with_for_update=True)
+        if obj is None:
+            db.add(models.AvatarObject(key=key))
+            db.flush()
+        else:
+            db.execute(update(models.AvatarObject).where(models.AvatarObject.key == key).values(updated_at=now))
+
+
+# シングルトンインスタンス
+avatar_object_crud = AvatarObjectCRUD()
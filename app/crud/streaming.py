@@ -0,0 +1,38 @@
+"""
+Streaming read helpers.
+
+This module provides chunked full-table reads backed by server-side cursors.
+"""
+
+from typing import Iterator, Sequence, Type, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..models.base import BaseModel
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+# 1チャンク（1フェッチ）あたりの行数
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def iter_chunks(
+    db: Session, model: Type[ModelType], *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Sequence[ModelType]]:
+    """
+    テーブル全体をid順にチャンク単位で取得
+
+    yield_per によりサーバーサイドカーソル（stream_results）で読み出すため、
+    テーブルの件数に関わらずメモリ上に保持するのは1チャンク分だけです。
+
+    Args:
+        db: データベースセッション
+        model: 対象モデル
+        chunk_size: 1チャンクあたりの行数
+
+    Yields:
+        エンティティのリスト（最大chunk_size件）
+    """
+    stmt = select(model).order_by(model.id).execution_options(yield_per=chunk_size)
+    yield from db.execute(stmt).scalars().partitions()
@@ -4,11 +4,16 @@ CRUD operations for Tag entity.
 This module provides data access layer operations for the tag table.
 """
 
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence, Tuple
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
+from .pagination import paginate_by_keyset
+from .relations import with_relations
+from .streaming import DEFAULT_CHUNK_SIZE, iter_chunks
 
 
 class TagCRUD:
@@ -18,17 +23,55 @@ class TagCRUD:
     タグエンティティの全てのデータアクセス操作を提供します。
     """
 
-    def get(self, db: Session, id: int) -> Optional[models.Tag]:
+    def get(self, db: Session, id: int, *, include: Sequence[str] = ()) -> Optional[models.Tag]:
         """IDでタグを取得"""
-        return db.query(models.Tag).filter(models.Tag.id == id).first()
+        return with_relations(db.query(models.Tag), models.Tag, include).filter(models.Tag.id == id).first()
 
-    def get_by_ssid(self, db: Session, ssid: str) -> Optional[models.Tag]:
+    def get_by_ssid(self, db: Session, ssid: str, *, include: Sequence[str] = ()) -> Optional[models.Tag]:
         """SSIDでタグを取得"""
-        return db.query(models.Tag).filter(models.Tag.ssid == ssid).first()
+        return with_relations(db.query(models.Tag), models.Tag, include).filter(models.Tag.ssid == ssid).first()
 
-    def get_multi(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[models.Tag]:
+    def get_multi(
+        self, db: Session, *, skip: int = 0, limit: int = 100, include: Sequence[str] = ()
+    ) -> List[models.Tag]:
         """タグ一覧を取得"""
-        return db.query(models.Tag).offset(skip).limit(limit).all()
+        return (
+            with_relations(db.query(models.Tag), models.Tag, include)
+            .order_by(models.Tag.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+    def get_multi_by_cursor(
+        self, db: Session, *, cursor: Optional[str] = None, limit: int = 100, include: Sequence[str] = ()
+    ) -> Tuple[List[models.Tag], Optional[str]]:
+        """
+        タグ一覧をキーセットページネーションで取得
+
+        Args:
+            db: データベースセッション
+            cursor: 前ページのnext_cursor（最初のページはNone）
+            limit: 取得上限数
+            include: 一括読み込みするリレーション名
+
+        Returns:
+            (タグのリスト, 次ページのカーソル)
+
+        Raises:
+            ValueError: カーソルが不正な場合
+        """
+        return paginate_by_keyset(
+            with_relations(db.query(models.Tag), models.Tag, include),
+            [models.Tag.id],
+            cursor=cursor,
+            limit=limit,
+            parsers=[int],
+        )
+
+    def iter_chunks(self, db: Session, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Sequence[models.Tag]]:
+        """タグ全件をチャンク単位で取得（サーバーサイドカーソル）"""
+        return iter_chunks(db, models.Tag, chunk_size=chunk_size)
 
     def create(self, db: Session, *, obj_in: schemas.TagCreate) -> models.Tag:
         """タグを作成"""
@@ -63,3 +106,57 @@ class TagCRUD:
             db.commit()
             return True
         return False
+
+
+class AsyncTagCRUD:
+    """
+    タグCRUDクラス（非同期版）
+
+    TagCRUDと同じ操作をAsyncSession上で提供します。
+    async defのルーターからイベントループをブロックせずに利用できます。
+    """
+
+    async def get(self, db: AsyncSession, id: int) -> Optional[models.Tag]:
+        """IDでタグを取得"""
+        return await db.get(models.Tag, id)
+
+    async def get_by_ssid(self, db: AsyncSession, ssid: str) -> Optional[models.Tag]:
+        """SSIDでタグを取得"""
+        result = await db.execute(select(models.Tag).where(models.Tag.ssid == ssid))
+        return result.scalars().first()
+
+    async def get_multi(self, db: AsyncSession, *, skip: int = 0, limit: int = 100) -> List[models.Tag]:
+        """タグ一覧を取得"""
+        result = await db.execute(select(models.Tag).offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def create(self, db: AsyncSession, *, obj_in: schemas.TagCreate) -> models.Tag:
+        """タグを作成"""
+        db_tag = models.Tag(**obj_in.model_dump())
+        db.add(db_tag)
+        await db.commit()
+        await db.refresh(db_tag)
+        return db_tag
+
+    async def update(self, db: AsyncSession, *, id: int, obj_in: schemas.TagUpdate) -> Optional[models.Tag]:
+        """タグを更新"""
+        db_tag = await self.get(db, id)
+        if db_tag:
+            # None値を除外して更新対象フィールドのみを抽出
+            filtered_data = {field: value for field, value in obj_in.model_dump().items() if value is not None}
+
+            for field, value in filtered_data.items():
+                setattr(db_tag, field, value)
+
+            await db.commit()
+            await db.refresh(db_tag)
+        return db_tag
+
+    async def remove(self, db: AsyncSession, *, id: int) -> bool:
+        """タグを削除"""
+        db_tag = await self.get(db, id)
+        if db_tag:
+            await db.delete(db_tag)
+            await db.commit()
+            return True
+        return False
@@ -0,0 +1,147 @@
+"""
+CRUD operations for the event timeline.
+
+This module provides interval-overlap queries and year/decade/century
+bucketing for events. On PostgreSQL the overlap test uses the daterange
+expression backed by the ix_event_period_gist GiST index; other dialects
+fall back to the equivalent start/end comparison.
+"""
+
+from datetime import date
+from typing import List, Tuple
+
+from sqlalchemy import Integer, and_, case, cast, extract, func, literal_column, select
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..models.event import EVENT_PERIOD_SQL
+
+
+def overlaps_period(db: Session, start_date: date, end_date: date):
+    """
+    期間 [start_date, end_date] と重なる出来事の条件式を生成
+
+    終了日のない出来事は開始日の1日だけの出来事として扱います。
+
+    Args:
+        db: データベースセッション（方言の判定に使用）
+        start_date: 期間の開始日（含む）
+        end_date: 期間の終了日（含む）
+
+    Returns:
+        filterに渡す条件式
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        # インデックスと同じ式にすることでGiSTインデックスが使われる
+        window = func.daterange(start_date, end_date, literal_column("'[]'"))
+        return literal_column(EVENT_PERIOD_SQL).op("&&")(window)
+
+    # 終了日が開始日より前、またはない場合は開始日の1日だけとみなす（PostgreSQLの式と同じ扱い）
+    event_end = case(
+        (models.Event.end_date > models.Event.start_date, models.Event.end_date), else_=models.Event.start_date
+    )
+    return and_(models.Event.start_date <= end_date, event_end >= start_date)
+
+
+class TimelineCRUD:
+    """
+    タイムラインCRUDクラス
+
+    期間の重なり検索と、年・年代・世紀単位の集計をSQLで行います。
+    """
+
+    def get_events_overlapping(
+        self, db: Session, start_date: date, end_date: date, *, skip: int = 0, limit: int = 100
+    ) -> List[models.Event]:
+        """
+        期間と重なる出来事を開始日順に取得
+
+        Args:
+            db: データベースセッション
+            start_date: 期間の開始日（含む）
+            end_date: 期間の終了日（含む）
+            skip: スキップ数
+            limit: 取得上限数
+
+        Returns:
+            出来事のリスト
+        """
+        return (
+            db.query(models.Event)
+            .filter(overlaps_period(db, start_date, end_date))
+            .order_by(models.Event.start_date, models.Event.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+    def count_by_bucket(
+        self, db: Session, start_date: date, end_date: date, bucket_years: int
+    ) -> List[Tuple[int, int]]:
+        """
+        期間と重なる出来事をバケットごとに数える
+
+        期間より前に始まった出来事は期間の開始年のバケットに数えます。
+
+        Args:
+            db: データベースセッション
+            start_date: 期間の開始日（含む）
+            end_date: 期間の終了日（含む）
+            bucket_years: 1バケットの年数（1, 10, 100）
+
+        Returns:
+            (バケットの開始年, 件数) のリスト（開始年順、0件のバケットは含まない）
+        """
+        bucket = self._bucket_expression(db, start_date, bucket_years).label("bucket")
+        stmt = (
+            select(bucket, func.count().label("count"))
+            .where(overlaps_period(db, start_date, end_date))
+            .group_by(bucket)
+            .order_by(bucket)
+        )
+        return [(int(bucket), int(count)) for bucket, count in db.execute(stmt)]
+
+    def get_events_by_bucket(
+        self, db: Session, start_date: date, end_date: date, bucket_years: int, per_bucket: int
+    ) -> List[Tuple[int, models.Event]]:
+        """
+        バケットごとに開始日の早い出来事を最大 per_bucket 件取得
+
+        ROW_NUMBER() のウィンドウ関数で各バケットの上位だけをSQL側で絞り込みます。
+
+        Args:
+            db: データベースセッション
+            start_date: 期間の開始日（含む）
+            end_date: 期間の終了日（含む）
+            bucket_years: 1バケットの年数（1, 10, 100）
+            per_bucket: バケットあたりの取得件数
+
+        Returns:
+            (バケットの開始年, 出来事) のリスト（バケット順・開始日順）
+        """
+        bucket = self._bucket_expression(db, start_date, bucket_years)
+        ranked = (
+            select(
+                models.Event.id.label("event_id"),
+                bucket.label("bucket"),
+                func.row_number()
+                .over(partition_by=bucket, order_by=(models.Event.start_date, models.Event.id))
+                .label("position"),
+            )
+            .where(overlaps_period(db, start_date, end_date))
+            .subquery()
+        )
+        stmt = (
+            select(ranked.c.bucket, models.Event)
+            .join(ranked, ranked.c.event_id == models.Event.id)
+            .where(ranked.c.position <= per_bucket)
+            .order_by(ranked.c.bucket, ranked.c.position)
+        )
+        return [(row.bucket, row.Event) for row in db.execute(stmt)]
+
+    @staticmethod
+    def _bucket_expression(db: Session, start_date: date, bucket_years: int):
+        """出来事が属するバケットの開始年を求める式（期間の開始より前の出来事は開始年に寄せる）"""
+        greatest = func.max if db.get_bind().dialect.name == "sqlite" else func.greatest
+        year = cast(greatest(cast(extract("year", models.Event.start_date), Integer), start_date.year), Integer)
+        return year // bucket_years * bucket_years
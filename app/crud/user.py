@@ -4,14 +4,71 @@ CRUD operations for User entity.
 This module provides data access layer operations for the user table.
 """
 
-from datetime import datetime, timezone
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
+from sqlalchemy import Integer, String, Update, case, cast, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from .. import schemas
+from ..auth.password_executor import password_executor
+from ..auth.principal_cache import user_principal_cache
 from ..auth.utils import get_password_hash
 from ..models.user import User
+from .pagination import paginate_by_keyset
+
+# ログイン失敗でアカウントをロックする回数
+MAX_FAILED_LOGIN_ATTEMPTS = 5
+
+# ロック時間（分）
+LOGIN_LOCK_MINUTES = 30
+
+
+class LoginOutcome(NamedTuple):
+    """ログイン結果を記録した後のユーザーの状態"""
+
+    failed_login_attempts: int
+    locked_until: Optional[str]
+    last_login: Optional[str]
+
+
+def _login_outcome_statement(user_id: str, success: bool, max_failed_attempts: int, lock_minutes: int) -> Update:
+    """
+    ログイン結果を記録するUPDATE ... RETURNING文を生成
+
+    失敗回数はSQL側で加算するため、同時に失敗したリクエストの更新が失われません。
+    SET句の右辺は更新前の値を参照するので、加算後の回数でロック要否を同じ文の中で判定できます。
+    """
+    values: Dict[str, Any]
+    if success:
+        values = {
+            "last_login": datetime.now(timezone.utc).isoformat(),
+            "failed_login_attempts": "0",
+            "locked_until": None,
+        }
+    else:
+        failed_attempts = cast(User.failed_login_attempts, Integer) + 1
+        lock_time = datetime.now(timezone.utc) + timedelta(minutes=lock_minutes)
+        values = {
+            "failed_login_attempts": cast(failed_attempts, String),
+            "locked_until": case(
+                (failed_attempts >= max_failed_attempts, lock_time.isoformat()), else_=User.locked_until
+            ),
+        }
+    return (
+        update(User)
+        .where(User.id == user_id)
+        .values(**values)
+        .returning(User.failed_login_attempts, User.locked_until, User.last_login)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _to_login_outcome(row) -> Optional[LoginOutcome]:
+    if row is None:
+        return None
+    return LoginOutcome(int(row.failed_login_attempts), row.locked_until, row.last_login)
 
 
 class UserCRUD:
@@ -35,7 +92,13 @@ class UserCRUD:
 
     def get_multi(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[User]:
         """ユーザー一覧を取得"""
-        return db.query(User).offset(skip).limit(limit).all()
+        return db.query(User).order_by(User.id).offset(skip).limit(limit).all()
+
+    def get_multi_by_cursor(
+        self, db: Session, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[User], Optional[str]]:
+        """ユーザー一覧をキーセットページネーションで取得"""
+        return paginate_by_keyset(db.query(User), [User.id], cursor=cursor, limit=limit, parsers=[str])
 
     def get_active_users(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[User]:
         """アクティブユーザー一覧を取得"""
@@ -45,11 +108,13 @@ class UserCRUD:
         """役割でユーザーを検索"""
         return db.query(User).filter(User.role == role).offset(skip).limit(limit).all()
 
-    def create(self, db: Session, *, obj_in: schemas.UserCreate) -> User:
-        """ユーザーを作成"""
+    def create(self, db: Session, *, obj_in: schemas.UserCreate, hashed_password: Optional[str] = None) -> User:
+        """ユーザーを作成（hashed_passwordを渡した場合はハッシュ化を省略）"""
         data = obj_in.model_dump()
         password = data.pop("password", None)
-        if password:
+        if hashed_password:
+            data["hashed_password"] = hashed_password
+        elif password:
             data["hashed_password"] = get_password_hash(password)
         db_user = User(**data)
         db.add(db_user)
@@ -70,6 +135,8 @@ class UserCRUD:
 
             db.commit()
             db.refresh(db_user)
+            # 認可に使うプリンシパルキャッシュを無効化
+            user_principal_cache.invalidate(user_id)
         return db_user
 
     def update_password(self, db: Session, *, user_id: str, hashed_password: str) -> Optional[User]:
@@ -90,6 +157,35 @@ class UserCRUD:
             db.refresh(db_user)
         return db_user
 
+    def record_login(
+        self,
+        db: Session,
+        *,
+        user_id: str,
+        success: bool,
+        max_failed_attempts: int = MAX_FAILED_LOGIN_ATTEMPTS,
+        lock_minutes: int = LOGIN_LOCK_MINUTES,
+    ) -> Optional[LoginOutcome]:
+        """
+        ログイン結果を1回のUPDATEで記録
+
+        成功時は最終ログイン日時を更新して失敗回数とロックをリセットし、
+        失敗時は失敗回数を加算して上限に達したらロックします。
+
+        Args:
+            db: データベースセッション
+            user_id: ユーザーID
+            success: ログインに成功したか
+            max_failed_attempts: ロックする失敗回数
+            lock_minutes: ロック時間（分）
+
+        Returns:
+            記録後の状態（ユーザーが存在しない場合はNone）
+        """
+        row = db.execute(_login_outcome_statement(user_id, success, max_failed_attempts, lock_minutes)).first()
+        db.commit()
+        return _to_login_outcome(row)
+
     def increment_failed_attempts(self, db: Session, *, user_id: str) -> Optional[User]:
         """ログイン失敗回数を増加"""
         db_user = self.get(db, user_id)
@@ -114,8 +210,6 @@ class UserCRUD:
         """アカウントをロック"""
         db_user = self.get(db, user_id)
         if db_user:
-            from datetime import timedelta
-
             lock_time = datetime.now(timezone.utc) + timedelta(minutes=lock_minutes)
             db_user.locked_until = lock_time.isoformat()
             db.commit()
@@ -138,6 +232,8 @@ class UserCRUD:
             db_user.is_active = False
             db.commit()
             db.refresh(db_user)
+            # 認可に使うプリンシパルキャッシュを無効化
+            user_principal_cache.invalidate(user_id)
         return db_user
 
     def activate(self, db: Session, *, user_id: str) -> Optional[User]:
@@ -147,6 +243,8 @@ class UserCRUD:
             db_user.is_active = True
             db.commit()
             db.refresh(db_user)
+            # 認可に使うプリンシパルキャッシュを無効化
+            user_principal_cache.invalidate(user_id)
         return db_user
 
     def remove(self, db: Session, *, user_id: str) -> bool:
@@ -155,6 +253,7 @@ class UserCRUD:
         if db_user:
             db.delete(db_user)
             db.commit()
+            user_principal_cache.invalidate(user_id)
             return True
         return False
 
@@ -179,5 +278,196 @@ class UserCRUD:
         return db.query(User).filter(User.role == role).count()
 
 
+class AsyncUserCRUD:
+    """
+    ユーザーCRUDクラス（非同期版）
+
+    UserCRUDと同じ操作をAsyncSession上で提供します。
+    """
+
+    async def get(self, db: AsyncSession, user_id: str) -> Optional[User]:
+        """IDでユーザーを取得"""
+        return await db.get(User, user_id)
+
+    async def get_by_email(self, db: AsyncSession, email: str) -> Optional[User]:
+        """メールアドレスでユーザーを取得"""
+        result = await db.execute(select(User).where(User.email == email))
+        return result.scalars().first()
+
+    async def get_by_username(self, db: AsyncSession, username: str) -> Optional[User]:
+        """ユーザー名でユーザーを取得"""
+        result = await db.execute(select(User).where(User.username == username))
+        return result.scalars().first()
+
+    async def get_multi(self, db: AsyncSession, *, skip: int = 0, limit: int = 100) -> List[User]:
+        """ユーザー一覧を取得"""
+        result = await db.execute(select(User).offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def get_active_users(self, db: AsyncSession, *, skip: int = 0, limit: int = 100) -> List[User]:
+        """アクティブユーザー一覧を取得"""
+        result = await db.execute(select(User).where(User.is_active.is_(True)).offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def get_by_role(self, db: AsyncSession, role: str, *, skip: int = 0, limit: int = 100) -> List[User]:
+        """役割でユーザーを検索"""
+        result = await db.execute(select(User).where(User.role == role).offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def create(
+        self, db: AsyncSession, *, obj_in: schemas.UserCreate, hashed_password: Optional[str] = None
+    ) -> User:
+        """ユーザーを作成（ハッシュ化はイベントループを塞がないよう専用ワーカーで実行）"""
+        data = obj_in.model_dump()
+        password = data.pop("password", None)
+        if hashed_password:
+            data["hashed_password"] = hashed_password
+        elif password:
+            data["hashed_password"] = await password_executor.hash(password)
+        db_user = User(**data)
+        db.add(db_user)
+        await db.commit()
+        await db.refresh(db_user)
+        return db_user
+
+    async def update(self, db: AsyncSession, *, user_id: str, obj_in: schemas.UserUpdate) -> Optional[User]:
+        """ユーザーを更新"""
+        db_user = await self.get(db, user_id)
+        if db_user:
+            for field, value in obj_in.model_dump(exclude_unset=True).items():
+                setattr(db_user, field, value)
+
+            await db.commit()
+            await db.refresh(db_user)
+            # 認可に使うプリンシパルキャッシュを無効化
+            user_principal_cache.invalidate(user_id)
+        return db_user
+
+    async def update_password(self, db: AsyncSession, *, user_id: str, hashed_password: str) -> Optional[User]:
+        """パスワードを更新"""
+        db_user = await self.get(db, user_id)
+        if db_user:
+            db_user.hashed_password = hashed_password
+            await db.commit()
+            await db.refresh(db_user)
+        return db_user
+
+    async def update_last_login(self, db: AsyncSession, *, user_id: str) -> Optional[User]:
+        """最終ログイン日時を更新"""
+        db_user = await self.get(db, user_id)
+        if db_user:
+            db_user.last_login = datetime.now(timezone.utc).isoformat()
+            await db.commit()
+            await db.refresh(db_user)
+        return db_user
+
+    async def record_login(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: str,
+        success: bool,
+        max_failed_attempts: int = MAX_FAILED_LOGIN_ATTEMPTS,
+        lock_minutes: int = LOGIN_LOCK_MINUTES,
+    ) -> Optional[LoginOutcome]:
+        """ログイン結果を1回のUPDATEで記録"""
+        result = await db.execute(_login_outcome_statement(user_id, success, max_failed_attempts, lock_minutes))
+        row = result.first()
+        await db.commit()
+        return _to_login_outcome(row)
+
+    async def increment_failed_attempts(self, db: AsyncSession, *, user_id: str) -> Optional[User]:
+        """ログイン失敗回数を増加"""
+        db_user = await self.get(db, user_id)
+        if db_user:
+            current_count = int(db_user.failed_login_attempts or "0")
+            db_user.failed_login_attempts = str(current_count + 1)
+            await db.commit()
+            await db.refresh(db_user)
+        return db_user
+
+    async def reset_failed_attempts(self, db: AsyncSession, *, user_id: str) -> Optional[User]:
+        """ログイン失敗回数をリセット"""
+        db_user = await self.get(db, user_id)
+        if db_user:
+            db_user.failed_login_attempts = "0"
+            db_user.locked_until = None
+            await db.commit()
+            await db.refresh(db_user)
+        return db_user
+
+    async def lock_account(self, db: AsyncSession, *, user_id: str, lock_minutes: int = 30) -> Optional[User]:
+        """アカウントをロック"""
+        db_user = await self.get(db, user_id)
+        if db_user:
+            lock_time = datetime.now(timezone.utc) + timedelta(minutes=lock_minutes)
+            db_user.locked_until = lock_time.isoformat()
+            await db.commit()
+            await db.refresh(db_user)
+        return db_user
+
+    async def unlock_account(self, db: AsyncSession, *, user_id: str) -> Optional[User]:
+        """アカウントのロックを解除"""
+        db_user = await self.get(db, user_id)
+        if db_user:
+            db_user.locked_until = None
+            await db.commit()
+            await db.refresh(db_user)
+        return db_user
+
+    async def deactivate(self, db: AsyncSession, *, user_id: str) -> Optional[User]:
+        """ユーザーを無効化"""
+        db_user = await self.get(db, user_id)
+        if db_user:
+            db_user.is_active = False
+            await db.commit()
+            await db.refresh(db_user)
+            # 認可に使うプリンシパルキャッシュを無効化
+            user_principal_cache.invalidate(user_id)
+        return db_user
+
+    async def activate(self, db: AsyncSession, *, user_id: str) -> Optional[User]:
+        """ユーザーを有効化"""
+        db_user = await self.get(db, user_id)
+        if db_user:
+            db_user.is_active = True
+            await db.commit()
+            await db.refresh(db_user)
+            # 認可に使うプリンシパルキャッシュを無効化
+            user_principal_cache.invalidate(user_id)
+        return db_user
+
+    async def remove(self, db: AsyncSession, *, user_id: str) -> bool:
+        """ユーザーを削除"""
+        db_user = await self.get(db, user_id)
+        if db_user:
+            await db.delete(db_user)
+            await db.commit()
+            user_principal_cache.invalidate(user_id)
+            return True
+        return False
+
+    async def exists(self, db: AsyncSession, *, email: Optional[str] = None, username: Optional[str] = None) -> bool:
+        """ユーザーの存在確認"""
+        if email:
+            return await self.get_by_email(db, email) is not None
+        if username:
+            return await self.get_by_username(db, username) is not None
+        return False
+
+    async def count(self, db: AsyncSession) -> int:
+        """ユーザー数を取得"""
+        return await db.scalar(select(func.count()).select_from(User)) or 0
+
+    async def count_active(self, db: AsyncSession) -> int:
+        """アクティブユーザー数を取得"""
+        return await db.scalar(select(func.count()).select_from(User).where(User.is_active.is_(True))) or 0
+
+    async def count_by_role(self, db: AsyncSession, role: str) -> int:
+        """役割別ユーザー数を取得"""
+        return await db.scalar(select(func.count()).select_from(User).where(User.role == role)) or 0
+
+
 # シングルトンインスタンス
 user_crud = UserCRUD()
+async_user_crud = AsyncUserCRUD()
@@ -1,7 +1,8 @@
 import os
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -43,6 +44,33 @@ def get_pool_settings(database_url: str) -> dict:
     return {}
 
 
+def get_async_database_url(database_url: str) -> str:
+    """同期用のデータベースURLを非同期ドライバ用のURLに変換"""
+    if database_url.startswith("postgresql+asyncpg://") or database_url.startswith("sqlite+aiosqlite://"):
+        return database_url
+    if database_url.startswith("postgresql"):
+        # postgresql:// / postgresql+psycopg2:// → postgresql+asyncpg://
+        return "postgresql+asyncpg://" + database_url.split("://", 1)[1]
+    if database_url.startswith("sqlite"):
+        return "sqlite+aiosqlite://" + database_url.split("://", 1)[1]
+    return database_url
+
+
+def get_async_connect_args(database_url: str) -> dict:
+    """非同期ドライバ別の接続設定を取得"""
+    if "sqlite" in database_url:
+        return {"check_same_thread": False}
+    elif "postgresql" in database_url:
+        # asyncpgはlibpqの"options"を受け付けないためserver_settingsで指定する
+        return {
+            "server_settings": {
+                "application_name": "chrono_wiki_timeline",
+                "timezone": "utc",
+            }
+        }
+    return {}
+
+
 # エンジン作成
 engine = create_engine(
     DATABASE_URL,
@@ -54,6 +82,24 @@ engine = create_engine(
 # セッションファクトリ作成
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 非同期エンジン作成（PostgreSQL: asyncpg / SQLite: aiosqlite）
+ASYNC_DATABASE_URL = get_async_database_url(DATABASE_URL)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    connect_args=get_async_connect_args(ASYNC_DATABASE_URL),
+    **get_pool_settings(ASYNC_DATABASE_URL),
+    echo=os.getenv("DEBUG", "0") == "1",
+)
+
+# 非同期セッションファクトリ作成
+# expire_on_commit=False: コミット後の属性アクセスで暗黙のI/O（lazy load）が発生しないようにする
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 
 def get_db() -> Generator[Session, None, None]:
     """データベースセッションを取得"""
@@ -64,6 +110,12 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """非同期データベースセッションを取得"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def create_tables():
     """テーブルを作成"""
     Base.metadata.create_all(bind=engine)
@@ -9,6 +9,7 @@ from typing import Optional
 from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
+from ..auth.principal_cache import user_principal_cache
 from ..database import get_db
 from ..enums import UserRole
 from ..models.user import User
@@ -47,12 +48,22 @@ def create_api_user(auth_info: dict) -> User:
 
 
 def verify_jwt_user(auth_info: dict, db: Session) -> Optional[User]:
-    """JWT認証の詳細検証"""
+    """
+    JWT認証の詳細検証
+
+    ユーザーの有効性・役割は短いTTLのプリンシパルキャッシュから参照し、
+    ミス時のみusersテーブルを引きます。
+    """
     user_id = auth_info.get("user_id")
     if not user_id:
         return None
 
-    user = user_service.get_user(db, user_id)
+    user = user_principal_cache.get(user_id)
+    if user is None:
+        user = user_service.get_user(db, user_id)
+        if user:
+            user_principal_cache.set(user)
+
     if not user or not user.is_active:
         return None
 
@@ -5,9 +5,13 @@ Enum定義
 """
 
 from .event_person_role import EventPersonRole
+from .export_target import ExportTarget
+from .timeline_granularity import TimelineGranularity
 from .user_role import UserRole
 
 __all__ = [
     "EventPersonRole",
+    "ExportTarget",
+    "TimelineGranularity",
     "UserRole",
 ]
@@ -0,0 +1,15 @@
+"""
+エクスポート対象を定義するEnum
+
+バッチのストリーミングエクスポートで指定できるテーブルを管理します。
+"""
+
+from enum import Enum
+
+
+class ExportTarget(str, Enum):
+    """エクスポート対象"""
+
+    PERSONS = "persons"
+    EVENTS = "events"
+    TAGS = "tags"
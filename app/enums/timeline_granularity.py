@@ -0,0 +1,20 @@
+"""
+タイムラインの集計単位を定義するEnum
+
+/timeline のバケット幅（年・年代・世紀）を管理します。
+"""
+
+from enum import Enum
+
+
+class TimelineGranularity(str, Enum):
+    """タイムラインの集計単位"""
+
+    YEAR = "year"
+    DECADE = "decade"
+    CENTURY = "century"
+
+    @property
+    def years(self) -> int:
+        """1バケットの年数"""
+        return {"year": 1, "decade": 10, "century": 100}[self.value]
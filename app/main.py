@@ -1,9 +1,23 @@
 from fastapi import FastAPI
 
 from .core import get_logger, setup_logging
+from .core.responses import FastJSONResponse
 from .middleware.auth import HybridAuthMiddleware
 from .middleware.logging import RequestLoggingMiddleware
-from .routers import auth, avatar, batch, demo_logging, events, health, persons, tags, users
+from .routers import (
+    auth,
+    avatar,
+    batch,
+    demo_logging,
+    events,
+    health,
+    persons,
+    search,
+    statistics,
+    tags,
+    timeline,
+    users,
+)
 
 # ログ設定の初期化
 setup_logging()
@@ -12,6 +26,7 @@ logger = get_logger("main")
 app = FastAPI(
     title="Historical Figures API",
     version="1.0.0",
+    default_response_class=FastJSONResponse,
     openapi_tags=[
         {
             "name": "authentication",
@@ -29,6 +44,18 @@ app = FastAPI(
             "name": "tags",
             "description": "タグの管理に関する操作。",
         },
+        {
+            "name": "search",
+            "description": "人物・イベント・タグの横断検索。",
+        },
+        {
+            "name": "statistics",
+            "description": "集計カウンターによる件数と内訳の取得。",
+        },
+        {
+            "name": "timeline",
+            "description": "期間と重なるイベントの年・年代・世紀単位の集計。",
+        },
         {
             "name": "users",
             "description": "ユーザー管理に関する操作。",
@@ -55,6 +82,9 @@ app.include_router(avatar.router, prefix="/api/v1")
 app.include_router(persons.router, prefix="/api/v1")
 app.include_router(tags.router, prefix="/api/v1")
 app.include_router(events.router, prefix="/api/v1")
+app.include_router(search.router, prefix="/api/v1")
+app.include_router(timeline.router, prefix="/api/v1")
+app.include_router(statistics.router, prefix="/api/v1")
 app.include_router(users.router, prefix="/api/v1")
 
 # ヘルスチェックルーターを登録（認証不要）
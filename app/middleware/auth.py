@@ -5,43 +5,58 @@
 """
 
 import os
-from typing import Callable, Optional
+from typing import Optional
 
-from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from ..auth.token_cache import TokenVerificationCache, token_verification_cache
 from ..auth.utils import verify_token as verify_jwt_token
 
 
-class HybridAuthMiddleware(BaseHTTPMiddleware):
-    """ハイブリッド認証ミドルウェア"""
+class HybridAuthMiddleware:
+    """
+    ハイブリッド認証ミドルウェア
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # 認証不要なエンドポイントをチェック
-        if self._is_auth_exempt(request.url.path):
-            return await call_next(request)
+    BaseHTTPMiddlewareを使わない純粋なASGIミドルウェアです。
+    リクエスト・レスポンスをタスクやストリームで包み直さないため、
+    ストリーミングレスポンスをそのまま通し、1リクエストあたりのオーバーヘッドも小さくなります。
+    """
+
+    def __init__(self, app: ASGIApp, token_cache: Optional[TokenVerificationCache] = None) -> None:
+        self.app = app
+        # 検証済みJWTのキャッシュ（デフォルトでプロセス内共有のキャッシュを使用）
+        self.token_cache = token_cache if token_cache is not None else token_verification_cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # HTTP以外（lifespan・websocket）と認証不要なエンドポイントはそのまま通す
+        if scope["type"] != "http" or self._is_auth_exempt(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
         # 基本認証チェック
-        auth_info = await self._basic_auth_check(request)
+        auth_info = self._basic_auth_check(Headers(scope=scope))
 
         if auth_info is None:
-            return JSONResponse(status_code=401, content={"detail": "Authentication required"})
+            response = JSONResponse(status_code=401, content={"detail": "Authentication required"})
+            await response(scope, receive, send)
+            return
 
-        # 認証情報をリクエストに追加
-        request.state.auth_info = auth_info
+        # 認証情報をリクエストに追加（request.state.auth_info として参照できる）
+        scope.setdefault("state", {})["auth_info"] = auth_info
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
-    async def _basic_auth_check(self, request: Request) -> Optional[dict]:
+    def _basic_auth_check(self, headers: Headers) -> Optional[dict]:
         """基本認証チェック"""
         # 1. X-API-Key認証（最優先）
-        api_key = request.headers.get("X-API-Key")
+        api_key = headers.get("X-API-Key")
         if api_key:
             return self._verify_api_key(api_key)
 
         # 2. JWT認証
-        auth_header = request.headers.get("Authorization")
+        auth_header = headers.get("Authorization")
         if auth_header and auth_header.startswith("Bearer "):
             return self._verify_jwt_basic(auth_header)
 
@@ -60,7 +75,13 @@ class HybridAuthMiddleware(BaseHTTPMiddleware):
         """JWT認証の基本検証"""
         try:
             token = auth_header.replace("Bearer ", "")
-            payload = verify_jwt_token(token)
+
+            # 同じトークンの署名検証はexpまで省略する
+            payload = self.token_cache.get(token)
+            if payload is None:
+                payload = verify_jwt_token(token)
+                if payload:
+                    self.token_cache.set(token, payload)
 
             if payload:
                 return {
@@ -8,46 +8,63 @@ import time
 from typing import Callable
 
 from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from ..core import get_logger
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """リクエストログミドルウェア"""
+class RequestLoggingMiddleware:
+    """
+    リクエストログミドルウェア
+
+    BaseHTTPMiddlewareを使わない純粋なASGIミドルウェアです。
+    ステータスコードは send される http.response.start から取得し、
+    処理時間はレスポンス本文の送信完了までを計測します。
+    """
 
-    def __init__(self, app):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
         self.logger = get_logger("middleware.logging")
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # リクエスト開始時間
         start_time = time.time()
 
+        method = scope["method"]
+        path = scope["path"]
+
         # クライアントIPアドレスを取得
-        client_ip = request.client.host if request.client else "unknown"
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
 
         # リクエスト情報をログに記録
         self.logger.info(
-            f"受信リクエスト: {request.method} {request.url.path} - "
+            f"受信リクエスト: {method} {path} - "
             f"IP: {client_ip} - "
-            f"User-Agent: {request.headers.get('user-agent', 'unknown')}"
+            f"User-Agent: {Headers(scope=scope).get('user-agent', 'unknown')}"
         )
 
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
         # リクエスト処理
-        response = await call_next(request)
+        await self.app(scope, receive, send_with_status)
 
         # 処理時間を計算
         process_time = time.time() - start_time
 
         # レスポンス情報をログに記録
-        self.logger.info(
-            f"レスポンス完了: {request.method} {request.url.path} - "
-            f"Status: {response.status_code} - "
-            f"Process Time: {process_time:.3f}s"
-        )
-
-        return response
+        self.logger.info(f"レスポンス完了: {method} {path} - Status: {status_code} - Process Time: {process_time:.3f}s")
 
 
 def log_request_middleware(request: Request, call_next: Callable) -> Response:
@@ -2,6 +2,9 @@ from .associations import EventPerson, EventTag, PersonTag
 from .base import Base, TimestampMixin
 from .event import Event
 from .person import Person
+from .search import SEARCH_FTS_TABLE
+from .statistics import StatCounter
+from .storage import AvatarObject, AvatarUpload
 from .tag import Tag
 
 __all__ = [
@@ -13,4 +16,8 @@ __all__ = [
     "PersonTag",
     "EventTag",
     "EventPerson",
+    "SEARCH_FTS_TABLE",
+    "StatCounter",
+    "AvatarObject",
+    "AvatarUpload",
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import BigInteger, Column, ForeignKey, String
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, String
 
 from ..enums import EventPersonRole
 from .base import Base, TimestampMixin
@@ -19,6 +19,8 @@ class EventTag(Base, TimestampMixin):
     """出来事とタグの中間テーブル"""
 
     __tablename__ = "event_tag"
+    # 主キー (event_id, tag_id) の逆引き用（タグからイベントを引く）
+    __table_args__ = (Index("ix_event_tag_tag_id_event_id", "tag_id", "event_id"),)
 
     event_id = Column(BigInteger, ForeignKey("event.id"), primary_key=True)
     tag_id = Column(BigInteger, ForeignKey("tag.id"), primary_key=True)
@@ -29,6 +31,8 @@ class EventPerson(Base, TimestampMixin):
     """出来事と人物の中間テーブル"""
 
     __tablename__ = "event_person"
+    # 主キー (event_id, person_id) の逆引き用（人物からイベントを引く）
+    __table_args__ = (Index("ix_event_person_person_id_event_id", "person_id", "event_id"),)
 
     event_id = Column(BigInteger, ForeignKey("event.id"), primary_key=True)
     person_id = Column(BigInteger, ForeignKey("person.id"), primary_key=True)
@@ -8,16 +8,24 @@ class Base(DeclarativeBase):
     pass
 
 
+def utc_now() -> datetime:
+    """
+    現在時刻（UTC）をタイムゾーンなしのdatetimeで返す
+
+    カラムは TIMESTAMP WITHOUT TIME ZONE のため、
+    tz付きの値を拒否するasyncpgでもそのまま書き込めるようにする
+    """
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
 class TimestampMixin:
     """タイムスタンプ用のMixinクラス"""
 
-    created_at = Column(
-        DateTime, default=lambda: datetime.now(UTC), nullable=False
-    )
+    created_at = Column(DateTime, default=utc_now, nullable=False)
     updated_at = Column(
         DateTime,
-        default=lambda: datetime.now(UTC),
-        onupdate=lambda: datetime.now(UTC),
+        default=utc_now,
+        onupdate=utc_now,
         nullable=False,
     )
 
@@ -1,18 +1,31 @@
-from sqlalchemy import JSON, Column, Date, Numeric, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import JSON, Column, Date, Index, Integer, Numeric, String, Text, event, text
+from sqlalchemy.orm import column_property, relationship
 
+from ..core.geo import grid_cell
 from .base import BaseModel
 
+# 出来事の期間（終了日がなければ開始日のみ、両端を含む）を表すPostgreSQLのdaterange式
+# 終了日が開始日より前のデータでもエラーにならないよう、終了日は開始日以上に寄せる
+# クエリ側（app/crud/timeline.py）でも同じ式を使うことでGiSTインデックスが使われる
+EVENT_PERIOD_SQL = "daterange(start_date, greatest(end_date, start_date), '[]')"
+
 
 class Event(BaseModel):
     """出来事モデル"""
 
     __tablename__ = "event"
+    __table_args__ = (
+        # キーセットページネーション（start_date, id順）用
+        Index("ix_event_start_date_id", "start_date", "id"),
+        # 期間の重なり検索（&&）用のGiSTインデックス（PostgreSQLのみ）
+        Index("ix_event_period_gist", text(EVENT_PERIOD_SQL), postgresql_using="gist").ddl_if(dialect="postgresql"),
+    )
 
     # idはBaseModelで定義済みのため削除
     ssid = Column(String(50), nullable=False, unique=True, index=True)
     title = Column(String(255), nullable=False)
-    start_date = Column(Date, nullable=False)
+    # 集計カウンター（app/models/statistics.py）が変更前の値を使うため、期限切れでも旧値を読み込む
+    start_date = column_property(Column(Date, nullable=False), active_history=True)
     end_date = Column(Date, nullable=True)
     description = Column(Text, nullable=True)
     location_name = Column(String(255), nullable=True)
@@ -20,7 +33,17 @@ class Event(BaseModel):
     longitude = Column(Numeric(11, 8), nullable=True)
     place_id = Column(String(255), nullable=True)
     image_url = Column(JSON, nullable=True)
+    # 緯度経度から求めるグリッドセル番号（範囲検索用、app/core/geo.py）
+    geo_cell = Column(Integer, nullable=True, index=True)
 
     # リレーションシップ
     tags = relationship("Tag", secondary="event_tag", back_populates="events")
     persons = relationship("Person", secondary="event_person", back_populates="events")
+
+
+# イベントリスナー
+@event.listens_for(Event, "before_insert")
+@event.listens_for(Event, "before_update")
+def generate_geo_cell(mapper, connection, target):
+    """Event作成・更新時にgeo_cellを自動生成"""
+    target.geo_cell = grid_cell(target.latitude, target.longitude)
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Date, String, Text, event
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Date, Index, String, Text, event, func
+from sqlalchemy.orm import column_property, relationship
 
 from .base import BaseModel
 
@@ -8,6 +8,10 @@ class Person(BaseModel):
     """人物モデル"""
 
     __tablename__ = "person"
+    __table_args__ = (
+        # 生年での絞り込み（birth_dateの範囲検索）と生年順のキーセットページネーション用
+        Index("ix_person_birth_date_id", "birth_date", "id"),
+    )
 
     # idはBaseModelで定義済みのため削除
     ssid = Column(String(50), nullable=False, unique=True, index=True)
@@ -16,7 +20,8 @@ class Person(BaseModel):
     search_name = Column(String(255), nullable=False, index=True)
     birth_date = Column(Date, nullable=False)
     death_date = Column(Date, nullable=True)
-    born_country = Column(String(100), nullable=False)
+    # 集計カウンター（app/models/statistics.py）が変更前の値を使うため、期限切れでも旧値を読み込む
+    born_country = column_property(Column(String(100), nullable=False), active_history=True)
     born_region = Column(String(100), nullable=True)
     description = Column(Text, nullable=True)
     portrait_url = Column(String(2048), nullable=True)
@@ -37,6 +42,10 @@ class Person(BaseModel):
         return " ".join(parts).lower()
 
 
+# 出生国での絞り込み（大文字小文字を区別しない）とid順のキーセットページネーション用の式インデックス
+Index("ix_person_born_country_lower_id", func.lower(Person.born_country), Person.id)
+
+
 # イベントリスナー
 @event.listens_for(Person, "before_insert")
 @event.listens_for(Person, "before_update")
@@ -0,0 +1,57 @@
+"""
+全文検索インデックス
+
+SQLite環境ではFTS5（trigramトークナイザ）の仮想テーブル search_fts を作成し、
+person / event / tag のトリガーで同期します。
+PostgreSQLでは pg_trgm のGINインデックスをマイグレーションで作成します
+（alembic/versions/003_search_trgm_indexes.py）。
+"""
+
+from sqlalchemy import DDL, event
+
+from .base import Base
+
+# FTS5仮想テーブル名
+SEARCH_FTS_TABLE = "search_fts"
+
+# entity_type, entity_id は検索対象外（UNINDEXED）、body のみをtrigramでインデックス
+_CREATE_FTS = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_FTS_TABLE} "
+    "USING fts5(entity_type UNINDEXED, entity_id UNINDEXED, body, tokenize='trigram')"
+)
+
+# (テーブル名, 検索本文のSQL式)
+_FTS_SOURCES = [
+    ("person", "new.search_name"),
+    ("event", "new.title || ' ' || coalesce(new.description, '')"),
+    ("tag", "new.name || ' ' || coalesce(new.description, '')"),
+]
+
+
+def _trigger_ddls() -> list:
+    """各テーブルの同期トリガーDDLを生成"""
+    statements = []
+    for table, body in _FTS_SOURCES:
+        insert = f"INSERT INTO {SEARCH_FTS_TABLE}(entity_type, entity_id, body) VALUES ('{table}', new.id, {body});"
+        delete = f"DELETE FROM {SEARCH_FTS_TABLE} WHERE entity_type = '{table}' AND entity_id = old.id;"
+        statements.extend(
+            [
+                f"CREATE TRIGGER IF NOT EXISTS {table}_fts_ai AFTER INSERT ON {table} BEGIN {insert} END",
+                f"CREATE TRIGGER IF NOT EXISTS {table}_fts_au AFTER UPDATE ON {table} BEGIN {delete} {insert} END",
+                f"CREATE TRIGGER IF NOT EXISTS {table}_fts_ad AFTER DELETE ON {table} BEGIN {delete} END",
+            ]
+        )
+    return statements
+
+
+# create_all 後にFTSテーブルとトリガーを作成（SQLiteのみ）
+event.listen(Base.metadata, "after_create", DDL(_CREATE_FTS).execute_if(dialect="sqlite"))
+for _statement in _trigger_ddls():
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+
+# drop_all 前にFTSテーブルを削除（トリガーは元テーブルと一緒に削除される）
+event.listen(
+    Base.metadata,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {SEARCH_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
@@ -0,0 +1,235 @@
+"""
+集計カウンター
+
+人物・出来事・タグ・ユーザーの件数を (スコープ, キー) ごとに stat_counter テーブルへ保持します。
+カウンターはORMの書き込みと同じトランザクションで差分更新されるため、統計の取得は
+テーブル全体の集計ではなく主キーでの参照になります。
+"""
+
+from collections import Counter
+from datetime import date
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    ColumnElement,
+    Integer,
+    String,
+    cast,
+    delete,
+    event,
+    extract,
+    func,
+    insert,
+    inspect,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from .base import Base
+from .event import Event
+from .person import Person
+from .tag import Tag
+from .user import User
+
+# 総数を表すキー
+TOTAL_KEY = "total"
+
+# 差分をためるSession.infoのキー
+_DELTAS_KEY = "stat_counter_deltas"
+
+
+class StatCounter(Base):
+    """集計カウンターモデル"""
+
+    __tablename__ = "stat_counter"
+
+    scope = Column(String(32), primary_key=True)
+    key = Column(String(100), primary_key=True)
+    count = Column(BigInteger, nullable=False, default=0)
+
+
+def _year_key(value: Any) -> str:
+    return str(value.year if isinstance(value, date) else int(value))
+
+
+def _bool_key(value: Any) -> str:
+    return "true" if value else "false"
+
+
+class CounterDefinition(NamedTuple):
+    """カウンターの定義"""
+
+    scope: str
+    model: type
+    # キーにする属性（Noneの場合は総数）
+    attribute: Optional[str] = None
+    # 属性値（または再集計時のGROUP BYの値）からキーへの変換
+    to_key: Callable[[Any], str] = str
+    # 再集計時のGROUP BY式（省略時は属性の列）
+    group_by: Optional[Callable[[], ColumnElement]] = None
+
+
+COUNTERS: Tuple[CounterDefinition, ...] = (
+    CounterDefinition("person", Person),
+    CounterDefinition("person_country", Person, "born_country"),
+    CounterDefinition("event", Event),
+    CounterDefinition(
+        "event_year", Event, "start_date", _year_key, lambda: cast(extract("year", Event.start_date), Integer)
+    ),
+    CounterDefinition("tag", Tag),
+    CounterDefinition("user", User),
+    CounterDefinition("user_role", User, "role"),
+    CounterDefinition("user_active", User, "is_active", _bool_key),
+)
+
+# 種類ごとの定義と、カウンターに影響する属性名
+_COUNTERS_BY_MODEL: Dict[type, List[CounterDefinition]] = {}
+for _definition in COUNTERS:
+    _COUNTERS_BY_MODEL.setdefault(_definition.model, []).append(_definition)
+COUNTED_ATTRIBUTES: Dict[type, set] = {
+    model: {d.attribute for d in definitions if d.attribute} for model, definitions in _COUNTERS_BY_MODEL.items()
+}
+
+
+def _key(definition: CounterDefinition, value: Any) -> Optional[str]:
+    if definition.attribute is None:
+        return TOTAL_KEY
+    return None if value is None else definition.to_key(value)
+
+
+def _deltas(session: Session) -> Counter:
+    return session.info.setdefault(_DELTAS_KEY, Counter())
+
+
+def _record(session: Session, obj: Any, sign: int, *, previous: bool = False) -> None:
+    """オブジェクトの各カウンターのキーに差分を記録（previous=Trueなら変更前の値を使用）"""
+    state = inspect(obj)
+    for definition in _COUNTERS_BY_MODEL.get(type(obj), ()):
+        value = None
+        if definition.attribute is not None:
+            value = getattr(obj, definition.attribute)
+            if previous:
+                history = state.attrs[definition.attribute].history
+                if history.deleted:
+                    value = history.deleted[0]
+        key = _key(definition, value)
+        if key is not None:
+            _deltas(session)[(definition.scope, key)] += sign
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_changes(session, flush_context, instances):
+    """更新・削除されるオブジェクトの差分を記録（行と変更履歴が残っているflush前に行う）"""
+    for obj in session.dirty:
+        attributes = COUNTED_ATTRIBUTES.get(type(obj))
+        if not attributes:
+            continue
+        state = inspect(obj)
+        if any(state.attrs[attribute].history.has_changes() for attribute in attributes):
+            _record(session, obj, -1, previous=True)
+            _record(session, obj, +1)
+    for obj in session.deleted:
+        if type(obj) in _COUNTERS_BY_MODEL:
+            _record(session, obj, -1, previous=True)
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_changes(session, flush_context):
+    """追加されたオブジェクトの差分を記録し、flushと同じトランザクションでカウンターに反映"""
+    for obj in session.new:
+        # デフォルト値（is_activeなど）はINSERT後に確定するためflush後に記録する
+        if type(obj) in _COUNTERS_BY_MODEL:
+            _record(session, obj, +1)
+
+    deltas = session.info.pop(_DELTAS_KEY, None)
+    if deltas:
+        apply_counter_deltas(session, deltas)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_changes(session, previous_transaction):
+    """flushに失敗した場合などに、反映されなかった差分を破棄"""
+    session.info.pop(_DELTAS_KEY, None)
+
+
+def apply_counter_deltas(session: Session, deltas: Dict[Tuple[str, str], int]) -> None:
+    """
+    カウンターに差分を加算（存在しないキーは作成）
+
+    Args:
+        session: データベースセッション
+        deltas: (スコープ, キー) ごとの差分
+    """
+    rows = [{"scope": scope, "key": key, "count": delta} for (scope, key), delta in sorted(deltas.items()) if delta]
+    if not rows:
+        return
+
+    connection = session.connection()
+    dialect = connection.dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        dialect_insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+        stmt = dialect_insert(StatCounter)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[StatCounter.scope, StatCounter.key],
+            set_={"count": StatCounter.count + stmt.excluded["count"]},
+        )
+        connection.execute(stmt, rows)
+        return
+
+    for row in rows:
+        result = connection.execute(
+            update(StatCounter)
+            .where(StatCounter.scope == row["scope"], StatCounter.key == row["key"])
+            .values(count=StatCounter.count + row["count"])
+        )
+        if result.rowcount == 0:
+            connection.execute(insert(StatCounter).values(**row))
+
+
+def rebuild_counters(session: Session, models: Optional[List[type]] = None) -> None:
+    """
+    カウンターを元テーブルから再集計
+
+    Args:
+        session: データベースセッション
+        models: 再集計する種類（Noneの場合は全て）
+    """
+    definitions = [d for d in COUNTERS if models is None or d.model in models]
+    connection = session.connection()
+    for definition in definitions:
+        connection.execute(delete(StatCounter).where(StatCounter.scope == definition.scope))
+        counts: List[Tuple[Optional[str], Optional[int]]]
+        if definition.attribute is None:
+            counts = [(TOTAL_KEY, connection.scalar(select(func.count()).select_from(definition.model)))]
+        else:
+            column = definition.group_by() if definition.group_by else getattr(definition.model, definition.attribute)
+            grouped = connection.execute(select(column, func.count()).group_by(column))
+            counts = [(_key(definition, value), count) for value, count in grouped]
+        rows = [{"scope": definition.scope, "key": key, "count": count} for key, count in counts if key and count]
+        if rows:
+            connection.execute(insert(StatCounter), rows)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _rebuild_after_bulk_write(orm_execute_state):
+    """ORMの一括UPDATE/DELETEは行ごとのイベントがないため、実行後に該当する種類を再集計"""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return None
+    mapper = orm_execute_state.bind_mapper
+    model = mapper.class_ if mapper is not None else None
+    if model not in _COUNTERS_BY_MODEL:
+        return None
+    if orm_execute_state.is_update:
+        values = getattr(orm_execute_state.statement, "_values", None)
+        keys = {getattr(column, "key", column) for column in values} if values else None
+        if keys is not None and not keys & COUNTED_ATTRIBUTES[model]:
+            return None
+
+    result = orm_execute_state.invoke_statement()
+    rebuild_counters(orm_execute_state.session, [model])
+    return result
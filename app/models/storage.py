@@ -0,0 +1,30 @@
+"""
+ストレージオブジェクトの参照
+
+内容のハッシュをキーにして保存したS3オブジェクト（アバター画像）と、それを参照するアップロードを保持します。
+同じ画像が複数回アップロードされても実体は1つのため、アップロードごとの参照がすべて解放されたときだけS3から削除します。
+"""
+
+import uuid
+
+from sqlalchemy import Column, DateTime, ForeignKey, String
+
+from .base import Base, TimestampMixin, utc_now
+
+
+class AvatarObject(Base, TimestampMixin):
+    """内容アドレスで保存したアバター画像モデル（同じキーへの参照の追加・解放を直列化する行ロックにも使用）"""
+
+    __tablename__ = "avatar_object"
+
+    key = Column(String(255), primary_key=True)
+
+
+class AvatarUpload(Base):
+    """アバター画像のアップロードごとの参照モデル"""
+
+    __tablename__ = "avatar_upload"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    key = Column(String(255), ForeignKey("avatar_object.key", ondelete="CASCADE"), nullable=False, index=True)
+    created_at = Column(DateTime, default=utc_now, nullable=False)
@@ -31,11 +31,12 @@ class User(Base, TimestampMixin):
 
     # セキュリティ・認証
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    # is_active・roleは集計カウンター（app/models/statistics.py）が変更前の値を使うため、期限切れでも旧値を読み込む
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, active_history=True)
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
     # 権限・ロール
-    role: Mapped[str] = mapped_column(String(50), default=UserRole.USER.value, nullable=False)
+    role: Mapped[str] = mapped_column(String(50), default=UserRole.USER.value, nullable=False, active_history=True)
 
     # セキュリティ監視
     last_login: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
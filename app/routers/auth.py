@@ -9,9 +9,12 @@ from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from .. import schemas
-from ..auth.utils import create_access_token, create_refresh_token, get_token_expires_in, verify_password
+from ..auth.password_executor import PasswordExecutorBusyError, password_executor
+from ..auth.utils import create_access_token, create_refresh_token, get_token_expires_in
+from ..crud.user import MAX_FAILED_LOGIN_ATTEMPTS
 from ..database import get_db
 from ..dependencies.jwt_auth import get_current_active_user
 from ..models.user import User
@@ -19,24 +22,48 @@ from ..services.user import user_service
 
 router = APIRouter(tags=["authentication"])
 
+# パスワード処理の待ち行列が満杯のときにクライアントへ返す再試行までの秒数
+PASSWORD_BUSY_RETRY_AFTER_SECONDS = 1
+
+
+def _password_busy() -> HTTPException:
+    """パスワード処理の待ち行列が満杯のときの503エラー"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication service is busy",
+        headers={"Retry-After": str(PASSWORD_BUSY_RETRY_AFTER_SECONDS)},
+    )
+
 
 @router.post("/auth/register", response_model=schemas.User, status_code=status.HTTP_201_CREATED)
-def register(user_data: schemas.UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: schemas.UserCreate, db: Session = Depends(get_db)):
     """ユーザー登録"""
+    # 重複した登録でパスワード処理の枠を消費しないよう、ハッシュ化の前に重複をチェックする
+    try:
+        await run_in_threadpool(user_service.validate_new_user, db, user_data)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    try:
+        hashed_password = await password_executor.hash(user_data.password)
+    except PasswordExecutorBusyError:
+        raise _password_busy()
+
     try:
-        user = user_service.create_user(db, user_data)
+        # ハッシュ化の間に登録された場合に備え、作成時にも重複をチェックする
+        user = await run_in_threadpool(user_service.create_user, db, user_data, hashed_password)
         return user
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.post("/auth/login", response_model=schemas.Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     """ログイン"""
     # ユーザー検索（メールアドレスまたはユーザー名で）
-    user = user_service.get_user_by_email(db, form_data.username)
+    user = await run_in_threadpool(user_service.get_user_by_email, db, form_data.username)
     if not user:
-        user = user_service.get_user_by_username(db, form_data.username)
+        user = await run_in_threadpool(user_service.get_user_by_username, db, form_data.username)
 
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect credentials")
@@ -49,23 +76,21 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
         if lock_time > datetime.now(timezone.utc):
             raise HTTPException(status_code=status.HTTP_423_LOCKED, detail="Account temporarily locked")
 
-    # パスワード検証
-    if not verify_password(form_data.password, user.hashed_password):
-        # 失敗回数を増加
-        user_service.increment_failed_attempts(db, user.id)
-
-        # 5回失敗でアカウントロック
-        failed_attempts = int(user.failed_login_attempts or "0") + 1
-        if failed_attempts >= 5:
-            user_service.lock_account(db, user.id, lock_minutes=30)
+    # パスワード検証（専用ワーカーで実行し、満杯なら503で即時に返す）
+    try:
+        password_valid = await password_executor.verify(form_data.password, user.hashed_password)
+    except PasswordExecutorBusyError:
+        raise _password_busy()
+
+    if not password_valid:
+        # 失敗回数を加算し、上限に達したらロック（1回のUPDATEで記録）
+        outcome = await run_in_threadpool(user_service.record_login_failure, db, user.id)
+        if outcome and outcome.failed_login_attempts >= MAX_FAILED_LOGIN_ATTEMPTS:
+            raise HTTPException(status_code=status.HTTP_423_LOCKED, detail="Account temporarily locked")
 
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect credentials")
 
-    # ログイン成功時の処理
-    user_service.update_last_login(db, user.id)
-    user_service.reset_failed_attempts(db, user.id)
-
-    # トークン生成
+    # トークン生成（記録のコミットで属性が失効する前に読み出す）
     access_token_expires = timedelta(minutes=30)
     access_token = create_access_token(
         data={"sub": user.id, "email": user.email, "role": user.role}, expires_delta=access_token_expires
@@ -73,6 +98,9 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
 
     refresh_token = create_refresh_token(data={"sub": user.id})
 
+    # ログイン成功を記録（最終ログイン日時の更新と失敗回数のリセットを1回のUPDATEで行う）
+    await run_in_threadpool(user_service.record_login_success, db, user.id)
+
     return {
         "access_token": access_token,
         "token_type": "bearer",
@@ -137,7 +165,7 @@ def logout(current_user: User = Depends(get_current_active_user)):
 
 
 @router.post("/auth/change-password")
-def change_password(
+async def change_password(
     current_password: str,
     new_password: str,
     current_user: User = Depends(get_current_active_user),
@@ -145,7 +173,12 @@ def change_password(
 ):
     """パスワード変更"""
     # 現在のパスワードを検証
-    if not verify_password(current_password, current_user.hashed_password):
+    try:
+        password_valid = await password_executor.verify(current_password, current_user.hashed_password)
+    except PasswordExecutorBusyError:
+        raise _password_busy()
+
+    if not password_valid:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Incorrect current password")
 
     # 新しいパスワードのバリデーション
@@ -155,7 +188,12 @@ def change_password(
         )
 
     # 新しいパスワードを設定
-    updated_user = user_service.update_password(db, current_user.id, new_password)
+    try:
+        hashed_password = await password_executor.hash(new_password)
+    except PasswordExecutorBusyError:
+        raise _password_busy()
+
+    updated_user = await run_in_threadpool(user_service.update_hashed_password, db, current_user.id, hashed_password)
     if updated_user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
@@ -1,15 +1,22 @@
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from functools import lru_cache
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.orm import Session
 
 from .. import schemas
+from ..database import get_db
 from ..dependencies.api_key_auth import verify_token
 from ..services.s3_storage_service import S3StorageService
+from ..services.upload_stream import receive_upload
 
 router = APIRouter(tags=["avatar"])
 
 
+@lru_cache(maxsize=None)
 def get_s3_storage_service() -> S3StorageService:
     """
-    S3ストレージサービスのインスタンスを取得
+    S3ストレージサービスのインスタンスを取得（接続プールを再利用するため、リクエスト間で共有）
 
     Returns:
         S3StorageService: S3ストレージサービスのインスタンス
@@ -17,10 +24,28 @@ def get_s3_storage_service() -> S3StorageService:
     return S3StorageService()
 
 
-@router.post("/upload/avatar", response_model=schemas.AvatarUploadResponse)
+# 本文はストリーミングで受信するため、OpenAPIのリクエストボディを明示する
+AVATAR_UPLOAD_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                }
+            }
+        },
+    }
+}
+
+
+@router.post("/upload/avatar", response_model=schemas.AvatarUploadResponse, openapi_extra=AVATAR_UPLOAD_BODY)
 async def upload_avatar(
-    file: UploadFile = File(...),
+    request: Request,
     api_key=Depends(verify_token),
+    db: Session = Depends(get_db),
     s3_storage_service: S3StorageService = Depends(get_s3_storage_service),
 ):
     """
@@ -28,25 +53,23 @@ async def upload_avatar(
 
     認証済みユーザーがアバター画像をS3にアップロードできます。
     画像は自動的にリサイズされ、最適化されます。
+    一覧表示などで使う小さいサイズ（32/64/128/300px）のAVIF・WebP・JPEGも生成し、srcset として返します。
+    同じ画像がすでにアップロードされている場合は、保存済みの画像のURLを返します。
+    本文はチャンク単位で一時ファイルへ受信し、サイズ上限の超過や画像以外のファイルは受信途中で拒否します。
+    画像処理が混み合っている場合は503（Retry-After付き）を返します。
     """
+    # ファイルを受信（サイズ・画像形式の検証を含む）
+    upload = await receive_upload(request, max_size=s3_storage_service.max_file_size)
     try:
-        # ファイル名の検証
-        if not file.filename:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ファイル名が指定されていません")
-
-        # コンテンツタイプの検証
-        if not file.content_type:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="コンテンツタイプが指定されていません")
-
-        # ファイル内容を読み込み
-        file_content = await file.read()
-
-        # S3にアップロード
-        result = s3_storage_service.upload_avatar(
-            file_content=file_content,
-            filename=file.filename,
-            content_type=file.content_type,
-        )
+        # 拡張子と実際の画像形式の一致を検証
+        if not upload.extension_matches:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="ファイルの拡張子と画像形式が一致しません",
+            )
+
+        # S3にアップロード（画像処理はワーカープロセス、S3への送信はスレッドプールで実行）
+        result = await s3_storage_service.upload_avatar_async(upload.file, upload.filename, upload.mime_type, db)
 
         return schemas.AvatarUploadResponse(**result)
 
@@ -57,29 +80,36 @@ async def upload_avatar(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="アップロード処理中にエラーが発生しました"
         )
+    finally:
+        upload.close()
 
 
+# データベースの行ロックとS3への呼び出しはブロッキングのため、同期関数としてスレッドプールで実行する
 @router.delete("/upload/avatar/{filename}")
-async def delete_avatar(
+def delete_avatar(
     filename: str,
+    upload_id: Optional[str] = Query(None, description="アップロード時に返された upload_id"),
     api_key=Depends(verify_token),
+    db: Session = Depends(get_db),
     s3_storage_service: S3StorageService = Depends(get_s3_storage_service),
 ):
     """
     アバター画像削除（S3）
 
-    認証済みユーザーがS3からアバター画像を削除できます。
+    認証済みユーザーがS3からアバター画像を削除できます。サイズ・形式ごとのバリアントも削除します。
+    同じ画像は複数のアップロードで共有されるため、アップロード時の upload_id を指定して自分の参照だけを解放し、
+    他のアップロードが参照している間はS3の画像を残します。同じ upload_id での再送は何もせず成功します。
     """
     try:
         # ファイルキーを構築
         file_key = f"avatars/{filename}"
 
-        # ファイルが存在するかチェック
-        if not s3_storage_service.file_exists(file_key):
+        # ファイルが存在するかチェック（参照の解放は再送でも成功させるため確認しない）
+        if upload_id is None and not s3_storage_service.file_exists(file_key):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="指定されたファイルが見つかりません")
 
-        # S3から削除
-        success = s3_storage_service.delete_file(file_key)
+        # 参照を解放し、最後の参照であればS3から削除（バリアントを含む）
+        success = s3_storage_service.delete_avatar(file_key, db, upload_id)
 
         if success:
             return {"message": "ファイルが正常に削除されました"}
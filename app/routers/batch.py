@@ -4,15 +4,18 @@
 APIキー認証専用のバッチ処理エンドポイントを提供します。
 """
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from .. import schemas
+from ..crud.streaming import DEFAULT_CHUNK_SIZE
 from ..database import get_db
 from ..dependencies.api_key_auth import verify_token
-from ..services import EventService, PersonService, TagService
+from ..enums import ExportTarget
+from ..services import EventService, ExportService, PersonService, StatisticsService, TagService
 
 router = APIRouter(tags=["batch"])
 
@@ -32,10 +35,22 @@ def get_tag_service() -> TagService:
     return TagService()
 
 
+def get_export_service() -> ExportService:
+    """エクスポートサービスのインスタンスを取得"""
+    return ExportService()
+
+
+def get_statistics_service() -> StatisticsService:
+    """統計サービスのインスタンスを取得"""
+    return StatisticsService()
+
+
 @router.get("/batch/persons/", response_model=List[schemas.Person])
 def batch_get_persons(
+    response: Response,
     skip: int = 0,
-    limit: int = 1000,
+    limit: int = Query(default=1000, ge=1, description="取得上限数（1000を超える値は1000に丸める）"),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     person_service: PersonService = Depends(get_person_service),
     api_key=Depends(verify_token),
@@ -46,6 +61,7 @@ def batch_get_persons(
     Args:
         skip: スキップ数
         limit: 取得上限数（最大1000）
+        cursor: 前ページのX-Next-Cursor（指定時はキーセットページネーション）
         db: データベースセッション
         person_service: 人物サービス
         api_key: APIキー（認証用）
@@ -57,13 +73,26 @@ def batch_get_persons(
     if limit > 1000:
         limit = 1000
 
-    return person_service.get_persons(db, skip=skip, limit=limit)
+    if cursor is None and skip > 0:
+        # 後方互換のOFFSETページネーション
+        return person_service.get_persons(db, skip=skip, limit=limit)
+
+    try:
+        persons, next_cursor = person_service.get_persons_page(db, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return persons
 
 
 @router.get("/batch/events/", response_model=List[schemas.Event])
 def batch_get_events(
+    response: Response,
     skip: int = 0,
-    limit: int = 1000,
+    limit: int = Query(default=1000, ge=1, description="取得上限数（1000を超える値は1000に丸める）"),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     event_service: EventService = Depends(get_event_service),
     api_key=Depends(verify_token),
@@ -74,6 +103,7 @@ def batch_get_events(
     Args:
         skip: スキップ数
         limit: 取得上限数（最大1000）
+        cursor: 前ページのX-Next-Cursor（指定時はキーセットページネーション）
         db: データベースセッション
         event_service: イベントサービス
         api_key: APIキー（認証用）
@@ -85,13 +115,26 @@ def batch_get_events(
     if limit > 1000:
         limit = 1000
 
-    return event_service.get_events(db, skip=skip, limit=limit)
+    if cursor is None and skip > 0:
+        # 後方互換のOFFSETページネーション
+        return event_service.get_events(db, skip=skip, limit=limit)
+
+    try:
+        events, next_cursor = event_service.get_events_page(db, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return events
 
 
 @router.get("/batch/tags/", response_model=List[schemas.Tag])
 def batch_get_tags(
+    response: Response,
     skip: int = 0,
-    limit: int = 1000,
+    limit: int = Query(default=1000, ge=1, description="取得上限数（1000を超える値は1000に丸める）"),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     tag_service: TagService = Depends(get_tag_service),
     api_key=Depends(verify_token),
@@ -102,6 +145,7 @@ def batch_get_tags(
     Args:
         skip: スキップ数
         limit: 取得上限数（最大1000）
+        cursor: 前ページのX-Next-Cursor（指定時はキーセットページネーション）
         db: データベースセッション
         tag_service: タグサービス
         api_key: APIキー（認証用）
@@ -113,7 +157,18 @@ def batch_get_tags(
     if limit > 1000:
         limit = 1000
 
-    return tag_service.get_tags(db, skip=skip, limit=limit)
+    if cursor is None and skip > 0:
+        # 後方互換のOFFSETページネーション
+        return tag_service.get_tags(db, skip=skip, limit=limit)
+
+    try:
+        tags, next_cursor = tag_service.get_tags_page(db, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return tags
 
 
 @router.post("/batch/persons/", response_model=List[schemas.Person])
@@ -126,6 +181,8 @@ def batch_create_persons(
     """
     人物をバッチ作成（APIキー認証専用）
 
+    全件を1トランザクションで作成し、1件でもエラーがあれば何も作成しません。
+
     Args:
         persons: 人物作成データのリスト
         db: データベースセッション
@@ -141,15 +198,10 @@ def batch_create_persons(
     if len(persons) > 100:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Batch size cannot exceed 100 items")
 
-    created_persons = []
-    for person in persons:
-        try:
-            created_person = person_service.create_person(db, person)
-            created_persons.append(created_person)
-        except ValueError as e:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Error creating person: {str(e)}")
-
-    return created_persons
+    try:
+        return person_service.create_persons(db, persons)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Error creating person: {str(e)}")
 
 
 @router.post("/batch/events/", response_model=List[schemas.Event])
@@ -162,6 +214,8 @@ def batch_create_events(
     """
     イベントをバッチ作成（APIキー認証専用）
 
+    全件を1トランザクションで作成し、1件でもエラーがあれば何も作成しません。
+
     Args:
         events: イベント作成データのリスト
         db: データベースセッション
@@ -177,23 +231,72 @@ def batch_create_events(
     if len(events) > 100:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Batch size cannot exceed 100 items")
 
-    created_events = []
-    for event in events:
-        try:
-            created_event = event_service.create_event(db, event)
-            created_events.append(created_event)
-        except ValueError as e:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Error creating event: {str(e)}")
+    try:
+        return event_service.create_events(db, events)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Error creating event: {str(e)}")
 
-    return created_events
 
+@router.get("/batch/export/{target}.ndjson", response_class=StreamingResponse)
+def batch_export_ndjson(
+    target: ExportTarget,
+    chunk_size: int = Query(default=DEFAULT_CHUNK_SIZE, ge=1, le=10000),
+    db: Session = Depends(get_db),
+    export_service: ExportService = Depends(get_export_service),
+    api_key=Depends(verify_token),
+):
+    """
+    全件をNDJSONでストリーミング出力（APIキー認証専用）
 
-@router.get("/batch/stats")
+    Args:
+        target: エクスポート対象（persons / events / tags）
+        chunk_size: 1回のフェッチで読み出す行数
+        db: データベースセッション
+        export_service: エクスポートサービス
+        api_key: APIキー（認証用）
+
+    Returns:
+        1行1レコードのNDJSONストリーム
+    """
+    return StreamingResponse(
+        export_service.stream_ndjson(db, target, chunk_size=chunk_size),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{target.value}.ndjson"'},
+    )
+
+
+@router.get("/batch/export/{target}.csv", response_class=StreamingResponse)
+def batch_export_csv(
+    target: ExportTarget,
+    chunk_size: int = Query(default=DEFAULT_CHUNK_SIZE, ge=1, le=10000),
+    db: Session = Depends(get_db),
+    export_service: ExportService = Depends(get_export_service),
+    api_key=Depends(verify_token),
+):
+    """
+    全件をCSVでストリーミング出力（APIキー認証専用）
+
+    Args:
+        target: エクスポート対象（persons / events / tags）
+        chunk_size: 1回のフェッチで読み出す行数
+        db: データベースセッション
+        export_service: エクスポートサービス
+        api_key: APIキー（認証用）
+
+    Returns:
+        ヘッダー付きCSVストリーム
+    """
+    return StreamingResponse(
+        export_service.stream_csv(db, target, chunk_size=chunk_size),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{target.value}.csv"'},
+    )
+
+
+@router.get("/batch/stats", response_model=schemas.EntityCounts)
 def get_batch_stats(
     db: Session = Depends(get_db),
-    person_service: PersonService = Depends(get_person_service),
-    event_service: EventService = Depends(get_event_service),
-    tag_service: TagService = Depends(get_tag_service),
+    statistics_service: StatisticsService = Depends(get_statistics_service),
     api_key=Depends(verify_token),
 ):
     """
@@ -201,23 +304,10 @@ def get_batch_stats(
 
     Args:
         db: データベースセッション
-        person_service: 人物サービス
-        event_service: イベントサービス
-        tag_service: タグサービス
+        statistics_service: 統計サービス
         api_key: APIキー（認証用）
 
     Returns:
-        統計情報
-    """
-    # 各サービスの統計情報を取得
-    persons = person_service.get_persons(db, skip=0, limit=1)
-    events = event_service.get_events(db, skip=0, limit=1)
-    tags = tag_service.get_tags(db, skip=0, limit=1)
-
-    # 実際のカウントは別途実装が必要
-    return {
-        "persons": len(persons),
-        "events": len(events),
-        "tags": len(tags),
-        "total": len(persons) + len(events) + len(tags),
-    }
+        人物・出来事・タグの件数（集計カウンターから取得）
+    """
+    return statistics_service.get_entity_counts(db)
@@ -1,9 +1,11 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
 from .. import schemas
+from ..core.conditional import not_modified_response
+from ..core.responses import ModelListResponse
 from ..database import get_db
 from ..dependencies.hybrid_auth import require_admin, require_auth, require_moderator
 from ..models.user import User
@@ -56,10 +58,15 @@ def create_event(
         )
 
 
-@router.get("/events/", response_model=List[schemas.Event])
+@router.get("/events/", response_model=List[schemas.EventDetail], response_model_exclude_unset=True)
 def read_events(
+    request: Request,
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(default=100, ge=1, le=1000, description="取得上限数"),
+    cursor: Optional[str] = None,
+    include: Optional[str] = Query(default=None, description="含める関連エンティティ（tags,persons のカンマ区切り）"),
+    fields: Optional[str] = Query(default=None, description="返すフィールド（カンマ区切り、または summary）"),
     db: Session = Depends(get_db),
     event_service: EventService = Depends(get_event_service),
     current_user: User = Depends(require_auth),
@@ -70,18 +77,114 @@ def read_events(
     Args:
         skip: スキップ数
         limit: 取得上限数
+        cursor: 前ページのX-Next-Cursor（指定時はキーセットページネーション）
+        include: 含める関連エンティティ（tags,persons のカンマ区切り）
+        fields: 返すフィールド（カンマ区切り、または summary。includeとは同時に指定できない）
         db: データベースセッション
         event_service: イベントサービス（DI）
 
     Returns:
-        イベントのリスト
+        イベントのリスト（If-None-Match に一致する場合は本文なしの304）
+
+    Raises:
+        HTTPException: カーソル・include・fieldsが不正な場合
+    """
+    try:
+        if cursor is None and skip > 0:
+            # 後方互換のOFFSETページネーション
+            next_cursor = None
+            events = event_service.get_events(db, skip=skip, limit=limit, include=include, fields=fields)
+        else:
+            events, next_cursor = event_service.get_events_page(
+                db, cursor=cursor, limit=limit, include=include, fields=fields
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    not_modified = not_modified_response(request, response, events, next_cursor)
+    if not_modified is not None:
+        return not_modified
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    # サービス層で検証済みのため、response_modelでの再検証を省略して直接JSONにする
+    return ModelListResponse(events, exclude_unset=True, headers=response.headers)
+
+
+@router.get("/events/nearby", response_model=List[schemas.EventNearby])
+def read_events_nearby(
+    lat: float = Query(..., ge=-90, le=90, description="中心の緯度"),
+    lon: float = Query(..., ge=-180, le=180, description="中心の経度"),
+    radius_km: float = Query(default=10.0, gt=0, description="半径（km）"),
+    limit: int = Query(default=100, ge=1, le=1000, description="取得上限数"),
+    db: Session = Depends(get_db),
+    event_service: EventService = Depends(get_event_service),
+    current_user: User = Depends(require_auth),
+):
+    """
+    中心から半径 radius_km 以内のイベントを近い順に取得
+
+    Args:
+        lat: 中心の緯度
+        lon: 中心の経度
+        radius_km: 半径（km）
+        limit: 取得上限数
+        db: データベースセッション
+        event_service: イベントサービス（DI）
+
+    Returns:
+        距離付きイベントのリスト
+
+    Raises:
+        HTTPException: 半径が上限を超える場合
+    """
+    try:
+        return event_service.get_events_nearby(db, lat, lon, radius_km, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/events/bbox", response_model=List[schemas.Event])
+def read_events_in_bbox(
+    min_lat: float = Query(..., ge=-90, le=90, description="南端の緯度"),
+    min_lon: float = Query(..., ge=-180, le=180, description="西端の経度（max_lonより大きい場合は日付変更線をまたぐ）"),
+    max_lat: float = Query(..., ge=-90, le=90, description="北端の緯度"),
+    max_lon: float = Query(..., ge=-180, le=180, description="東端の経度"),
+    limit: int = Query(default=100, ge=1, le=1000, description="取得上限数"),
+    db: Session = Depends(get_db),
+    event_service: EventService = Depends(get_event_service),
+    current_user: User = Depends(require_auth),
+):
     """
-    return event_service.get_events(db, skip=skip, limit=limit)
+    矩形内のイベントを取得（地図表示用）
 
+    Args:
+        min_lat: 南端の緯度
+        min_lon: 西端の経度
+        max_lat: 北端の緯度
+        max_lon: 東端の経度
+        limit: 取得上限数
+        db: データベースセッション
+        event_service: イベントサービス（DI）
 
-@router.get("/events/{event_id}", response_model=schemas.Event)
+    Returns:
+        開始日順のイベントのリスト
+
+    Raises:
+        HTTPException: 矩形が無効な場合
+    """
+    try:
+        return event_service.get_events_in_bbox(db, min_lat, min_lon, max_lat, max_lon, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/events/{event_id}", response_model=schemas.EventDetail, response_model_exclude_unset=True)
 def read_event(
+    request: Request,
+    response: Response,
     event_id: int,
+    include: Optional[str] = Query(default=None, description="含める関連エンティティ（tags,persons のカンマ区切り）"),
     db: Session = Depends(get_db),
     event_service: EventService = Depends(get_event_service),
     current_user: User = Depends(require_auth),
@@ -91,21 +194,30 @@ def read_event(
 
     Args:
         event_id: イベントID
+        include: 含める関連エンティティ（tags,persons のカンマ区切り）
         db: データベースセッション
         event_service: イベントサービス（DI）
 
     Returns:
-        イベントデータ
+        イベントデータ（If-None-Match / If-Modified-Since に一致する場合は本文なしの304）
 
     Raises:
-        HTTPException: イベントが見つからない場合
+        HTTPException: イベントが見つからない場合、またはincludeが不正な場合
     """
-    event = event_service.get_event(db, event_id)
+    try:
+        event = event_service.get_event(db, event_id, include=include)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     if event is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found",
         )
+
+    not_modified = not_modified_response(request, response, event)
+    if not_modified is not None:
+        return not_modified
     return event
 
 
@@ -13,6 +13,10 @@ from fastapi.responses import JSONResponse
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from ..auth.password_executor import password_executor
+from ..auth.token_cache import token_verification_cache
+from ..core.cache import cache_stats, get_cache_backend
+from ..core.image_executor import image_executor
 from ..database import get_db
 
 router = APIRouter(tags=["health"])
@@ -104,6 +108,28 @@ async def detailed_health_check(db: Session = Depends(get_db)):
     if missing_vars:
         health_info["status"] = "degraded"
 
+    # キャッシュチェック
+    health_info["checks"]["cache"] = {
+        "status": "healthy",
+        "backend": type(get_cache_backend()).__name__,
+        "statistics": cache_stats.snapshot(),
+        "jwt_cache": token_verification_cache.info(),
+    }
+
+    # パスワードハッシュ用ワーカーの待ち行列
+    password_stats = password_executor.stats()
+    health_info["checks"]["password_hashing"] = {
+        "status": "healthy" if password_stats["queued"] < password_stats["max_queue"] else "busy",
+        **password_stats,
+    }
+
+    # 画像処理用ワーカーの待ち行列
+    image_stats = image_executor.stats()
+    health_info["checks"]["image_processing"] = {
+        "status": "healthy" if image_stats["queued"] < image_stats["max_queue"] else "busy",
+        **image_stats,
+    }
+
     # システムリソースチェック（オプショナル）
     system_check = await _check_system_resources()
     health_info["checks"]["system"] = system_check
@@ -1,13 +1,16 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
 from .. import schemas
+from ..core.conditional import not_modified_response
+from ..core.responses import ModelListResponse
 from ..database import get_db
 from ..dependencies.hybrid_auth import require_admin, require_auth, require_moderator
 from ..models.user import User
-from ..services import PersonService
+from ..services import EventService, PersonService
+from .events import get_event_service
 
 router = APIRouter(tags=["persons"])
 
@@ -56,10 +59,20 @@ def create_person(
         )
 
 
-@router.get("/persons/", response_model=List[schemas.Person])
+@router.get("/persons/", response_model=List[schemas.PersonDetail], response_model_exclude_unset=True)
 def read_persons(
+    request: Request,
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(default=100, ge=1, le=1000, description="取得上限数"),
+    cursor: Optional[str] = None,
+    include: Optional[str] = Query(default=None, description="含める関連エンティティ（tags,events のカンマ区切り）"),
+    fields: Optional[str] = Query(default=None, description="返すフィールド（カンマ区切り、または summary）"),
+    birth_year: Optional[int] = Query(default=None, ge=1, le=9999, description="生年"),
+    birth_year_from: Optional[int] = Query(default=None, ge=1, le=9999, description="生年の下限（含む）"),
+    birth_year_to: Optional[int] = Query(default=None, ge=1, le=9999, description="生年の上限（含む）"),
+    country: Optional[str] = Query(default=None, max_length=100, description="出生国（大文字小文字を区別しない）"),
+    sort: str = Query(default="id", description="並び順（id / birth_date）"),
     db: Session = Depends(get_db),
     person_service: PersonService = Depends(get_person_service),
     current_user: User = Depends(require_auth),
@@ -70,18 +83,60 @@ def read_persons(
     Args:
         skip: スキップ数
         limit: 取得上限数
+        cursor: 前ページのX-Next-Cursor（指定時はキーセットページネーション）
+        include: 含める関連エンティティ（tags,events のカンマ区切り）
+        fields: 返すフィールド（カンマ区切り、または summary。includeとは同時に指定できない）
+        birth_year: 生年
+        birth_year_from: 生年の下限
+        birth_year_to: 生年の上限
+        country: 出生国
+        sort: 並び順（カーソルは同じ絞り込み条件・並び順で使用）
         db: データベースセッション
         person_service: 人物サービス（DI）
 
     Returns:
-        人物のリスト
+        人物のリスト（If-None-Match に一致する場合は本文なしの304）
+
+    Raises:
+        HTTPException: カーソル・include・fields・絞り込み条件・並び順が不正な場合
     """
-    return person_service.get_persons(db, skip=skip, limit=limit)
+    filters = schemas.PersonFilter(
+        birth_year=birth_year,
+        birth_year_from=birth_year_from,
+        birth_year_to=birth_year_to,
+        born_country=country,
+        sort=sort,
+    )
+    try:
+        if cursor is None and skip > 0:
+            # 後方互換のOFFSETページネーション
+            next_cursor = None
+            persons = person_service.get_persons(
+                db, skip=skip, limit=limit, include=include, filters=filters, fields=fields
+            )
+        else:
+            persons, next_cursor = person_service.get_persons_page(
+                db, cursor=cursor, limit=limit, include=include, filters=filters, fields=fields
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    not_modified = not_modified_response(request, response, persons, next_cursor)
+    if not_modified is not None:
+        return not_modified
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    # サービス層で検証済みのため、response_modelでの再検証を省略して直接JSONにする
+    return ModelListResponse(persons, exclude_unset=True, headers=response.headers)
 
 
-@router.get("/persons/{person_id}", response_model=schemas.Person)
+@router.get("/persons/{person_id}", response_model=schemas.PersonDetail, response_model_exclude_unset=True)
 def read_person(
+    request: Request,
+    response: Response,
     person_id: int,
+    include: Optional[str] = Query(default=None, description="含める関連エンティティ（tags,events のカンマ区切り）"),
     db: Session = Depends(get_db),
     person_service: PersonService = Depends(get_person_service),
     current_user: User = Depends(require_auth),
@@ -91,27 +146,39 @@ def read_person(
 
     Args:
         person_id: 人物ID
+        include: 含める関連エンティティ（tags,events のカンマ区切り）
         db: データベースセッション
         person_service: 人物サービス（DI）
 
     Returns:
-        人物データ
+        人物データ（If-None-Match / If-Modified-Since に一致する場合は本文なしの304）
 
     Raises:
-        HTTPException: 人物が見つからない場合
+        HTTPException: 人物が見つからない場合、またはincludeが不正な場合
     """
-    person = person_service.get_person(db, person_id)
+    try:
+        person = person_service.get_person(db, person_id, include=include)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     if person is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Person not found",
         )
+
+    not_modified = not_modified_response(request, response, person)
+    if not_modified is not None:
+        return not_modified
     return person
 
 
-@router.get("/persons/ssid/{ssid}", response_model=schemas.Person)
+@router.get("/persons/ssid/{ssid}", response_model=schemas.PersonDetail, response_model_exclude_unset=True)
 def read_person_by_ssid(
+    request: Request,
+    response: Response,
     ssid: str,
+    include: Optional[str] = Query(default=None, description="含める関連エンティティ（tags,events のカンマ区切り）"),
     db: Session = Depends(get_db),
     person_service: PersonService = Depends(get_person_service),
     current_user: User = Depends(require_auth),
@@ -121,24 +188,68 @@ def read_person_by_ssid(
 
     Args:
         ssid: 人物のSSID
+        include: 含める関連エンティティ（tags,events のカンマ区切り）
         db: データベースセッション
         person_service: 人物サービス（DI）
 
     Returns:
-        人物データ
+        人物データ（If-None-Match / If-Modified-Since に一致する場合は本文なしの304）
 
     Raises:
-        HTTPException: 人物が見つからない場合
+        HTTPException: 人物が見つからない場合、またはincludeが不正な場合
     """
-    person = person_service.get_person_by_ssid(db, ssid)
+    try:
+        person = person_service.get_person_by_ssid(db, ssid, include=include)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     if person is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Person not found",
         )
+
+    not_modified = not_modified_response(request, response, person)
+    if not_modified is not None:
+        return not_modified
     return person
 
 
+@router.get("/persons/{person_id}/events", response_model=List[schemas.Event])
+def read_person_events(
+    person_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+    person_service: PersonService = Depends(get_person_service),
+    event_service: EventService = Depends(get_event_service),
+    current_user: User = Depends(require_auth),
+):
+    """
+    人物に関連するイベントを取得
+
+    Args:
+        person_id: 人物ID
+        skip: スキップ数
+        limit: 取得上限数
+        db: データベースセッション
+        person_service: 人物サービス（DI）
+        event_service: イベントサービス（DI）
+
+    Returns:
+        開始日順のイベントのリスト
+
+    Raises:
+        HTTPException: 人物が見つからない場合
+    """
+    if person_service.get_person(db, person_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Person not found",
+        )
+    return event_service.get_events_by_person(db, person_id, skip=skip, limit=limit)
+
+
 @router.put("/persons/{person_id}", response_model=schemas.Person)
 def update_person(
     person_id: int,
@@ -0,0 +1,57 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from .. import schemas
+from ..database import get_db
+from ..dependencies.hybrid_auth import require_auth
+from ..models.user import User
+from ..services import SearchService
+
+router = APIRouter(tags=["search"])
+
+
+def get_search_service() -> SearchService:
+    """
+    検索サービスのインスタンスを取得
+
+    Returns:
+        SearchService: 検索サービスのインスタンス
+    """
+    return SearchService()
+
+
+@router.get("/search", response_model=schemas.SearchResults)
+def search(
+    q: str = Query(..., description="検索語"),
+    types: Optional[str] = Query(default=None, description="検索対象（persons,events,tags のカンマ区切り）"),
+    limit: int = Query(default=20, ge=1, le=100, description="種類ごとの取得上限数"),
+    db: Session = Depends(get_db),
+    search_service: SearchService = Depends(get_search_service),
+    current_user: User = Depends(require_auth),
+):
+    """
+    人物・イベント・タグをキーワードで横断検索
+
+    Args:
+        q: 検索語
+        types: 検索対象の種類（未指定なら全て）
+        limit: 種類ごとの取得上限数
+        db: データベースセッション
+        search_service: 検索サービス（DI）
+
+    Returns:
+        スコアの降順に並んだ検索結果
+
+    Raises:
+        HTTPException: 検索語または検索対象の種類が無効な場合
+    """
+    target_types = [t.strip() for t in types.split(",") if t.strip()] if types else None
+    try:
+        return search_service.search(db, q, types=target_types, limit=limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
@@ -0,0 +1,60 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from .. import schemas
+from ..database import get_db
+from ..dependencies.hybrid_auth import require_admin, require_auth
+from ..models.user import User
+from ..services import StatisticsService
+
+router = APIRouter(tags=["statistics"])
+
+
+def get_statistics_service() -> StatisticsService:
+    """
+    統計サービスのインスタンスを取得
+
+    Returns:
+        StatisticsService: 統計サービスのインスタンス
+    """
+    return StatisticsService()
+
+
+@router.get("/stats", response_model=schemas.Statistics)
+def read_statistics(
+    db: Session = Depends(get_db),
+    statistics_service: StatisticsService = Depends(get_statistics_service),
+    current_user: User = Depends(require_auth),
+):
+    """
+    人物・出来事・タグの件数と内訳を取得
+
+    Args:
+        db: データベースセッション
+        statistics_service: 統計サービス（DI）
+
+    Returns:
+        統計情報
+    """
+    return statistics_service.get_statistics(db)
+
+
+@router.post("/stats/rebuild", response_model=schemas.Statistics)
+def rebuild_statistics(
+    db: Session = Depends(get_db),
+    statistics_service: StatisticsService = Depends(get_statistics_service),
+    current_user: User = Depends(require_admin),
+):
+    """
+    集計カウンターを元テーブルから再集計（管理者のみ）
+
+    SQLを直接実行してデータを変更した後などに使用します。
+
+    Args:
+        db: データベースセッション
+        statistics_service: 統計サービス（DI）
+
+    Returns:
+        再集計後の統計情報
+    """
+    return statistics_service.rebuild(db)
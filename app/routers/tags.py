@@ -1,13 +1,16 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
 from .. import schemas
+from ..core.conditional import not_modified_response
+from ..core.responses import ModelListResponse
 from ..database import get_db
 from ..dependencies.hybrid_auth import require_admin, require_auth, require_moderator
 from ..models.user import User
-from ..services import TagService
+from ..services import EventService, TagService
+from .events import get_event_service
 
 router = APIRouter(tags=["tags"])
 
@@ -56,10 +59,14 @@ def create_tag(
         )
 
 
-@router.get("/tags/", response_model=List[schemas.Tag])
+@router.get("/tags/", response_model=List[schemas.TagDetail], response_model_exclude_unset=True)
 def read_tags(
+    request: Request,
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(default=100, ge=1, le=1000, description="取得上限数"),
+    cursor: Optional[str] = None,
+    include: Optional[str] = Query(default=None, description="含める関連エンティティ（persons,events のカンマ区切り）"),
     db: Session = Depends(get_db),
     tag_service: TagService = Depends(get_tag_service),
     current_user: User = Depends(require_auth),
@@ -70,18 +77,43 @@ def read_tags(
     Args:
         skip: スキップ数
         limit: 取得上限数
+        cursor: 前ページのX-Next-Cursor（指定時はキーセットページネーション）
+        include: 含める関連エンティティ（persons,events のカンマ区切り）
         db: データベースセッション
         tag_service: タグサービス（DI）
 
     Returns:
-        タグのリスト
+        タグのリスト（If-None-Match に一致する場合は本文なしの304）
+
+    Raises:
+        HTTPException: カーソルまたはincludeが不正な場合
     """
-    return tag_service.get_tags(db, skip=skip, limit=limit)
+    try:
+        if cursor is None and skip > 0:
+            # 後方互換のOFFSETページネーション
+            next_cursor = None
+            tags = tag_service.get_tags(db, skip=skip, limit=limit, include=include)
+        else:
+            tags, next_cursor = tag_service.get_tags_page(db, cursor=cursor, limit=limit, include=include)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+    not_modified = not_modified_response(request, response, tags, next_cursor)
+    if not_modified is not None:
+        return not_modified
 
-@router.get("/tags/{tag_id}", response_model=schemas.Tag)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    # サービス層で検証済みのため、response_modelでの再検証を省略して直接JSONにする
+    return ModelListResponse(tags, exclude_unset=True, headers=response.headers)
+
+
+@router.get("/tags/{tag_id}", response_model=schemas.TagDetail, response_model_exclude_unset=True)
 def read_tag(
+    request: Request,
+    response: Response,
     tag_id: int,
+    include: Optional[str] = Query(default=None, description="含める関連エンティティ（persons,events のカンマ区切り）"),
     db: Session = Depends(get_db),
     tag_service: TagService = Depends(get_tag_service),
     current_user: User = Depends(require_auth),
@@ -91,24 +123,68 @@ def read_tag(
 
     Args:
         tag_id: タグID
+        include: 含める関連エンティティ（persons,events のカンマ区切り）
         db: データベースセッション
         tag_service: タグサービス（DI）
 
     Returns:
-        タグデータ
+        タグデータ（If-None-Match / If-Modified-Since に一致する場合は本文なしの304）
 
     Raises:
-        HTTPException: タグが見つからない場合
+        HTTPException: タグが見つからない場合、またはincludeが不正な場合
     """
-    tag = tag_service.get_tag(db, tag_id)
+    try:
+        tag = tag_service.get_tag(db, tag_id, include=include)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     if tag is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tag not found",
         )
+
+    not_modified = not_modified_response(request, response, tag)
+    if not_modified is not None:
+        return not_modified
     return tag
 
 
+@router.get("/tags/{tag_id}/events", response_model=List[schemas.Event])
+def read_tag_events(
+    tag_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+    tag_service: TagService = Depends(get_tag_service),
+    event_service: EventService = Depends(get_event_service),
+    current_user: User = Depends(require_auth),
+):
+    """
+    タグに関連するイベントを取得
+
+    Args:
+        tag_id: タグID
+        skip: スキップ数
+        limit: 取得上限数
+        db: データベースセッション
+        tag_service: タグサービス（DI）
+        event_service: イベントサービス（DI）
+
+    Returns:
+        開始日順のイベントのリスト
+
+    Raises:
+        HTTPException: タグが見つからない場合
+    """
+    if tag_service.get_tag(db, tag_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tag not found",
+        )
+    return event_service.get_events_by_tag(db, tag_id, skip=skip, limit=limit)
+
+
 @router.put("/tags/{tag_id}", response_model=schemas.Tag)
 def update_tag(
     tag_id: int,
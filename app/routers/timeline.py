@@ -0,0 +1,61 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from .. import schemas
+from ..database import get_db
+from ..dependencies.hybrid_auth import require_auth
+from ..enums import TimelineGranularity
+from ..models.user import User
+from ..services import TimelineService
+
+router = APIRouter(tags=["timeline"])
+
+
+def get_timeline_service() -> TimelineService:
+    """
+    タイムラインサービスのインスタンスを取得
+
+    Returns:
+        TimelineService: タイムラインサービスのインスタンス
+    """
+    return TimelineService()
+
+
+@router.get("/timeline", response_model=schemas.Timeline)
+def read_timeline(
+    start_date: date = Query(..., description="期間の開始日（含む）"),
+    end_date: date = Query(..., description="期間の終了日（含む）"),
+    granularity: TimelineGranularity = Query(default=TimelineGranularity.YEAR, description="集計単位"),
+    per_bucket: int = Query(default=5, description="バケットごとに返す出来事の件数（0なら件数のみ）"),
+    db: Session = Depends(get_db),
+    timeline_service: TimelineService = Depends(get_timeline_service),
+    current_user: User = Depends(require_auth),
+):
+    """
+    期間と重なる出来事を年・年代・世紀単位で集計
+
+    複数日にわたる出来事も、期間と少しでも重なれば対象になります。
+
+    Args:
+        start_date: 期間の開始日
+        end_date: 期間の終了日
+        granularity: 集計単位（year / decade / century）
+        per_bucket: バケットごとに返す出来事の件数
+        db: データベースセッション
+        timeline_service: タイムラインサービス（DI）
+
+    Returns:
+        出来事のあるバケットの一覧
+
+    Raises:
+        HTTPException: 期間またはper_bucketが無効な場合
+    """
+    try:
+        return timeline_service.get_timeline(db, start_date, end_date, granularity=granularity, per_bucket=per_bucket)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
@@ -4,9 +4,9 @@
 ユーザーのCRUD操作と管理機能を提供します。
 """
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from .. import schemas
@@ -14,27 +14,40 @@ from ..database import get_db
 from ..dependencies.hybrid_auth import require_admin, require_auth, require_moderator
 from ..enums import UserRole
 from ..models.user import User
+from ..services import StatisticsService
 from ..services.user import user_service
+from .statistics import get_statistics_service
 
 router = APIRouter(tags=["users"])
 
 
 @router.get("/users/", response_model=List[schemas.User])
 def get_users(
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(default=100, ge=1, le=1000, description="取得上限数"),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin),
 ):
-    """ユーザー一覧を取得（管理者のみ）"""
-    users = user_service.get_users(db, skip=skip, limit=limit)
+    """ユーザー一覧を取得（管理者のみ、cursor指定時はキーセットページネーション）"""
+    if cursor is None and skip > 0:
+        return user_service.get_users(db, skip=skip, limit=limit)
+
+    try:
+        users, next_cursor = user_service.get_users_page(db, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return users
 
 
 @router.get("/users/active", response_model=List[schemas.User])
 def get_active_users(
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(default=100, ge=1, le=1000, description="取得上限数"),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_moderator),
 ):
@@ -47,7 +60,7 @@ def get_active_users(
 def get_users_by_role(
     role: str,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(default=100, ge=1, le=1000, description="取得上限数"),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_moderator),
 ):
@@ -159,16 +172,14 @@ def unlock_user_account(
     return user
 
 
-@router.get("/users/stats/count")
+@router.get("/users/stats/count", response_model=schemas.UserStatistics)
 def get_user_count(
     db: Session = Depends(get_db),
+    statistics_service: StatisticsService = Depends(get_statistics_service),
     current_user: User = Depends(require_moderator),
 ):
-    """ユーザー統計情報を取得（モデレーター以上）"""
-    total_users = user_service.count_users(db)
-    active_users = user_service.count_active_users(db)
-
-    return {"total_users": total_users, "active_users": active_users, "inactive_users": total_users - active_users}
+    """ユーザー統計情報を取得（モデレーター以上、集計カウンターから取得）"""
+    return statistics_service.get_user_statistics(db)
 
 
 @router.get("/users/stats/role/{role}/count")
@@ -1,9 +1,9 @@
 from datetime import date, datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
-from .enums import UserRole
+from .enums import TimelineGranularity, UserRole
 
 
 class UserBase(BaseModel):
@@ -109,6 +109,30 @@ class Person(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class PersonSummary(BaseModel):
+    """人物一覧用の軽量レスポンススキーマ（fields=summary）"""
+
+    id: int
+    updated_at: datetime
+    ssid: str = Field(..., max_length=50, description="検索用識別子")
+    full_name: str = Field(..., max_length=100, description="フルネーム")
+    display_name: str = Field(..., max_length=50, description="表示名")
+    birth_date: date = Field(..., description="生年月日")
+    death_date: Optional[date] = Field(default=None, description="没年月日")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PersonFilter(BaseModel):
+    """人物一覧の絞り込み・並べ替え条件"""
+
+    birth_year: Optional[int] = Field(default=None, ge=1, le=9999, description="生年")
+    birth_year_from: Optional[int] = Field(default=None, ge=1, le=9999, description="生年の下限（含む）")
+    birth_year_to: Optional[int] = Field(default=None, ge=1, le=9999, description="生年の上限（含む）")
+    born_country: Optional[str] = Field(default=None, max_length=100, description="出生国（大文字小文字を区別しない）")
+    sort: str = Field(default="id", description="並び順（id / birth_date）")
+
+
 class TagBase(BaseModel):
     """タグの基本スキーマ"""
 
@@ -202,6 +226,100 @@ class Event(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class EventSummary(BaseModel):
+    """出来事一覧用の軽量レスポンススキーマ（fields=summary）"""
+
+    id: int
+    updated_at: datetime
+    ssid: str = Field(..., max_length=50, description="検索用識別子")
+    title: str = Field(..., max_length=255, description="タイトル")
+    start_date: date = Field(..., description="開始日")
+    end_date: Optional[date] = Field(default=None, description="終了日")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# 関連エンティティを含むスキーマ（include で指定したリレーションのみ設定される）
+class PersonDetail(Person):
+    """関連エンティティ付き人物レスポンススキーマ"""
+
+    tags: Optional[List[Tag]] = Field(default=None, description="タグ（include=tags）")
+    events: Optional[List[Event]] = Field(default=None, description="関連する出来事（include=events）")
+
+
+class EventDetail(Event):
+    """関連エンティティ付き出来事レスポンススキーマ"""
+
+    tags: Optional[List[Tag]] = Field(default=None, description="タグ（include=tags）")
+    persons: Optional[List[Person]] = Field(default=None, description="関連する人物（include=persons）")
+
+
+class EventNearby(Event):
+    """中心からの距離付き出来事レスポンススキーマ"""
+
+    distance_km: float = Field(..., description="中心からの距離（km）")
+
+
+class TagDetail(Tag):
+    """関連エンティティ付きタグレスポンススキーマ"""
+
+    persons: Optional[List[Person]] = Field(default=None, description="タグ付けされた人物（include=persons）")
+    events: Optional[List[Event]] = Field(default=None, description="タグ付けされた出来事（include=events）")
+
+
+class SearchResults(BaseModel):
+    """キーワード検索レスポンススキーマ（各リストはスコアの降順）"""
+
+    query: str = Field(..., description="検索語")
+    persons: List[Person] = Field(default_factory=list, description="一致した人物")
+    events: List[Event] = Field(default_factory=list, description="一致した出来事")
+    tags: List[Tag] = Field(default_factory=list, description="一致したタグ")
+
+
+class EntityCounts(BaseModel):
+    """エンティティ件数スキーマ"""
+
+    persons: int = Field(..., description="人物数")
+    events: int = Field(..., description="出来事数")
+    tags: int = Field(..., description="タグ数")
+    total: int = Field(..., description="合計")
+
+
+class Statistics(EntityCounts):
+    """統計情報スキーマ"""
+
+    events_by_year: Dict[int, int] = Field(default_factory=dict, description="開始年ごとの出来事数")
+    persons_by_country: Dict[str, int] = Field(default_factory=dict, description="出生国ごとの人物数")
+
+
+class UserStatistics(BaseModel):
+    """ユーザー統計情報スキーマ"""
+
+    total_users: int = Field(..., description="ユーザー数")
+    active_users: int = Field(..., description="有効なユーザー数")
+    inactive_users: int = Field(..., description="無効なユーザー数")
+    users_by_role: Dict[str, int] = Field(default_factory=dict, description="役割ごとのユーザー数")
+
+
+class TimelineBucket(BaseModel):
+    """タイムラインのバケット（年・年代・世紀）"""
+
+    start_year: int = Field(..., description="バケットの開始年")
+    end_year: int = Field(..., description="バケットの終了年（含む）")
+    count: int = Field(..., description="期間と重なる出来事の件数")
+    events: List[Event] = Field(default_factory=list, description="開始日の早い出来事（最大 per_bucket 件）")
+
+
+class Timeline(BaseModel):
+    """タイムラインレスポンススキーマ"""
+
+    start_date: date = Field(..., description="期間の開始日")
+    end_date: date = Field(..., description="期間の終了日")
+    granularity: TimelineGranularity = Field(..., description="集計単位")
+    total: int = Field(..., description="期間と重なる出来事の総数")
+    buckets: List[TimelineBucket] = Field(default_factory=list, description="出来事のあるバケット（開始年順）")
+
+
 # 認証関連スキーマ
 class Token(BaseModel):
     """トークンレスポンススキーマ"""
@@ -239,6 +357,13 @@ class AvatarUploadResponse(BaseModel):
 
     url: str = Field(..., description="アップロードされた画像のURL")
     filename: str = Field(..., description="保存されたファイル名")
+    srcset: Dict[str, str] = Field(
+        default_factory=dict,
+        description="画像形式（avif / webp / jpeg）ごとのsrcset（幅記述子付き。一覧表示などで小さいサイズを選べる）",
+    )
+    upload_id: Optional[str] = Field(
+        None, description="このアップロードの参照ID（同じ画像は他のアップロードと共有されるため、削除時に指定する）"
+    )
 
 
 __all__ = [
@@ -250,6 +375,7 @@ __all__ = [
     "PersonCreate",
     "PersonUpdate",
     "Person",
+    "PersonSummary",
     "TagBase",
     "TagCreate",
     "TagUpdate",
@@ -258,6 +384,8 @@ __all__ = [
     "EventCreate",
     "EventUpdate",
     "Event",
+    "EventSummary",
+    "SearchResults",
     "Token",
     "TokenData",
     "LoginRequest",
@@ -6,15 +6,25 @@
 """
 
 from .base import BaseService
+from .cache import EntityCache
 from .event_service import EventService
+from .export_service import ExportService
 from .person_service import PersonService
+from .search_service import SearchService
+from .statistics_service import StatisticsService
 from .tag_service import TagService
+from .timeline_service import TimelineService
 from .user import UserService
 
 __all__ = [
     "BaseService",
+    "EntityCache",
     "EventService",
+    "ExportService",
     "PersonService",
+    "SearchService",
+    "StatisticsService",
     "TagService",
+    "TimelineService",
     "UserService",
 ]
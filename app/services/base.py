@@ -5,17 +5,44 @@
 共通のビジネスロジックとエラーハンドリングを提供します。
 """
 
-from typing import Any, Generic, List, Optional, TypeVar
+from functools import lru_cache
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar
 
+from pydantic import BaseModel, ConfigDict, create_model
 from sqlalchemy.orm import Session
 
 # ジェネリック型の定義
 ModelType = TypeVar("ModelType")
 CreateSchemaType = TypeVar("CreateSchemaType")
 UpdateSchemaType = TypeVar("UpdateSchemaType")
+DetailSchemaType = TypeVar("DetailSchemaType", bound=BaseModel)
 
+# fieldsで指定できるプリセット名（summary_schemaのフィールド）
+SUMMARY_FIELDS = "summary"
 
-class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+# fieldsの指定に関わらず返すフィールド（ETagの計算とクライアントでの識別に使用）
+ALWAYS_INCLUDED_FIELDS = ("id", "updated_at")
+
+
+@lru_cache(maxsize=128)
+def sparse_schema(schema: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    スキーマから指定フィールドだけのスキーマを生成（フィールドの組み合わせごとにキャッシュ）
+
+    Args:
+        schema: 元のレスポンススキーマ
+        fields: 含めるフィールド名（検証済みであること）
+
+    Returns:
+        指定フィールドだけを持つスキーマ（読み込んでいない属性には触れない）
+    """
+    definitions: Dict[str, Any] = {
+        name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in fields
+    }
+    return create_model(f"{schema.__name__}Fields", __config__=ConfigDict(from_attributes=True), **definitions)
+
+
+class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType, DetailSchemaType]):
     """
     ベースサービスクラス
 
@@ -23,6 +50,13 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     共通のCRUD操作とビジネスロジックを提供します。
     """
 
+    # レスポンススキーマ・関連エンティティ付きスキーマ・includeで指定できるリレーション（サブクラスで定義）
+    response_schema: Type[BaseModel]
+    detail_schema: Type[DetailSchemaType]
+    relation_schemas: Dict[str, Type[BaseModel]] = {}
+    # 一覧用の軽量スキーマ（fields=summary、サブクラスで定義）
+    summary_schema: Optional[Type[BaseModel]] = None
+
     def __init__(self, crud_operations: Any):
         """
         初期化
@@ -44,10 +78,20 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """エンティティ一覧を取得"""
         return self.crud.get_multi(db, skip=skip, limit=limit)
 
+    def get_multi_by_cursor(
+        self, db: Session, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """エンティティ一覧をキーセットページネーションで取得"""
+        return self.crud.get_multi_by_cursor(db, cursor=cursor, limit=limit)
+
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         """エンティティを作成"""
         return self.crud.create(db, obj_in=obj_in)
 
+    def create_multi(self, db: Session, *, objs_in: List[CreateSchemaType]) -> List[ModelType]:
+        """エンティティを一括作成"""
+        return self.crud.create_multi(db, objs_in=objs_in)
+
     def update(self, db: Session, *, id: int, obj_in: UpdateSchemaType) -> Optional[ModelType]:
         """エンティティを更新"""
         return self.crud.update(db, id=id, obj_in=obj_in)
@@ -55,3 +99,97 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def remove(self, db: Session, *, id: int) -> bool:
         """エンティティを削除"""
         return self.crud.remove(db, id=id)
+
+    def parse_include(self, include: Optional[str]) -> Tuple[str, ...]:
+        """
+        include指定（カンマ区切り）を検証してリレーション名のタプルに変換
+
+        Args:
+            include: リレーション名のカンマ区切り（例: "tags,events"）
+
+        Returns:
+            重複を除いたリレーション名（未指定なら空）
+
+        Raises:
+            ValueError: 未対応のリレーション名が含まれる場合
+        """
+        names: List[str] = []
+        for name in (include or "").split(","):
+            name = name.strip()
+            if not name or name in names:
+                continue
+            if name not in self.relation_schemas:
+                allowed = ", ".join(self.relation_schemas)
+                raise ValueError(f"Invalid include '{name}'. Allowed values: {allowed}")
+            names.append(name)
+        return tuple(names)
+
+    def to_detail(self, obj: ModelType, include: Sequence[str]) -> DetailSchemaType:
+        """
+        エンティティを関連エンティティ付きスキーマに変換
+
+        includeで指定したリレーションだけを設定するため、読み込んでいないリレーションには触れません。
+
+        Args:
+            obj: 指定リレーションを読み込み済みのエンティティ
+            include: 設定するリレーション名
+
+        Returns:
+            関連エンティティ付きスキーマ
+        """
+        base = self.response_schema.model_validate(obj)
+        relations = {
+            name: [self.relation_schemas[name].model_validate(item) for item in getattr(obj, name)] for name in include
+        }
+        return self.detail_schema(**dict(base), **relations)
+
+    def parse_fields(self, fields: Optional[str], include: Sequence[str] = ()) -> Tuple[str, ...]:
+        """
+        fields指定（カンマ区切り）を検証して読み込む列名のタプルに変換
+
+        "summary" は summary_schema のフィールドを表します。id と updated_at は常に含めます。
+
+        Args:
+            fields: フィールド名のカンマ区切り（例: "full_name,birth_date" / "summary"）
+            include: 同時に指定されたリレーション名
+
+        Returns:
+            重複を除いたフィールド名（未指定なら空で、全フィールドを返す）
+
+        Raises:
+            ValueError: 未対応のフィールド名が含まれる場合、またはincludeと同時に指定された場合
+        """
+        requested = [name.strip() for name in (fields or "").split(",") if name.strip()]
+        if not requested:
+            return ()
+        if include:
+            raise ValueError("fields cannot be combined with include")
+
+        names: List[str] = list(ALWAYS_INCLUDED_FIELDS)
+        for name in requested:
+            if name == SUMMARY_FIELDS and self.summary_schema is not None:
+                expanded = list(self.summary_schema.model_fields)
+            elif name in self.response_schema.model_fields:
+                expanded = [name]
+            else:
+                allowed = ", ".join([SUMMARY_FIELDS, *self.response_schema.model_fields])
+                raise ValueError(f"Invalid fields '{name}'. Allowed values: {allowed}")
+            names.extend(field for field in expanded if field not in names)
+        return tuple(names)
+
+    def to_sparse(self, obj: ModelType, fields: Sequence[str]) -> BaseModel:
+        """
+        fieldsで読み込んだエンティティを指定フィールドだけのスキーマに変換
+
+        フィールドが summary_schema と一致する場合は summary_schema を使用します。
+
+        Args:
+            obj: 指定列を読み込み済みのエンティティ
+            fields: parse_fieldsで検証済みのフィールド名
+
+        Returns:
+            指定フィールドだけのスキーマ
+        """
+        if self.summary_schema is not None and set(fields) == set(self.summary_schema.model_fields):
+            return self.summary_schema.model_validate(obj)
+        return sparse_schema(self.response_schema, tuple(fields)).model_validate(obj)
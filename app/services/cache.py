@@ -0,0 +1,84 @@
+"""
+エンティティキャッシュ
+
+サービス層のリードスルーキャッシュを提供します。
+レスポンススキーマをJSONで保存し、ヒット時はDBアクセスと属性からの変換を省略します。
+"""
+
+from typing import Generic, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from ..core.cache import DEFAULT_TTL_SECONDS, KEY_PREFIX, CacheBackend, cache_stats, get_cache_backend
+
+SchemaType = TypeVar("SchemaType", bound=BaseModel)
+
+
+class EntityCache(Generic[SchemaType]):
+    """
+    エンティティキャッシュ
+
+    キーは `{namespace}:id:{id}` にレスポンスJSONを、`{namespace}:ssid:{ssid}` にIDを保存します。
+    SSIDはIDへの参照のみを持つため、更新・削除時はIDのエントリを消すだけで無効化できます。
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        schema: Type[SchemaType],
+        *,
+        backend: Optional[CacheBackend] = None,
+        ttl: int = DEFAULT_TTL_SECONDS,
+    ):
+        """
+        初期化
+
+        Args:
+            namespace: キーの名前空間（エンティティ名）
+            schema: キャッシュするレスポンススキーマ
+            backend: キャッシュバックエンド（デフォルトで共有バックエンドを使用）
+            ttl: エントリの有効期限（秒）
+        """
+        self.namespace = namespace
+        self.schema = schema
+        self.backend = backend
+        self.ttl = ttl
+
+    def _backend(self) -> CacheBackend:
+        return self.backend if self.backend is not None else get_cache_backend()
+
+    def _id_key(self, id: int) -> str:
+        return f"{KEY_PREFIX}{self.namespace}:id:{id}"
+
+    def _ssid_key(self, ssid: str) -> str:
+        return f"{KEY_PREFIX}{self.namespace}:ssid:{ssid}"
+
+    def get(self, id: int) -> Optional[SchemaType]:
+        """IDでキャッシュを取得"""
+        raw = self._backend().get(self._id_key(id))
+        cache_stats.record(self.namespace, hit=raw is not None)
+        if raw is None:
+            return None
+        return self.schema.model_validate_json(raw)
+
+    def get_by_ssid(self, ssid: str) -> Optional[SchemaType]:
+        """SSIDでキャッシュを取得"""
+        raw_id = self._backend().get(self._ssid_key(ssid))
+        if raw_id is None:
+            cache_stats.record(self.namespace, hit=False)
+            return None
+        return self.get(int(raw_id))
+
+    def set(self, entity: SchemaType) -> None:
+        """エンティティをキャッシュに保存"""
+        backend = self._backend()
+        entity_id = getattr(entity, "id")
+        backend.set(self._id_key(entity_id), entity.model_dump_json(), self.ttl)
+
+        ssid = getattr(entity, "ssid", None)
+        if ssid:
+            backend.set(self._ssid_key(ssid), str(entity_id), self.ttl)
+
+    def invalidate(self, id: int) -> None:
+        """IDのエントリを無効化"""
+        self._backend().delete(self._id_key(id))
@@ -6,16 +6,22 @@
 """
 
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from .. import schemas
+from ..core.geo import BoundingBox
 from ..crud.event import EventCRUD
 from .base import BaseService
+from .cache import EntityCache
 
+# 近傍検索の半径の上限（km）
+MAX_NEARBY_RADIUS_KM = 500.0
 
-class EventService(BaseService[schemas.Event, schemas.EventCreate, schemas.EventUpdate]):
+
+class EventService(BaseService[schemas.Event, schemas.EventCreate, schemas.EventUpdate, schemas.EventDetail]):
     """
     イベントサービス
 
@@ -23,16 +29,23 @@ class EventService(BaseService[schemas.Event, schemas.EventCreate, schemas.Event
     シンプルなDI（依存性注入）パターンを使用してCRUD層との結合度を下げます。
     """
 
-    def __init__(self, event_crud=None):
+    response_schema = schemas.Event
+    detail_schema = schemas.EventDetail
+    relation_schemas = {"tags": schemas.Tag, "persons": schemas.Person}
+    summary_schema = schemas.EventSummary
+
+    def __init__(self, event_crud=None, cache: Optional[EntityCache[schemas.Event]] = None):
         """
         初期化
 
         Args:
             event_crud: イベントCRUDオブジェクト（デフォルトでEventCRUD()を使用）
+            cache: イベントキャッシュ（デフォルトで共有キャッシュバックエンドを使用）
         """
         if event_crud is None:
             event_crud = EventCRUD()
         super().__init__(event_crud)
+        self.cache = cache if cache is not None else EntityCache("event", schemas.Event)
 
     def create_event(self, db: Session, event: schemas.EventCreate) -> schemas.Event:
         """
@@ -62,39 +75,108 @@ class EventService(BaseService[schemas.Event, schemas.EventCreate, schemas.Event
         # レスポンススキーマに変換
         return schemas.Event.model_validate(created_event)
 
-    def get_event(self, db: Session, event_id: int) -> Optional[schemas.Event]:
+    def create_events(self, db: Session, events: List[schemas.EventCreate]) -> List[schemas.Event]:
+        """
+        イベントを一括作成
+
+        SSIDの重複チェックは1クエリ、作成は1トランザクションで行い、
+        1件でも不正なデータがあれば何も作成しません。
+
+        Args:
+            db: データベースセッション
+            events: イベント作成データのリスト
+
+        Returns:
+            作成されたイベントのリスト（入力順）
+
+        Raises:
+            ValueError: SSIDが重複・登録済みの場合、またはバリデーションエラーの場合
+        """
+        # ビジネスルール: データバリデーション
+        for event in events:
+            self.validate_event_data(event)
+
+        # ビジネスルール: SSIDの重複チェック（リクエスト内・登録済み）
+        ssids = [event.ssid for event in events]
+        duplicated = sorted({ssid for ssid in ssids if ssids.count(ssid) > 1})
+        if duplicated:
+            raise ValueError(f"SSID '{duplicated[0]}' is duplicated in the request")
+
+        existing = self.crud.get_existing_ssids(db, ssids)
+        if existing:
+            raise ValueError(f"SSID '{sorted(existing)[0]}' is already registered")
+
+        # CRUD操作を実行
+        created_events = self.create_multi(db, objs_in=events)
+
+        # レスポンススキーマに変換
+        return [schemas.Event.model_validate(event) for event in created_events]
+
+    def get_event(self, db: Session, event_id: int, include: Optional[str] = None) -> Optional[schemas.Event]:
         """
         イベントを取得
 
         Args:
             db: データベースセッション
             event_id: イベントID
+            include: 含める関連エンティティ（tags,persons のカンマ区切り）
 
         Returns:
             イベントまたはNone
+
+        Raises:
+            ValueError: includeが不正な場合
         """
+        relations = self.parse_include(include)
+        if relations:
+            # 関連エンティティはキャッシュせず、selectinloadで一括読み込みする
+            event = self.crud.get(db, event_id, include=relations)
+            return self.to_detail(event, relations) if event else None
+
+        cached = self.cache.get(event_id)
+        if cached is not None:
+            return cached
+
         event = self.get(db, event_id)
         if event:
-            return schemas.Event.model_validate(event)
+            result = schemas.Event.model_validate(event)
+            self.cache.set(result)
+            return result
         return None
 
-    def get_event_by_ssid(self, db: Session, ssid: str) -> Optional[schemas.Event]:
+    def get_event_by_ssid(self, db: Session, ssid: str, include: Optional[str] = None) -> Optional[schemas.Event]:
         """
         SSIDでイベントを取得
 
         Args:
             db: データベースセッション
             ssid: イベントのSSID
+            include: 含める関連エンティティ（tags,persons のカンマ区切り）
 
         Returns:
             イベントまたはNone
+
+        Raises:
+            ValueError: includeが不正な場合
         """
+        relations = self.parse_include(include)
+        if relations:
+            event = self.crud.get_by_ssid(db, ssid, include=relations)
+            return self.to_detail(event, relations) if event else None
+
         event = self.get_by_ssid(db, ssid)
         if event:
             return schemas.Event.model_validate(event)
         return None
 
-    def get_events(self, db: Session, skip: int = 0, limit: int = 100) -> List[schemas.Event]:
+    def get_events(
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        include: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> List[BaseModel]:
         """
         イベント一覧を取得
 
@@ -102,13 +184,63 @@ class EventService(BaseService[schemas.Event, schemas.EventCreate, schemas.Event
             db: データベースセッション
             skip: スキップ数
             limit: 取得上限数
+            include: 含める関連エンティティ（tags,persons のカンマ区切り）
+            fields: 返すフィールド（カンマ区切り、または summary）
 
         Returns:
-            イベントのリスト
+            イベントのリスト（fields指定時は指定フィールドだけのスキーマ）
+
+        Raises:
+            ValueError: includeまたはfieldsが不正な場合
         """
+        relations = self.parse_include(include)
+        columns = self.parse_fields(fields, relations)
+        if columns:
+            events = self.crud.get_multi(db, skip=skip, limit=limit, fields=columns)
+            return [self.to_sparse(e, columns) for e in events]
+        if relations:
+            events = self.crud.get_multi(db, skip=skip, limit=limit, include=relations)
+            return [self.to_detail(e, relations) for e in events]
+
         events = self.get_multi(db, skip=skip, limit=limit)
         return [schemas.Event.model_validate(e) for e in events]
 
+    def get_events_page(
+        self,
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        include: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> Tuple[List[BaseModel], Optional[str]]:
+        """
+        イベント一覧をカーソルで取得
+
+        Args:
+            db: データベースセッション
+            cursor: 前ページのnext_cursor（最初のページはNone）
+            limit: 取得上限数
+            include: 含める関連エンティティ（tags,persons のカンマ区切り）
+            fields: 返すフィールド（カンマ区切り、または summary）
+
+        Returns:
+            (イベントのリスト（fields指定時は指定フィールドだけのスキーマ）, 次ページのカーソル)
+
+        Raises:
+            ValueError: カーソル・include・fieldsが不正な場合
+        """
+        relations = self.parse_include(include)
+        columns = self.parse_fields(fields, relations)
+        if columns:
+            events, next_cursor = self.crud.get_multi_by_cursor(db, cursor=cursor, limit=limit, fields=columns)
+            return [self.to_sparse(e, columns) for e in events], next_cursor
+        if relations:
+            events, next_cursor = self.crud.get_multi_by_cursor(db, cursor=cursor, limit=limit, include=relations)
+            return [self.to_detail(e, relations) for e in events], next_cursor
+
+        events, next_cursor = self.get_multi_by_cursor(db, cursor=cursor, limit=limit)
+        return [schemas.Event.model_validate(e) for e in events], next_cursor
+
     def update_event(self, db: Session, event_id: int, event: schemas.EventUpdate) -> Optional[schemas.Event]:
         """
         イベントを更新
@@ -129,6 +261,7 @@ class EventService(BaseService[schemas.Event, schemas.EventCreate, schemas.Event
 
         # CRUD操作を実行
         updated_event = self.update(db, id=event_id, obj_in=event)
+        self.cache.invalidate(event_id)
 
         if updated_event:
             return schemas.Event.model_validate(updated_event)
@@ -145,7 +278,9 @@ class EventService(BaseService[schemas.Event, schemas.EventCreate, schemas.Event
         Returns:
             削除成功フラグ
         """
-        return self.remove(db, id=event_id)
+        deleted = self.remove(db, id=event_id)
+        self.cache.invalidate(event_id)
+        return deleted
 
     def validate_event_data(self, event: schemas.EventCreate) -> None:
         """
@@ -278,6 +413,113 @@ class EventService(BaseService[schemas.Event, schemas.EventCreate, schemas.Event
         # ビジネスロジック: Pydanticスキーマに変換
         return [schemas.Event.model_validate(event) for event in events]
 
+    def get_events_in_bbox(
+        self, db: Session, min_lat: float, min_lon: float, max_lat: float, max_lon: float, limit: int = 100
+    ) -> List[schemas.Event]:
+        """
+        矩形内のイベントを取得
+
+        Args:
+            db: データベースセッション
+            min_lat: 南端の緯度
+            min_lon: 西端の経度（max_lonより大きい場合は日付変更線をまたぐ）
+            max_lat: 北端の緯度
+            max_lon: 東端の経度
+            limit: 取得上限数
+
+        Returns:
+            開始日順のイベントのリスト
+
+        Raises:
+            ValueError: 緯度経度が無効な場合
+        """
+        # ビジネスルール: 緯度経度の検証
+        self.validate_coordinates(min_lat, min_lon)
+        self.validate_coordinates(max_lat, max_lon)
+        if min_lat > max_lat:
+            raise ValueError("min_lat cannot be greater than max_lat")
+
+        events = self.crud.get_events_in_bbox(db, BoundingBox(min_lat, min_lon, max_lat, max_lon), limit=limit)
+        return [schemas.Event.model_validate(event) for event in events]
+
+    def get_events_nearby(
+        self, db: Session, latitude: float, longitude: float, radius_km: float, limit: int = 100
+    ) -> List[schemas.EventNearby]:
+        """
+        中心から半径 radius_km 以内のイベントを近い順に取得
+
+        Args:
+            db: データベースセッション
+            latitude: 中心の緯度
+            longitude: 中心の経度
+            radius_km: 半径（km）
+            limit: 取得上限数
+
+        Returns:
+            距離付きイベントのリスト（距離順）
+
+        Raises:
+            ValueError: 緯度経度または半径が無効な場合
+        """
+        # ビジネスルール: 緯度経度と半径の検証
+        self.validate_coordinates(latitude, longitude)
+        if not 0 < radius_km <= MAX_NEARBY_RADIUS_KM:
+            raise ValueError(f"Radius must be greater than 0 and at most {MAX_NEARBY_RADIUS_KM:g} km")
+
+        nearby = self.crud.get_events_nearby(db, latitude, longitude, radius_km, limit=limit)
+        return [
+            schemas.EventNearby(**schemas.Event.model_validate(event).model_dump(), distance_km=round(distance, 3))
+            for event, distance in nearby
+        ]
+
+    def validate_coordinates(self, latitude: float, longitude: float) -> None:
+        """
+        緯度経度のバリデーション
+
+        Args:
+            latitude: 緯度
+            longitude: 経度
+
+        Raises:
+            ValueError: 範囲外の場合
+        """
+        if not -90 <= latitude <= 90:
+            raise ValueError("Latitude must be between -90 and 90")
+        if not -180 <= longitude <= 180:
+            raise ValueError("Longitude must be between -180 and 180")
+
+    def get_events_by_person(self, db: Session, person_id: int, skip: int = 0, limit: int = 100) -> List[schemas.Event]:
+        """
+        人物に関連するイベントを取得
+
+        Args:
+            db: データベースセッション
+            person_id: 人物ID
+            skip: スキップ数
+            limit: 取得上限数
+
+        Returns:
+            開始日順のイベントのリスト
+        """
+        events = self.crud.get_events_by_person(db, person_id, skip=skip, limit=limit)
+        return [schemas.Event.model_validate(event) for event in events]
+
+    def get_events_by_tag(self, db: Session, tag_id: int, skip: int = 0, limit: int = 100) -> List[schemas.Event]:
+        """
+        タグに関連するイベントを取得
+
+        Args:
+            db: データベースセッション
+            tag_id: タグID
+            skip: スキップ数
+            limit: 取得上限数
+
+        Returns:
+            開始日順のイベントのリスト
+        """
+        events = self.crud.get_events_by_tag(db, tag_id, skip=skip, limit=limit)
+        return [schemas.Event.model_validate(event) for event in events]
+
     def get_event_statistics_by_year(self, db: Session, year: int) -> dict:
         """
         指定年のイベント統計を取得
@@ -0,0 +1,108 @@
+"""
+エクスポートサービス
+
+人物・イベント・タグの全件をNDJSON / CSVとしてストリーミング出力します。
+シンプルなDI（依存性注入）パターンを使用してCRUD層との結合度を下げます。
+"""
+
+import csv
+import io
+import json
+from typing import Any, Dict, Iterator, List, Tuple, Type
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from .. import schemas
+from ..crud.event import EventCRUD
+from ..crud.person import PersonCRUD
+from ..crud.streaming import DEFAULT_CHUNK_SIZE
+from ..crud.tag import TagCRUD
+from ..enums import ExportTarget
+
+
+class ExportService:
+    """
+    エクスポートサービス
+
+    サーバーサイドカーソルで1チャンクずつ読み出し、チャンクごとに文字列を返します。
+    全件をリストやJSON配列としてメモリに展開しないため、件数に関わらず一定のメモリで動作します。
+    """
+
+    def __init__(self, person_crud=None, event_crud=None, tag_crud=None):
+        """
+        初期化
+
+        Args:
+            person_crud: 人物CRUDオブジェクト（デフォルトでPersonCRUD()を使用）
+            event_crud: イベントCRUDオブジェクト（デフォルトでEventCRUD()を使用）
+            tag_crud: タグCRUDオブジェクト（デフォルトでTagCRUD()を使用）
+        """
+        self.targets: Dict[ExportTarget, Tuple[Any, Type[BaseModel]]] = {
+            ExportTarget.PERSONS: (person_crud or PersonCRUD(), schemas.Person),
+            ExportTarget.EVENTS: (event_crud or EventCRUD(), schemas.Event),
+            ExportTarget.TAGS: (tag_crud or TagCRUD(), schemas.Tag),
+        }
+
+    def stream_ndjson(self, db: Session, target: ExportTarget, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        """
+        全件をNDJSON（1行1レコード）で出力
+
+        Args:
+            db: データベースセッション（出力完了時にクローズします）
+            target: エクスポート対象
+            chunk_size: 1チャンクあたりの行数
+
+        Yields:
+            チャンク分のNDJSON文字列
+        """
+        crud, schema = self.targets[target]
+        try:
+            for chunk in crud.iter_chunks(db, chunk_size=chunk_size):
+                yield "".join(schema.model_validate(row).model_dump_json() + "\n" for row in chunk)
+        finally:
+            # レスポンス送信中もセッションを使うため、依存性の後始末ではなくここで閉じる
+            db.close()
+
+    def stream_csv(self, db: Session, target: ExportTarget, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        """
+        全件をヘッダー付きCSVで出力
+
+        dict型のカラム（image_url等）はJSON文字列、NoneはCSVの空欄になります。
+
+        Args:
+            db: データベースセッション（出力完了時にクローズします）
+            target: エクスポート対象
+            chunk_size: 1チャンクあたりの行数
+
+        Yields:
+            チャンク分のCSV文字列（最初はヘッダー行）
+        """
+        crud, schema = self.targets[target]
+        columns = list(schema.model_fields)
+        try:
+            yield self._csv_rows([columns])
+            for chunk in crud.iter_chunks(db, chunk_size=chunk_size):
+                yield self._csv_rows(
+                    [self._csv_values(schema.model_validate(row).model_dump(mode="json"), columns) for row in chunk]
+                )
+        finally:
+            db.close()
+
+    @staticmethod
+    def _csv_values(data: Dict[str, Any], columns: List[str]) -> List[Any]:
+        """1レコードをCSVの値リストに変換"""
+        values = []
+        for column in columns:
+            value = data[column]
+            if isinstance(value, (dict, list)):
+                value = json.dumps(value, ensure_ascii=False)
+            values.append(value)
+        return values
+
+    @staticmethod
+    def _csv_rows(rows: List[List[Any]]) -> str:
+        """行のリストをCSV文字列に変換"""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue()
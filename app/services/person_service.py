@@ -5,16 +5,18 @@
 シンプルなDI（依存性注入）パターンを使用してCRUD層との結合度を下げます。
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
 from ..crud.person import PersonCRUD
 from .base import BaseService
+from .cache import EntityCache
 
 
-class PersonService(BaseService[models.Person, schemas.PersonCreate, schemas.PersonUpdate]):
+class PersonService(BaseService[models.Person, schemas.PersonCreate, schemas.PersonUpdate, schemas.PersonDetail]):
     """
     人物サービス
 
@@ -22,16 +24,23 @@ class PersonService(BaseService[models.Person, schemas.PersonCreate, schemas.Per
     シンプルなDI（依存性注入）パターンを使用してCRUD層との結合度を下げます。
     """
 
-    def __init__(self, person_crud=None):
+    response_schema = schemas.Person
+    detail_schema = schemas.PersonDetail
+    relation_schemas = {"tags": schemas.Tag, "events": schemas.Event}
+    summary_schema = schemas.PersonSummary
+
+    def __init__(self, person_crud=None, cache: Optional[EntityCache[schemas.Person]] = None):
         """
         初期化
 
         Args:
             person_crud: 人物CRUDオブジェクト（デフォルトでPersonCRUD()を使用）
+            cache: 人物キャッシュ（デフォルトで共有キャッシュバックエンドを使用）
         """
         if person_crud is None:
             person_crud = PersonCRUD()
         super().__init__(person_crud)
+        self.cache = cache if cache is not None else EntityCache("person", schemas.Person)
 
     def create_person(self, db: Session, person: schemas.PersonCreate) -> schemas.Person:
         """
@@ -61,39 +70,115 @@ class PersonService(BaseService[models.Person, schemas.PersonCreate, schemas.Per
         # レスポンススキーマに変換
         return schemas.Person.model_validate(created_person)
 
-    def get_person(self, db: Session, person_id: int) -> Optional[schemas.Person]:
+    def create_persons(self, db: Session, persons: List[schemas.PersonCreate]) -> List[schemas.Person]:
+        """
+        人物を一括作成
+
+        SSIDの重複チェックは1クエリ、作成は1トランザクションで行い、
+        1件でも不正なデータがあれば何も作成しません。
+
+        Args:
+            db: データベースセッション
+            persons: 人物作成データのリスト
+
+        Returns:
+            作成された人物のリスト（入力順）
+
+        Raises:
+            ValueError: SSIDが重複・登録済みの場合、またはバリデーションエラーの場合
+        """
+        # ビジネスルール: データバリデーション
+        for person in persons:
+            self.validate_person_data(person)
+
+        # ビジネスルール: SSIDの重複チェック（リクエスト内・登録済み）
+        ssids = [person.ssid for person in persons]
+        duplicated = sorted({ssid for ssid in ssids if ssids.count(ssid) > 1})
+        if duplicated:
+            raise ValueError(f"SSID '{duplicated[0]}' is duplicated in the request")
+
+        existing = self.crud.get_existing_ssids(db, ssids)
+        if existing:
+            raise ValueError(f"SSID '{sorted(existing)[0]}' is already registered")
+
+        # CRUD操作を実行
+        created_persons = self.create_multi(db, objs_in=persons)
+
+        # レスポンススキーマに変換
+        return [schemas.Person.model_validate(person) for person in created_persons]
+
+    def get_person(self, db: Session, person_id: int, include: Optional[str] = None) -> Optional[schemas.Person]:
         """
         人物を取得
 
         Args:
             db: データベースセッション
             person_id: 人物ID
+            include: 含める関連エンティティ（tags,events のカンマ区切り）
 
         Returns:
             人物またはNone
+
+        Raises:
+            ValueError: includeが不正な場合
         """
+        relations = self.parse_include(include)
+        if relations:
+            # 関連エンティティはキャッシュせず、selectinloadで一括読み込みする
+            person = self.crud.get(db, person_id, include=relations)
+            return self.to_detail(person, relations) if person else None
+
+        cached = self.cache.get(person_id)
+        if cached is not None:
+            return cached
+
         person = self.get(db, person_id)
         if person:
-            return schemas.Person.model_validate(person)
+            result = schemas.Person.model_validate(person)
+            self.cache.set(result)
+            return result
         return None
 
-    def get_person_by_ssid(self, db: Session, ssid: str) -> Optional[schemas.Person]:
+    def get_person_by_ssid(self, db: Session, ssid: str, include: Optional[str] = None) -> Optional[schemas.Person]:
         """
         SSIDで人物を取得
 
         Args:
             db: データベースセッション
             ssid: 人物のSSID
+            include: 含める関連エンティティ（tags,events のカンマ区切り）
 
         Returns:
             人物またはNone
+
+        Raises:
+            ValueError: includeが不正な場合
         """
+        relations = self.parse_include(include)
+        if relations:
+            person = self.crud.get_by_ssid(db, ssid, include=relations)
+            return self.to_detail(person, relations) if person else None
+
+        cached = self.cache.get_by_ssid(ssid)
+        if cached is not None:
+            return cached
+
         person = self.get_by_ssid(db, ssid)
         if person:
-            return schemas.Person.model_validate(person)
+            result = schemas.Person.model_validate(person)
+            self.cache.set(result)
+            return result
         return None
 
-    def get_persons(self, db: Session, skip: int = 0, limit: int = 100) -> List[schemas.Person]:
+    def get_persons(
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        include: Optional[str] = None,
+        filters: Optional[schemas.PersonFilter] = None,
+        fields: Optional[str] = None,
+    ) -> List[BaseModel]:
         """
         人物一覧を取得
 
@@ -101,13 +186,64 @@ class PersonService(BaseService[models.Person, schemas.PersonCreate, schemas.Per
             db: データベースセッション
             skip: スキップ数
             limit: 取得上限数
+            include: 含める関連エンティティ（tags,events のカンマ区切り）
+            filters: 絞り込み・並べ替え条件
+            fields: 返すフィールド（カンマ区切り、または summary）
 
         Returns:
-            人物のリスト
+            人物のリスト（fields指定時は指定フィールドだけのスキーマ）
+
+        Raises:
+            ValueError: include・fields・絞り込み条件・並べ替えキーが不正な場合
         """
-        persons = self.get_multi(db, skip=skip, limit=limit)
+        relations = self.parse_include(include)
+        columns = self.parse_fields(fields, relations)
+        self.validate_person_filter(filters)
+        persons = self.crud.get_multi(db, skip=skip, limit=limit, include=relations, filters=filters, fields=columns)
+        if columns:
+            return [self.to_sparse(p, columns) for p in persons]
+        if relations:
+            return [self.to_detail(p, relations) for p in persons]
         return [schemas.Person.model_validate(p) for p in persons]
 
+    def get_persons_page(
+        self,
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        include: Optional[str] = None,
+        filters: Optional[schemas.PersonFilter] = None,
+        fields: Optional[str] = None,
+    ) -> Tuple[List[BaseModel], Optional[str]]:
+        """
+        人物一覧をカーソルで取得
+
+        Args:
+            db: データベースセッション
+            cursor: 前ページのnext_cursor（最初のページはNone）
+            limit: 取得上限数
+            include: 含める関連エンティティ（tags,events のカンマ区切り）
+            filters: 絞り込み・並べ替え条件
+            fields: 返すフィールド（カンマ区切り、または summary）
+
+        Returns:
+            (人物のリスト（fields指定時は指定フィールドだけのスキーマ）, 次ページのカーソル)
+
+        Raises:
+            ValueError: カーソル・include・fields・絞り込み条件・並べ替えキーが不正な場合
+        """
+        relations = self.parse_include(include)
+        columns = self.parse_fields(fields, relations)
+        self.validate_person_filter(filters)
+        persons, next_cursor = self.crud.get_multi_by_cursor(
+            db, cursor=cursor, limit=limit, include=relations, filters=filters, fields=columns
+        )
+        if columns:
+            return [self.to_sparse(p, columns) for p in persons], next_cursor
+        if relations:
+            return [self.to_detail(p, relations) for p in persons], next_cursor
+        return [schemas.Person.model_validate(p) for p in persons], next_cursor
+
     def update_person(self, db: Session, person_id: int, person: schemas.PersonUpdate) -> Optional[schemas.Person]:
         """
         人物を更新
@@ -128,6 +264,7 @@ class PersonService(BaseService[models.Person, schemas.PersonCreate, schemas.Per
 
         # CRUD操作を実行
         updated_person = self.update(db, id=person_id, obj_in=person)
+        self.cache.invalidate(person_id)
 
         if updated_person:
             return schemas.Person.model_validate(updated_person)
@@ -144,7 +281,9 @@ class PersonService(BaseService[models.Person, schemas.PersonCreate, schemas.Per
         Returns:
             削除成功フラグ
         """
-        return self.remove(db, id=person_id)
+        deleted = self.remove(db, id=person_id)
+        self.cache.invalidate(person_id)
+        return deleted
 
     def validate_person_data(self, person: schemas.PersonCreate) -> None:
         """
@@ -184,6 +323,24 @@ class PersonService(BaseService[models.Person, schemas.PersonCreate, schemas.Per
             if person.birth_date > person.death_date:
                 raise ValueError("Birth date cannot be after death date")
 
+    def validate_person_filter(self, filters: Optional[schemas.PersonFilter]) -> None:
+        """
+        人物の絞り込み条件のバリデーション
+
+        Args:
+            filters: 絞り込み条件
+
+        Raises:
+            ValueError: バリデーションエラーの場合
+        """
+        if filters is None:
+            return
+
+        # ビジネスルール: 生年の範囲の整合性チェック
+        if filters.birth_year_from is not None and filters.birth_year_to is not None:
+            if filters.birth_year_from > filters.birth_year_to:
+                raise ValueError("birth_year_from cannot be after birth_year_to")
+
     def get_persons_by_birth_year(
         self, db: Session, year: int, skip: int = 0, limit: int = 100
     ) -> List[schemas.Person]:
@@ -199,13 +356,8 @@ class PersonService(BaseService[models.Person, schemas.PersonCreate, schemas.Per
         Returns:
             人物のリスト
         """
-        persons = self.get_multi(db, skip=skip, limit=limit)
-        filtered_persons = [
-            p
-            for p in persons
-            if hasattr(p, "birth_date") and getattr(p, "birth_date", None) and p.birth_date.year == year
-        ]
-        return [schemas.Person.model_validate(p) for p in filtered_persons]
+        persons = self.crud.get_multi(db, skip=skip, limit=limit, filters=schemas.PersonFilter(birth_year=year))
+        return [schemas.Person.model_validate(p) for p in persons]
 
     def get_persons_by_country(
         self, db: Session, country: str, skip: int = 0, limit: int = 100
@@ -215,19 +367,12 @@ class PersonService(BaseService[models.Person, schemas.PersonCreate, schemas.Per
 
         Args:
             db: データベースセッション
-            country: 出生国
+            country: 出生国（大文字小文字を区別しない）
             skip: スキップ数
             limit: 取得上限数
 
         Returns:
             人物のリスト
         """
-        persons = self.get_multi(db, skip=skip, limit=limit)
-        filtered_persons = [
-            p
-            for p in persons
-            if hasattr(p, "born_country")
-            and getattr(p, "born_country", None)
-            and p.born_country.lower() == country.lower()
-        ]
-        return [schemas.Person.model_validate(p) for p in filtered_persons]
+        persons = self.crud.get_multi(db, skip=skip, limit=limit, filters=schemas.PersonFilter(born_country=country))
+        return [schemas.Person.model_validate(p) for p in persons]
@@ -2,18 +2,70 @@
 AWS S3ストレージサービス
 
 画像ファイルのS3へのアップロード、ダウンロード、削除機能を提供します。
+S3クライアントは接続プールごとプロセス内で共有し、大きなオブジェクトはマルチパートアップロードで送信します。
+アバター画像は処理後の内容のハッシュをキーにして保存し、同じ画像の再アップロードではS3への書き込みを省略します。
 """
 
+import asyncio
+import hashlib
 import io
 import os
-import uuid
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import IO, BinaryIO, Dict, List, Optional, Tuple, Union
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from fastapi import HTTPException, status
-from PIL import Image
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from ..core.image_executor import ImageExecutorBusyError, image_executor
+from ..core.images import ImageVariant, InvalidImageError, ProcessedAvatar, process_avatar_images
+from ..crud.storage import avatar_object_crud
+
+# 画像処理の待ち行列が満杯のときに再試行を促す秒数
+IMAGE_BUSY_RETRY_AFTER_SECONDS = 2
+
+# S3クライアントのHTTP接続プールの大きさ（botocoreのデフォルトは10。スレッドプールからの同時送信数に合わせる）
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "32"))
+
+# この大きさ以上のオブジェクトはマルチパートアップロードで送信（S3のパートの最小サイズは5MB）
+S3_MULTIPART_THRESHOLD = int(os.getenv("S3_MULTIPART_THRESHOLD_BYTES", str(8 * 1024 * 1024)))
+S3_MULTIPART_CHUNKSIZE = int(os.getenv("S3_MULTIPART_CHUNKSIZE_BYTES", str(8 * 1024 * 1024)))
+
+# マルチパートアップロードで同時に送信するパート数
+S3_MULTIPART_CONCURRENCY = int(os.getenv("S3_MULTIPART_CONCURRENCY", "4"))
+
+# アバター画像のCache-Control（キーは毎回新しいため、1年間キャッシュ）
+AVATAR_CACHE_CONTROL = "max-age=31536000"
+
+
+@lru_cache(maxsize=None)
+def get_s3_client(region_name: str, aws_access_key_id: str, aws_secret_access_key: str):
+    """
+    接続プール付きのS3クライアントを取得
+
+    クライアントの作成（エンドポイント定義の読み込みなど）は1回あたり10ms程度かかるため、
+    同じ設定では1つのクライアントを共有します。boto3のクライアントはスレッドセーフです。
+
+    Args:
+        region_name: AWSリージョン
+        aws_access_key_id: AWSアクセスキー
+        aws_secret_access_key: AWSシークレットキー
+
+    Returns:
+        S3クライアント
+    """
+    return boto3.client(
+        "s3",
+        region_name=region_name,
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        config=Config(max_pool_connections=S3_MAX_POOL_CONNECTIONS, retries={"mode": "standard"}),
+    )
 
 
 class S3StorageService:
@@ -43,12 +95,14 @@ class S3StorageService:
         if not self.bucket_name:
             raise ValueError("AWS_S3_BUCKET_NAME environment variable is required")
 
-        # S3クライアントを初期化
-        self.s3_client = boto3.client(
-            "s3",
-            region_name=self.region_name,
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key,
+        # S3クライアントを取得（接続プールごと共有）
+        self.s3_client = get_s3_client(self.region_name, self.aws_access_key_id, self.aws_secret_access_key)
+
+        # 大きなオブジェクトのマルチパートアップロード設定
+        self.transfer_config = TransferConfig(
+            multipart_threshold=S3_MULTIPART_THRESHOLD,
+            multipart_chunksize=S3_MULTIPART_CHUNKSIZE,
+            max_concurrency=S3_MULTIPART_CONCURRENCY,
         )
 
         # 許可された画像拡張子
@@ -57,7 +111,9 @@ class S3StorageService:
         # 最大ファイルサイズ（5MB）
         self.max_file_size = 5 * 1024 * 1024
 
-    def upload_avatar(self, file_content: bytes, filename: str, content_type: str) -> dict:
+    def upload_avatar(
+        self, file_content: bytes, filename: str, content_type: str, db: Optional[Session] = None
+    ) -> dict:
         """
         アバター画像をS3にアップロード
 
@@ -65,71 +121,278 @@ class S3StorageService:
             file_content: ファイルの内容
             filename: ファイル名
             content_type: コンテンツタイプ
+            db: 参照数を記録するデータベースセッション（省略時は記録しない）
 
         Returns:
-            dict: アップロード結果（url, filename）
+            dict: アップロード結果（url, filename, srcset, upload_id）
 
         Raises:
             HTTPException: アップロードエラー時
         """
+        # ファイルサイズチェック
+        if len(file_content) > self.max_file_size:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"ファイルサイズが大きすぎます。最大{self.max_file_size // (1024*1024)}MBまで",
+            )
+        return self.upload_avatar_file(io.BytesIO(file_content), filename, content_type, db)
+
+    def upload_avatar_file(
+        self, file: IO[bytes], filename: str, content_type: str, db: Optional[Session] = None
+    ) -> dict:
+        """
+        ファイルオブジェクトのアバター画像をS3にアップロード
+
+        画像処理を呼び出し元のスレッドで行います。async のルートからは upload_avatar_async を使用してください。
+
+        Args:
+            file: 画像ファイル（シーク可能であること）
+            filename: ファイル名
+            content_type: コンテンツタイプ
+            db: 参照数を記録するデータベースセッション（省略時は記録しない）
+
+        Returns:
+            dict: アップロード結果（url, filename, srcset, upload_id）
+
+        Raises:
+            HTTPException: アップロードエラー時
+        """
+        file_extension = self._validate_extension(filename)
+        return self._store_avatar(self._process_image(file, file_extension), file_extension, content_type, db)
+
+    async def upload_avatar_async(
+        self, file: IO[bytes], filename: str, content_type: str, db: Optional[Session] = None
+    ) -> dict:
+        """
+        アバター画像を画像処理用ワーカープロセスで処理してS3にアップロード
+
+        デコード・縮小・エンコードは image_executor で、S3への送信はスレッドプールで並列に行うため、
+        イベントループを止めません。サイズ上限は受信時に確認済みであること。
+
+        Args:
+            file: 画像ファイル（シーク可能であること）
+            filename: ファイル名
+            content_type: コンテンツタイプ
+            db: 参照数を記録するデータベースセッション（省略時は記録しない）
+
+        Returns:
+            dict: アップロード結果（url, filename, srcset, upload_id）
+
+        Raises:
+            HTTPException: アップロードエラー時（画像処理の待ち行列が満杯の場合は503）
+        """
+        file_extension = self._validate_extension(filename)
+        file.seek(0)
         try:
-            # ファイルサイズチェック
-            if len(file_content) > self.max_file_size:
-                raise HTTPException(
-                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    detail=f"ファイルサイズが大きすぎます。最大{self.max_file_size // (1024*1024)}MBまで",
-                )
+            processed = await image_executor.process_avatar(file.read(), file_extension)
+        except ImageExecutorBusyError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="画像処理が混み合っています。しばらくしてから再度お試しください",
+                headers={"Retry-After": str(IMAGE_BUSY_RETRY_AFTER_SECONDS)},
+            )
+        except InvalidImageError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="無効な画像ファイルです")
 
-            # ファイル拡張子チェック
-            file_extension = Path(filename).suffix.lower()
-            if file_extension not in self.allowed_extensions:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"サポートされていないファイル形式です。許可: {', '.join(self.allowed_extensions)}",
-                )
+        return await self._store_avatar_async(processed, file_extension, content_type, db)
 
-            # 画像の検証とリサイズ
-            processed_content = self._process_image(file_content, file_extension)
+    def _validate_extension(self, filename: str) -> str:
+        """
+        ファイル拡張子を検証
 
-            # ユニークなファイル名を生成
-            unique_filename = f"avatars/{uuid.uuid4()}{file_extension}"
+        Returns:
+            str: 小文字の拡張子
 
-            # S3にアップロード
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=unique_filename,
-                Body=processed_content,
-                ContentType=content_type,
-                CacheControl="max-age=31536000",  # 1年間キャッシュ
+        Raises:
+            HTTPException: 許可されていない拡張子の場合
+        """
+        file_extension = Path(filename).suffix.lower()
+        if file_extension not in self.allowed_extensions:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"サポートされていないファイル形式です。許可: {', '.join(self.allowed_extensions)}",
             )
+        return file_extension
 
-            # URLを生成
-            url = f"https://{self.bucket_name}.s3.{self.region_name}.amazonaws.com/{unique_filename}"
+    def _store_avatar(
+        self, processed: ProcessedAvatar, file_extension: str, content_type: str, db: Optional[Session] = None
+    ) -> dict:
+        """
+        処理済みのアバター画像とバリアントをS3に保存
 
-            return {"url": url, "filename": unique_filename}
+        本体は avatars/{ハッシュ}{拡張子}、バリアントは avatars/{ハッシュ}/{サイズ}{拡張子} に保存します。
+        同じ画像がすでに保存されている場合は書き込みを省略し、既存のURLを返します。
 
-        except ClientError as e:
-            error_code = e.response["Error"]["Code"]
+        Args:
+            processed: 処理された画像とバリアント
+            file_extension: ファイル拡張子
+            content_type: コンテンツタイプ
+            db: 参照数を記録するデータベースセッション（省略時は記録しない）
+
+        Returns:
+            dict: アップロード結果（url, filename, srcset, upload_id）
+
+        Raises:
+            HTTPException: アップロードエラー時
+        """
+        key = self._avatar_key(processed, file_extension)
+        upload_id, references = self._acquire(db, key)
+
+        try:
+            if not self._is_stored(key, references):
+                for object_key, body, object_content_type in self._avatar_objects(key, processed, content_type):
+                    self.upload_object(object_key, body, object_content_type)
+        except Exception as e:
+            self._release(db, upload_id)
+            raise self._upload_error(e)
+
+        return self._avatar_result(key, processed, upload_id)
+
+    async def _store_avatar_async(
+        self, processed: ProcessedAvatar, file_extension: str, content_type: str, db: Optional[Session] = None
+    ) -> dict:
+        """
+        処理済みのアバター画像とバリアントを、スレッドプールから並列にS3へ保存
+
+        Args:
+            processed: 処理された画像とバリアント
+            file_extension: ファイル拡張子
+            content_type: コンテンツタイプ
+            db: 参照数を記録するデータベースセッション（省略時は記録しない）
+
+        Returns:
+            dict: アップロード結果（url, filename, srcset, upload_id）
+
+        Raises:
+            HTTPException: アップロードエラー時
+        """
+        key = self._avatar_key(processed, file_extension)
+        upload_id, references = await run_in_threadpool(self._acquire, db, key)
+
+        try:
+            if not await run_in_threadpool(self._is_stored, key, references):
+                *variants, avatar = self._avatar_objects(key, processed, content_type)
+                await asyncio.gather(*(run_in_threadpool(self.upload_object, *obj) for obj in variants))
+                await run_in_threadpool(self.upload_object, *avatar)
+        except Exception as e:
+            await run_in_threadpool(self._release, db, upload_id)
+            raise self._upload_error(e)
+
+        return self._avatar_result(key, processed, upload_id)
+
+    @staticmethod
+    def _avatar_key(processed: ProcessedAvatar, file_extension: str) -> str:
+        """処理後の内容のハッシュによるS3オブジェクトキー（avatars/{sha256}{拡張子}）"""
+        return f"avatars/{hashlib.sha256(processed.content).hexdigest()}{file_extension}"
+
+    @staticmethod
+    def _acquire(db: Optional[Session], key: str) -> Tuple[Optional[str], int]:
+        """アップロードの参照を追加（セッションがない場合は記録せず (None, 0) を返す）"""
+        return avatar_object_crud.acquire(db, key) if db is not None else (None, 0)
+
+    def _release(self, db: Optional[Session], upload_id: Optional[str]) -> None:
+        """保存に失敗したアップロードの参照を戻す（最後の参照なら書きかけのオブジェクトも削除）"""
+        if db is not None and upload_id is not None:
+            self.release_avatar(db, upload_id)
+
+    def _is_stored(self, key: str, references: int) -> bool:
+        """
+        同じ画像がすでに保存されているか
+
+        最初の参照（references == 1）は、削除と入れ違いになっても確実に残るよう常に書き込みます。
+        本体はバリアントの後に保存するため、本体があればバリアントも揃っています。
+        """
+        return references != 1 and self.file_exists(key)
+
+    def _avatar_objects(self, key: str, processed: ProcessedAvatar, content_type: str) -> List[Tuple[str, bytes, str]]:
+        """
+        保存するオブジェクトの (キー, 内容, コンテンツタイプ) のリスト
+
+        本体を最後に置き、本体があればバリアントも揃っているようにします。
+        """
+        objects = [(self._variant_key(key, v), v.content, v.content_type) for v in processed.variants]
+        objects.append((key, processed.content, content_type))
+        return objects
+
+    def _avatar_result(self, key: str, processed: ProcessedAvatar, upload_id: Optional[str] = None) -> dict:
+        return {
+            "url": self.get_file_url(key),
+            "filename": key,
+            "srcset": self._build_srcset(key, processed.variants),
+            "upload_id": upload_id,
+        }
+
+    def _upload_error(self, error: Exception) -> HTTPException:
+        """アップロード時の例外をHTTPExceptionに変換"""
+        if isinstance(error, HTTPException):
+            return error
+        if isinstance(error, ClientError):
+            error_code = error.response["Error"]["Code"]
             if error_code == "NoSuchBucket":
-                raise HTTPException(
+                return HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="S3バケットが見つかりません"
                 )
             elif error_code == "AccessDenied":
-                raise HTTPException(
+                return HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="S3アクセス権限がありません"
                 )
             else:
-                raise HTTPException(
+                return HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"S3アップロードエラー: {error_code}"
                 )
-        except NoCredentialsError:
-            raise HTTPException(
+        if isinstance(error, NoCredentialsError):
+            return HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="AWS認証情報が設定されていません"
             )
-        except Exception:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="ファイルアップロードに失敗しました"
+        return HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="ファイルアップロードに失敗しました"
+        )
+
+    def upload_object(
+        self,
+        key: str,
+        body: Union[bytes, BinaryIO],
+        content_type: str,
+        cache_control: str = AVATAR_CACHE_CONTROL,
+    ) -> None:
+        """
+        オブジェクトをS3にアップロード
+
+        multipart_threshold 未満のバイト列は1回の PutObject で送信し、それ以上の大きさのものやファイルは
+        TransferManager でパートに分割して並列に送信します（ファイルは全体をメモリに読み込みません）。
+
+        Args:
+            key: S3オブジェクトキー
+            body: 内容（バイト列またはファイル）
+            content_type: コンテンツタイプ
+            cache_control: Cache-Control
+        """
+        extra_args = {"ContentType": content_type, "CacheControl": cache_control}
+        if isinstance(body, bytes):
+            if len(body) < self.transfer_config.multipart_threshold:
+                self.s3_client.put_object(Bucket=self.bucket_name, Key=key, Body=body, **extra_args)
+                return
+            body = io.BytesIO(body)
+
+        self.s3_client.upload_fileobj(body, self.bucket_name, key, ExtraArgs=extra_args, Config=self.transfer_config)
+
+    @staticmethod
+    def _variant_prefix(key: str) -> str:
+        """アバターのバリアントを保存するプレフィックス（avatars/{id}/）"""
+        return f"{Path(key).with_suffix('').as_posix()}/"
+
+    def _variant_key(self, key: str, variant: ImageVariant) -> str:
+        """バリアントのS3オブジェクトキー（avatars/{id}/{サイズ}{拡張子}）"""
+        return f"{self._variant_prefix(key)}{variant.size}{variant.extension}"
+
+    def _build_srcset(self, key: str, variants: List[ImageVariant]) -> Dict[str, str]:
+        """画像形式ごとのsrcset（幅の昇順、幅記述子付き）を作成"""
+        candidates: Dict[str, List[str]] = {}
+        for variant in sorted(variants, key=lambda v: v.width):
+            candidates.setdefault(variant.format, []).append(
+                f"{self.get_file_url(self._variant_key(key, variant))} {variant.width}w"
             )
+        return {image_format: ", ".join(urls) for image_format, urls in candidates.items()}
 
     def download_file(self, key: str) -> Optional[bytes]:
         """
@@ -165,6 +428,88 @@ class S3StorageService:
         except ClientError:
             return False
 
+    def delete_avatar(self, key: str, db: Optional[Session] = None, upload_id: Optional[str] = None) -> bool:
+        """
+        アバター画像を削除
+
+        参照が記録されている画像は、アップロードIDを指定して自分の参照だけを解放します（release_avatar）。
+        参照の記録がない画像（ハッシュ化以前のキーなど）や、セッションがない場合は画像とバリアントをそのまま削除します。
+
+        Args:
+            key: アバター画像のS3オブジェクトキー
+            db: 参照を記録したデータベースセッション
+            upload_id: アップロード時に返されたアップロードID
+
+        Returns:
+            bool: 成功時True（参照が残っていてS3から削除しなかった場合を含む）
+
+        Raises:
+            HTTPException: 参照が記録されている画像でアップロードIDがない場合、またはIDとキーが一致しない場合
+        """
+        if db is not None:
+            if upload_id is not None:
+                return self.release_avatar(db, upload_id, key)
+            if avatar_object_crud.is_tracked(db, key):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="共有されている画像のため、アップロード時の upload_id を指定してください",
+                )
+        return self._delete_avatar_objects(key)
+
+    def release_avatar(self, db: Session, upload_id: str, key: Optional[str] = None) -> bool:
+        """
+        アップロードの参照を解放し、最後の参照であれば画像とそのバリアントをS3から削除
+
+        同じ画像の他のアップロードが参照している間はS3のオブジェクトを残します。
+        解放済みの参照に対しては何もせずTrueを返すため、再送や二重の削除でも他のアップロードの参照は減りません。
+
+        Args:
+            db: データベースセッション
+            upload_id: アップロードID
+            key: 指定した場合は、参照のキーと一致することを確認
+
+        Returns:
+            bool: 成功時True
+
+        Raises:
+            HTTPException: 参照のキーが key と一致しない場合
+        """
+        try:
+            released = avatar_object_crud.release(db, upload_id)
+            if released is None:
+                db.rollback()
+                return True
+
+            released_key, remaining = released
+            if key is not None and released_key != key:
+                db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail="指定されたアップロードが見つかりません"
+                )
+
+            # 最後の参照の場合は、同じキーへのアップロードを行ロックで待たせたままS3から削除する
+            if remaining == 0 and not self._delete_avatar_objects(released_key):
+                db.rollback()
+                return False
+            db.commit()
+            return True
+        except HTTPException:
+            raise
+        except Exception:
+            db.rollback()
+            raise
+
+    def _delete_avatar_objects(self, key: str) -> bool:
+        """アバター画像とそのバリアントをS3から削除"""
+        keys = [key, *self.list_files(self._variant_prefix(key))]
+        try:
+            response = self.s3_client.delete_objects(
+                Bucket=self.bucket_name, Delete={"Objects": [{"Key": k} for k in keys], "Quiet": True}
+            )
+        except ClientError:
+            return False
+        return not response.get("Errors")
+
     def file_exists(self, key: str) -> bool:
         """
         ファイルがS3に存在するかチェック
@@ -193,55 +538,24 @@ class S3StorageService:
         """
         return f"https://{self.bucket_name}.s3.{self.region_name}.amazonaws.com/{key}"
 
-    def _process_image(self, file_content: bytes, file_extension: str) -> bytes:
+    def _process_image(self, file: IO[bytes], file_extension: str) -> ProcessedAvatar:
         """
-        画像を処理（検証とリサイズ）
+        画像を処理（検証とリサイズ、バリアントの生成）
 
         Args:
-            file_content: 画像ファイルの内容
+            file: 画像ファイル（シーク可能であること）
             file_extension: ファイル拡張子
 
         Returns:
-            bytes: 処理された画像データ
+            ProcessedAvatar: 処理された画像とバリアント
 
         Raises:
             HTTPException: 画像処理エラー時
         """
+        file.seek(0)
         try:
-            # PILで画像を開く
-            with Image.open(io.BytesIO(file_content)) as img:
-                # 画像形式の検証
-                img.verify()
-
-                # 画像を再度開いてリサイズ処理
-                with Image.open(io.BytesIO(file_content)) as img:
-                    # RGBAの場合はRGBに変換
-                    if img.mode in ("RGBA", "LA", "P"):
-                        img = img.convert("RGB")
-
-                    # アバター用にリサイズ（最大300x300）
-                    img.thumbnail((300, 300), Image.Resampling.LANCZOS)
-
-                    # 画像をバイトデータに変換
-                    output_buffer = io.BytesIO()
-
-                    # 拡張子に応じて保存形式を決定
-                    if file_extension.lower() in [".jpg", ".jpeg"]:
-                        img.save(output_buffer, format="JPEG", optimize=True, quality=85)
-                    elif file_extension.lower() == ".png":
-                        img.save(output_buffer, format="PNG", optimize=True)
-                    elif file_extension.lower() == ".gif":
-                        img.save(output_buffer, format="GIF", optimize=True)
-                    elif file_extension.lower() == ".webp":
-                        img.save(output_buffer, format="WEBP", quality=85)
-                    else:
-                        # デフォルトはJPEG
-                        img.save(output_buffer, format="JPEG", optimize=True, quality=85)
-
-                    output_buffer.seek(0)
-                    return output_buffer.getvalue()
-
-        except Exception:
+            return process_avatar_images(file.read(), file_extension)
+        except InvalidImageError:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="無効な画像ファイルです")
 
     def list_files(self, prefix: str = "") -> list:
@@ -0,0 +1,79 @@
+"""
+検索サービス
+
+人物・イベント・タグを横断するキーワード検索のビジネスロジックを実装します。
+シンプルなDI（依存性注入）パターンを使用してCRUD層との結合度を下げます。
+"""
+
+from typing import Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from .. import schemas
+from ..crud.search import SearchCRUD
+
+# 検索対象の種類
+SEARCH_TYPES = ("persons", "events", "tags")
+
+# 検索語の最大長
+MAX_QUERY_LENGTH = 100
+
+
+class SearchService:
+    """
+    検索サービス
+
+    人物・イベント・タグを横断するキーワード検索を提供します。
+    """
+
+    def __init__(self, search_crud=None):
+        """
+        初期化
+
+        Args:
+            search_crud: 検索CRUDオブジェクト（デフォルトでSearchCRUD()を使用）
+        """
+        self.crud = search_crud if search_crud is not None else SearchCRUD()
+
+    def search(
+        self, db: Session, query: str, types: Optional[Iterable[str]] = None, limit: int = 20
+    ) -> schemas.SearchResults:
+        """
+        キーワードで横断検索
+
+        Args:
+            db: データベースセッション
+            query: 検索語
+            types: 検索対象の種類（persons / events / tags、Noneなら全て）
+            limit: 種類ごとの取得上限数
+
+        Returns:
+            スコアの降順に並んだ検索結果
+
+        Raises:
+            ValueError: 検索語または検索対象の種類が無効な場合
+        """
+        # ビジネスルール: 検索語の検証
+        query = (query or "").strip()
+        if not query:
+            raise ValueError("Search term is required")
+        if len(query) > MAX_QUERY_LENGTH:
+            raise ValueError(f"Search term must be at most {MAX_QUERY_LENGTH} characters")
+
+        targets = set(SEARCH_TYPES if types is None else types)
+        unknown = targets - set(SEARCH_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown search type: {', '.join(sorted(unknown))}")
+
+        results = schemas.SearchResults(query=query)
+        if "persons" in targets:
+            results.persons = [
+                schemas.Person.model_validate(person) for person, _ in self.crud.search_persons(db, query, limit=limit)
+            ]
+        if "events" in targets:
+            results.events = [
+                schemas.Event.model_validate(event) for event, _ in self.crud.search_events(db, query, limit=limit)
+            ]
+        if "tags" in targets:
+            results.tags = [schemas.Tag.model_validate(tag) for tag, _ in self.crud.search_tags(db, query, limit=limit)]
+        return results
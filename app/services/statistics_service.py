@@ -0,0 +1,96 @@
+"""
+統計サービス
+
+人物・出来事・タグ・ユーザーの件数を集計カウンターから返すビジネスロジックを実装します。
+シンプルなDI（依存性注入）パターンを使用してCRUD層との結合度を下げます。
+"""
+
+from sqlalchemy.orm import Session
+
+from .. import schemas
+from ..crud.statistics import StatisticsCRUD
+
+
+class StatisticsService:
+    """
+    統計サービス
+
+    集計カウンターは書き込みと同じトランザクションで更新されるため、
+    ここでの取得は件数によらず一定の時間で終わります。
+    """
+
+    def __init__(self, statistics_crud=None):
+        """
+        初期化
+
+        Args:
+            statistics_crud: 集計カウンターCRUDオブジェクト（デフォルトでStatisticsCRUD()を使用）
+        """
+        self.crud = statistics_crud if statistics_crud is not None else StatisticsCRUD()
+
+    def get_entity_counts(self, db: Session) -> schemas.EntityCounts:
+        """
+        人物・出来事・タグの件数を取得
+
+        Args:
+            db: データベースセッション
+
+        Returns:
+            件数
+        """
+        persons = self.crud.get_count(db, "person")
+        events = self.crud.get_count(db, "event")
+        tags = self.crud.get_count(db, "tag")
+        return schemas.EntityCounts(persons=persons, events=events, tags=tags, total=persons + events + tags)
+
+    def get_statistics(self, db: Session) -> schemas.Statistics:
+        """
+        件数と内訳（年別の出来事数・出生国別の人物数）を取得
+
+        Args:
+            db: データベースセッション
+
+        Returns:
+            統計情報
+        """
+        return schemas.Statistics(
+            **self.get_entity_counts(db).model_dump(),
+            events_by_year={int(year): count for year, count in self.crud.get_counts(db, "event_year").items()},
+            persons_by_country=self.crud.get_counts(db, "person_country"),
+        )
+
+    def get_user_statistics(self, db: Session) -> schemas.UserStatistics:
+        """
+        ユーザー数と内訳を取得
+
+        Args:
+            db: データベースセッション
+
+        Returns:
+            ユーザー統計情報
+        """
+        total_users = self.crud.get_count(db, "user")
+        active_users = self.crud.get_count(db, "user_active", "true")
+        return schemas.UserStatistics(
+            total_users=total_users,
+            active_users=active_users,
+            inactive_users=total_users - active_users,
+            users_by_role=self.crud.get_counts(db, "user_role"),
+        )
+
+    def count_users_by_role(self, db: Session, role: str) -> int:
+        """役割別ユーザー数を取得"""
+        return self.crud.get_count(db, "user_role", role)
+
+    def rebuild(self, db: Session) -> schemas.Statistics:
+        """
+        集計カウンターを元テーブルから再集計
+
+        Args:
+            db: データベースセッション
+
+        Returns:
+            再集計後の統計情報
+        """
+        self.crud.rebuild(db)
+        return self.get_statistics(db)
@@ -5,16 +5,17 @@
 シンプルなDI（依存性注入）パターンを使用してCRUD層との結合度を下げます。
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
 from .. import schemas
 from ..crud.tag import TagCRUD
 from .base import BaseService
+from .cache import EntityCache
 
 
-class TagService(BaseService[schemas.Tag, schemas.TagCreate, schemas.TagUpdate]):
+class TagService(BaseService[schemas.Tag, schemas.TagCreate, schemas.TagUpdate, schemas.TagDetail]):
     """
     タグサービス
 
@@ -22,16 +23,22 @@ class TagService(BaseService[schemas.Tag, schemas.TagCreate, schemas.TagUpdate])
     シンプルなDI（依存性注入）パターンを使用してCRUD層との結合度を下げます。
     """
 
-    def __init__(self, tag_crud=None):
+    response_schema = schemas.Tag
+    detail_schema = schemas.TagDetail
+    relation_schemas = {"persons": schemas.Person, "events": schemas.Event}
+
+    def __init__(self, tag_crud=None, cache: Optional[EntityCache[schemas.Tag]] = None):
         """
         初期化
 
         Args:
             tag_crud: タグCRUDオブジェクト（デフォルトでTagCRUD()を使用）
+            cache: タグキャッシュ（デフォルトで共有キャッシュバックエンドを使用）
         """
         if tag_crud is None:
             tag_crud = TagCRUD()
         super().__init__(tag_crud)
+        self.cache = cache if cache is not None else EntityCache("tag", schemas.Tag)
 
     def create_tag(self, db: Session, tag: schemas.TagCreate) -> schemas.Tag:
         """
@@ -61,39 +68,66 @@ class TagService(BaseService[schemas.Tag, schemas.TagCreate, schemas.TagUpdate])
         # レスポンススキーマに変換
         return schemas.Tag.model_validate(created_tag)
 
-    def get_tag(self, db: Session, tag_id: int) -> Optional[schemas.Tag]:
+    def get_tag(self, db: Session, tag_id: int, include: Optional[str] = None) -> Optional[schemas.Tag]:
         """
         タグを取得
 
         Args:
             db: データベースセッション
             tag_id: タグID
+            include: 含める関連エンティティ（persons,events のカンマ区切り）
 
         Returns:
             タグまたはNone
+
+        Raises:
+            ValueError: includeが不正な場合
         """
+        relations = self.parse_include(include)
+        if relations:
+            # 関連エンティティはキャッシュせず、selectinloadで一括読み込みする
+            tag = self.crud.get(db, tag_id, include=relations)
+            return self.to_detail(tag, relations) if tag else None
+
+        cached = self.cache.get(tag_id)
+        if cached is not None:
+            return cached
+
         tag = self.get(db, tag_id)
         if tag:
-            return schemas.Tag.model_validate(tag)
+            result = schemas.Tag.model_validate(tag)
+            self.cache.set(result)
+            return result
         return None
 
-    def get_tag_by_ssid(self, db: Session, ssid: str) -> Optional[schemas.Tag]:
+    def get_tag_by_ssid(self, db: Session, ssid: str, include: Optional[str] = None) -> Optional[schemas.Tag]:
         """
         SSIDでタグを取得
 
         Args:
             db: データベースセッション
             ssid: タグのSSID
+            include: 含める関連エンティティ（persons,events のカンマ区切り）
 
         Returns:
             タグまたはNone
+
+        Raises:
+            ValueError: includeが不正な場合
         """
+        relations = self.parse_include(include)
+        if relations:
+            tag = self.crud.get_by_ssid(db, ssid, include=relations)
+            return self.to_detail(tag, relations) if tag else None
+
         tag = self.get_by_ssid(db, ssid)
         if tag:
             return schemas.Tag.model_validate(tag)
         return None
 
-    def get_tags(self, db: Session, skip: int = 0, limit: int = 100) -> List[schemas.Tag]:
+    def get_tags(
+        self, db: Session, skip: int = 0, limit: int = 100, include: Optional[str] = None
+    ) -> List[schemas.Tag]:
         """
         タグ一覧を取得
 
@@ -101,13 +135,48 @@ class TagService(BaseService[schemas.Tag, schemas.TagCreate, schemas.TagUpdate])
             db: データベースセッション
             skip: スキップ数
             limit: 取得上限数
+            include: 含める関連エンティティ（persons,events のカンマ区切り）
 
         Returns:
             タグのリスト
+
+        Raises:
+            ValueError: includeが不正な場合
         """
+        relations = self.parse_include(include)
+        if relations:
+            tags = self.crud.get_multi(db, skip=skip, limit=limit, include=relations)
+            return [self.to_detail(t, relations) for t in tags]
+
         tags = self.get_multi(db, skip=skip, limit=limit)
         return [schemas.Tag.model_validate(t) for t in tags]
 
+    def get_tags_page(
+        self, db: Session, cursor: Optional[str] = None, limit: int = 100, include: Optional[str] = None
+    ) -> Tuple[List[schemas.Tag], Optional[str]]:
+        """
+        タグ一覧をカーソルで取得
+
+        Args:
+            db: データベースセッション
+            cursor: 前ページのnext_cursor（最初のページはNone）
+            limit: 取得上限数
+            include: 含める関連エンティティ（persons,events のカンマ区切り）
+
+        Returns:
+            (タグのリスト, 次ページのカーソル)
+
+        Raises:
+            ValueError: カーソルまたはincludeが不正な場合
+        """
+        relations = self.parse_include(include)
+        if relations:
+            tags, next_cursor = self.crud.get_multi_by_cursor(db, cursor=cursor, limit=limit, include=relations)
+            return [self.to_detail(t, relations) for t in tags], next_cursor
+
+        tags, next_cursor = self.get_multi_by_cursor(db, cursor=cursor, limit=limit)
+        return [schemas.Tag.model_validate(t) for t in tags], next_cursor
+
     def update_tag(self, db: Session, tag_id: int, tag: schemas.TagUpdate) -> Optional[schemas.Tag]:
         """
         タグを更新
@@ -128,6 +197,7 @@ class TagService(BaseService[schemas.Tag, schemas.TagCreate, schemas.TagUpdate])
 
         # CRUD操作を実行
         updated_tag = self.update(db, id=tag_id, obj_in=tag)
+        self.cache.invalidate(tag_id)
 
         if updated_tag:
             return schemas.Tag.model_validate(updated_tag)
@@ -144,7 +214,9 @@ class TagService(BaseService[schemas.Tag, schemas.TagCreate, schemas.TagUpdate])
         Returns:
             削除成功フラグ
         """
-        return self.remove(db, id=tag_id)
+        deleted = self.remove(db, id=tag_id)
+        self.cache.invalidate(tag_id)
+        return deleted
 
     def validate_tag_data(self, tag: schemas.TagCreate) -> None:
         """
@@ -0,0 +1,88 @@
+"""
+タイムラインサービス
+
+期間と重なる出来事を年・年代・世紀単位で集計するビジネスロジックを実装します。
+シンプルなDI（依存性注入）パターンを使用してCRUD層との結合度を下げます。
+"""
+
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List
+
+from sqlalchemy.orm import Session
+
+from .. import schemas
+from ..crud.timeline import TimelineCRUD
+from ..enums import TimelineGranularity
+
+# バケットあたりに返す出来事の最大件数
+MAX_EVENTS_PER_BUCKET = 50
+
+
+class TimelineService:
+    """
+    タイムラインサービス
+
+    件数の集計とバケットごとの上位件数の絞り込みはSQL側で行い、
+    アプリケーション側ではバケットへの詰め替えだけを行います。
+    """
+
+    def __init__(self, timeline_crud=None):
+        """
+        初期化
+
+        Args:
+            timeline_crud: タイムラインCRUDオブジェクト（デフォルトでTimelineCRUD()を使用）
+        """
+        self.crud = timeline_crud if timeline_crud is not None else TimelineCRUD()
+
+    def get_timeline(
+        self,
+        db: Session,
+        start_date: date,
+        end_date: date,
+        granularity: TimelineGranularity = TimelineGranularity.YEAR,
+        per_bucket: int = 5,
+    ) -> schemas.Timeline:
+        """
+        期間と重なる出来事をバケットごとに集計
+
+        Args:
+            db: データベースセッション
+            start_date: 期間の開始日（含む）
+            end_date: 期間の終了日（含む）
+            granularity: 集計単位
+            per_bucket: バケットごとに返す出来事の件数（0なら件数のみ）
+
+        Returns:
+            タイムライン
+
+        Raises:
+            ValueError: 期間またはper_bucketが無効な場合
+        """
+        # ビジネスルール: 期間とバケットあたり件数の検証
+        if start_date > end_date:
+            raise ValueError("Start date cannot be after end date")
+        if not 0 <= per_bucket <= MAX_EVENTS_PER_BUCKET:
+            raise ValueError(f"per_bucket must be between 0 and {MAX_EVENTS_PER_BUCKET}")
+
+        years = granularity.years
+        counts = self.crud.count_by_bucket(db, start_date, end_date, years)
+
+        events: Dict[int, List[schemas.Event]] = defaultdict(list)
+        if counts and per_bucket > 0:
+            for bucket, event in self.crud.get_events_by_bucket(db, start_date, end_date, years, per_bucket):
+                events[bucket].append(schemas.Event.model_validate(event))
+
+        return schemas.Timeline(
+            start_date=start_date,
+            end_date=end_date,
+            granularity=granularity,
+            total=sum(count for _, count in counts),
+            buckets=[
+                schemas.TimelineBucket(
+                    start_year=bucket, end_year=bucket + years - 1, count=count, events=events.get(bucket, [])
+                )
+                for bucket, count in counts
+            ],
+        )
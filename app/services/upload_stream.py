@@ -0,0 +1,249 @@
+"""
+ストリーミングアップロード
+
+multipart/form-data のリクエスト本文をチャンク単位で解析し、ファイルパートを一時ファイルへ書き出します。
+アップロード全体をメモリに読み込まず、サイズ上限を超えた時点で読み込みを打ち切り、
+先頭のマジックバイトが許可された画像形式でなければ残りを受信する前に拒否します。
+"""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from tempfile import SpooledTemporaryFile
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+from python_multipart import MultipartParser
+from python_multipart.multipart import parse_options_header
+
+if TYPE_CHECKING:
+    from python_multipart.multipart import MultipartCallbacks
+
+# メモリ上に保持する上限（これを超えると一時ファイルへ書き出す）
+DEFAULT_SPOOL_MEMORY_SIZE = int(os.getenv("UPLOAD_SPOOL_MEMORY_BYTES", str(256 * 1024)))
+
+# Content-Length での事前判定で許容する multipart の境界・ヘッダー分の余裕
+MULTIPART_OVERHEAD = 16 * 1024
+
+# 形式の判定に必要な先頭バイト数
+SNIFF_SIZE = 12
+
+# 画像形式ごとの (拡張子, MIMEタイプ)
+IMAGE_FORMATS: Dict[str, Tuple[Tuple[str, ...], str]] = {
+    "jpeg": ((".jpg", ".jpeg"), "image/jpeg"),
+    "png": ((".png",), "image/png"),
+    "gif": ((".gif",), "image/gif"),
+    "webp": ((".webp",), "image/webp"),
+}
+
+
+def sniff_image_format(head: bytes) -> Optional[str]:
+    """
+    先頭のマジックバイトから画像形式を判定
+
+    Args:
+        head: ファイルの先頭（SNIFF_SIZE バイト以上）
+
+    Returns:
+        画像形式（jpeg / png / gif / webp）、許可された形式でなければNone
+    """
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head.startswith((b"GIF87a", b"GIF89a")):
+        return "gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+@dataclass
+class SpooledUpload:
+    """一時ファイルに受信したアップロードファイル"""
+
+    file: SpooledTemporaryFile
+    filename: str
+    content_type: str
+    size: int = 0
+    image_format: Optional[str] = None
+
+    @property
+    def mime_type(self) -> str:
+        """判定した画像形式のMIMEタイプ"""
+        return self._format_info()[1]
+
+    @property
+    def extension_matches(self) -> bool:
+        """ファイル名の拡張子が判定した画像形式と一致するか"""
+        return Path(self.filename).suffix.lower() in self._format_info()[0]
+
+    def _format_info(self) -> Tuple[Tuple[str, ...], str]:
+        if self.image_format is None:
+            raise ValueError("画像形式が判定されていません")
+        return IMAGE_FORMATS[self.image_format]
+
+    def close(self) -> None:
+        """一時ファイルを削除"""
+        self.file.close()
+
+
+@dataclass
+class _Part:
+    """解析中のパート"""
+
+    headers: Dict[bytes, bytes] = field(default_factory=dict)
+    upload: Optional[SpooledUpload] = None
+    head: bytes = b""
+
+
+class _UploadReceiver:
+    """MultipartParser のコールバックで指定フィールドのファイルを一時ファイルへ書き出す"""
+
+    def __init__(self, field_name: str, max_size: int, spool_size: int):
+        self.field_name = field_name
+        self.max_size = max_size
+        self.spool_size = spool_size
+        self.upload: Optional[SpooledUpload] = None
+        self._part = _Part()
+        self._header_field = b""
+        self._header_value = b""
+        self._opened: List[SpooledUpload] = []
+
+    def callbacks(self) -> "MultipartCallbacks":
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+        }
+
+    def on_part_begin(self) -> None:
+        self._part = _Part()
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self._part.headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._part.headers.get(b"content-disposition", b""))
+        if options.get(b"name", b"").decode("latin-1") != self.field_name or self.upload is not None:
+            # 対象外のフィールド（2つ目以降の同名ファイルを含む）は読み捨てる
+            return
+        if not options.get(b"filename"):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ファイル名が指定されていません")
+
+        upload = SpooledUpload(
+            file=SpooledTemporaryFile(max_size=self.spool_size),
+            filename=options[b"filename"].decode("utf-8", errors="replace"),
+            content_type=self._part.headers.get(b"content-type", b"").decode("latin-1"),
+        )
+        self._opened.append(upload)
+        self._part.upload = upload
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        upload = self._part.upload
+        if upload is None:
+            return
+
+        chunk = data[start:end]
+        upload.size += len(chunk)
+        if upload.size > self.max_size:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"ファイルサイズが大きすぎます。最大{self.max_size // (1024 * 1024)}MBまで",
+            )
+        if upload.image_format is None:
+            self._part.head += chunk[: SNIFF_SIZE - len(self._part.head)]
+            if len(self._part.head) >= SNIFF_SIZE:
+                self._sniff(upload)
+        # チャンクはサーバーの受信単位（数十KB）のため、書き込みは短時間で終わる
+        upload.file.write(chunk)
+
+    def on_part_end(self) -> None:
+        upload = self._part.upload
+        if upload is None:
+            return
+        if upload.image_format is None:
+            # SNIFF_SIZE に満たない小さなファイル
+            self._sniff(upload)
+        upload.file.seek(0)
+        self.upload = upload
+
+    def _sniff(self, upload: SpooledUpload) -> None:
+        upload.image_format = sniff_image_format(self._part.head)
+        if upload.image_format is None:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail=f"サポートされていない画像形式です。許可: {', '.join(IMAGE_FORMATS)}",
+            )
+
+    def close_all(self) -> None:
+        for upload in self._opened:
+            upload.close()
+
+
+async def receive_upload(
+    request: Request,
+    *,
+    field_name: str = "file",
+    max_size: int,
+    spool_size: int = DEFAULT_SPOOL_MEMORY_SIZE,
+) -> SpooledUpload:
+    """
+    multipart/form-data のリクエストからファイルをストリーミングで受信
+
+    Content-Length が上限を明らかに超える場合は本文を読まずに拒否します。
+    受信中にサイズ上限を超えた場合や、先頭のマジックバイトが許可された画像形式でない場合は、
+    その時点で読み込みを打ち切ります。
+
+    Args:
+        request: リクエスト
+        field_name: ファイルのフォームフィールド名
+        max_size: ファイルサイズの上限（バイト）
+        spool_size: メモリ上に保持する上限（超えると一時ファイルへ書き出す）
+
+    Returns:
+        受信したファイル（使用後に close() すること）
+
+    Raises:
+        HTTPException: 本文が multipart/form-data でない、ファイルがない、サイズ超過、または画像形式が不正な場合
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="multipart/form-data で送信してください")
+
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_size + MULTIPART_OVERHEAD:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"ファイルサイズが大きすぎます。最大{max_size // (1024 * 1024)}MBまで",
+        )
+
+    receiver = _UploadReceiver(field_name, max_size, spool_size)
+    parser = MultipartParser(params[b"boundary"], receiver.callbacks())
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+        parser.finalize()
+    except HTTPException:
+        receiver.close_all()
+        raise
+    except Exception:
+        receiver.close_all()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="multipart の形式が不正です")
+
+    if receiver.upload is None:
+        receiver.close_all()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ファイルが指定されていません")
+    return receiver.upload
@@ -4,20 +4,21 @@
 ビジネスロジックを担当し、CRUD層とルーター層の間の橋渡しをします。
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
 from .. import schemas
-from ..crud.user import user_crud
+from ..crud.statistics import statistics_crud
+from ..crud.user import LoginOutcome, user_crud
 from ..models.user import User
 
 
 class UserService:
     """ユーザーサービスクラス"""
 
-    def create_user(self, db: Session, user_data: schemas.UserCreate) -> User:
-        """ユーザーを作成"""
+    def validate_new_user(self, db: Session, user_data: schemas.UserCreate) -> None:
+        """メールアドレス・ユーザー名の重複をチェック（重複していればValueError）"""
         # メールアドレス重複チェック
         if user_crud.exists(db, email=user_data.email):
             raise ValueError("Email already registered")
@@ -26,7 +27,10 @@ class UserService:
         if user_crud.exists(db, username=user_data.username):
             raise ValueError("Username already taken")
 
-        return user_crud.create(db, obj_in=user_data)
+    def create_user(self, db: Session, user_data: schemas.UserCreate, hashed_password: Optional[str] = None) -> User:
+        """ユーザーを作成（hashed_passwordを渡した場合はハッシュ化を省略）"""
+        self.validate_new_user(db, user_data)
+        return user_crud.create(db, obj_in=user_data, hashed_password=hashed_password)
 
     def get_user(self, db: Session, user_id: str) -> Optional[User]:
         """ユーザーを取得"""
@@ -44,6 +48,12 @@ class UserService:
         """ユーザー一覧を取得"""
         return user_crud.get_multi(db, skip=skip, limit=limit)
 
+    def get_users_page(
+        self, db: Session, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[User], Optional[str]]:
+        """ユーザー一覧をカーソルで取得"""
+        return user_crud.get_multi_by_cursor(db, cursor=cursor, limit=limit)
+
     def get_active_users(self, db: Session, skip: int = 0, limit: int = 100) -> List[User]:
         """アクティブユーザー一覧を取得"""
         return user_crud.get_active_users(db, skip=skip, limit=limit)
@@ -78,10 +88,22 @@ class UserService:
         hashed_password = get_password_hash(new_password)
         return user_crud.update_password(db, user_id=user_id, hashed_password=hashed_password)
 
+    def update_hashed_password(self, db: Session, user_id: str, hashed_password: str) -> Optional[User]:
+        """ハッシュ化済みのパスワードで更新"""
+        return user_crud.update_password(db, user_id=user_id, hashed_password=hashed_password)
+
     def update_last_login(self, db: Session, user_id: str) -> Optional[User]:
         """最終ログイン日時を更新"""
         return user_crud.update_last_login(db, user_id=user_id)
 
+    def record_login_success(self, db: Session, user_id: str) -> Optional[LoginOutcome]:
+        """ログイン成功を記録（最終ログイン日時の更新と失敗回数・ロックのリセット）"""
+        return user_crud.record_login(db, user_id=user_id, success=True)
+
+    def record_login_failure(self, db: Session, user_id: str) -> Optional[LoginOutcome]:
+        """ログイン失敗を記録（失敗回数の加算と上限到達時のロック）"""
+        return user_crud.record_login(db, user_id=user_id, success=False)
+
     def increment_failed_attempts(self, db: Session, user_id: str) -> Optional[User]:
         """ログイン失敗回数を増加"""
         return user_crud.increment_failed_attempts(db, user_id=user_id)
@@ -115,16 +137,16 @@ class UserService:
         return user_crud.exists(db, email=email, username=username)
 
     def count_users(self, db: Session) -> int:
-        """ユーザー数を取得"""
-        return user_crud.count(db)
+        """ユーザー数を取得（集計カウンターから取得）"""
+        return statistics_crud.get_count(db, "user")
 
     def count_active_users(self, db: Session) -> int:
-        """アクティブユーザー数を取得"""
-        return user_crud.count_active(db)
+        """アクティブユーザー数を取得（集計カウンターから取得）"""
+        return statistics_crud.get_count(db, "user_active", "true")
 
     def count_users_by_role(self, db: Session, role: str) -> int:
-        """役割別ユーザー数を取得"""
-        return user_crud.count_by_role(db, role)
+        """役割別ユーザー数を取得（集計カウンターから取得）"""
+        return statistics_crud.get_count(db, "user_role", role)
 
 
 # シングルトンインスタンス
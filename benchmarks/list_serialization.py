@@ -0,0 +1,122 @@
+"""
+一覧レスポンスの直列化コスト計測
+
+/persons/?limit=1000 と同じ形のレスポンス（検証済みの schemas.Person 1000件）について、
+response_model で再検証して標準のjsonで直列化する旧経路と、ModelListResponse で直接JSONにする新経路の
+1リクエストあたりの処理時間を比較します。データベースの読み込みは両経路で同じため含めず、
+ネットワークを介さずASGIアプリを直接呼び出します。
+
+使い方:
+    python -m benchmarks.list_serialization [リクエスト数] [件数]
+"""
+
+import asyncio
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import List
+
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
+
+from app import schemas
+from app.core.responses import FastJSONResponse, ModelListResponse
+
+
+def build_persons(count: int) -> List[schemas.Person]:
+    """サービス層が返すのと同じ検証済みの人物スキーマを作成"""
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    return [
+        schemas.Person(
+            id=i,
+            created_at=now,
+            updated_at=now + timedelta(seconds=i),
+            ssid=f"person_{i}",
+            full_name=f"人物 {i}",
+            display_name=f"人物{i}",
+            birth_date=date(1500, 1, 1) + timedelta(days=i),
+            death_date=date(1560, 1, 1) + timedelta(days=i),
+            born_country="日本",
+            born_region="山城国",
+            description="戦国時代の人物。" * 4,
+            portrait_url=f"https://example.com/portraits/{i}.jpg",
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def create_app(persons: List[schemas.Person], fast: bool) -> FastAPI:
+    """計測対象のアプリを作成（fast=Trueなら新経路）"""
+    app = FastAPI(default_response_class=FastJSONResponse if fast else JSONResponse)
+
+    @app.get("/api/v1/persons/", response_model=List[schemas.PersonDetail], response_model_exclude_unset=True)
+    def read_persons(response: Response):
+        if fast:
+            return ModelListResponse(persons, exclude_unset=True, headers=response.headers)
+        return persons
+
+    return app
+
+
+async def call(app: FastAPI) -> bytes:
+    """ASGIアプリを1回呼び出し、レスポンス本文を返す"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/persons/",
+        "raw_path": b"/api/v1/persons/",
+        "root_path": "",
+        "query_string": b"limit=1000",
+        "headers": [(b"user-agent", b"benchmark")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+    body = bytearray()
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return bytes(body)
+
+
+async def measure(app: FastAPI, requests: int) -> float:
+    """1リクエストあたりの平均処理時間（ミリ秒）を計測"""
+    # ウォームアップ
+    for _ in range(5):
+        await call(app)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await call(app)
+    return (time.perf_counter() - start) / requests * 1000
+
+
+async def main(requests: int, count: int) -> None:
+    persons = build_persons(count)
+    before, after = create_app(persons, fast=False), create_app(persons, fast=True)
+
+    # 両経路の出力が同じであることを確認してから計測する
+    assert await call(before) == await call(after)
+
+    print(f"requests: {requests}, persons: {count}")
+    before_ms = await measure(before, requests)
+    print(f"{'response_model + json（旧）':<36} {before_ms:8.2f} ms/req")
+    after_ms = await measure(after, requests)
+    print(f"{'ModelListResponse（新）':<36} {after_ms:8.2f} ms/req ({before_ms / after_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 1000,
+        )
+    )
@@ -0,0 +1,160 @@
+"""
+ミドルウェアのオーバーヘッド計測
+
+BaseHTTPMiddleware版（旧実装と同じ処理）と純粋なASGI版の認証・ログミドルウェアについて、
+1リクエストあたりの処理時間を比較します。ネットワークを介さずASGIアプリを直接呼び出します。
+
+使い方:
+    python -m benchmarks.middleware_overhead [リクエスト数]
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+from typing import Callable
+
+# app.auth.utils は import 時に環境変数を読むため、先に既定値を設定する
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_DAYS", "7")
+os.environ.setdefault("API_KEY", "benchmark-api-key")
+
+from fastapi import FastAPI, Request, Response  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from starlette.datastructures import Headers  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from app.middleware.auth import HybridAuthMiddleware  # noqa: E402
+from app.middleware.logging import RequestLoggingMiddleware  # noqa: E402
+
+
+class BaseHTTPHybridAuthMiddleware(BaseHTTPMiddleware):
+    """比較用: BaseHTTPMiddleware版の認証ミドルウェア（旧実装と同じ処理）"""
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.auth = HybridAuthMiddleware(app)
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        if self.auth._is_auth_exempt(request.url.path):
+            return await call_next(request)
+
+        auth_info = self.auth._basic_auth_check(Headers(scope=request.scope))
+        if auth_info is None:
+            return JSONResponse(status_code=401, content={"detail": "Authentication required"})
+
+        request.state.auth_info = auth_info
+        return await call_next(request)
+
+
+class BaseHTTPRequestLoggingMiddleware(BaseHTTPMiddleware):
+    """比較用: BaseHTTPMiddleware版のログミドルウェア（旧実装と同じ処理）"""
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.logger = logging.getLogger("app.middleware.logging")
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        start_time = time.time()
+        client_ip = request.client.host if request.client else "unknown"
+        self.logger.info(
+            f"受信リクエスト: {request.method} {request.url.path} - "
+            f"IP: {client_ip} - "
+            f"User-Agent: {request.headers.get('user-agent', 'unknown')}"
+        )
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        self.logger.info(
+            f"レスポンス完了: {request.method} {request.url.path} - "
+            f"Status: {response.status_code} - "
+            f"Process Time: {process_time:.3f}s"
+        )
+        return response
+
+
+def create_app(auth_middleware=None, logging_middleware=None) -> FastAPI:
+    """計測対象のアプリを作成（main.py と同じ順序でミドルウェアを追加）"""
+    app = FastAPI()
+    if logging_middleware:
+        app.add_middleware(logging_middleware)
+    if auth_middleware:
+        app.add_middleware(auth_middleware)
+
+    @app.get("/api/v1/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+async def call(app: FastAPI) -> int:
+    """ASGIアプリを1回呼び出し、ステータスコードを返す"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/ping",
+        "raw_path": b"/api/v1/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"x-api-key", os.environ["API_KEY"].encode()), (b"user-agent", b"benchmark")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def measure(app: FastAPI, requests: int) -> float:
+    """1リクエストあたりの平均処理時間（マイクロ秒）を計測"""
+    # ウォームアップ（ミドルウェアスタックの構築を含む）
+    for _ in range(100):
+        assert await call(app) == 200
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await call(app)
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+async def main(requests: int) -> None:
+    # ログ出力自体のコストを除外し、ミドルウェアの構造によるオーバーヘッドを比べる
+    logging.getLogger("app.middleware.logging").disabled = True
+
+    cases = [
+        ("ミドルウェアなし", create_app()),
+        (
+            "BaseHTTPMiddleware（認証 + ログ）",
+            create_app(BaseHTTPHybridAuthMiddleware, BaseHTTPRequestLoggingMiddleware),
+        ),
+        ("純粋なASGI（認証 + ログ）", create_app(HybridAuthMiddleware, RequestLoggingMiddleware)),
+    ]
+
+    baseline = None
+    print(f"requests: {requests}")
+    for name, app in cases:
+        per_request = await measure(app, requests)
+        if baseline is None:
+            baseline = per_request
+            print(f"{name:<36} {per_request:8.1f} us/req")
+        else:
+            print(f"{name:<36} {per_request:8.1f} us/req (overhead {per_request - baseline:+.1f} us)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
@@ -0,0 +1,85 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.auth.password_executor import PasswordExecutor, PasswordExecutorBusyError
+
+
+@pytest.fixture
+def executor():
+    executor = PasswordExecutor(max_workers=1, max_queue=1)
+    yield executor
+    executor.shutdown()
+
+
+def test_hash_and_verify(executor):
+    async def scenario():
+        hashed = await executor.hash("secret-password")
+        return await executor.verify("secret-password", hashed), await executor.verify("wrong", hashed)
+
+    assert asyncio.run(scenario()) == (True, False)
+    assert executor.stats()["completed"] == 3
+
+
+def test_rejects_when_queue_is_full(executor):
+    release = threading.Event()
+
+    async def scenario():
+        running = asyncio.ensure_future(executor.run(release.wait))
+        queued = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0.05)
+
+        stats = executor.stats()
+        with pytest.raises(PasswordExecutorBusyError):
+            await executor.run(release.wait)
+
+        release.set()
+        await asyncio.gather(running, queued)
+        return stats
+
+    stats = asyncio.run(scenario())
+
+    assert stats["running"] == 1
+    assert stats["queued"] == 1
+    assert executor.stats() == {
+        "max_workers": 1,
+        "max_queue": 1,
+        "running": 0,
+        "queued": 0,
+        "completed": 2,
+        "rejected": 1,
+    }
+
+
+def test_cancelled_queued_call_releases_slot(executor):
+    release = threading.Event()
+
+    async def scenario():
+        running = asyncio.ensure_future(executor.run(release.wait))
+        queued = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0.05)
+        assert executor.stats()["queued"] == 1
+
+        # クライアントの切断などで待機中のリクエストがキャンセルされる
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        stats = executor.stats()
+
+        release.set()
+        await running
+        return stats
+
+    stats = asyncio.run(scenario())
+
+    assert stats["queued"] == 0
+    assert stats["running"] == 1
+    assert executor.stats() == {
+        "max_workers": 1,
+        "max_queue": 1,
+        "running": 0,
+        "queued": 0,
+        "completed": 1,
+        "rejected": 0,
+    }
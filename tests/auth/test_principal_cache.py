@@ -0,0 +1,74 @@
+from unittest.mock import Mock
+
+import pytest
+
+from app.auth.principal_cache import UserPrincipalCache
+from app.core.cache import InMemoryCacheBackend, cache_stats
+from app.dependencies import hybrid_auth
+from app.models.user import User
+
+
+def _user(**overrides) -> User:
+    fields = {
+        "id": "user-1",
+        "username": "nobunaga",
+        "email": "nobunaga@example.com",
+        "full_name": "織田信長",
+        "hashed_password": "secret-hash",
+        "role": "moderator",
+        "is_active": True,
+        "is_superuser": False,
+    }
+    fields.update(overrides)
+    return User(**fields)
+
+
+@pytest.fixture
+def principal_cache():
+    return UserPrincipalCache(backend=InMemoryCacheBackend(), ttl=30)
+
+
+def test_set_and_get(principal_cache):
+    principal_cache.set(_user())
+
+    cached = principal_cache.get("user-1")
+
+    assert cached.id == "user-1"
+    assert cached.role == "moderator"
+    assert cached.is_active is True
+    # パスワードハッシュはキャッシュしない
+    assert cached.hashed_password == ""
+    assert principal_cache.get("user-2") is None
+    assert cache_stats.snapshot()["user_principal"] == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_invalidate(principal_cache):
+    principal_cache.set(_user())
+
+    principal_cache.invalidate("user-1")
+
+    assert principal_cache.get("user-1") is None
+
+
+def test_verify_jwt_user_uses_cache(principal_cache, monkeypatch):
+    user_service = Mock()
+    user_service.get_user.return_value = _user()
+    monkeypatch.setattr(hybrid_auth, "user_service", user_service)
+    monkeypatch.setattr(hybrid_auth, "user_principal_cache", principal_cache)
+    auth_info = {"type": "jwt", "verified": True, "user_id": "user-1"}
+
+    first = hybrid_auth.verify_jwt_user(auth_info, db=Mock())
+    second = hybrid_auth.verify_jwt_user(auth_info, db=Mock())
+
+    assert first.id == second.id == "user-1"
+    assert user_service.get_user.call_count == 1
+
+
+def test_verify_jwt_user_rejects_cached_inactive_user(principal_cache, monkeypatch):
+    user_service = Mock()
+    monkeypatch.setattr(hybrid_auth, "user_service", user_service)
+    monkeypatch.setattr(hybrid_auth, "user_principal_cache", principal_cache)
+    principal_cache.set(_user(is_active=False))
+
+    assert hybrid_auth.verify_jwt_user({"user_id": "user-1"}, db=Mock()) is None
+    user_service.get_user.assert_not_called()
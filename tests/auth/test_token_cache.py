@@ -0,0 +1,57 @@
+import time
+
+import pytest
+
+from app.auth.token_cache import TokenVerificationCache
+from app.core.cache import cache_stats
+
+
+@pytest.fixture
+def token_cache():
+    return TokenVerificationCache(maxsize=2)
+
+
+def test_set_and_get(token_cache):
+    payload = {"sub": "user-1", "exp": time.time() + 60}
+    token_cache.set("token-1", payload)
+
+    assert token_cache.get("token-1") == payload
+    assert token_cache.get("token-2") is None
+    assert cache_stats.snapshot()["jwt"] == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_get_returns_copy(token_cache):
+    token_cache.set("token-1", {"sub": "user-1", "exp": time.time() + 60})
+
+    token_cache.get("token-1")["sub"] = "tampered"
+
+    assert token_cache.get("token-1")["sub"] == "user-1"
+
+
+def test_expired_entry_is_dropped(token_cache, monkeypatch):
+    now = time.time()
+    token_cache.set("token-1", {"sub": "user-1", "exp": now + 10})
+
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+
+    assert token_cache.get("token-1") is None
+    assert token_cache.info()["size"] == 0
+
+
+def test_payload_without_exp_is_not_cached(token_cache):
+    token_cache.set("token-1", {"sub": "user-1"})
+    token_cache.set("token-2", {"sub": "user-2", "exp": time.time() - 1})
+
+    assert token_cache.info()["size"] == 0
+
+
+def test_least_recently_used_is_evicted(token_cache):
+    exp = time.time() + 60
+    token_cache.set("token-1", {"sub": "user-1", "exp": exp})
+    token_cache.set("token-2", {"sub": "user-2", "exp": exp})
+    token_cache.get("token-1")
+    token_cache.set("token-3", {"sub": "user-3", "exp": exp})
+
+    assert token_cache.get("token-1") is not None
+    assert token_cache.get("token-2") is None
+    assert token_cache.get("token-3") is not None
@@ -1,8 +1,24 @@
 import os
 import sys
 
+import pytest
+
 # プロジェクトのルートディレクトリをPYTHONPATHに追加
 sys.path.insert(
     0,
     os.path.abspath(os.path.join(os.path.dirname(__file__), "..")),
 )
+
+
+@pytest.fixture(autouse=True)
+def clear_entity_cache():
+    """テスト間でキャッシュが残らないようにクリア"""
+    from app.auth.token_cache import token_verification_cache
+    from app.core.cache import cache_stats, get_cache_backend
+
+    get_cache_backend().clear()
+    token_verification_cache.clear()
+    cache_stats.reset()
+    yield
+    get_cache_backend().clear()
+    token_verification_cache.clear()
@@ -7,8 +7,11 @@ from datetime import date
 from typing import Optional
 
 import pytest
+import pytest_asyncio
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.enums import UserRole
 from app.models.base import Base
@@ -41,6 +44,24 @@ def db_session():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest_asyncio.fixture(scope="function")
+async def async_db_session():
+    """テスト用非同期データベースセッション"""
+    from app.database import get_async_database_url
+
+    Base.metadata.create_all(bind=engine)
+
+    # テストごとにイベントループが変わるため、接続をプールしない
+    async_engine = create_async_engine(get_async_database_url(str(SQLALCHEMY_DATABASE_URL)), poolclass=NullPool)
+    session_factory = async_sessionmaker(bind=async_engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_factory() as session:
+            yield session
+    finally:
+        await async_engine.dispose()
+        Base.metadata.drop_all(bind=engine)
+
+
 # テストデータファクトリ
 class PersonTestData:
     """人物テストデータファクトリ"""
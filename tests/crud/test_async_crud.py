@@ -0,0 +1,126 @@
+"""
+CRUD tests for async CRUD classes.
+
+AsyncSession上で動作する非同期CRUDクラスのテストケースを実装します。
+"""
+
+import pytest
+
+from app.crud import AsyncEventCRUD, AsyncPersonCRUD, AsyncTagCRUD
+from app.crud.user import AsyncUserCRUD
+from app.schemas import EventUpdate, PersonUpdate, TagUpdate, UserUpdate
+
+from .conftest import EventTestData, PersonTestData, TagTestData, UserTestData
+
+
+@pytest.mark.crud
+@pytest.mark.asyncio
+class TestAsyncPersonCRUD:
+    """非同期人物CRUD操作のテスト"""
+
+    async def test_create_and_get_person(self, async_db_session):
+        """人物作成・取得のテスト"""
+        person_crud = AsyncPersonCRUD()
+        created = await person_crud.create(async_db_session, obj_in=PersonTestData.create_person_data())
+
+        assert created.id is not None
+
+        by_id = await person_crud.get(async_db_session, created.id)
+        by_ssid = await person_crud.get_by_ssid(async_db_session, "test_person_001")
+
+        assert by_id is not None
+        assert by_id.full_name == "織田信長"
+        assert by_ssid is not None
+        assert by_ssid.id == created.id
+
+    async def test_get_multi_update_remove(self, async_db_session):
+        """人物一覧取得・更新・削除のテスト"""
+        person_crud = AsyncPersonCRUD()
+        for person_data in PersonTestData.create_sample_persons():
+            await person_crud.create(async_db_session, obj_in=person_data)
+
+        persons = await person_crud.get_multi(async_db_session, skip=1, limit=5)
+        assert len(persons) == 2
+
+        target = persons[0]
+        updated = await person_crud.update(async_db_session, id=target.id, obj_in=PersonUpdate(display_name="更新"))
+        assert updated is not None
+        assert updated.display_name == "更新"
+
+        assert await person_crud.remove(async_db_session, id=target.id) is True
+        assert await person_crud.get(async_db_session, target.id) is None
+        assert await person_crud.remove(async_db_session, id=999999) is False
+
+
+@pytest.mark.crud
+@pytest.mark.asyncio
+class TestAsyncEventCRUD:
+    """非同期イベントCRUD操作のテスト"""
+
+    async def test_event_lifecycle(self, async_db_session):
+        """イベント作成・更新・削除のテスト"""
+        event_crud = AsyncEventCRUD()
+        created = await event_crud.create(async_db_session, obj_in=EventTestData.create_event_data())
+
+        found = await event_crud.get_by_ssid(async_db_session, "test_event_001")
+        assert found is not None
+        assert found.title == "桶狭間の戦い"
+
+        updated = await event_crud.update(async_db_session, id=created.id, obj_in=EventUpdate(title="新タイトル"))
+        assert updated is not None
+        assert updated.title == "新タイトル"
+
+        assert await event_crud.remove(async_db_session, id=created.id) is True
+        assert await event_crud.get_multi(async_db_session) == []
+
+
+@pytest.mark.crud
+@pytest.mark.asyncio
+class TestAsyncTagCRUD:
+    """非同期タグCRUD操作のテスト"""
+
+    async def test_tag_lifecycle(self, async_db_session):
+        """タグ作成・更新・削除のテスト"""
+        tag_crud = AsyncTagCRUD()
+        created = await tag_crud.create(async_db_session, obj_in=TagTestData.create_tag_data())
+
+        updated = await tag_crud.update(async_db_session, id=created.id, obj_in=TagUpdate(name="大名"))
+        assert updated is not None
+        assert updated.name == "大名"
+
+        assert await tag_crud.remove(async_db_session, id=created.id) is True
+        assert await tag_crud.get(async_db_session, created.id) is None
+
+
+@pytest.mark.crud
+@pytest.mark.asyncio
+class TestAsyncUserCRUD:
+    """非同期ユーザーCRUD操作のテスト"""
+
+    async def test_user_lifecycle(self, async_db_session):
+        """ユーザー作成・検索・更新のテスト"""
+        user_crud = AsyncUserCRUD()
+        created = await user_crud.create(async_db_session, obj_in=UserTestData.create_user_data())
+
+        assert await user_crud.exists(async_db_session, email="test@example.com") is True
+        assert await user_crud.exists(async_db_session, username="nobody") is False
+        assert (await user_crud.get_by_username(async_db_session, "testuser")).id == created.id
+
+        updated = await user_crud.update(async_db_session, user_id=created.id, obj_in=UserUpdate(bio="hello"))
+        assert updated is not None
+        assert updated.bio == "hello"
+
+        await user_crud.increment_failed_attempts(async_db_session, user_id=created.id)
+        user = await user_crud.increment_failed_attempts(async_db_session, user_id=created.id)
+        assert user is not None
+        assert user.failed_login_attempts == "2"
+
+        outcome = await user_crud.record_login(async_db_session, user_id=created.id, success=False)
+        assert outcome.failed_login_attempts == 3
+        outcome = await user_crud.record_login(async_db_session, user_id=created.id, success=True)
+        assert outcome.failed_login_attempts == 0
+        assert outcome.last_login is not None
+
+        await user_crud.deactivate(async_db_session, user_id=created.id)
+        assert await user_crud.count(async_db_session) == 1
+        assert await user_crud.count_active(async_db_session) == 0
@@ -9,10 +9,13 @@ from typing import cast
 
 import pytest
 
+from app import models
 from app.crud.event import EventCRUD
+from app.crud.person import PersonCRUD
+from app.crud.tag import TagCRUD
 from app.schemas import EventUpdate
 
-from .conftest import EventTestData
+from .conftest import EventTestData, PersonTestData, TagTestData
 
 
 @pytest.mark.crud
@@ -73,6 +76,35 @@ class TestEventCRUD:
         events = event_crud.get_multi(db_session, skip=2, limit=1)
         assert len(events) == 1
 
+    def test_get_events_by_cursor(self, event_crud, db_session):
+        """イベント一覧取得（キーセットページネーション）のテスト"""
+        sample_events = EventTestData.create_sample_events()
+
+        # 開始日順とは逆の順序で登録する
+        for event_data in reversed(sample_events):
+            event_crud.create(db_session, obj_in=event_data)
+
+        first_page, next_cursor = event_crud.get_multi_by_cursor(db_session, limit=2)
+        assert [e.title for e in first_page] == ["桶狭間の戦い", "本能寺の変"]
+        assert next_cursor is not None
+
+        second_page, last_cursor = event_crud.get_multi_by_cursor(db_session, cursor=next_cursor, limit=2)
+        assert [e.title for e in second_page] == ["関ヶ原の戦い"]
+        assert last_cursor is None
+
+    def test_get_events_by_invalid_cursor(self, event_crud, db_session):
+        """不正なカーソルのテスト"""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            event_crud.get_multi_by_cursor(db_session, cursor="not-a-cursor")
+
+    def test_get_events_by_cursor_non_positive_limit(self, event_crud, db_session):
+        """limitが0以下の場合は空のページを返すテスト"""
+        for event_data in EventTestData.create_sample_events():
+            event_crud.create(db_session, obj_in=event_data)
+
+        for limit in (0, -1):
+            assert event_crud.get_multi_by_cursor(db_session, limit=limit) == ([], None)
+
     def test_update_event(self, event_crud, db_session):
         """イベント更新のテスト"""
         event_data = EventTestData.create_event_data(
@@ -317,54 +349,49 @@ class TestEventCRUD:
         assert count_1700 == 0
 
     def test_get_events_by_person(self, event_crud, db_session):
-        """人物に関連するイベントを取得するテスト"""
-        # テストデータ作成
-        events_data = [
-            EventTestData.create_event_data(
-                ssid="test_event_person_001",
-                title="織田信長の戦い",
-                description="織田信長が活躍した戦い",
-            ),
-            EventTestData.create_event_data(
-                ssid="test_event_person_002",
-                title="徳川家康の戦い",
-                description="徳川家康が活躍した戦い",
-            ),
+        """人物に関連するイベントを関連テーブル経由で取得するテスト"""
+        person = PersonCRUD().create(db_session, obj_in=PersonTestData.create_person_data())
+        other = PersonCRUD().create(db_session, obj_in=PersonTestData.create_person_data(ssid="test_person_other"))
+        events = [
+            event_crud.create(
+                db_session,
+                obj_in=EventTestData.create_event_data(
+                    ssid=f"test_event_person_{i:03d}", start_date=start_date, end_date=None
+                ),
+            )
+            for i, start_date in enumerate(["1582-06-21", "1560-06-12", "1575-06-29"])
         ]
+        # 説明文に人物IDを含むだけのイベントは対象外
+        event_crud.create(
+            db_session,
+            obj_in=EventTestData.create_event_data(ssid="test_event_person_desc", description=f"ID {person.id}"),
+        )
+        for event in events[:2]:
+            db_session.add(models.EventPerson(event_id=event.id, person_id=person.id))
+        db_session.add(models.EventPerson(event_id=events[2].id, person_id=other.id))
+        db_session.commit()
 
-        for event_data in events_data:
-            event_crud.create(db_session, obj_in=event_data)
-
-        # 人物IDで検索（現在は基本的な実装のため、descriptionでの検索）
-        events = event_crud.get_events_by_person(db_session, person_id=1)
+        result = event_crud.get_events_by_person(db_session, person_id=person.id)
 
-        # 現在の実装では基本的な検索のみ
-        assert isinstance(events, list)
+        # 開始日順
+        assert [e.ssid for e in result] == ["test_event_person_001", "test_event_person_000"]
+        assert event_crud.get_events_by_person(db_session, person_id=person.id, skip=1, limit=1)[0].id == events[0].id
 
     def test_get_events_by_tag(self, event_crud, db_session):
-        """タグに関連するイベントを取得するテスト"""
-        # テストデータ作成
-        events_data = [
-            EventTestData.create_event_data(
-                ssid="test_event_tag_001",
-                title="戦国時代の戦い",
-                description="戦国時代の重要な戦い",
-            ),
-            EventTestData.create_event_data(
-                ssid="test_event_tag_002",
-                title="江戸時代の事件",
-                description="江戸時代の重要な事件",
-            ),
+        """タグに関連するイベントを関連テーブル経由で取得するテスト"""
+        tag = TagCRUD().create(db_session, obj_in=TagTestData.create_tag_data())
+        events = [
+            event_crud.create(db_session, obj_in=EventTestData.create_event_data(ssid=f"test_event_tag_{i:03d}"))
+            for i in range(3)
         ]
+        for event in events[1:]:
+            db_session.add(models.EventTag(event_id=event.id, tag_id=tag.id))
+        db_session.commit()
 
-        for event_data in events_data:
-            event_crud.create(db_session, obj_in=event_data)
-
-        # タグIDで検索（現在は基本的な実装のため、descriptionでの検索）
-        events = event_crud.get_events_by_tag(db_session, tag_id=1)
+        result = event_crud.get_events_by_tag(db_session, tag_id=tag.id)
 
-        # 現在の実装では基本的な検索のみ
-        assert isinstance(events, list)
+        assert [e.id for e in result] == [events[1].id, events[2].id]
+        assert event_crud.get_events_by_tag(db_session, tag_id=tag.id + 1) == []
 
     def test_get_events_statistics(self, event_crud, db_session):
         """イベントの統計情報を取得するテスト"""
@@ -0,0 +1,181 @@
+"""
+CRUD tests for geospatial event search.
+
+グリッドセル計算とEventCRUDの範囲・近傍検索のテストケースを実装します。
+"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from app import models
+from app.core.geo import (
+    GRID_COLUMNS,
+    BoundingBox,
+    bounding_boxes_around,
+    cell_ranges,
+    grid_cell,
+    haversine_km,
+    split_antimeridian,
+)
+from app.crud.event import EventCRUD
+from app.schemas import EventUpdate
+
+from .conftest import EventTestData
+
+# (ssid, 緯度, 経度)
+LOCATIONS = [
+    ("geo_kyoto", 35.0116, 135.7681),
+    ("geo_osaka", 34.6937, 135.5023),
+    ("geo_nagoya", 35.1815, 136.9066),
+    ("geo_tokyo", 35.6762, 139.6503),
+    ("geo_fiji", -17.7134, 178.0650),
+    ("geo_samoa", -13.7590, -172.1046),
+]
+
+
+@pytest.mark.unit
+class TestGeoHelpers:
+    """グリッドセル計算のテスト"""
+
+    def test_grid_cell_is_row_major(self):
+        """同じ緯度帯で経度が隣り合うセルは連番になるテスト"""
+        assert grid_cell(35.0, 135.05) + 1 == grid_cell(35.0, 135.15)
+        assert grid_cell(35.15, 135.05) == grid_cell(35.05, 135.05) + GRID_COLUMNS
+
+    def test_grid_cell_clamps_edges(self):
+        """緯度90度・経度180度が範囲内のセルになるテスト"""
+        assert grid_cell(90, 180) == grid_cell(89.99, 179.99)
+        assert grid_cell(-90, -180) == 0
+
+    def test_grid_cell_without_coordinates(self):
+        """緯度経度がない場合はNoneになるテスト"""
+        assert grid_cell(None, 135.0) is None
+        assert grid_cell(35.0, None) is None
+
+    def test_grid_cell_accepts_decimal(self):
+        """Numeric列のDecimal値でも同じセルになるテスト"""
+        assert grid_cell(Decimal("35.0116"), Decimal("135.7681")) == grid_cell(35.0116, 135.7681)
+
+    def test_cell_ranges_one_range_per_row(self):
+        """緯度帯ごとに1区間になるテスト"""
+        ranges = cell_ranges(BoundingBox(34.95, 135.45, 35.25, 135.75))
+
+        assert len(ranges) == 4
+        assert all(last - first == 3 for first, last in ranges)
+
+    def test_cell_ranges_collapses_tall_boxes(self):
+        """緯度帯が多い場合は1区間にまとめるテスト"""
+        box = BoundingBox(-60, 10, 60, 20)
+
+        assert cell_ranges(box, max_ranges=8) == [(grid_cell(-60, 10), grid_cell(60, 20))]
+
+    def test_split_antimeridian(self):
+        """日付変更線をまたぐ矩形を2つに分割するテスト"""
+        boxes = split_antimeridian(BoundingBox(-20, 170, -10, -170))
+
+        assert boxes == [BoundingBox(-20, 170, -10, 180.0), BoundingBox(-20, -180.0, -10, -170)]
+
+    def test_bounding_boxes_around_contains_circle(self):
+        """円を含む矩形になるテスト"""
+        (box,) = bounding_boxes_around(35.0, 135.0, 50)
+
+        assert box.min_lat < 35.0 - 0.44 and box.max_lat > 35.0 + 0.44
+        assert haversine_km(35.0, 135.0, 35.0, box.max_lon) >= 50
+
+    def test_bounding_boxes_around_near_pole(self):
+        """極を含む場合は経度全体になるテスト"""
+        (box,) = bounding_boxes_around(89.9, 0.0, 50)
+
+        assert (box.min_lon, box.max_lat, box.max_lon) == (-180.0, 90.0, 180.0)
+
+    def test_haversine(self):
+        """大円距離のテスト（赤道上の経度1度、京都・東京間）"""
+        assert haversine_km(0, 0, 0, 1) == pytest.approx(111.195, abs=0.01)
+        assert haversine_km(35.0116, 135.7681, 35.6762, 139.6503) == pytest.approx(360, abs=2)
+
+
+@pytest.mark.crud
+class TestEventGeoCRUD:
+    """イベントの範囲・近傍検索のテスト"""
+
+    @pytest.fixture
+    def event_crud(self):
+        """EventCRUDインスタンス"""
+        return EventCRUD()
+
+    @pytest.fixture
+    def located_events(self, event_crud, db_session):
+        """位置の異なるイベントを作成"""
+        for ssid, latitude, longitude in LOCATIONS:
+            event_crud.create(
+                db_session,
+                obj_in=EventTestData.create_event_data(ssid=ssid, latitude=latitude, longitude=longitude),
+            )
+        event_crud.create(
+            db_session, obj_in=EventTestData.create_event_data(ssid="geo_unknown", latitude=None, longitude=None)
+        )
+
+    def test_geo_cell_set_on_create_and_update(self, event_crud, db_session):
+        """作成・更新時にgeo_cellが設定されるテスト"""
+        event = event_crud.create(db_session, obj_in=EventTestData.create_event_data(latitude=35.0, longitude=135.0))
+        assert event.geo_cell == grid_cell(35.0, 135.0)
+
+        event = event_crud.update(db_session, id=event.id, obj_in=EventUpdate(latitude=34.0, longitude=134.0))
+        assert event.geo_cell == grid_cell(34.0, 134.0)
+
+    def test_get_events_in_bbox(self, event_crud, db_session, located_events):
+        """矩形内のイベントのみ取得するテスト"""
+        events = event_crud.get_events_in_bbox(db_session, BoundingBox(34.5, 135.0, 35.5, 137.0))
+
+        assert sorted(e.ssid for e in events) == ["geo_kyoto", "geo_nagoya", "geo_osaka"]
+
+    def test_get_events_in_bbox_excludes_edge_cell_remainder(self, event_crud, db_session, located_events):
+        """境界のセルに入るが矩形外のイベントを除外するテスト"""
+        events = event_crud.get_events_in_bbox(db_session, BoundingBox(35.0, 135.70, 35.01, 135.76))
+
+        assert events == []
+
+    def test_get_events_in_bbox_across_antimeridian(self, event_crud, db_session, located_events):
+        """日付変更線をまたぐ矩形のテスト"""
+        events = event_crud.get_events_in_bbox(db_session, BoundingBox(-20, 170, -10, -170))
+
+        assert sorted(e.ssid for e in events) == ["geo_fiji", "geo_samoa"]
+
+    def test_get_events_nearby_orders_by_distance(self, event_crud, db_session, located_events):
+        """半径内のイベントを近い順に取得するテスト"""
+        nearby = event_crud.get_events_nearby(db_session, 35.0116, 135.7681, 150)
+
+        assert [event.ssid for event, _ in nearby] == ["geo_kyoto", "geo_osaka", "geo_nagoya"]
+        assert nearby[0][1] == pytest.approx(0, abs=0.01)
+        assert nearby[1][1] == pytest.approx(42.9, abs=1)
+
+    def test_get_events_nearby_excludes_box_corners(self, event_crud, db_session, located_events):
+        """矩形内でも半径外のイベントは含まないテスト"""
+        nearby = event_crud.get_events_nearby(db_session, 35.0116, 135.7681, 40)
+
+        assert [event.ssid for event, _ in nearby] == ["geo_kyoto"]
+
+    def test_get_events_nearby_limit(self, event_crud, db_session, located_events):
+        """取得上限数のテスト"""
+        nearby = event_crud.get_events_nearby(db_session, 35.0116, 135.7681, 500, limit=2)
+
+        assert [event.ssid for event, _ in nearby] == ["geo_kyoto", "geo_osaka"]
+
+    def test_get_events_nearby_loads_only_limit_rows(self, event_crud, db_session, located_events):
+        """イベントの行は取得上限数だけ読み込むテスト"""
+        db_session.expunge_all()
+        loaded = []
+
+        def on_load(target, context):
+            loaded.append(target.ssid)
+
+        event.listen(models.Event, "load", on_load)
+        try:
+            nearby = event_crud.get_events_nearby(db_session, 35.0116, 135.7681, 500, limit=1)
+        finally:
+            event.remove(models.Event, "load", on_load)
+
+        assert [e.ssid for e, _ in nearby] == ["geo_kyoto"]
+        assert loaded == ["geo_kyoto"]
@@ -9,7 +9,7 @@ from typing import cast
 import pytest
 
 from app.crud.person import PersonCRUD
-from app.schemas import PersonUpdate
+from app.schemas import PersonFilter, PersonUpdate
 
 from .conftest import PersonTestData
 
@@ -68,6 +68,81 @@ class TestPersonCRUD:
         persons = person_crud.get_multi(db_session, skip=2, limit=1)
         assert len(persons) == 1
 
+    def test_get_persons_by_cursor(self, person_crud, db_session):
+        """人物一覧取得（キーセットページネーション）のテスト"""
+        for person_data in PersonTestData.create_sample_persons():
+            person_crud.create(db_session, obj_in=person_data)
+
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = person_crud.get_multi_by_cursor(db_session, cursor=cursor, limit=2)
+            seen.extend(p.ssid for p in page)
+            if cursor is None:
+                break
+
+        assert seen == ["test_person_001", "test_person_002", "test_person_003"]
+
+    @pytest.fixture
+    def filter_persons(self, person_crud, db_session):
+        """生年・出生国の異なる人物を作成"""
+        for ssid, birth_date, born_country in [
+            ("filter_001", "1537-03-17", "日本"),
+            ("filter_002", "1534-06-23", "日本"),
+            ("filter_003", "1534-01-01", "Portugal"),
+            ("filter_004", "1543-01-31", "日本"),
+            ("filter_005", "1534-12-31", "日本"),
+        ]:
+            person_crud.create(
+                db_session,
+                obj_in=PersonTestData.create_person_data(ssid=ssid, birth_date=birth_date, born_country=born_country),
+            )
+
+    def test_get_multi_filters_by_birth_year(self, person_crud, db_session, filter_persons):
+        """生年での絞り込みがSQLで行われるテスト"""
+        persons = person_crud.get_multi(db_session, filters=PersonFilter(birth_year=1534))
+
+        assert [p.ssid for p in persons] == ["filter_002", "filter_003", "filter_005"]
+
+    def test_get_multi_filters_beyond_first_page(self, person_crud, db_session, filter_persons):
+        """ページ上限より後ろにある一致も取得できるテスト"""
+        persons = person_crud.get_multi(db_session, limit=1, filters=PersonFilter(birth_year=1543))
+
+        assert [p.ssid for p in persons] == ["filter_004"]
+
+    def test_get_multi_filters_by_country_case_insensitive(self, person_crud, db_session, filter_persons):
+        """出生国での絞り込みが大文字小文字を区別しないテスト"""
+        persons = person_crud.get_multi(db_session, filters=PersonFilter(born_country="portugal"))
+
+        assert [p.ssid for p in persons] == ["filter_003"]
+
+    def test_get_multi_combines_filters(self, person_crud, db_session, filter_persons):
+        """生年の範囲と出生国を組み合わせた絞り込みのテスト"""
+        filters = PersonFilter(birth_year_from=1535, birth_year_to=1550, born_country="日本")
+
+        persons = person_crud.get_multi(db_session, filters=filters)
+
+        assert [p.ssid for p in persons] == ["filter_001", "filter_004"]
+
+    def test_get_multi_by_cursor_sorted_by_birth_date(self, person_crud, db_session, filter_persons):
+        """生年順のキーセットページネーションのテスト"""
+        filters = PersonFilter(born_country="日本", sort="birth_date")
+
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = person_crud.get_multi_by_cursor(db_session, cursor=cursor, limit=2, filters=filters)
+            seen.extend(p.ssid for p in page)
+            if cursor is None:
+                break
+
+        assert seen == ["filter_002", "filter_005", "filter_001", "filter_004"]
+
+    def test_get_multi_invalid_sort(self, person_crud, db_session):
+        """不正な並べ替えキーのテスト"""
+        with pytest.raises(ValueError, match="Invalid sort 'name'"):
+            person_crud.get_multi(db_session, filters=PersonFilter(sort="name"))
+
     def test_update_person(self, person_crud, db_session):
         """人物更新のテスト"""
         person_data = PersonTestData.create_person_data(
@@ -0,0 +1,122 @@
+"""
+CRUD tests for relationship eager loading and sparse fieldsets.
+
+include指定によるリレーションの一括読み込みと、fields指定による列の絞り込みのテストケースを実装します。
+"""
+
+import pytest
+from sqlalchemy import event, inspect
+
+from app import models
+from app.crud.event import EventCRUD
+from app.crud.person import PersonCRUD
+from app.crud.tag import TagCRUD
+from app.schemas import PersonFilter
+
+from .conftest import EventTestData, PersonTestData, TagTestData
+
+
+class _StatementCounter:
+    """実行されたSQL文の数を数える"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _before_cursor_execute(self, *args):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._before_cursor_execute)
+
+
+@pytest.mark.crud
+class TestRelationEagerLoading:
+    """リレーションの一括読み込みのテスト"""
+
+    @pytest.fixture
+    def linked_data(self, db_session):
+        """人物・タグ・イベントを関連付けたデータ"""
+        person_crud = PersonCRUD()
+        persons = [
+            person_crud.create(db_session, obj_in=PersonTestData.create_person_data(ssid=f"person_{i:03d}"))
+            for i in range(10)
+        ]
+        tags = [TagCRUD().create(db_session, obj_in=data) for data in TagTestData.create_sample_tags()]
+        event_ = EventCRUD().create(db_session, obj_in=EventTestData.create_event_data())
+
+        for i, person in enumerate(persons):
+            db_session.add(models.PersonTag(person_id=person.id, tag_id=tags[i % len(tags)].id))
+            db_session.add(models.EventPerson(event_id=event_.id, person_id=person.id))
+        db_session.add(models.EventTag(event_id=event_.id, tag_id=tags[0].id))
+        db_session.commit()
+        event_id = event_.id
+        db_session.expunge_all()
+        return event_id
+
+    def test_get_multi_with_tags_uses_constant_queries(self, db_session, linked_data):
+        """人物一覧とタグの取得が件数に関わらず2クエリで済むテスト"""
+        with _StatementCounter(db_session.get_bind()) as counter:
+            persons = PersonCRUD().get_multi(db_session, limit=100, include=("tags",))
+            tag_names = [[tag.ssid for tag in person.tags] for person in persons]
+
+        assert counter.count == 2
+        assert len(persons) == 10
+        assert tag_names[0] == ["test_tag_001"]
+        assert tag_names[1] == ["test_tag_002"]
+
+    def test_get_multi_by_cursor_with_relations(self, db_session, linked_data):
+        """カーソルページネーションでも複数のリレーションを一括読み込みするテスト"""
+        with _StatementCounter(db_session.get_bind()) as counter:
+            persons, next_cursor = PersonCRUD().get_multi_by_cursor(db_session, limit=5, include=("tags", "events"))
+            for person in persons:
+                person.tags, person.events
+
+        assert counter.count == 3
+        assert len(persons) == 5
+        assert next_cursor is not None
+        assert all(len(person.events) == 1 for person in persons)
+
+    def test_get_event_with_persons_and_tags(self, db_session, linked_data):
+        """イベントの人物・タグを読み込むテスト"""
+        with _StatementCounter(db_session.get_bind()) as counter:
+            loaded = EventCRUD().get(db_session, linked_data, include=("persons", "tags"))
+            persons, tags = loaded.persons, loaded.tags
+
+        assert counter.count == 3
+        assert len(persons) == 10
+        assert [tag.ssid for tag in tags] == ["test_tag_001"]
+
+    def test_get_tag_by_ssid_with_persons(self, db_session, linked_data):
+        """SSIDで取得したタグの人物を読み込むテスト"""
+        tag = TagCRUD().get_by_ssid(db_session, "test_tag_001", include=("persons",))
+
+        assert sorted(person.ssid for person in tag.persons) == ["person_000", "person_003", "person_006", "person_009"]
+
+    def test_get_multi_loads_only_requested_columns(self, db_session, linked_data):
+        """fields指定で指定列だけを読み込むテスト"""
+        persons = PersonCRUD().get_multi(db_session, limit=3, fields=("id", "updated_at", "display_name"))
+
+        state = inspect(persons[0])
+        assert {"id", "updated_at", "display_name"} <= set(state.dict)
+        assert "description" in state.unloaded
+        assert "born_country" in state.unloaded
+
+    def test_get_multi_by_cursor_loads_key_columns(self, db_session, linked_data):
+        """fields指定のカーソルページネーションで並び順の列も読み込むテスト"""
+        filters = PersonFilter(sort="birth_date")
+
+        persons, next_cursor = PersonCRUD().get_multi_by_cursor(
+            db_session, limit=5, filters=filters, fields=("id", "full_name")
+        )
+        events, _ = EventCRUD().get_multi_by_cursor(db_session, limit=5, fields=("id", "title"))
+
+        assert next_cursor is not None
+        assert "birth_date" in inspect(persons[0]).dict
+        assert "description" in inspect(persons[0]).unloaded
+        assert {"start_date", "title"} <= set(inspect(events[0]).dict)
+        assert "image_url" in inspect(events[0]).unloaded
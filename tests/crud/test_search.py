@@ -0,0 +1,153 @@
+"""
+CRUD tests for keyword search.
+
+SearchCRUDクラスのテストケースを実装します。
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app import models
+from app.crud.event import EventCRUD
+from app.crud.person import PersonCRUD
+from app.crud.search import SearchCRUD
+from app.crud.tag import TagCRUD
+from app.models.base import Base
+from app.schemas import EventUpdate
+
+from .conftest import EventTestData, PersonTestData, TagTestData
+
+
+@pytest.mark.crud
+class TestSearchCRUD:
+    """キーワード検索のテスト"""
+
+    @pytest.fixture
+    def search_crud(self):
+        """SearchCRUDインスタンス"""
+        return SearchCRUD()
+
+    def test_search_persons_ranks_exact_match_first(self, search_crud, db_session):
+        """表示名の完全一致が部分一致より上位になるテスト"""
+        person_crud = PersonCRUD()
+        person_crud.create(
+            db_session,
+            obj_in=PersonTestData.create_person_data(ssid="p_a", full_name="織田信秀", display_name="信秀の子・信長"),
+        )
+        person_crud.create(
+            db_session,
+            obj_in=PersonTestData.create_person_data(ssid="p_b", full_name="織田信長", display_name="信長"),
+        )
+        person_crud.create(
+            db_session,
+            obj_in=PersonTestData.create_person_data(ssid="p_c", full_name="徳川家康", display_name="家康"),
+        )
+
+        results = search_crud.search_persons(db_session, "信長")
+
+        assert [person.ssid for person, _ in results] == ["p_b", "p_a"]
+        assert results[0][1] > results[1][1]
+
+    def test_search_persons_is_case_insensitive(self, search_crud, db_session):
+        """大文字小文字を区別しない検索のテスト"""
+        PersonCRUD().create(
+            db_session,
+            obj_in=PersonTestData.create_person_data(
+                ssid="napoleon", full_name="Napoléon Bonaparte", display_name="Napoleon"
+            ),
+        )
+
+        results = search_crud.search_persons(db_session, "NAPOLEON")
+
+        assert [person.ssid for person, _ in results] == ["napoleon"]
+
+    def test_search_events_title_ranks_above_description(self, search_crud, db_session):
+        """タイトル一致が説明一致より上位になるテスト"""
+        event_crud = EventCRUD()
+        event_crud.create(
+            db_session,
+            obj_in=EventTestData.create_event_data(
+                ssid="e_desc", title="本能寺の変", description="明智光秀が織田信長を討った"
+            ),
+        )
+        event_crud.create(
+            db_session,
+            obj_in=EventTestData.create_event_data(ssid="e_title", title="織田信長の上洛", description="京へ上る"),
+        )
+
+        results = search_crud.search_events(db_session, "織田信長")
+
+        assert [event.ssid for event, _ in results] == ["e_title", "e_desc"]
+
+    def test_search_escapes_like_wildcards(self, search_crud, db_session):
+        """LIKEのワイルドカードが文字として扱われるテスト"""
+        TagCRUD().create(db_session, obj_in=TagTestData.create_tag_data(ssid="t_pct", name="100%", description=None))
+        TagCRUD().create(db_session, obj_in=TagTestData.create_tag_data(ssid="t_num", name="1000", description=None))
+
+        results = search_crud.search_tags(db_session, "100%")
+
+        assert [tag.ssid for tag, _ in results] == ["t_pct"]
+
+    def test_search_respects_limit(self, search_crud, db_session):
+        """取得上限数のテスト"""
+        for tag_data in TagTestData.create_sample_tags():
+            TagCRUD().create(db_session, obj_in=tag_data)
+
+        assert len(search_crud.search_tags(db_session, "の", limit=1)) == 1
+
+
+@pytest.mark.crud
+class TestSearchCRUDSQLiteFTS:
+    """SQLite（FTS5）フォールバックのテスト"""
+
+    @pytest.fixture
+    def sqlite_session(self):
+        """FTS5テーブル付きのインメモリSQLiteセッション"""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        try:
+            yield session
+        finally:
+            session.close()
+            Base.metadata.drop_all(bind=engine)
+            engine.dispose()
+
+    def _add_event(self, session, event_id: int, **kwargs):
+        """ID指定でイベントを追加（SQLiteはBIGINTの自動採番をしないため）"""
+        event = models.Event(id=event_id, **EventTestData.create_event_data(**kwargs).model_dump())
+        session.add(event)
+        session.commit()
+        return event
+
+    def test_fts_table_is_synced_by_triggers(self, sqlite_session):
+        """トリガーでFTSテーブルが同期されるテスト"""
+        event = self._add_event(sqlite_session, 1, ssid="e1", title="桶狭間の戦い")
+
+        EventCRUD().update(sqlite_session, id=event.id, obj_in=EventUpdate(title="長篠の戦い"))
+        rows = sqlite_session.execute(text("SELECT entity_type, entity_id, body FROM search_fts")).all()
+        assert len(rows) == 1
+        assert rows[0][0] == "event"
+        assert rows[0][2].startswith("長篠の戦い")
+
+        EventCRUD().remove(sqlite_session, id=event.id)
+        assert sqlite_session.execute(text("SELECT count(*) FROM search_fts")).scalar() == 0
+
+    def test_search_events_with_fts(self, sqlite_session):
+        """FTS5でのイベント検索のテスト"""
+        self._add_event(sqlite_session, 1, ssid="e1", title="桶狭間の戦い", description="今川義元が討たれた")
+        self._add_event(sqlite_session, 2, ssid="e2", title="長篠の戦い", description="鉄砲隊の活躍")
+
+        results = SearchCRUD().search_events(sqlite_session, "今川義元")
+
+        assert [event.ssid for event, _ in results] == ["e1"]
+
+    def test_search_short_term_falls_back_to_like(self, sqlite_session):
+        """trigram未満の短い語はLIKE検索になるテスト"""
+        self._add_event(sqlite_session, 1, ssid="e1", title="桶狭間の戦い")
+        self._add_event(sqlite_session, 2, ssid="e2", title="本能寺の変", description="明智光秀の謀反")
+
+        results = SearchCRUD().search_events(sqlite_session, "戦い")
+
+        assert [event.ssid for event, _ in results] == ["e1"]
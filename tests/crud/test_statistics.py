@@ -0,0 +1,144 @@
+"""
+CRUD tests for aggregate statistics.
+
+集計カウンターの差分更新とStatisticsCRUDのテストケースを実装します。
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+
+from app import models
+from app.crud.event import EventCRUD
+from app.crud.person import PersonCRUD
+from app.crud.statistics import StatisticsCRUD
+from app.crud.user import UserCRUD
+from app.models.user import User
+from app.schemas import EventUpdate, UserCreate
+
+from .conftest import EventTestData, PersonTestData
+
+
+@pytest.mark.crud
+class TestStatisticsCRUD:
+    """集計カウンターのテスト"""
+
+    @pytest.fixture
+    def statistics_crud(self):
+        """StatisticsCRUDインスタンス"""
+        return StatisticsCRUD()
+
+    @pytest.fixture
+    def events(self, db_session):
+        """開始年の異なるイベントを作成"""
+        event_crud = EventCRUD()
+        return [
+            event_crud.create(db_session, obj_in=EventTestData.create_event_data(ssid=f"stats_{i}", start_date=d))
+            for i, d in enumerate(["1560-06-12", "1582-06-21", "1582-07-02"])
+        ]
+
+    def _create_user(self, db_session, name: str, role: str = "user") -> User:
+        user_in = UserCreate(email=f"{name}@example.com", username=name, password="password123", role=role)
+        return UserCRUD().create(db_session, obj_in=user_in, hashed_password="hashed")
+
+    def test_counts_on_create(self, statistics_crud, db_session, events):
+        """作成時に総数と年別の件数が増えるテスト"""
+        assert statistics_crud.get_count(db_session, "event") == 3
+        assert statistics_crud.get_counts(db_session, "event_year") == {"1560": 1, "1582": 2}
+
+    def test_counts_follow_update(self, statistics_crud, db_session, events):
+        """開始年の変更で年別の件数が移るテスト"""
+        EventCRUD().update(db_session, id=events[0].id, obj_in=EventUpdate(start_date=date(1600, 10, 21)))
+
+        assert statistics_crud.get_count(db_session, "event") == 3
+        assert statistics_crud.get_counts(db_session, "event_year") == {"1582": 2, "1600": 1}
+
+    def test_counts_on_delete(self, statistics_crud, db_session, events):
+        """削除時に件数が減り、0件のキーは返さないテスト"""
+        EventCRUD().remove(db_session, id=events[0].id)
+
+        assert statistics_crud.get_count(db_session, "event") == 2
+        assert statistics_crud.get_counts(db_session, "event_year") == {"1582": 2}
+        assert statistics_crud.get_count(db_session, "event_year", "1560") == 0
+
+    def test_counts_on_bulk_create(self, statistics_crud, db_session):
+        """一括作成でも件数が増えるテスト"""
+        PersonCRUD().create_multi(
+            db_session,
+            objs_in=[
+                PersonTestData.create_person_data(ssid=f"stats_person_{i}", born_country=country)
+                for i, country in enumerate(["日本", "日本", "Portugal"])
+            ],
+        )
+
+        assert statistics_crud.get_count(db_session, "person") == 3
+        assert statistics_crud.get_counts(db_session, "person_country") == {"Portugal": 1, "日本": 2}
+
+    def test_counts_follow_update_of_expired_attribute(self, statistics_crud, db_session):
+        """コミット後（属性が期限切れ）の変更でも変更前のキーが減るテスト"""
+        person = models.Person(
+            **PersonTestData.create_person_data(ssid="stats_expired", born_country="JP").model_dump()
+        )
+        db_session.add(person)
+        db_session.commit()
+
+        for country in ("US", "FR"):
+            person.born_country = country
+            db_session.commit()
+            assert statistics_crud.get_counts(db_session, "person_country") == {country: 1}
+
+        assert statistics_crud.get_count(db_session, "person_country", "JP") == 0
+        assert statistics_crud.get_count(db_session, "person_country", "US") == 0
+
+    def test_user_counts_follow_update_of_expired_attribute(self, statistics_crud, db_session):
+        """コミット後のユーザーの役割・有効状態の変更テスト"""
+        user = self._create_user(db_session, "stats_expired_user")
+        db_session.expire(user)
+
+        user.role = "admin"
+        user.is_active = False
+        db_session.commit()
+
+        assert statistics_crud.get_counts(db_session, "user_role") == {"admin": 1}
+        assert statistics_crud.get_counts(db_session, "user_active") == {"false": 1}
+
+    def test_user_counts(self, statistics_crud, db_session):
+        """ユーザーの役割別・有効無効別の件数テスト"""
+        user = self._create_user(db_session, "stats_user")
+        self._create_user(db_session, "stats_admin", role="admin")
+        UserCRUD().deactivate(db_session, user_id=user.id)
+
+        assert statistics_crud.get_count(db_session, "user") == 2
+        assert statistics_crud.get_counts(db_session, "user_role") == {"admin": 1, "user": 1}
+        assert statistics_crud.get_counts(db_session, "user_active") == {"false": 1, "true": 1}
+
+    def test_counts_after_bulk_delete(self, statistics_crud, db_session):
+        """ORMの一括DELETE後は再集計されるテスト"""
+        self._create_user(db_session, "stats_bulk_1")
+        self._create_user(db_session, "stats_bulk_2", role="admin")
+
+        db_session.query(User).filter(User.role == "admin").delete()
+        db_session.commit()
+
+        assert statistics_crud.get_count(db_session, "user") == 1
+        assert statistics_crud.get_counts(db_session, "user_role") == {"user": 1}
+
+    def test_rebuild(self, statistics_crud, db_session, events):
+        """SQLを直接実行した後に再集計で正しい件数に戻るテスト"""
+        db_session.execute(text("DELETE FROM event WHERE ssid = 'stats_0'"))
+        db_session.commit()
+        assert statistics_crud.get_count(db_session, "event") == 3
+
+        statistics_crud.rebuild(db_session)
+
+        assert statistics_crud.get_count(db_session, "event") == 2
+        assert statistics_crud.get_counts(db_session, "event_year") == {"1582": 2}
+
+    def test_rollback_discards_counts(self, statistics_crud, db_session):
+        """ロールバックした書き込みは件数に反映されないテスト"""
+        db_session.add(models.Event(ssid="stats_rollback", title="ロールバック", start_date=date(1600, 1, 1)))
+        db_session.flush()
+        db_session.rollback()
+
+        assert statistics_crud.get_count(db_session, "event") == 0
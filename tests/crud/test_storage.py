@@ -0,0 +1,69 @@
+"""
+CRUD tests for avatar object references.
+
+アバター画像のアップロードごとの参照のテストケースを実装します。
+"""
+
+import pytest
+
+from app import models
+from app.crud.storage import AvatarObjectCRUD
+
+KEY = "avatars/0123abcd.png"
+
+
+@pytest.mark.crud
+class TestAvatarObjectCRUD:
+    """アバター画像の参照のテスト"""
+
+    @pytest.fixture
+    def avatar_object_crud(self):
+        """AvatarObjectCRUDインスタンス"""
+        return AvatarObjectCRUD()
+
+    def test_acquire_adds_reference_per_upload(self, avatar_object_crud, db_session):
+        """acquireでアップロードごとに参照が追加されるテスト"""
+        assert avatar_object_crud.get_ref_count(db_session, KEY) == 0
+        assert avatar_object_crud.is_tracked(db_session, KEY) is False
+
+        first_id, first_count = avatar_object_crud.acquire(db_session, KEY)
+        second_id, second_count = avatar_object_crud.acquire(db_session, KEY)
+
+        assert (first_count, second_count) == (1, 2)
+        assert first_id != second_id
+        assert avatar_object_crud.get_upload(db_session, first_id).key == KEY
+        assert avatar_object_crud.is_tracked(db_session, KEY) is True
+
+    def test_release_removes_last_reference(self, avatar_object_crud, db_session):
+        """releaseで参照が減り、最後の参照でキーの記録が削除されるテスト"""
+        first_id, _ = avatar_object_crud.acquire(db_session, KEY)
+        second_id, _ = avatar_object_crud.acquire(db_session, KEY)
+
+        assert avatar_object_crud.release(db_session, first_id) == (KEY, 1)
+        db_session.commit()
+        assert avatar_object_crud.release(db_session, second_id) == (KEY, 0)
+        db_session.commit()
+
+        assert db_session.get(models.AvatarObject, KEY) is None
+
+    def test_release_is_idempotent(self, avatar_object_crud, db_session):
+        """同じアップロードIDでの再度のreleaseが他のアップロードの参照を減らさないテスト"""
+        first_id, _ = avatar_object_crud.acquire(db_session, KEY)
+        avatar_object_crud.acquire(db_session, KEY)
+
+        assert avatar_object_crud.release(db_session, first_id) == (KEY, 1)
+        db_session.commit()
+        assert avatar_object_crud.release(db_session, first_id) is None
+        assert avatar_object_crud.release(db_session, "unknown") is None
+
+        assert avatar_object_crud.get_ref_count(db_session, KEY) == 1
+
+    def test_release_is_rolled_back_with_transaction(self, avatar_object_crud, db_session):
+        """コミット前にロールバックすると参照が戻るテスト（S3の削除に失敗した場合）"""
+        upload_id, _ = avatar_object_crud.acquire(db_session, KEY)
+
+        assert avatar_object_crud.release(db_session, upload_id) == (KEY, 0)
+        db_session.rollback()
+
+        assert avatar_object_crud.get_ref_count(db_session, KEY) == 1
+        assert avatar_object_crud.is_tracked(db_session, KEY) is True
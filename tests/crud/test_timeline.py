@@ -0,0 +1,111 @@
+"""
+CRUD tests for the event timeline.
+
+TimelineCRUDクラスのテストケースを実装します。
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import select, text
+
+from app import models
+from app.crud.event import EventCRUD
+from app.crud.timeline import TimelineCRUD, overlaps_period
+
+from .conftest import EventTestData
+
+
+@pytest.mark.crud
+class TestTimelineCRUD:
+    """タイムラインCRUD操作のテスト"""
+
+    @pytest.fixture
+    def timeline_crud(self):
+        """TimelineCRUDインスタンス"""
+        return TimelineCRUD()
+
+    @pytest.fixture
+    def events(self, db_session):
+        """期間の異なるイベントを作成"""
+        event_crud = EventCRUD()
+        for ssid, title, start_date, end_date in [
+            ("timeline_001", "応仁の乱", "1467-05-20", "1477-12-16"),
+            ("timeline_002", "桶狭間の戦い", "1560-06-12", "1560-06-12"),
+            ("timeline_003", "長篠の戦い", "1575-06-29", None),
+            ("timeline_004", "本能寺の変", "1582-06-21", "1582-06-21"),
+            ("timeline_005", "山崎の戦い", "1582-07-02", "1582-07-02"),
+            ("timeline_006", "関ヶ原の戦い", "1600-10-21", "1600-10-21"),
+        ]:
+            event_crud.create(
+                db_session,
+                obj_in=EventTestData.create_event_data(
+                    ssid=ssid, title=title, start_date=start_date, end_date=end_date
+                ),
+            )
+
+    def test_overlapping_includes_events_started_before_window(self, timeline_crud, db_session, events):
+        """期間より前に始まり期間内に終わる出来事も含むテスト"""
+        result = timeline_crud.get_events_overlapping(db_session, date(1470, 1, 1), date(1470, 12, 31))
+
+        assert [event.ssid for event in result] == ["timeline_001"]
+
+    def test_overlapping_boundaries_are_inclusive(self, timeline_crud, db_session, events):
+        """期間の両端の日付を含むテスト"""
+        result = timeline_crud.get_events_overlapping(db_session, date(1477, 12, 16), date(1560, 6, 12))
+
+        assert [event.ssid for event in result] == ["timeline_001", "timeline_002"]
+
+    def test_overlapping_event_without_end_date(self, timeline_crud, db_session, events):
+        """終了日のない出来事は開始日だけで判定するテスト"""
+        assert [
+            e.ssid for e in timeline_crud.get_events_overlapping(db_session, date(1575, 6, 29), date(1575, 6, 29))
+        ] == ["timeline_003"]
+        assert timeline_crud.get_events_overlapping(db_session, date(1575, 6, 30), date(1575, 12, 31)) == []
+
+    def test_overlapping_pagination(self, timeline_crud, db_session, events):
+        """開始日順のページネーションテスト"""
+        result = timeline_crud.get_events_overlapping(db_session, date(1400, 1, 1), date(1700, 1, 1), skip=1, limit=2)
+
+        assert [event.ssid for event in result] == ["timeline_002", "timeline_003"]
+
+    def test_count_by_decade(self, timeline_crud, db_session, events):
+        """年代ごとの件数テスト"""
+        result = timeline_crud.count_by_bucket(db_session, date(1550, 1, 1), date(1599, 12, 31), 10)
+
+        assert result == [(1560, 1), (1570, 1), (1580, 2)]
+
+    def test_count_by_century_clamps_to_window_start(self, timeline_crud, db_session, events):
+        """期間より前に始まった出来事は開始年のバケットに数えるテスト"""
+        result = timeline_crud.count_by_bucket(db_session, date(1475, 1, 1), date(1699, 12, 31), 100)
+
+        assert result == [(1400, 1), (1500, 4), (1600, 1)]
+
+    def test_count_by_year_starts_inside_window(self, timeline_crud, db_session, events):
+        """期間の途中の年から始まるバケットのテスト"""
+        result = timeline_crud.count_by_bucket(db_session, date(1476, 6, 1), date(1560, 12, 31), 1)
+
+        assert result == [(1476, 1), (1560, 1)]
+
+    def test_get_events_by_bucket_limits_per_bucket(self, timeline_crud, db_session, events):
+        """バケットごとの件数上限のテスト"""
+        result = timeline_crud.get_events_by_bucket(db_session, date(1550, 1, 1), date(1599, 12, 31), 10, 1)
+
+        assert [(bucket, event.ssid) for bucket, event in result] == [
+            (1560, "timeline_002"),
+            (1570, "timeline_003"),
+            (1580, "timeline_004"),
+        ]
+
+    def test_overlap_uses_period_index(self, db_session, events):
+        """PostgreSQLでは重なり判定にGiSTインデックスを使えるテスト"""
+        bind = db_session.get_bind()
+        if bind.dialect.name != "postgresql":
+            pytest.skip("GiST index is PostgreSQL only")
+
+        stmt = select(models.Event.id).where(overlaps_period(db_session, date(1560, 1, 1), date(1560, 12, 31)))
+        sql = stmt.compile(dialect=bind.dialect, compile_kwargs={"literal_binds": True})
+        db_session.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = "\n".join(db_session.execute(text(f"EXPLAIN {sql}")).scalars())
+
+        assert "ix_event_period_gist" in plan
@@ -8,7 +8,9 @@ from datetime import datetime, timezone
 
 import pytest
 
+from app.auth.principal_cache import user_principal_cache
 from app.crud.user import UserCRUD
+from app.models.user import User
 from app.schemas import UserUpdate
 
 from .conftest import UserTestData
@@ -247,6 +249,57 @@ class TestUserCRUD:
         updated_user = user_crud.unlock_account(db_session, user_id=created_user.id)
         assert updated_user.locked_until is None
 
+    def test_record_login_failure_locks_at_limit(self, user_crud, db_session):
+        """ログイン失敗の記録で回数が加算され、上限でロックされるテスト"""
+        user_data = UserTestData.create_user_data(
+            email="outcome@example.com", username="outcomeuser", full_name="Outcome User"
+        )
+        created_user = user_crud.create(db_session, obj_in=user_data)
+
+        outcomes = [
+            user_crud.record_login(db_session, user_id=created_user.id, success=False, max_failed_attempts=3)
+            for _ in range(3)
+        ]
+
+        assert [outcome.failed_login_attempts for outcome in outcomes] == [1, 2, 3]
+        assert outcomes[1].locked_until is None
+        assert datetime.fromisoformat(outcomes[2].locked_until) > datetime.now(timezone.utc)
+        assert user_crud.get(db_session, created_user.id).failed_login_attempts == "3"
+
+    def test_record_login_failure_uses_current_count(self, user_crud, db_session):
+        """読み込み済みの古い値ではなくDB上の回数に加算されるテスト"""
+        user_data = UserTestData.create_user_data(
+            email="stale@example.com", username="staleuser", full_name="Stale User"
+        )
+        created_user = user_crud.create(db_session, obj_in=user_data)
+        stale_user = user_crud.get(db_session, created_user.id)
+
+        # 別のリクエストが先に失敗を記録した状態
+        db_session.query(User).filter(User.id == created_user.id).update({"failed_login_attempts": "2"})
+        db_session.commit()
+
+        outcome = user_crud.record_login(db_session, user_id=stale_user.id, success=False)
+        assert outcome.failed_login_attempts == 3
+
+    def test_record_login_success_resets(self, user_crud, db_session):
+        """ログイン成功の記録で失敗回数とロックがリセットされるテスト"""
+        user_data = UserTestData.create_user_data(
+            email="success@example.com", username="successuser", full_name="Success User"
+        )
+        created_user = user_crud.create(db_session, obj_in=user_data)
+        user_crud.record_login(db_session, user_id=created_user.id, success=False, max_failed_attempts=1)
+
+        outcome = user_crud.record_login(db_session, user_id=created_user.id, success=True)
+
+        assert outcome.failed_login_attempts == 0
+        assert outcome.locked_until is None
+        assert outcome.last_login is not None
+        assert user_crud.get(db_session, created_user.id).last_login == outcome.last_login
+
+    def test_record_login_not_found(self, user_crud, db_session):
+        """存在しないユーザーのログイン記録テスト"""
+        assert user_crud.record_login(db_session, user_id="non-existent-id", success=False) is None
+
     def test_deactivate_user(self, user_crud, db_session):
         """ユーザー無効化のテスト"""
         user_data = UserTestData.create_user_data(
@@ -288,6 +341,24 @@ class TestUserCRUD:
         deleted_user = user_crud.get(db_session, created_user.id)
         assert deleted_user is None
 
+    def test_principal_cache_invalidated_on_change(self, user_crud, db_session):
+        """更新・有効化・無効化・削除でプリンシパルキャッシュが無効化されるテスト"""
+        user_data = UserTestData.create_user_data(
+            email="principal@example.com", username="principaluser", full_name="Principal User"
+        )
+        created_user = user_crud.create(db_session, obj_in=user_data)
+
+        operations = [
+            lambda: user_crud.update(db_session, user_id=created_user.id, obj_in=UserUpdate(role="moderator")),
+            lambda: user_crud.deactivate(db_session, user_id=created_user.id),
+            lambda: user_crud.activate(db_session, user_id=created_user.id),
+            lambda: user_crud.remove(db_session, user_id=created_user.id),
+        ]
+        for operation in operations:
+            user_principal_cache.set(created_user)
+            operation()
+            assert user_principal_cache.get(created_user.id) is None
+
     def test_exists_user(self, user_crud, db_session):
         """ユーザー存在確認のテスト"""
         user_data = UserTestData.create_user_data(
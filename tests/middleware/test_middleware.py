@@ -0,0 +1,157 @@
+"""
+ミドルウェアのテスト
+
+純粋なASGIミドルウェア（認証・リクエストログ）の動作をテストします。
+"""
+
+import logging
+
+import pytest
+from fastapi import FastAPI, Request, status
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.auth.utils import create_access_token
+from app.middleware.auth import HybridAuthMiddleware
+from app.middleware.logging import RequestLoggingMiddleware
+
+
+def _create_app() -> FastAPI:
+    """ミドルウェアを組み込んだテスト用アプリを作成"""
+    app = FastAPI()
+    app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(HybridAuthMiddleware)
+
+    @app.get("/health")
+    def health():
+        return {"status": "ok"}
+
+    @app.get("/api/v1/whoami")
+    def whoami(request: Request):
+        auth_info = request.state.auth_info
+        return {"type": auth_info["type"], "user_id": auth_info["user_id"], "role": auth_info["role"]}
+
+    @app.get("/api/v1/stream")
+    def stream():
+        return StreamingResponse(iter(["a\n", "b\n", "c\n"]), media_type="text/plain")
+
+    return app
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """テスト用クライアント"""
+    monkeypatch.setenv("API_KEY", "test_api_key")
+    return TestClient(_create_app())
+
+
+class _ListHandler(logging.Handler):
+    """ログレコードを保持するハンドラー"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.mark.auth
+class TestHybridAuthMiddleware:
+    """ハイブリッド認証ミドルウェアのテスト"""
+
+    def test_exempt_path(self, client):
+        """認証不要パスは認証なしで通るテスト"""
+        response = client.get("/health")
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_no_auth(self, client):
+        """認証なしで401になるテスト"""
+        response = client.get("/api/v1/whoami")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.json() == {"detail": "Authentication required"}
+
+    def test_api_key_sets_auth_info(self, client):
+        """APIキー認証でrequest.state.auth_infoが設定されるテスト"""
+        response = client.get("/api/v1/whoami", headers={"X-API-Key": "test_api_key"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"type": "api_key", "user_id": "system", "role": "admin"}
+
+    def test_invalid_api_key(self, client):
+        """不正なAPIキーで401になるテスト"""
+        response = client.get("/api/v1/whoami", headers={"X-API-Key": "invalid"})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_jwt_sets_auth_info(self, client):
+        """JWT認証でrequest.state.auth_infoが設定されるテスト"""
+        token = create_access_token({"sub": "user-1", "role": "moderator"})
+        response = client.get("/api/v1/whoami", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"type": "jwt", "user_id": "user-1", "role": "moderator"}
+
+    def test_invalid_jwt(self, client):
+        """不正なJWTで401になるテスト"""
+        response = client.get("/api/v1/whoami", headers={"Authorization": "Bearer invalid"})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_jwt_verification_is_cached(self, client, monkeypatch):
+        """同じJWTの2回目以降は署名検証を省略するテスト"""
+        from app.middleware import auth
+
+        calls = []
+        original = auth.verify_jwt_token
+        monkeypatch.setattr(auth, "verify_jwt_token", lambda token: calls.append(token) or original(token))
+        token = create_access_token({"sub": "user-1"})
+
+        for _ in range(3):
+            response = client.get("/api/v1/whoami", headers={"Authorization": f"Bearer {token}"})
+            assert response.status_code == status.HTTP_200_OK
+
+        assert len(calls) == 1
+
+    def test_tampered_jwt_is_not_served_from_cache(self, client):
+        """署名を改ざんしたJWTはキャッシュから返らないテスト"""
+        token = create_access_token({"sub": "user-1"})
+        client.get("/api/v1/whoami", headers={"Authorization": f"Bearer {token}"})
+
+        tampered = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+        response = client.get("/api/v1/whoami", headers={"Authorization": f"Bearer {tampered}"})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_streaming_response_passes_through(self, client):
+        """ストリーミングレスポンスがそのまま返るテスト"""
+        response = client.get("/api/v1/stream", headers={"X-API-Key": "test_api_key"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.text == "a\nb\nc\n"
+
+
+@pytest.mark.unit
+class TestRequestLoggingMiddleware:
+    """リクエストログミドルウェアのテスト"""
+
+    @pytest.fixture
+    def log_messages(self):
+        """ミドルウェアのログを収集"""
+        handler = _ListHandler()
+        logger = logging.getLogger("app.middleware.logging")
+        previous_level = logger.level
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        try:
+            yield handler.messages
+        finally:
+            logger.removeHandler(handler)
+            logger.setLevel(previous_level)
+
+    def test_access_log_lines(self, client, log_messages):
+        """受信・完了のログが記録されるテスト"""
+        client.get("/health", headers={"User-Agent": "pytest-agent"})
+
+        assert log_messages[0].startswith("受信リクエスト: GET /health - IP: testclient - User-Agent: pytest-agent")
+        assert log_messages[1].startswith("レスポンス完了: GET /health - Status: 200 - Process Time: ")
+
+    def test_access_log_records_status(self, client, log_messages):
+        """アプリが返したステータスが記録されるテスト"""
+        client.get("/api/v1/missing", headers={"X-API-Key": "test_api_key"})
+
+        assert "Status: 404" in log_messages[1]
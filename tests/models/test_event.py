@@ -99,3 +99,11 @@ def test_event_model_numeric_fields():
     # 数値型フィールドの存在確認
     assert hasattr(Event, "latitude")
     assert hasattr(Event, "longitude")
+
+
+@pytest.mark.model
+def test_event_model_geo_cell():
+    """Eventモデルのgeo_cellカラムをテスト"""
+    assert hasattr(Event, "geo_cell")
+    assert Event.geo_cell.nullable
+    assert Event.geo_cell.index
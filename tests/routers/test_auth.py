@@ -462,3 +462,53 @@ class TestAuthPasswordChangeScenarios:
         )
 
         assert response.status_code == scenario["expected_status"]
+
+
+@pytest.mark.router
+@pytest.mark.integration
+class TestAuthPasswordExecutorBusy:
+    """パスワード処理の待ち行列が満杯の場合のテスト"""
+
+    @pytest.fixture
+    def busy_executor(self, monkeypatch):
+        """常に満杯のエグゼキューター"""
+        from app.auth.password_executor import PasswordExecutorBusyError
+        from app.routers import auth
+
+        async def reject(*args):
+            raise PasswordExecutorBusyError("Password hashing queue is full")
+
+        monkeypatch.setattr(auth.password_executor, "run", reject)
+
+    def test_login_returns_503(self, auth_client, test_db_session, busy_executor):
+        """ログインが503と再試行時間を返すテスト"""
+        from app import schemas
+        from app.crud.user import user_crud
+
+        user_data = UserTestData.create_user_data(email="busy@example.com", username="busyuser", full_name="Busy User")
+        user_crud.create(test_db_session, obj_in=schemas.UserCreate(**user_data))
+
+        response = auth_client.post(
+            "/api/v1/auth/login", data={"username": "busy@example.com", "password": "testpassword123"}
+        )
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.headers["Retry-After"] == "1"
+
+    def test_register_returns_503(self, auth_client, busy_executor):
+        """ユーザー登録が503を返すテスト"""
+        user_data = UserTestData.create_user_data(email="busy@example.com", username="busyuser", full_name="Busy User")
+
+        response = auth_client.post("/api/v1/auth/register", json=user_data)
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+    def test_duplicate_register_does_not_use_executor(self, auth_client, test_db_session, busy_executor):
+        """重複した登録はパスワード処理の前に400を返すテスト"""
+        from app import schemas
+        from app.crud.user import user_crud
+
+        user_data = UserTestData.create_user_data(email="busy@example.com", username="busyuser", full_name="Busy User")
+        user_crud.create(test_db_session, obj_in=schemas.UserCreate(**user_data))
+
+        response = auth_client.post("/api/v1/auth/register", json=user_data)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == "Email already registered"
@@ -0,0 +1,133 @@
+"""
+アバタールーターの結合テスト
+
+ストリーミングアップロードの受信・検証をテストします。S3へのアップロードはフェイクに置き換えます。
+"""
+
+import asyncio
+import io
+import os
+
+import pytest
+from fastapi import status
+from PIL import Image
+
+from app.main import app
+from app.routers.avatar import get_s3_storage_service
+
+
+class FakeS3StorageService:
+    """受け取ったファイルを記録するS3ストレージサービスのフェイク"""
+
+    def __init__(self, max_file_size: int = 64 * 1024):
+        self.max_file_size = max_file_size
+        self.uploads = []
+        self.deletes = []
+
+    def upload_avatar_file(self, file, filename: str, content_type: str) -> dict:
+        self.uploads.append((file.read(), filename, content_type))
+        key = f"avatars/fake-{len(self.uploads)}.png"
+        return {"url": f"https://example.com/{key}", "filename": key}
+
+    async def upload_avatar_async(self, file, filename: str, content_type: str, db=None) -> dict:
+        return self.upload_avatar_file(file, filename, content_type)
+
+    def file_exists(self, key: str) -> bool:
+        return True
+
+    def delete_avatar(self, key: str, db=None, upload_id=None) -> bool:
+        # イベントループのスレッドで呼ばれていないことを記録
+        try:
+            asyncio.get_running_loop()
+            self.deletes.append((key, "event_loop"))
+        except RuntimeError:
+            self.deletes.append((key, "worker_thread"))
+        return True
+
+
+def _png(size=(20, 20)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color="red").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.mark.router
+@pytest.mark.integration
+class TestAvatarRouter:
+    """アバタールーターの結合テスト"""
+
+    @pytest.fixture
+    def s3_service(self, client):
+        service = FakeS3StorageService()
+        app.dependency_overrides[get_s3_storage_service] = lambda: service
+        return service
+
+    @pytest.fixture
+    def headers(self):
+        return {"X-API-Key": os.environ["API_KEY"]}
+
+    def test_upload_avatar_success(self, client, s3_service, headers):
+        """画像をストリーミングで受信してアップロードするテスト"""
+        content = _png()
+        response = client.post(
+            "/api/v1/upload/avatar", files={"file": ("me.png", content, "application/octet-stream")}, headers=headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["filename"] == "avatars/fake-1.png"
+        # コンテンツタイプは申告値ではなく判定した画像形式を使う
+        assert s3_service.uploads == [(content, "me.png", "image/png")]
+
+    def test_upload_avatar_too_large(self, client, s3_service, headers):
+        """サイズ上限を超えるファイルを受信途中で拒否するテスト"""
+        content = _png() + b"\0" * (s3_service.max_file_size + 1)
+        response = client.post(
+            "/api/v1/upload/avatar", files={"file": ("big.png", content, "image/png")}, headers=headers
+        )
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert s3_service.uploads == []
+
+    def test_upload_avatar_not_image(self, client, s3_service, headers):
+        """マジックバイトが画像でないファイルを拒否するテスト"""
+        response = client.post(
+            "/api/v1/upload/avatar",
+            files={"file": ("fake.png", b"<html><script>alert(1)</script></html>", "image/png")},
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+        assert s3_service.uploads == []
+
+    def test_upload_avatar_extension_mismatch(self, client, s3_service, headers):
+        """拡張子と画像形式が一致しないファイルを拒否するテスト"""
+        response = client.post(
+            "/api/v1/upload/avatar", files={"file": ("photo.jpg", _png(), "image/jpeg")}, headers=headers
+        )
+
+        assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+        assert "一致しません" in response.json()["detail"]
+
+    def test_upload_avatar_missing_file(self, client, s3_service, headers):
+        """ファイルのフィールドがないリクエストのテスト"""
+        response = client.post(
+            "/api/v1/upload/avatar", files={"other": ("me.png", _png(), "image/png")}, headers=headers
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = client.post("/api/v1/upload/avatar", json={"file": "me.png"}, headers=headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_upload_avatar_requires_api_key(self, client, s3_service):
+        """APIキーがない場合は本文を受信せずに拒否するテスト"""
+        response = client.post("/api/v1/upload/avatar", files={"file": ("me.png", _png(), "image/png")})
+
+        assert response.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+        assert s3_service.uploads == []
+
+    def test_delete_avatar_runs_off_event_loop(self, client, s3_service, headers):
+        """S3・データベースへのブロッキング呼び出しがイベントループ外で行われるテスト"""
+        response = client.delete("/api/v1/upload/avatar/fake-1.png", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert s3_service.deletes == [("avatars/fake-1.png", "worker_thread")]
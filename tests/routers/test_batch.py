@@ -126,6 +126,12 @@ class TestBatchLimits:
         # 制限が1000に調整されることを確認
         assert len(data) <= 1000
 
+    def test_batch_get_persons_non_positive_limit(self, client, api_key):
+        """バッチ人物取得で0以下のlimitを拒否するテスト"""
+        headers = {"X-API-Key": api_key}
+        response = client.get("/api/v1/batch/persons/?limit=0", headers=headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
     def test_batch_create_persons_limit(self, client, api_key):
         """バッチ人物作成の制限テスト"""
         headers = {"X-API-Key": api_key}
@@ -165,6 +171,45 @@ class TestBatchLimits:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "Batch size cannot exceed 100 items" in response.json()["detail"]
 
+    def test_batch_create_persons_duplicate_ssid(self, client, api_key):
+        """リクエスト内でSSIDが重複したバッチ人物作成テスト"""
+        headers = {"X-API-Key": api_key}
+        person = {
+            "ssid": "test_person_dup",
+            "full_name": "Test Person",
+            "display_name": "Test",
+            "birth_date": "1900-01-01",
+            "born_country": "Japan",
+        }
+        response = client.post("/api/v1/batch/persons/", headers=headers, json=[person, person])
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "duplicated in the request" in response.json()["detail"]
+
+    def test_batch_export_persons_ndjson(self, client, api_key):
+        """人物のNDJSONエクスポートテスト"""
+        headers = {"X-API-Key": api_key}
+        response = client.get("/api/v1/batch/export/persons.ndjson", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    def test_batch_export_tags_csv(self, client, api_key):
+        """タグのCSVエクスポートテスト"""
+        headers = {"X-API-Key": api_key}
+        response = client.get("/api/v1/batch/export/tags.csv", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.text.splitlines()[0] == "id,created_at,updated_at,ssid,name,description"
+
+    def test_batch_export_unknown_target(self, client, api_key):
+        """不明なエクスポート対象のテスト"""
+        headers = {"X-API-Key": api_key}
+        response = client.get("/api/v1/batch/export/users.ndjson", headers=headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_batch_export_requires_api_key(self, client):
+        """APIキーなしのエクスポートテスト"""
+        response = client.get("/api/v1/batch/export/persons.ndjson")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
 
 @pytest.mark.batch
 class TestBatchPerformance:
@@ -132,6 +132,19 @@ class TestEventsRouter:
         created_id = create_response.json()["id"]
         assert created_id in event_ids
 
+    def test_get_events_fields(self, client, sample_event_data):
+        """fields=summaryで一覧用の軽量スキーマを返すテスト"""
+        headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        client.post("/api/v1/events/", json=sample_event_data, headers=headers)
+
+        response = client.get("/api/v1/events/?fields=summary", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.json()[0]) == {"id", "updated_at", "ssid", "title", "start_date", "end_date"}
+
+        # OFFSETページネーションでも同じ
+        response = client.get("/api/v1/events/?fields=title&skip=0&limit=1", headers=headers)
+        assert set(response.json()[0]) == {"id", "updated_at", "title"}
+
     def test_get_events_pagination(self, client):
         """イベント一覧のページネーションテスト（一般ユーザー）"""
         # モデレーターで複数のイベントを作成
@@ -178,6 +191,37 @@ class TestEventsRouter:
         assert data["ssid"] == sample_event_data["ssid"]
         assert data["title"] == sample_event_data["title"]
 
+    def test_get_event_conditional(self, client, sample_event_data):
+        """イベント取得の条件付きリクエストのテスト"""
+        moderator_headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        event = client.post("/api/v1/events/", json=sample_event_data, headers=moderator_headers).json()
+
+        response = client.get(f"/api/v1/events/{event['id']}", headers=moderator_headers)
+        etag = response.headers["etag"]
+
+        not_modified = client.get(f"/api/v1/events/{event['id']}", headers={**moderator_headers, "If-None-Match": etag})
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified.content == b""
+
+        # 解釈できないIf-Modified-Sinceは無視する
+        invalid_since = client.get(
+            f"/api/v1/events/{event['id']}", headers={**moderator_headers, "If-Modified-Since": "yesterday"}
+        )
+        assert invalid_since.status_code == status.HTTP_200_OK
+
+        # 更新より前の日時には本文を返す
+        old_since = client.get(
+            f"/api/v1/events/{event['id']}",
+            headers={**moderator_headers, "If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"},
+        )
+        assert old_since.status_code == status.HTTP_200_OK
+
+        list_response = client.get("/api/v1/events/", headers=moderator_headers)
+        list_not_modified = client.get(
+            "/api/v1/events/", headers={**moderator_headers, "If-None-Match": list_response.headers["etag"]}
+        )
+        assert list_not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
     def test_get_event_not_found(self, client):
         """存在しないイベントの取得テスト（一般ユーザー）"""
         headers = self._create_user_and_login(client, role=UserRole.USER)
@@ -291,6 +335,81 @@ class TestEventsRouter:
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
+    def _create_located_events(self, client, headers):
+        """位置の異なるイベントを作成"""
+        for ssid, latitude, longitude in [
+            ("geo_kyoto", 35.0116, 135.7681),
+            ("geo_osaka", 34.6937, 135.5023),
+            ("geo_tokyo", 35.6762, 139.6503),
+        ]:
+            event_data = {
+                "ssid": ssid,
+                "title": ssid,
+                "start_date": "1600-01-01",
+                "location_name": ssid,
+                "latitude": latitude,
+                "longitude": longitude,
+            }
+            response = client.post("/api/v1/events/", json=event_data, headers=headers)
+            assert response.status_code == status.HTTP_201_CREATED
+
+    def test_get_events_nearby(self, client):
+        """半径内のイベントを近い順に取得するテスト"""
+        headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        self._create_located_events(client, headers)
+
+        response = client.get(
+            "/api/v1/events/nearby", params={"lat": 35.0116, "lon": 135.7681, "radius_km": 100}, headers=headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [e["ssid"] for e in data] == ["geo_kyoto", "geo_osaka"]
+        assert data[0]["distance_km"] == 0
+        assert 40 < data[1]["distance_km"] < 46
+
+    def test_get_events_nearby_radius_too_large(self, client):
+        """半径が上限を超える場合400になるテスト"""
+        headers = self._create_user_and_login(client)
+
+        response = client.get(
+            "/api/v1/events/nearby", params={"lat": 35.0, "lon": 135.0, "radius_km": 5000}, headers=headers
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_get_events_in_bbox(self, client):
+        """矩形内のイベントを取得するテスト"""
+        headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        self._create_located_events(client, headers)
+
+        response = client.get(
+            "/api/v1/events/bbox",
+            params={"min_lat": 34, "min_lon": 135, "max_lat": 36, "max_lon": 136},
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert sorted(e["ssid"] for e in response.json()) == ["geo_kyoto", "geo_osaka"]
+
+    def test_get_events_in_bbox_invalid(self, client):
+        """南端が北端より北の矩形で400、範囲外の緯度で422になるテスト"""
+        headers = self._create_user_and_login(client)
+
+        response = client.get(
+            "/api/v1/events/bbox",
+            params={"min_lat": 36, "min_lon": 135, "max_lat": 34, "max_lon": 136},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = client.get(
+            "/api/v1/events/bbox",
+            params={"min_lat": -91, "min_lon": 135, "max_lat": 34, "max_lon": 136},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
     def test_event_crud_workflow(self, client):
         """イベントCRUD操作の完全なワークフローテスト"""
         # 1. モデレーターでイベントを作成
@@ -136,6 +136,16 @@ class TestPersonsRouter:
         created_id = create_response.json()["id"]
         assert created_id in person_ids
 
+    def test_get_persons_same_as_detail(self, client, sample_person_data):
+        """一覧の要素が詳細と同じJSONになるテスト（response_modelを通さない直列化）"""
+        headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        person = client.post("/api/v1/persons/", json=sample_person_data, headers=headers).json()
+
+        list_response = client.get("/api/v1/persons/", headers=headers)
+        assert list_response.headers["content-type"] == "application/json"
+        detail_response = client.get(f"/api/v1/persons/{person['id']}", headers=headers)
+        assert list_response.json() == [detail_response.json()]
+
     def test_get_persons_pagination(self, client):
         """人物一覧のページネーションテスト（一般ユーザー）"""
         # モデレーターで複数の人物を作成
@@ -166,6 +176,129 @@ class TestPersonsRouter:
         # データが取得できることを確認
         assert isinstance(response2.json(), list)
 
+    def test_get_persons_cursor_pagination(self, client):
+        """人物一覧のカーソルページネーションテスト"""
+        moderator_headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        for i in range(3):
+            person_data = {
+                "ssid": f"test_person_cur_{i}",
+                "full_name": f"カーソルテスト{i}",
+                "display_name": f"カーソル{i}",
+                "birth_date": "1534-06-23",
+                "born_country": "日本",
+            }
+            client.post("/api/v1/persons/", json=person_data, headers=moderator_headers)
+
+        user_headers = self._create_user_and_login(client, role=UserRole.USER)
+
+        response1 = client.get("/api/v1/persons/?limit=2", headers=user_headers)
+        assert response1.status_code == status.HTTP_200_OK
+        assert len(response1.json()) == 2
+        next_cursor = response1.headers["X-Next-Cursor"]
+
+        response2 = client.get(f"/api/v1/persons/?limit=2&cursor={next_cursor}", headers=user_headers)
+        assert response2.status_code == status.HTTP_200_OK
+        assert [p["ssid"] for p in response2.json()] == ["test_person_cur_2"]
+        assert "X-Next-Cursor" not in response2.headers
+
+    def test_get_persons_invalid_cursor(self, client):
+        """不正なカーソルのテスト"""
+        user_headers = self._create_user_and_login(client, role=UserRole.USER)
+
+        response = client.get("/api/v1/persons/?cursor=invalid", headers=user_headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.parametrize("limit", [0, -1, 1001])
+    def test_get_persons_invalid_limit(self, client, limit):
+        """範囲外のlimitのテスト"""
+        user_headers = self._create_user_and_login(client, role=UserRole.USER)
+
+        response = client.get(f"/api/v1/persons/?limit={limit}", headers=user_headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_get_persons_filters(self, client):
+        """生年・出生国での絞り込みと生年順の並べ替えテスト"""
+        moderator_headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        for ssid, birth_date, born_country in [
+            ("test_person_filter_0", "1537-03-17", "日本"),
+            ("test_person_filter_1", "1534-06-23", "日本"),
+            ("test_person_filter_2", "1534-01-01", "Portugal"),
+        ]:
+            person_data = {
+                "ssid": ssid,
+                "full_name": ssid,
+                "display_name": ssid,
+                "birth_date": birth_date,
+                "born_country": born_country,
+            }
+            client.post("/api/v1/persons/", json=person_data, headers=moderator_headers)
+
+        response = client.get(
+            "/api/v1/persons/", params={"country": "日本", "sort": "birth_date"}, headers=moderator_headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [p["ssid"] for p in response.json()] == ["test_person_filter_1", "test_person_filter_0"]
+
+        response = client.get("/api/v1/persons/", params={"birth_year": 1534, "limit": 1}, headers=moderator_headers)
+        assert [p["ssid"] for p in response.json()] == ["test_person_filter_1"]
+        next_cursor = response.headers["X-Next-Cursor"]
+
+        response = client.get(
+            "/api/v1/persons/",
+            params={"birth_year": 1534, "limit": 1, "cursor": next_cursor},
+            headers=moderator_headers,
+        )
+        assert [p["ssid"] for p in response.json()] == ["test_person_filter_2"]
+        assert "X-Next-Cursor" not in response.headers
+
+    def test_get_persons_invalid_filters(self, client):
+        """不正な絞り込み条件・並び順のテスト"""
+        user_headers = self._create_user_and_login(client, role=UserRole.USER)
+
+        response = client.get("/api/v1/persons/?sort=name", headers=user_headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Invalid sort 'name'" in response.json()["detail"]
+
+        response = client.get("/api/v1/persons/?birth_year_from=1600&birth_year_to=1500", headers=user_headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = client.get("/api/v1/persons/?birth_year=0", headers=user_headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_get_persons_fields(self, client, sample_person_data):
+        """fields指定で指定フィールドだけを返すテスト"""
+        headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        client.post("/api/v1/persons/", json=sample_person_data, headers=headers)
+
+        summary = client.get("/api/v1/persons/?fields=summary", headers=headers)
+        assert summary.status_code == status.HTTP_200_OK
+        assert set(summary.json()[0]) == {
+            "id",
+            "updated_at",
+            "ssid",
+            "full_name",
+            "display_name",
+            "birth_date",
+            "death_date",
+        }
+
+        sparse = client.get("/api/v1/persons/?fields=full_name,born_country&sort=birth_date", headers=headers)
+        assert sparse.json() == [
+            {
+                "id": sparse.json()[0]["id"],
+                "updated_at": sparse.json()[0]["updated_at"],
+                "full_name": sample_person_data["full_name"],
+                "born_country": sample_person_data["born_country"],
+            }
+        ]
+
+        response = client.get("/api/v1/persons/?fields=hashed_password", headers=headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Invalid fields 'hashed_password'" in response.json()["detail"]
+
+        response = client.get("/api/v1/persons/?fields=summary&include=tags", headers=headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_get_person_success(self, client, sample_person_data):
         """人物取得の成功テスト（一般ユーザー）"""
         # モデレーターで人物を作成
@@ -380,3 +513,141 @@ class TestPersonsRouter:
         # 7. 削除確認
         final_get_response = client.get(f"/api/v1/persons/{created_person['id']}", headers=admin_headers)
         assert final_get_response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_get_persons_include_tags(self, client, sample_person_data, sample_tag_data, test_db_session):
+        """include=tagsで人物一覧・詳細にタグが含まれるテスト"""
+        from app import models
+
+        moderator_headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        person = client.post("/api/v1/persons/", json=sample_person_data, headers=moderator_headers).json()
+        tag = client.post("/api/v1/tags/", json=sample_tag_data, headers=moderator_headers).json()
+        test_db_session.add(models.PersonTag(person_id=person["id"], tag_id=tag["id"]))
+        test_db_session.commit()
+
+        list_response = client.get("/api/v1/persons/?include=tags", headers=moderator_headers)
+        assert list_response.status_code == status.HTTP_200_OK
+        assert [t["ssid"] for t in list_response.json()[0]["tags"]] == [sample_tag_data["ssid"]]
+        assert "events" not in list_response.json()[0]
+
+        detail_response = client.get(f"/api/v1/persons/{person['id']}?include=tags,events", headers=moderator_headers)
+        assert detail_response.status_code == status.HTTP_200_OK
+        assert detail_response.json()["events"] == []
+        assert detail_response.json()["tags"][0]["name"] == sample_tag_data["name"]
+
+        # include未指定ではリレーションを含まない
+        plain_response = client.get(f"/api/v1/persons/{person['id']}", headers=moderator_headers)
+        assert "tags" not in plain_response.json()
+        assert "death_date" in plain_response.json()
+
+    def test_get_person_conditional(self, client, sample_person_data):
+        """ETag / Last-Modified による条件付き取得のテスト"""
+        moderator_headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        person = client.post("/api/v1/persons/", json=sample_person_data, headers=moderator_headers).json()
+
+        response = client.get(f"/api/v1/persons/{person['id']}", headers=moderator_headers)
+        assert response.status_code == status.HTTP_200_OK
+        etag = response.headers["etag"]
+        last_modified = response.headers["last-modified"]
+        assert etag.startswith('W/"')
+        assert response.headers["cache-control"] == "private, no-cache"
+
+        # 一致するETagには本文なしの304を返す
+        not_modified = client.get(
+            f"/api/v1/persons/{person['id']}", headers={**moderator_headers, "If-None-Match": etag}
+        )
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified.content == b""
+        assert not_modified.headers["etag"] == etag
+
+        # SSIDでの取得も同じ検証子になる
+        by_ssid = client.get(
+            f"/api/v1/persons/ssid/{person['ssid']}", headers={**moderator_headers, "If-None-Match": etag}
+        )
+        assert by_ssid.status_code == status.HTTP_304_NOT_MODIFIED
+
+        since = client.get(
+            f"/api/v1/persons/{person['id']}", headers={**moderator_headers, "If-Modified-Since": last_modified}
+        )
+        assert since.status_code == status.HTTP_304_NOT_MODIFIED
+
+        # 更新後は新しいETagで本文を返す
+        client.put(f"/api/v1/persons/{person['id']}", json={"full_name": "更新後の名前"}, headers=moderator_headers)
+        modified = client.get(f"/api/v1/persons/{person['id']}", headers={**moderator_headers, "If-None-Match": etag})
+        assert modified.status_code == status.HTTP_200_OK
+        assert modified.headers["etag"] != etag
+        assert modified.json()["full_name"] == "更新後の名前"
+
+    def test_get_persons_conditional(self, client, sample_person_data):
+        """人物一覧の条件付き取得のテスト（ETagのみ）"""
+        moderator_headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        client.post("/api/v1/persons/", json=sample_person_data, headers=moderator_headers)
+
+        response = client.get("/api/v1/persons/", headers=moderator_headers)
+        etag = response.headers["etag"]
+        assert "last-modified" not in response.headers
+
+        not_modified = client.get("/api/v1/persons/", headers={**moderator_headers, "If-None-Match": etag})
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
+        # 別のページ・条件では一致しない
+        other_page = client.get(
+            "/api/v1/persons/?country=Nowhere", headers={**moderator_headers, "If-None-Match": etag}
+        )
+        assert other_page.status_code == status.HTTP_200_OK
+
+        # 人物が増えるとETagが変わる
+        client.post("/api/v1/persons/", json={**sample_person_data, "ssid": "conditional_2"}, headers=moderator_headers)
+        modified = client.get("/api/v1/persons/", headers={**moderator_headers, "If-None-Match": etag})
+        assert modified.status_code == status.HTTP_200_OK
+        assert len(modified.json()) == 2
+
+    def test_get_person_include_conditional(self, client, sample_person_data, sample_tag_data, test_db_session):
+        """関連エンティティの追加でETagが変わり、Last-Modifiedを返さないテスト"""
+        from app import models
+
+        moderator_headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        person = client.post("/api/v1/persons/", json=sample_person_data, headers=moderator_headers).json()
+        tag = client.post("/api/v1/tags/", json=sample_tag_data, headers=moderator_headers).json()
+
+        url = f"/api/v1/persons/{person['id']}?include=tags"
+        response = client.get(url, headers=moderator_headers)
+        etag = response.headers["etag"]
+        assert "last-modified" not in response.headers
+
+        # 関連付けは人物のupdated_atを変えないが、ETagは変わる
+        test_db_session.add(models.PersonTag(person_id=person["id"], tag_id=tag["id"]))
+        test_db_session.commit()
+        modified = client.get(url, headers={**moderator_headers, "If-None-Match": etag})
+        assert modified.status_code == status.HTTP_200_OK
+        assert [t["id"] for t in modified.json()["tags"]] == [tag["id"]]
+
+    def test_get_persons_invalid_include(self, client):
+        """未対応のincludeで400になるテスト"""
+        headers = self._create_user_and_login(client, role=UserRole.USER)
+        response = client.get("/api/v1/persons/?include=unknown", headers=headers)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Invalid include" in response.json()["detail"]
+
+    def test_get_person_events(self, client, sample_person_data, sample_event_data, test_db_session):
+        """人物に関連するイベント一覧取得テスト"""
+        from app import models
+
+        headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        created = client.post("/api/v1/persons/", json=sample_person_data, headers=headers).json()
+        event = client.post("/api/v1/events/", json=sample_event_data, headers=headers).json()
+        client.post("/api/v1/events/", json={**sample_event_data, "ssid": "test_event_unrelated"}, headers=headers)
+        test_db_session.add(models.EventPerson(event_id=event["id"], person_id=created["id"]))
+        test_db_session.commit()
+
+        response = client.get(f"/api/v1/persons/{created['id']}/events", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [e["ssid"] for e in response.json()] == [sample_event_data["ssid"]]
+
+    def test_get_person_events_not_found(self, client):
+        """存在しない人物のイベント一覧取得テスト"""
+        headers = self._create_user_and_login(client, role=UserRole.USER)
+        response = client.get("/api/v1/persons/999999/events", headers=headers)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
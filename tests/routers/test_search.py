@@ -0,0 +1,88 @@
+"""
+検索ルーターの結合テスト
+
+検索エンドポイントの統合テストを実装します。
+実際のデータベースとサービスを使用してテストします。
+"""
+
+import uuid
+
+import pytest
+from fastapi import status
+
+from app.enums.user_role import UserRole
+
+
+@pytest.mark.router
+@pytest.mark.integration
+class TestSearchRouter:
+    """検索ルーターの結合テスト"""
+
+    def _create_user_and_login(self, client, role: UserRole = UserRole.USER):
+        """ユーザーを作成してログインし、JWTトークンを取得"""
+        user_data = {
+            "email": f"test_{uuid.uuid4()}@example.com",
+            "username": f"testuser_{uuid.uuid4()}",
+            "password": "testpassword123",
+            "full_name": f"Test User ({role.value})",
+            "role": role.value,
+        }
+        client.post("/api/v1/auth/register", json=user_data)
+
+        login_data = {"username": user_data["email"], "password": "testpassword123"}
+        login_response = client.post("/api/v1/auth/login", data=login_data)
+        assert login_response.status_code == status.HTTP_200_OK
+
+        token_data = login_response.json()
+        return {"Authorization": f"Bearer {token_data['access_token']}"}
+
+    def test_search_across_entities(self, client, sample_person_data, sample_event_data):
+        """人物・イベントを横断検索するテスト"""
+        headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        client.post("/api/v1/persons/", json=sample_person_data, headers=headers)
+        client.post("/api/v1/events/", json=sample_event_data, headers=headers)
+
+        response = client.get("/api/v1/search", params={"q": sample_person_data["display_name"]}, headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["query"] == sample_person_data["display_name"]
+        assert [p["ssid"] for p in data["persons"]] == [sample_person_data["ssid"]]
+        assert isinstance(data["events"], list)
+        assert data["tags"] == []
+
+    def test_search_filter_types(self, client, sample_person_data):
+        """検索対象の種類を絞り込むテスト"""
+        headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        client.post("/api/v1/persons/", json=sample_person_data, headers=headers)
+
+        response = client.get(
+            "/api/v1/search",
+            params={"q": sample_person_data["display_name"], "types": "events,tags"},
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["persons"] == []
+
+    def test_search_invalid_type(self, client):
+        """不明な検索対象の種類で400になるテスト"""
+        headers = self._create_user_and_login(client)
+
+        response = client.get("/api/v1/search", params={"q": "信長", "types": "users"}, headers=headers)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_search_blank_query(self, client):
+        """空の検索語で400になるテスト"""
+        headers = self._create_user_and_login(client)
+
+        response = client.get("/api/v1/search", params={"q": "  "}, headers=headers)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_search_requires_auth(self, client):
+        """未認証で401になるテスト"""
+        response = client.get("/api/v1/search", params={"q": "信長"})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,118 @@
+"""
+統計ルーターの結合テスト
+
+統計エンドポイントの統合テストを実装します。
+実際のデータベースとサービスを使用してテストします。
+"""
+
+import uuid
+
+import pytest
+from fastapi import status
+from sqlalchemy import text
+
+from app.enums.user_role import UserRole
+
+
+@pytest.mark.router
+@pytest.mark.integration
+class TestStatisticsRouter:
+    """統計ルーターの結合テスト"""
+
+    def _create_user_and_login(self, client, role: UserRole = UserRole.USER):
+        """ユーザーを作成してログインし、JWTトークンを取得"""
+        user_data = {
+            "email": f"test_{uuid.uuid4()}@example.com",
+            "username": f"testuser_{uuid.uuid4()}",
+            "password": "testpassword123",
+            "full_name": f"Test User ({role.value})",
+            "role": role.value,
+        }
+        client.post("/api/v1/auth/register", json=user_data)
+
+        login_data = {"username": user_data["email"], "password": "testpassword123"}
+        login_response = client.post("/api/v1/auth/login", data=login_data)
+        assert login_response.status_code == status.HTTP_200_OK
+
+        token_data = login_response.json()
+        return {"Authorization": f"Bearer {token_data['access_token']}"}
+
+    def _create_data(self, client, headers):
+        """人物2件・イベント3件・タグ1件を作成"""
+        for i, country in enumerate(["日本", "Portugal"]):
+            person_data = {
+                "ssid": f"stats_person_{i}",
+                "full_name": f"人物{i}",
+                "display_name": f"人物{i}",
+                "birth_date": "1534-06-23",
+                "born_country": country,
+            }
+            assert client.post("/api/v1/persons/", json=person_data, headers=headers).status_code == 201
+        for i, start_date in enumerate(["1560-06-12", "1582-06-21", "1582-07-02"]):
+            event_data = {"ssid": f"stats_event_{i}", "title": f"出来事{i}", "start_date": start_date}
+            assert client.post("/api/v1/events/", json=event_data, headers=headers).status_code == 201
+        tag_data = {"ssid": "stats_tag", "name": "戦国"}
+        assert client.post("/api/v1/tags/", json=tag_data, headers=headers).status_code == 201
+
+    def test_get_statistics(self, client):
+        """件数と内訳の取得テスト"""
+        headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        self._create_data(client, headers)
+
+        response = client.get("/api/v1/stats", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "persons": 2,
+            "events": 3,
+            "tags": 1,
+            "total": 6,
+            "events_by_year": {"1560": 1, "1582": 2},
+            "persons_by_country": {"Portugal": 1, "日本": 1},
+        }
+
+    def test_batch_stats_counts(self, client, api_key_headers):
+        """バッチ統計情報が実際の件数を返すテスト"""
+        headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        self._create_data(client, headers)
+
+        response = client.get("/api/v1/batch/stats", headers=api_key_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"persons": 2, "events": 3, "tags": 1, "total": 6}
+
+    def test_user_stats_count(self, client):
+        """ユーザー統計情報のテスト"""
+        self._create_user_and_login(client)
+        headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+
+        response = client.get("/api/v1/users/stats/count", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "total_users": 2,
+            "active_users": 2,
+            "inactive_users": 0,
+            "users_by_role": {"moderator": 1, "user": 1},
+        }
+
+    def test_rebuild_statistics(self, client, test_db_session):
+        """SQLでの直接変更後に再集計で正しい件数に戻るテスト（管理者）"""
+        headers = self._create_user_and_login(client, role=UserRole.ADMIN)
+        self._create_data(client, headers)
+        test_db_session.execute(text("DELETE FROM event WHERE ssid = 'stats_event_0'"))
+        test_db_session.commit()
+
+        response = client.post("/api/v1/stats/rebuild", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["events"] == 2
+        assert response.json()["events_by_year"] == {"1582": 2}
+
+    def test_rebuild_statistics_requires_admin(self, client):
+        """再集計は管理者以外403になるテスト"""
+        headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+
+        response = client.post("/api/v1/stats/rebuild", headers=headers)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
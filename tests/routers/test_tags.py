@@ -159,6 +159,25 @@ class TestTagsRouter:
         assert data["ssid"] == sample_tag_data["ssid"]
         assert data["name"] == sample_tag_data["name"]
 
+    def test_get_tag_conditional(self, client, sample_tag_data):
+        """タグ取得の条件付きリクエストのテスト"""
+        moderator_headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        tag = client.post("/api/v1/tags/", json=sample_tag_data, headers=moderator_headers).json()
+
+        response = client.get(f"/api/v1/tags/{tag['id']}", headers=moderator_headers)
+        etag = response.headers["etag"]
+
+        # 弱い比較のため W/ の有無やリスト中の位置は問わない
+        weak = client.get(
+            f"/api/v1/tags/{tag['id']}", headers={**moderator_headers, "If-None-Match": f'"other", {etag[2:]}'}
+        )
+        assert weak.status_code == status.HTTP_304_NOT_MODIFIED
+
+        client.put(f"/api/v1/tags/{tag['id']}", json={"name": "更新後のタグ"}, headers=moderator_headers)
+        modified = client.get(f"/api/v1/tags/{tag['id']}", headers={**moderator_headers, "If-None-Match": etag})
+        assert modified.status_code == status.HTTP_200_OK
+        assert modified.json()["name"] == "更新後のタグ"
+
     def test_get_tag_not_found(self, client):
         """存在しないタグの取得テスト（一般ユーザー）"""
         headers = self._create_user_and_login(client, role=UserRole.USER)
@@ -314,3 +333,26 @@ class TestTagsRouter:
         # 6. 削除確認
         final_get_response = client.get(f"/api/v1/tags/{created_tag['id']}", headers=admin_headers)
         assert final_get_response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_get_tag_events(self, client, sample_tag_data, sample_event_data, test_db_session):
+        """タグに関連するイベント一覧取得テスト"""
+        from app import models
+
+        headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        created = client.post("/api/v1/tags/", json=sample_tag_data, headers=headers).json()
+        event = client.post("/api/v1/events/", json=sample_event_data, headers=headers).json()
+        client.post("/api/v1/events/", json={**sample_event_data, "ssid": "test_event_unrelated"}, headers=headers)
+        test_db_session.add(models.EventTag(event_id=event["id"], tag_id=created["id"]))
+        test_db_session.commit()
+
+        response = client.get(f"/api/v1/tags/{created['id']}/events", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [e["ssid"] for e in response.json()] == [sample_event_data["ssid"]]
+
+    def test_get_tag_events_not_found(self, client):
+        """存在しないタグのイベント一覧取得テスト"""
+        headers = self._create_user_and_login(client, role=UserRole.USER)
+        response = client.get("/api/v1/tags/999999/events", headers=headers)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,137 @@
+"""
+タイムラインルーターの結合テスト
+
+タイムラインエンドポイントの統合テストを実装します。
+実際のデータベースとサービスを使用してテストします。
+"""
+
+import uuid
+
+import pytest
+from fastapi import status
+
+from app.enums.user_role import UserRole
+
+
+@pytest.mark.router
+@pytest.mark.integration
+class TestTimelineRouter:
+    """タイムラインルーターの結合テスト"""
+
+    def _create_user_and_login(self, client, role: UserRole = UserRole.USER):
+        """ユーザーを作成してログインし、JWTトークンを取得"""
+        user_data = {
+            "email": f"test_{uuid.uuid4()}@example.com",
+            "username": f"testuser_{uuid.uuid4()}",
+            "password": "testpassword123",
+            "full_name": f"Test User ({role.value})",
+            "role": role.value,
+        }
+        client.post("/api/v1/auth/register", json=user_data)
+
+        login_data = {"username": user_data["email"], "password": "testpassword123"}
+        login_response = client.post("/api/v1/auth/login", data=login_data)
+        assert login_response.status_code == status.HTTP_200_OK
+
+        token_data = login_response.json()
+        return {"Authorization": f"Bearer {token_data['access_token']}"}
+
+    def _create_events(self, client, headers):
+        """期間の異なるイベントを作成"""
+        for ssid, title, start_date, end_date in [
+            ("timeline_001", "応仁の乱", "1467-05-20", "1477-12-16"),
+            ("timeline_002", "桶狭間の戦い", "1560-06-12", "1560-06-12"),
+            ("timeline_003", "本能寺の変", "1582-06-21", "1582-06-21"),
+            ("timeline_004", "山崎の戦い", "1582-07-02", "1582-07-02"),
+        ]:
+            event_data = {
+                "ssid": ssid,
+                "title": title,
+                "start_date": start_date,
+                "end_date": end_date,
+                "location_name": "京都",
+            }
+            response = client.post("/api/v1/events/", json=event_data, headers=headers)
+            assert response.status_code == status.HTTP_201_CREATED
+
+    def test_timeline_by_decade(self, client):
+        """年代ごとのタイムライン取得テスト"""
+        headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        self._create_events(client, headers)
+
+        response = client.get(
+            "/api/v1/timeline",
+            params={"start_date": "1470-01-01", "end_date": "1599-12-31", "granularity": "decade", "per_bucket": 1},
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["granularity"] == "decade"
+        assert data["total"] == 4
+        assert [(b["start_year"], b["end_year"], b["count"]) for b in data["buckets"]] == [
+            (1470, 1479, 1),
+            (1560, 1569, 1),
+            (1580, 1589, 2),
+        ]
+        assert [[e["ssid"] for e in b["events"]] for b in data["buckets"]] == [
+            ["timeline_001"],
+            ["timeline_002"],
+            ["timeline_003"],
+        ]
+
+    def test_timeline_counts_only(self, client):
+        """per_bucket=0で件数のみ返すテスト"""
+        headers = self._create_user_and_login(client, role=UserRole.MODERATOR)
+        self._create_events(client, headers)
+
+        response = client.get(
+            "/api/v1/timeline",
+            params={"start_date": "1400-01-01", "end_date": "1699-12-31", "granularity": "century", "per_bucket": 0},
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        buckets = response.json()["buckets"]
+        assert [(b["start_year"], b["count"], b["events"]) for b in buckets] == [(1400, 1, []), (1500, 3, [])]
+
+    def test_timeline_invalid_range(self, client):
+        """開始日が終了日より後の場合400になるテスト"""
+        headers = self._create_user_and_login(client)
+
+        response = client.get(
+            "/api/v1/timeline", params={"start_date": "1600-01-01", "end_date": "1500-01-01"}, headers=headers
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Start date cannot be after end date" in response.json()["detail"]
+
+    def test_timeline_invalid_per_bucket(self, client):
+        """per_bucketが上限を超える場合400になるテスト"""
+        headers = self._create_user_and_login(client)
+
+        response = client.get(
+            "/api/v1/timeline",
+            params={"start_date": "1500-01-01", "end_date": "1600-01-01", "per_bucket": 1000},
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_timeline_invalid_granularity(self, client):
+        """未知の集計単位で422になるテスト"""
+        headers = self._create_user_and_login(client)
+
+        response = client.get(
+            "/api/v1/timeline",
+            params={"start_date": "1500-01-01", "end_date": "1600-01-01", "granularity": "week"},
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_timeline_requires_auth(self, client):
+        """認証なしで401になるテスト"""
+        response = client.get("/api/v1/timeline", params={"start_date": "1500-01-01", "end_date": "1600-01-01"})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -5,8 +5,10 @@
 """
 
 import pytest
+from moto import mock_aws
 
 from app.services import EventService, PersonService, TagService
+from app.services.s3_storage_service import S3StorageService, get_s3_client
 from app.services.user import UserService
 
 # CRUDテストのフィクスチャをインポート（フィクスチャを利用可能にするため）
@@ -35,3 +37,14 @@ def tag_service():
 def user_service():
     """ユーザーサービスのインスタンス"""
     return UserService()
+
+
+@pytest.fixture
+def s3_service():
+    """motoのS3に接続したS3ストレージサービス（バケット作成済み）"""
+    with mock_aws():
+        get_s3_client.cache_clear()
+        service = S3StorageService()
+        service.s3_client.create_bucket(Bucket=service.bucket_name)
+        yield service
+    get_s3_client.cache_clear()
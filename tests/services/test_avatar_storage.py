@@ -0,0 +1,150 @@
+"""
+アバター画像の内容アドレス保存と重複排除のテスト
+
+S3はmotoのスタンドインを使用します。
+"""
+
+import asyncio
+import hashlib
+import io
+
+import pytest
+from botocore.exceptions import ClientError
+from fastapi import HTTPException
+from PIL import Image
+
+from app.crud.storage import avatar_object_crud
+
+
+def _image(color: str = "orange") -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (120, 80), color=color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _keys(service):
+    response = service.s3_client.list_objects_v2(Bucket=service.bucket_name)
+    return {obj["Key"] for obj in response.get("Contents", [])}
+
+
+@pytest.fixture
+def puts(s3_service, monkeypatch):
+    """upload_object の呼び出しを記録"""
+    calls = []
+    upload_object = s3_service.upload_object
+
+    def recording_upload_object(key, body, content_type, *args):
+        calls.append(key)
+        return upload_object(key, body, content_type, *args)
+
+    monkeypatch.setattr(s3_service, "upload_object", recording_upload_object)
+    return calls
+
+
+@pytest.mark.service
+class TestAvatarStorage:
+    """内容アドレス保存のテスト"""
+
+    def test_key_is_content_digest(self, s3_service, db_session):
+        result = s3_service.upload_avatar(_image(), "me.png", "image/png", db_session)
+
+        content = s3_service.download_file(result["filename"])
+        assert result["filename"] == f"avatars/{hashlib.sha256(content).hexdigest()}.png"
+        assert result["url"] == s3_service.get_file_url(result["filename"])
+
+    def test_reupload_skips_writes(self, s3_service, db_session, puts):
+        first = s3_service.upload_avatar(_image(), "me.png", "image/png", db_session)
+        written = len(puts)
+        second = s3_service.upload_avatar(_image(), "again.png", "image/png", db_session)
+
+        assert second.pop("upload_id") != first.pop("upload_id")
+        assert second == first
+        assert len(puts) == written
+        assert avatar_object_crud.get_ref_count(db_session, first["filename"]) == 2
+
+    def test_reupload_async_skips_writes(self, s3_service, db_session, puts):
+        async def upload():
+            return await s3_service.upload_avatar_async(io.BytesIO(_image()), "me.png", "image/png", db_session)
+
+        first = asyncio.run(upload())
+        written = len(puts)
+        second = asyncio.run(upload())
+
+        assert second.pop("upload_id") != first.pop("upload_id")
+        assert second == first
+        assert len(puts) == written
+        assert avatar_object_crud.get_ref_count(db_session, first["filename"]) == 2
+
+    def test_reupload_without_session_checks_existing_object(self, s3_service, puts):
+        first = s3_service.upload_avatar(_image(), "me.png", "image/png")
+        written = len(puts)
+
+        assert s3_service.upload_avatar(_image(), "me.png", "image/png") == first
+        assert first["upload_id"] is None
+        assert len(puts) == written
+
+    def test_delete_keeps_shared_object(self, s3_service, db_session):
+        first = s3_service.upload_avatar(_image(), "me.png", "image/png", db_session)
+        second = s3_service.upload_avatar(_image(), "again.png", "image/png", db_session)
+        key = first["filename"]
+        stored = _keys(s3_service)
+
+        assert s3_service.delete_avatar(key, db_session, first["upload_id"]) is True
+        assert _keys(s3_service) == stored
+        assert avatar_object_crud.get_ref_count(db_session, key) == 1
+
+        assert s3_service.delete_avatar(key, db_session, second["upload_id"]) is True
+        assert _keys(s3_service) == set()
+        assert avatar_object_crud.get_ref_count(db_session, key) == 0
+
+    def test_repeated_delete_keeps_other_references(self, s3_service, db_session):
+        """再送や二重の削除で他のアップロードの参照が減らないテスト"""
+        first = s3_service.upload_avatar(_image(), "me.png", "image/png", db_session)
+        s3_service.upload_avatar(_image(), "again.png", "image/png", db_session)
+        key = first["filename"]
+        stored = _keys(s3_service)
+
+        for _ in range(3):
+            assert s3_service.delete_avatar(key, db_session, first["upload_id"]) is True
+
+        assert _keys(s3_service) == stored
+        assert avatar_object_crud.get_ref_count(db_session, key) == 1
+
+    def test_delete_shared_object_requires_upload_id(self, s3_service, db_session):
+        key = s3_service.upload_avatar(_image(), "me.png", "image/png", db_session)["filename"]
+
+        with pytest.raises(HTTPException) as exc_info:
+            s3_service.delete_avatar(key, db_session)
+
+        assert exc_info.value.status_code == 400
+        assert key in _keys(s3_service)
+
+    def test_delete_with_upload_id_of_other_key(self, s3_service, db_session):
+        mine = s3_service.upload_avatar(_image(), "me.png", "image/png", db_session)
+        other = s3_service.upload_avatar(_image("purple"), "other.png", "image/png", db_session)
+
+        with pytest.raises(HTTPException) as exc_info:
+            s3_service.delete_avatar(mine["filename"], db_session, other["upload_id"])
+
+        assert exc_info.value.status_code == 404
+        assert avatar_object_crud.get_ref_count(db_session, other["filename"]) == 1
+
+    def test_delete_untracked_object(self, s3_service, db_session):
+        """参照の記録がない画像（ハッシュ化以前のキーなど）はそのまま削除するテスト"""
+        s3_service.upload_object("avatars/legacy.png", _image(), "image/png")
+
+        assert s3_service.delete_avatar("avatars/legacy.png", db_session) is True
+        assert _keys(s3_service) == set()
+
+    def test_failed_upload_releases_reference(self, s3_service, db_session, monkeypatch):
+        def failing_upload_object(key, body, content_type, *args):
+            raise ClientError({"Error": {"Code": "InternalError"}}, "PutObject")
+
+        monkeypatch.setattr(s3_service, "upload_object", failing_upload_object)
+
+        with pytest.raises(HTTPException) as exc_info:
+            s3_service.upload_avatar(_image(), "me.png", "image/png", db_session)
+
+        assert exc_info.value.status_code == 500
+        key = s3_service._avatar_key(s3_service._process_image(io.BytesIO(_image()), ".png"), ".png")
+        assert avatar_object_crud.get_ref_count(db_session, key) == 0
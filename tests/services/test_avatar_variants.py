@@ -0,0 +1,96 @@
+"""
+アバターのバリアント生成・保存のテスト
+
+S3はmotoのスタンドインを使用します。
+"""
+
+import asyncio
+import io
+
+import pytest
+from PIL import Image
+
+from app.core.images import AVAILABLE_VARIANT_FORMATS, process_avatar_images
+
+
+def _image(size, image_format: str = "JPEG", color: str = "green") -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color=color).save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+@pytest.mark.unit
+def test_process_avatar_images_variants():
+    processed = process_avatar_images(_image((1200, 600)), ".png", sizes=(32, 128, 300), formats=("webp", "jpeg"))
+
+    with Image.open(io.BytesIO(processed.content)) as img:
+        assert (img.format, img.size) == ("PNG", (300, 150))
+    assert [(v.size, v.width, v.height, v.format) for v in processed.variants] == [
+        (32, 32, 16, "webp"),
+        (32, 32, 16, "jpeg"),
+        (128, 128, 64, "webp"),
+        (128, 128, 64, "jpeg"),
+        (300, 300, 150, "webp"),
+        (300, 300, 150, "jpeg"),
+    ]
+    for variant in processed.variants:
+        with Image.open(io.BytesIO(variant.content)) as img:
+            assert (img.format, img.size) == (variant.format.upper(), (variant.width, variant.height))
+
+
+@pytest.mark.unit
+def test_process_avatar_images_does_not_upscale():
+    processed = process_avatar_images(_image((50, 50)), ".jpg", formats=("jpeg",))
+
+    # 64/128/300 はすべて50pxになるため、最初の1つだけを生成する
+    assert [(v.size, v.width) for v in processed.variants] == [(32, 32), (64, 50)]
+
+
+@pytest.mark.unit
+def test_available_variant_formats_include_fallbacks():
+    assert AVAILABLE_VARIANT_FORMATS[-2:] == ("webp", "jpeg")
+
+
+def _objects(service):
+    response = service.s3_client.list_objects_v2(Bucket=service.bucket_name)
+    return {
+        obj["Key"]: service.s3_client.head_object(Bucket=service.bucket_name, Key=obj["Key"])["ContentType"]
+        for obj in response.get("Contents", [])
+    }
+
+
+@pytest.mark.service
+def test_upload_avatar_stores_variants(s3_service):
+    result = s3_service.upload_avatar(_image((600, 600)), "me.jpg", "image/jpeg")
+
+    key = result["filename"]
+    prefix = key[: -len(".jpg")]
+    objects = _objects(s3_service)
+    assert objects[key] == "image/jpeg"
+    assert objects[f"{prefix}/32.webp"] == "image/webp"
+    assert objects[f"{prefix}/300.jpg"] == "image/jpeg"
+    assert len(objects) == 1 + 4 * len(AVAILABLE_VARIANT_FORMATS)
+
+    assert set(result["srcset"]) == set(AVAILABLE_VARIANT_FORMATS)
+    assert result["srcset"]["webp"] == ", ".join(
+        f"{s3_service.get_file_url(f'{prefix}/{size}.webp')} {size}w" for size in (32, 64, 128, 300)
+    )
+
+
+@pytest.mark.service
+def test_upload_avatar_async_stores_variants(s3_service):
+    result = asyncio.run(s3_service.upload_avatar_async(io.BytesIO(_image((600, 600))), "me.png", "image/png"))
+
+    objects = _objects(s3_service)
+    assert objects[result["filename"]] == "image/png"
+    assert len(objects) == 1 + 4 * len(AVAILABLE_VARIANT_FORMATS)
+
+
+@pytest.mark.service
+def test_delete_avatar_removes_variants(s3_service):
+    other = s3_service.upload_avatar(_image((100, 100), color="red"), "other.png", "image/png")["filename"]
+    key = s3_service.upload_avatar(_image((100, 100)), "me.png", "image/png")["filename"]
+
+    assert s3_service.delete_avatar(key) is True
+    assert all(not k.startswith(key[: -len(".png")]) for k in _objects(s3_service))
+    assert other in _objects(s3_service)
@@ -0,0 +1,186 @@
+"""
+エンティティキャッシュのテスト
+
+サービス層のリードスルーキャッシュと無効化をテストします。
+"""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from app import schemas
+from app.core.cache import (
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+    cache_stats,
+    get_cache_backend,
+    get_redis_url,
+    set_cache_backend,
+)
+from app.services import EntityCache, PersonService, TagService
+
+
+def _person_create(ssid: str = "cache_person_001") -> schemas.PersonCreate:
+    return schemas.PersonCreate(
+        ssid=ssid,
+        full_name="織田信長",
+        display_name="信長",
+        birth_date=date(1534, 6, 23),
+        born_country="日本",
+    )
+
+
+@pytest.mark.service
+class TestInMemoryCacheBackend:
+    """インメモリキャッシュバックエンドのテスト"""
+
+    def test_set_get_delete(self):
+        """保存・取得・削除のテスト"""
+        backend = InMemoryCacheBackend()
+        backend.set("key", "value", ttl=60)
+
+        assert backend.get("key") == "value"
+
+        backend.delete("key")
+        assert backend.get("key") is None
+
+    def test_expired_entry(self):
+        """TTL切れのエントリはミスになることのテスト"""
+        backend = InMemoryCacheBackend()
+        with patch("app.core.cache.time.monotonic", return_value=1000.0):
+            backend.set("key", "value", ttl=10)
+        with patch("app.core.cache.time.monotonic", return_value=1011.0):
+            assert backend.get("key") is None
+
+    def test_max_ttl_caps_entry_lifetime(self):
+        """有効期限が上限で切り詰められることのテスト"""
+        backend = InMemoryCacheBackend(max_ttl=5)
+        with patch("app.core.cache.time.monotonic", return_value=1000.0):
+            backend.set("key", "value", ttl=300)
+        with patch("app.core.cache.time.monotonic", return_value=1004.0):
+            assert backend.get("key") == "value"
+        with patch("app.core.cache.time.monotonic", return_value=1006.0):
+            assert backend.get("key") is None
+
+
+@pytest.fixture
+def cache_env(monkeypatch):
+    """Redis関連の環境変数を外し、テスト後に共有バックエンドを作り直す"""
+    for name in ("REDIS_URL", "REDIS_HOST", "REDIS_PORT", "REDIS_DB", "WEB_CONCURRENCY"):
+        monkeypatch.delenv(name, raising=False)
+    set_cache_backend(None)
+    yield monkeypatch
+    set_cache_backend(None)
+
+
+@pytest.mark.service
+class TestCacheBackendSelection:
+    """キャッシュバックエンドの選択のテスト"""
+
+    def test_redis_url_takes_precedence(self, cache_env):
+        """REDIS_URLが優先されることのテスト"""
+        cache_env.setenv("REDIS_URL", "redis://cache:6380/2")
+        cache_env.setenv("REDIS_HOST", "redis")
+
+        assert get_redis_url() == "redis://cache:6380/2"
+
+    def test_redis_url_from_host_port_db(self, cache_env):
+        """REDIS_HOST / REDIS_PORT / REDIS_DB からURLを組み立てることのテスト"""
+        cache_env.setenv("REDIS_HOST", "redis")
+        cache_env.setenv("REDIS_DB", "3")
+
+        assert get_redis_url() == "redis://redis:6379/3"
+        assert isinstance(get_cache_backend(), RedisCacheBackend)
+
+    def test_in_memory_backend_has_short_ttl(self, cache_env):
+        """Redis未設定時はインメモリで有効期限が短く制限されることのテスト"""
+        with patch("app.core.cache.logger") as logger:
+            backend = get_cache_backend()
+
+        assert get_redis_url() is None
+        assert isinstance(backend, InMemoryCacheBackend)
+        assert backend.max_ttl == 5
+        logger.error.assert_not_called()
+
+    def test_in_memory_backend_with_multiple_workers_logs_error(self, cache_env):
+        """複数ワーカーでインメモリを使用するとエラーを記録することのテスト"""
+        cache_env.setenv("WEB_CONCURRENCY", "4")
+
+        with patch("app.core.cache.logger") as logger:
+            assert isinstance(get_cache_backend(), InMemoryCacheBackend)
+
+        logger.error.assert_called_once()
+        assert "4ワーカー" in logger.error.call_args.args[0]
+
+
+@pytest.mark.service
+class TestPersonServiceCache:
+    """人物サービスのキャッシュのテスト"""
+
+    def test_get_person_is_served_from_cache(self, db_session):
+        """2回目の取得がキャッシュから返されることのテスト"""
+        service = PersonService(cache=EntityCache("person", schemas.Person, backend=InMemoryCacheBackend()))
+        created = service.create_person(db_session, _person_create())
+
+        with patch.object(service.crud, "get", wraps=service.crud.get) as crud_get:
+            first = service.get_person(db_session, created.id)
+            second = service.get_person(db_session, created.id)
+
+        assert first == second == created
+        assert crud_get.call_count == 1
+        assert cache_stats.snapshot()["person"]["hits"] == 1
+
+    def test_get_person_by_ssid_uses_id_entry(self, db_session):
+        """SSIDでの取得がIDのエントリを共有することのテスト"""
+        service = PersonService(cache=EntityCache("person", schemas.Person, backend=InMemoryCacheBackend()))
+        created = service.create_person(db_session, _person_create())
+        service.get_person(db_session, created.id)
+
+        with patch.object(service.crud, "get_by_ssid", wraps=service.crud.get_by_ssid) as crud_get_by_ssid:
+            cached = service.get_person_by_ssid(db_session, created.ssid)
+
+        assert cached is not None
+        assert cached.id == created.id
+        assert crud_get_by_ssid.call_count == 0
+
+    def test_update_invalidates_cache(self, db_session):
+        """更新でキャッシュが無効化されることのテスト"""
+        service = PersonService(cache=EntityCache("person", schemas.Person, backend=InMemoryCacheBackend()))
+        created = service.create_person(db_session, _person_create())
+        service.get_person(db_session, created.id)
+        service.get_person_by_ssid(db_session, created.ssid)
+
+        service.update_person(db_session, created.id, schemas.PersonUpdate(display_name="第六天魔王"))
+
+        assert service.get_person(db_session, created.id).display_name == "第六天魔王"
+        assert service.get_person_by_ssid(db_session, created.ssid).display_name == "第六天魔王"
+
+    def test_delete_invalidates_cache(self, db_session):
+        """削除でキャッシュが無効化されることのテスト"""
+        service = PersonService(cache=EntityCache("person", schemas.Person, backend=InMemoryCacheBackend()))
+        created = service.create_person(db_session, _person_create())
+        service.get_person(db_session, created.id)
+        service.get_person_by_ssid(db_session, created.ssid)
+
+        assert service.delete_person(db_session, created.id) is True
+
+        assert service.get_person(db_session, created.id) is None
+        assert service.get_person_by_ssid(db_session, created.ssid) is None
+
+
+@pytest.mark.service
+class TestTagServiceCache:
+    """タグサービスのキャッシュのテスト"""
+
+    def test_get_tag_is_served_from_cache(self, db_session):
+        """2回目の取得がキャッシュから返されることのテスト"""
+        service = TagService(cache=EntityCache("tag", schemas.Tag, backend=InMemoryCacheBackend()))
+        created = service.create_tag(db_session, schemas.TagCreate(ssid="cache_tag_001", name="戦国武将"))
+
+        with patch.object(service.crud, "get", wraps=service.crud.get) as crud_get:
+            service.get_tag(db_session, created.id)
+            cached = service.get_tag(db_session, created.id)
+
+        assert cached == created
+        assert crud_get.call_count == 1
@@ -49,6 +49,32 @@ class TestEventService:
         ):
             event_service.create_event(db_session, event_data)
 
+    def test_create_events_success(self, event_service: EventService, db_session):
+        """イベント一括作成の成功テスト"""
+        events_data = [
+            schemas.EventCreate(ssid=f"bulk_event_{i}", title=f"一括イベント{i}", start_date=date(1560 + i, 1, 1))
+            for i in range(5)
+        ]
+
+        events = event_service.create_events(db_session, events_data)
+
+        assert [e.ssid for e in events] == [f"bulk_event_{i}" for i in range(5)]
+        assert all(e.id is not None for e in events)
+
+    def test_create_events_invalid_item(self, event_service: EventService, db_session):
+        """不正なデータを含む一括作成で1件も作成されないテスト"""
+        events_data = [
+            schemas.EventCreate(ssid="bulk_valid", title="正常", start_date=date(1560, 1, 1)),
+            schemas.EventCreate(
+                ssid="bulk_invalid", title="不正", start_date=date(1561, 1, 1), end_date=date(1560, 1, 1)
+            ),
+        ]
+
+        with pytest.raises(ValueError, match="Start date cannot be after end date"):
+            event_service.create_events(db_session, events_data)
+
+        assert event_service.get_by_ssid(db_session, "bulk_valid") is None
+
     def test_validate_event_data_success(self, event_service: EventService):
         """イベントデータバリデーション成功テスト"""
         event_data = schemas.EventCreate(
@@ -0,0 +1,70 @@
+"""
+エクスポートサービスのテスト
+
+NDJSON / CSVのストリーミング出力をテストします。
+"""
+
+import csv
+import io
+import json
+from datetime import date
+
+import pytest
+
+from app import schemas
+from app.enums import ExportTarget
+from app.services import EventService, ExportService, PersonService
+
+
+@pytest.mark.service
+class TestExportService:
+    """エクスポートサービスのテスト"""
+
+    def _create_persons(self, db_session, count: int):
+        """テスト用の人物を一括作成"""
+        PersonService().create_persons(
+            db_session,
+            [
+                schemas.PersonCreate(
+                    ssid=f"export_person_{i}",
+                    full_name=f"人物{i}",
+                    display_name=f"人物{i}",
+                    birth_date=date(1500 + i, 1, 1),
+                    born_country="日本",
+                )
+                for i in range(count)
+            ],
+        )
+
+    def test_stream_ndjson_in_chunks(self, db_session):
+        """チャンク単位でNDJSONが出力されるテスト"""
+        self._create_persons(db_session, 5)
+
+        chunks = list(ExportService().stream_ndjson(db_session, ExportTarget.PERSONS, chunk_size=2))
+
+        assert len(chunks) == 3
+        lines = "".join(chunks).splitlines()
+        assert [json.loads(line)["ssid"] for line in lines] == [f"export_person_{i}" for i in range(5)]
+
+    def test_stream_ndjson_empty(self, db_session):
+        """0件の場合に何も出力されないテスト"""
+        assert "".join(ExportService().stream_ndjson(db_session, ExportTarget.TAGS)) == ""
+
+    def test_stream_csv(self, db_session):
+        """ヘッダー付きCSVが出力され、dictカラムがJSON文字列になるテスト"""
+        EventService().create_event(
+            db_session,
+            schemas.EventCreate(
+                ssid="export_event",
+                title="桶狭間の戦い",
+                start_date=date(1560, 6, 12),
+                image_url={"main": "https://example.com/okehazama.jpg"},
+            ),
+        )
+
+        rows = list(csv.DictReader(io.StringIO("".join(ExportService().stream_csv(db_session, ExportTarget.EVENTS)))))
+
+        assert len(rows) == 1
+        assert rows[0]["ssid"] == "export_event"
+        assert rows[0]["end_date"] == ""
+        assert json.loads(rows[0]["image_url"]) == {"main": "https://example.com/okehazama.jpg"}
@@ -0,0 +1,99 @@
+import asyncio
+import io
+
+import pytest
+from PIL import Image, JpegImagePlugin
+
+from app.core.image_executor import ImageExecutor, ImageExecutorBusyError
+from app.core.images import AVATAR_SIZE, InvalidImageError, process_avatar_image
+
+
+def _image(size, image_format: str) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color="blue").save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def executor():
+    executor = ImageExecutor(max_workers=1, max_queue=0)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("extension, image_format", [(".jpg", "JPEG"), (".png", "PNG"), (".webp", "WEBP")])
+def test_process_avatar_image_resizes(extension, image_format):
+    processed = process_avatar_image(_image((1200, 800), image_format), extension)
+
+    with Image.open(io.BytesIO(processed)) as img:
+        assert img.format == image_format
+        assert img.size == (300, 200)
+
+
+@pytest.mark.unit
+def test_process_avatar_image_drafts_jpeg(monkeypatch):
+    drafts = []
+    original = JpegImagePlugin.JpegImageFile.draft
+
+    def draft(self, mode, size):
+        result = original(self, mode, size)
+        drafts.append((size, self.size))
+        return result
+
+    monkeypatch.setattr(JpegImagePlugin.JpegImageFile, "draft", draft)
+    process_avatar_image(_image((2400, 2400), "JPEG"), ".jpg")
+
+    # thumbnail() より前に、DCTのスケーリングで 2400 → 600 (1/4) に縮小してデコードされる
+    assert drafts[0] == ((AVATAR_SIZE[0] * 2, AVATAR_SIZE[1] * 2), (600, 600))
+
+
+@pytest.mark.unit
+def test_process_avatar_image_rejects_invalid():
+    with pytest.raises(InvalidImageError):
+        process_avatar_image(b"not an image", ".png")
+
+
+@pytest.mark.service
+def test_process_avatar_in_worker(executor):
+    processed = asyncio.run(executor.process_avatar(_image((900, 900), "JPEG"), ".jpg"))
+
+    with Image.open(io.BytesIO(processed.content)) as img:
+        assert img.size == AVATAR_SIZE
+    assert {variant.size for variant in processed.variants} == {32, 64, 128, 300}
+    assert executor.stats()["completed"] == 1
+
+
+@pytest.mark.service
+def test_invalid_image_in_worker(executor):
+    with pytest.raises(InvalidImageError):
+        asyncio.run(executor.process_avatar(b"not an image", ".jpg"))
+
+
+@pytest.mark.service
+def test_rejects_when_queue_is_full(executor):
+    content = _image((2000, 2000), "PNG")
+
+    async def scenario():
+        running = asyncio.ensure_future(executor.process_avatar(content, ".png"))
+        await asyncio.sleep(0)
+
+        stats = executor.stats()
+        with pytest.raises(ImageExecutorBusyError):
+            await executor.process_avatar(content, ".png")
+
+        await running
+        return stats
+
+    stats = asyncio.run(scenario())
+
+    assert stats["running"] == 1
+    assert stats["queued"] == 0
+    assert executor.stats() == {
+        "max_workers": 1,
+        "max_queue": 0,
+        "running": 0,
+        "queued": 0,
+        "completed": 1,
+        "rejected": 1,
+    }
@@ -56,6 +56,56 @@ class TestPersonService:
         ):
             person_service.create_person(db_session, person_data)
 
+    def test_create_persons_success(self, person_service: PersonService, db_session):
+        """人物一括作成の成功テスト"""
+        persons_data = [
+            schemas.PersonCreate(
+                ssid=f"bulk_person_{i}",
+                full_name=f"一括人物{i}",
+                display_name=f"人物{i}",
+                birth_date=date(1500 + i, 1, 1),
+                born_country="日本",
+            )
+            for i in range(5)
+        ]
+
+        persons = person_service.create_persons(db_session, persons_data)
+
+        assert [p.ssid for p in persons] == [f"bulk_person_{i}" for i in range(5)]
+        assert all(p.id is not None for p in persons)
+        # search_nameはbefore_insertリスナーで生成される
+        assert person_service.get_by_ssid(db_session, "bulk_person_0").search_name.startswith("bulk_person_0")
+
+    def test_create_persons_is_atomic(self, person_service: PersonService, db_session):
+        """登録済みSSIDを含む一括作成で1件も作成されないテスト"""
+        existing = schemas.PersonCreate(
+            ssid="bulk_existing",
+            full_name="既存人物",
+            display_name="既存",
+            birth_date=date(1534, 6, 23),
+            born_country="日本",
+        )
+        person_service.create_person(db_session, existing)
+        new = existing.model_copy(update={"ssid": "bulk_new"})
+
+        with pytest.raises(ValueError, match="SSID 'bulk_existing' is already registered"):
+            person_service.create_persons(db_session, [new, existing])
+
+        assert person_service.get_by_ssid(db_session, "bulk_new") is None
+
+    def test_create_persons_duplicate_in_request(self, person_service: PersonService, db_session):
+        """リクエスト内で重複したSSIDの一括作成失敗テスト"""
+        person_data = schemas.PersonCreate(
+            ssid="bulk_dup",
+            full_name="重複人物",
+            display_name="重複",
+            birth_date=date(1534, 6, 23),
+            born_country="日本",
+        )
+
+        with pytest.raises(ValueError, match="SSID 'bulk_dup' is duplicated in the request"):
+            person_service.create_persons(db_session, [person_data, person_data])
+
     def test_validate_person_data_success(self, person_service: PersonService):
         """人物データバリデーション成功テスト"""
         person_data = schemas.PersonCreate(
@@ -289,6 +339,31 @@ class TestPersonService:
         assert len(chinese_persons) == 1
         assert chinese_persons[0].born_country.lower() == "中国"
 
+    def test_get_persons_by_country_beyond_first_page(self, person_service: PersonService, db_session):
+        """ページ上限より後ろにある人物も出生国で見つかるテスト"""
+        for i in range(3):
+            person_service.create_person(
+                db_session,
+                schemas.PersonCreate(
+                    ssid=f"test_person_page_{i}",
+                    full_name=f"人物{i}",
+                    display_name=f"人物{i}",
+                    birth_date=date(1534, 1, 1),
+                    born_country="中国" if i == 2 else "日本",
+                ),
+            )
+
+        persons = person_service.get_persons_by_country(db_session, "中国", limit=1)
+
+        assert [p.ssid for p in persons] == ["test_person_page_2"]
+
+    def test_get_persons_invalid_birth_year_range(self, person_service: PersonService, db_session):
+        """生年の下限が上限より後の場合のテスト"""
+        filters = schemas.PersonFilter(birth_year_from=1600, birth_year_to=1500)
+
+        with pytest.raises(ValueError, match="birth_year_from cannot be after birth_year_to"):
+            person_service.get_persons(db_session, filters=filters)
+
     def test_get_persons_pagination(self, person_service: PersonService, db_session):
         """人物一覧のページネーションテスト"""
         # 複数の人物を作成
@@ -322,3 +397,66 @@ class TestPersonService:
         assert page1_ids.isdisjoint(page2_ids)
         assert page2_ids.isdisjoint(page3_ids)
         assert page1_ids.isdisjoint(page3_ids)
+
+    def test_get_person_with_tags(self, person_service: PersonService, db_session):
+        """include=tagsで関連タグ付きの人物を取得するテスト"""
+        from app import models
+
+        person = person_service.create_person(
+            db_session,
+            schemas.PersonCreate(
+                ssid="p_incl",
+                full_name="織田信長",
+                display_name="信長",
+                birth_date=date(1534, 6, 23),
+                born_country="日本",
+            ),
+        )
+        tag = models.Tag(ssid="t_incl", name="戦国武将")
+        db_session.add(tag)
+        db_session.flush()
+        db_session.add(models.PersonTag(person_id=person.id, tag_id=tag.id))
+        db_session.commit()
+
+        result = person_service.get_person(db_session, person.id, include="tags")
+
+        assert isinstance(result, schemas.PersonDetail)
+        assert [t.ssid for t in result.tags] == ["t_incl"]
+        assert "events" not in result.model_fields_set
+
+    def test_get_persons_with_fields(self, person_service: PersonService, db_session):
+        """fields指定で指定フィールドとid・updated_atだけを返すテスト"""
+        person_service.create_person(
+            db_session,
+            schemas.PersonCreate(
+                ssid="p_fields",
+                full_name="織田信長",
+                display_name="信長",
+                birth_date=date(1534, 6, 23),
+                born_country="日本",
+                description="尾張の戦国大名",
+            ),
+        )
+
+        sparse = person_service.get_persons(db_session, fields="display_name")
+        summary, _ = person_service.get_persons_page(db_session, fields="summary")
+
+        assert sparse[0].model_dump() == {
+            "id": sparse[0].id,
+            "updated_at": sparse[0].updated_at,
+            "display_name": "信長",
+        }
+        assert isinstance(summary[0], schemas.PersonSummary)
+        assert "description" not in summary[0].model_dump()
+
+    def test_get_persons_invalid_fields(self, person_service: PersonService, db_session):
+        """未対応のfields・includeとの同時指定でエラーになるテスト"""
+        with pytest.raises(ValueError, match="Invalid fields 'password'"):
+            person_service.get_persons(db_session, fields="full_name,password")
+        with pytest.raises(ValueError, match="fields cannot be combined with include"):
+            person_service.get_persons(db_session, fields="summary", include="tags")
+
+    def test_get_persons_invalid_include(self, person_service: PersonService, db_session):
+        """未対応のincludeでエラーになるテスト"""
+        with pytest.raises(ValueError, match="Invalid include 'persons'"):
+            person_service.get_persons(db_session, include="tags,persons")
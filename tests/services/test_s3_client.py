@@ -0,0 +1,73 @@
+"""
+S3クライアントの共有とマルチパートアップロードのテスト
+
+S3はmotoのスタンドインを使用します。
+"""
+
+import io
+
+import boto3
+import pytest
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from fastapi import HTTPException
+
+from app.core.images import ProcessedAvatar
+from app.routers.avatar import get_s3_storage_service
+from app.services.s3_storage_service import S3_MAX_POOL_CONNECTIONS, S3StorageService
+
+MB = 1024 * 1024
+
+
+def _head(service, key):
+    return service.s3_client.head_object(Bucket=service.bucket_name, Key=key)
+
+
+@pytest.mark.service
+def test_client_is_shared(s3_service):
+    other = S3StorageService()
+
+    assert other.s3_client is s3_service.s3_client
+    assert s3_service.s3_client.meta.config.max_pool_connections == S3_MAX_POOL_CONNECTIONS
+
+
+@pytest.mark.service
+def test_storage_service_dependency_is_shared():
+    assert get_s3_storage_service() is get_s3_storage_service()
+
+
+@pytest.mark.service
+def test_upload_small_object_with_single_put(s3_service):
+    s3_service.upload_object("files/small.bin", b"x" * 1024, "application/octet-stream")
+
+    head = _head(s3_service, "files/small.bin")
+    assert "-" not in head["ETag"]
+    assert head["ContentType"] == "application/octet-stream"
+    assert head["CacheControl"] == "max-age=31536000"
+
+
+@pytest.mark.service
+@pytest.mark.parametrize("as_file", [False, True])
+def test_upload_large_object_with_multipart(s3_service, as_file):
+    s3_service.transfer_config = TransferConfig(multipart_threshold=5 * MB, multipart_chunksize=5 * MB)
+    content = bytes(range(256)) * (6 * MB // 256)
+
+    s3_service.upload_object("files/large.bin", io.BytesIO(content) if as_file else content, "video/mp4")
+
+    head = _head(s3_service, "files/large.bin")
+    # マルチパートアップロードのETagは「-パート数」で終わる
+    assert head["ETag"].endswith('-2"')
+    assert head["ContentType"] == "video/mp4"
+    # motoはパートのチェックサムを合成した値を返すため、読み出しでは検証しない
+    client = boto3.client("s3", config=Config(response_checksum_validation="when_required"))
+    assert client.get_object(Bucket=s3_service.bucket_name, Key="files/large.bin")["Body"].read() == content
+
+
+@pytest.mark.service
+def test_upload_to_missing_bucket_maps_error(s3_service):
+    s3_service.bucket_name = "missing-bucket"
+
+    with pytest.raises(HTTPException) as exc_info:
+        s3_service._store_avatar(ProcessedAvatar(content=b"avatar"), ".png", "image/png")
+    assert exc_info.value.status_code == 500
+    assert exc_info.value.detail == "S3バケットが見つかりません"
@@ -0,0 +1,65 @@
+"""
+タイムラインサービスのテスト
+
+タイムラインサービスのビジネスロジックをテストします。
+"""
+
+from datetime import date
+from unittest.mock import Mock
+
+import pytest
+
+from app.crud.timeline import TimelineCRUD
+from app.enums import TimelineGranularity
+from app.services import TimelineService
+
+
+@pytest.mark.service
+class TestTimelineService:
+    """タイムラインサービスのテスト"""
+
+    @pytest.fixture
+    def timeline_crud(self):
+        """タイムラインCRUDのモック"""
+        return Mock(spec=TimelineCRUD)
+
+    def test_get_timeline_builds_buckets(self, timeline_crud):
+        """件数からバケットを組み立てるテスト"""
+        timeline_crud.count_by_bucket.return_value = [(1560, 2), (1580, 3)]
+        timeline_crud.get_events_by_bucket.return_value = []
+        service = TimelineService(timeline_crud)
+
+        timeline = service.get_timeline(
+            Mock(), date(1550, 1, 1), date(1599, 12, 31), granularity=TimelineGranularity.DECADE
+        )
+
+        assert timeline.total == 5
+        assert [(b.start_year, b.end_year, b.count) for b in timeline.buckets] == [(1560, 1569, 2), (1580, 1589, 3)]
+        timeline_crud.count_by_bucket.assert_called_once()
+        assert timeline_crud.count_by_bucket.call_args.args[3] == 10
+
+    def test_get_timeline_counts_only_skips_event_query(self, timeline_crud):
+        """per_bucket=0では出来事を取得しないテスト"""
+        timeline_crud.count_by_bucket.return_value = [(1500, 1)]
+        service = TimelineService(timeline_crud)
+
+        timeline = service.get_timeline(
+            Mock(), date(1500, 1, 1), date(1599, 12, 31), granularity=TimelineGranularity.CENTURY, per_bucket=0
+        )
+
+        assert timeline.buckets[0].events == []
+        timeline_crud.get_events_by_bucket.assert_not_called()
+
+    def test_get_timeline_invalid_range(self, timeline_crud):
+        """開始日が終了日より後の場合のテスト"""
+        service = TimelineService(timeline_crud)
+
+        with pytest.raises(ValueError, match="Start date cannot be after end date"):
+            service.get_timeline(Mock(), date(1600, 1, 1), date(1500, 1, 1))
+
+    def test_get_timeline_invalid_per_bucket(self, timeline_crud):
+        """per_bucketが範囲外の場合のテスト"""
+        service = TimelineService(timeline_crud)
+
+        with pytest.raises(ValueError, match="per_bucket must be between"):
+            service.get_timeline(Mock(), date(1500, 1, 1), date(1600, 1, 1), per_bucket=-1)
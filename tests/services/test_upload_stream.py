@@ -0,0 +1,120 @@
+"""
+ストリーミングアップロードのテスト
+"""
+
+from tempfile import SpooledTemporaryFile
+
+import pytest
+from fastapi import HTTPException, Request
+
+from app.services.upload_stream import SNIFF_SIZE, SpooledUpload, receive_upload, sniff_image_format
+
+BOUNDARY = "testboundary"
+
+
+def _multipart(filename: str, content: bytes) -> bytes:
+    return (
+        (
+            f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+            f"Content-Type: application/octet-stream\r\n\r\n"
+        ).encode()
+        + content
+        + f"\r\n--{BOUNDARY}--\r\n".encode()
+    )
+
+
+def _request(body: bytes, chunk_size: int = 1024, content_length: bool = True) -> Request:
+    """本文を chunk_size ごとに受信するリクエスト（受信したチャンク数を記録）"""
+    chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+    headers = [(b"content-type", f"multipart/form-data; boundary={BOUNDARY}".encode())]
+    if content_length:
+        headers.append((b"content-length", str(len(body)).encode()))
+    request = Request({"type": "http", "method": "POST", "headers": headers})
+    request.received = 0
+
+    async def receive():
+        request.received += 1
+        chunk = chunks[request.received - 1] if request.received <= len(chunks) else b""
+        return {"type": "http.request", "body": chunk, "more_body": request.received < len(chunks)}
+
+    request._receive = receive
+    return request
+
+
+PNG_HEAD = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
+
+
+@pytest.mark.service
+@pytest.mark.unit
+class TestUploadStream:
+    """ストリーミングアップロードのテスト"""
+
+    @pytest.mark.parametrize(
+        "head, expected",
+        [
+            (b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01", "jpeg"),
+            (PNG_HEAD, "png"),
+            (b"GIF89a\x01\x00\x01\x00\x00\x00", "gif"),
+            (b"RIFF\x24\x00\x00\x00WEBPVP8 ", "webp"),
+            (b"<?xml version=", None),
+            (b"MZ\x90\x00\x03\x00\x00\x00\x04\x00\x00\x00", None),
+        ],
+    )
+    def test_sniff_image_format(self, head, expected):
+        """マジックバイトによる画像形式の判定テスト"""
+        assert sniff_image_format(head[:SNIFF_SIZE]) == expected
+
+    def test_format_before_sniffing_raises(self):
+        """画像形式の判定前にMIMEタイプを参照するとValueErrorになるテスト"""
+        upload = SpooledUpload(file=SpooledTemporaryFile(), filename="a.png", content_type="image/png")
+        try:
+            with pytest.raises(ValueError):
+                upload.mime_type
+        finally:
+            upload.close()
+
+    @pytest.mark.asyncio
+    async def test_receive_upload_spools_to_disk(self):
+        """メモリ上限を超えたファイルを一時ファイルに書き出すテスト"""
+        content = PNG_HEAD + b"\0" * 10_000
+        upload = await receive_upload(_request(_multipart("a.png", content)), max_size=20_000, spool_size=4096)
+        try:
+            assert upload.size == len(content)
+            assert upload.image_format == "png"
+            assert upload.file._rolled
+            assert upload.file.read() == content
+        finally:
+            upload.close()
+
+    @pytest.mark.asyncio
+    async def test_receive_upload_aborts_when_too_large(self):
+        """サイズ上限を超えた時点で残りの本文を読まずに打ち切るテスト"""
+        request = _request(_multipart("a.png", PNG_HEAD + b"\0" * 100_000), content_length=False)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await receive_upload(request, max_size=10_000)
+
+        assert exc_info.value.status_code == 413
+        assert request.received < 20
+
+    @pytest.mark.asyncio
+    async def test_receive_upload_rejects_by_content_length(self):
+        """Content-Lengthが上限を超える場合は本文を読まずに拒否するテスト"""
+        request = _request(_multipart("a.png", PNG_HEAD + b"\0" * 100_000))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await receive_upload(request, max_size=10_000)
+
+        assert exc_info.value.status_code == 413
+        assert request.received == 0
+
+    @pytest.mark.asyncio
+    async def test_receive_upload_rejects_non_image_on_first_chunk(self):
+        """先頭が画像でない場合は最初のチャンクで拒否するテスト"""
+        request = _request(_multipart("a.png", b"#!/bin/sh\n" + b"x" * 100_000), content_length=False)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await receive_upload(request, max_size=1_000_000)
+
+        assert exc_info.value.status_code == 415
+        assert request.received == 1